@@ -0,0 +1,491 @@
+"""OCR benchmark and accuracy regression suite.
+
+Generates a synthetic corpus with PIL (sizes, languages, table layouts),
+runs it through the home page in Chromium and through /api/v1/ocr, and
+records per case:
+
+  - time to first progress (browser: first progress bar movement)
+  - time to result
+  - character and word error rate against the ground truth
+  - JS heap in use once the result is shown (browser)
+
+Waits are on completion signals in the page, not fixed sleeps. Results are
+written to a JSON report and compared against a stored baseline; any
+regression beyond the tolerances exits non-zero. CI should pass
+--require-baseline, so a missing baseline fails the run instead of skipping
+the comparison.
+
+Usage:
+    python benchmark_ocr.py                       # browser only, compare to baseline
+    python benchmark_ocr.py --modes browser,api --api-key YOUR_KEY
+    python benchmark_ocr.py --update-baseline     # record a new baseline
+    python benchmark_ocr.py --require-baseline    # CI: fail without a baseline
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+
+from load_test_ocr import build_multipart, make_unique
+
+DEFAULT_BASE_URL = 'http://localhost:3000'
+CORPUS_DIR = '/tmp/ocr-benchmark/corpus'
+CJK_LANGUAGES = {'chi_sim', 'chi_tra', 'jpn', 'kor'}
+DEFAULT_REPORT = '/tmp/ocr-benchmark/report.json'
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'benchmarks', 'ocr-baseline.json')
+
+FONT_CANDIDATES = {
+    'latin': [
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+        '/usr/share/fonts/dejavu/DejaVuSans.ttf',
+        '/Library/Fonts/Arial.ttf',
+        '/System/Library/Fonts/Supplemental/Arial.ttf',
+        'C:\\Windows\\Fonts\\arial.ttf',
+    ],
+    'cjk': [
+        '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',
+        '/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc',
+        '/usr/share/fonts/truetype/wqy/wqy-zenhei.ttc',
+        '/System/Library/Fonts/PingFang.ttc',
+        'C:\\Windows\\Fonts\\msyh.ttc',
+    ],
+}
+
+# Page progress bars are Radix Progress roots; the indicator is translated
+# left by (100 - value)%
+FIRST_PROGRESS_JS = """() => {
+  const moved = [...document.querySelectorAll('[data-slot="progress-indicator"]')]
+    .some((el) => el.style.transform && el.style.transform !== 'translateX(-100%)');
+  const finished = [...document.querySelectorAll('span')]
+    .some((el) => el.textContent === 'Done' || el.classList.contains('text-destructive'));
+  return (moved || finished) ? performance.now() - window.__benchStart : null;
+}"""
+
+RESULT_JS = """() => {
+  const done = [...document.querySelectorAll('span')].some((el) => el.textContent === 'Done');
+  const failed = [...document.querySelectorAll('span.text-destructive')].length > 0;
+  return (done || failed) ? { elapsed: performance.now() - window.__benchStart, failed } : null;
+}"""
+
+
+# ==========================================
+# Corpus
+# ==========================================
+
+def find_font(kind):
+    for path in FONT_CANDIDATES[kind]:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_font(kind, size):
+    from PIL import ImageFont
+
+    path = find_font(kind)
+    if path:
+        return ImageFont.truetype(path, size)
+    if kind != 'latin':
+        return None
+    try:
+        # Pillow >= 10.1 ships a scalable default font
+        return ImageFont.load_default(size=size)
+    except TypeError:
+        return ImageFont.load_default()
+
+
+def render_text_image(path, lines, font, width, height, margin=40):
+    from PIL import Image, ImageDraw
+
+    img = Image.new('RGB', (width, height), color='white')
+    draw = ImageDraw.Draw(img)
+    y = margin
+    for line in lines:
+        draw.text((margin, y), line, fill='black', font=font)
+        bbox = draw.textbbox((margin, y), line, font=font)
+        y += int((bbox[3] - bbox[1]) * 1.6) + 4
+    img.save(path)
+
+
+def render_table_image(path, rows, font, cell_width, cell_height):
+    from PIL import Image, ImageDraw
+
+    margin = 30
+    width = margin * 2 + cell_width * len(rows[0])
+    height = margin * 2 + cell_height * len(rows)
+    img = Image.new('RGB', (width, height), color='white')
+    draw = ImageDraw.Draw(img)
+    for r, row in enumerate(rows):
+        for c, cell in enumerate(row):
+            x = margin + c * cell_width
+            y = margin + r * cell_height
+            draw.rectangle([x, y, x + cell_width, y + cell_height], outline='black', width=2)
+            draw.text((x + 12, y + cell_height // 4), cell, fill='black', font=font)
+    img.save(path)
+
+
+def build_corpus(selected=None):
+    """Generate the benchmark images. Returns a list of case dicts with the
+    ground-truth text; cases whose font is unavailable are skipped."""
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        raise SystemExit('PIL is required to generate the benchmark corpus')
+
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    paragraph = [
+        'The quick brown fox jumps over the lazy dog',
+        'Invoice 2024-0117 total amount 1,234.56 USD',
+        'Pack my box with five dozen liquor jugs',
+        'Sphinx of black quartz judge my vow 0987654321',
+    ]
+    specs = [
+        # name, language, UI language label, font kind, lines, size, font size
+        ('eng-small', 'eng', 'English', 'latin', paragraph[:1], (500, 120), 22),
+        ('eng-medium', 'eng', 'English', 'latin', paragraph[:2], (1400, 360), 40),
+        ('eng-large', 'eng', 'English', 'latin', paragraph, (3200, 2000), 72),
+        ('deu-medium', 'deu', 'German', 'latin',
+         ['Größere Übungen für Bücher', 'Straße und Prüfung heute'], (1400, 360), 40),
+        ('fra-medium', 'fra', 'French', 'latin',
+         ['Le garçon a déjà mangé', 'Très bientôt à la fenêtre'], (1400, 360), 40),
+        ('spa-medium', 'spa', 'Spanish', 'latin',
+         ['El niño comió mañana', 'Canción de la montaña'], (1400, 360), 40),
+        ('chi_sim-medium', 'chi_sim', 'Chinese (Simplified)', 'cjk',
+         ['图像文字识别测试', '今天天气很好'], (1200, 360), 56),
+    ]
+
+    cases = []
+    for name, language, label, font_kind, lines, (width, height), font_size in specs:
+        if selected and name not in selected:
+            continue
+        font = load_font(font_kind, font_size)
+        if font is None:
+            print(f"  - skipping {name}: no {font_kind} font found")
+            continue
+        path = os.path.join(CORPUS_DIR, f'{name}.png')
+        render_text_image(path, lines, font, width, height)
+        cases.append({'name': name, 'language': language, 'label': label,
+                      'kind': 'text', 'path': path, 'truth': '\n'.join(lines)})
+
+    table_rows = [
+        ['Item', 'Qty', 'Price'],
+        ['Apples', '12', '3.40'],
+        ['Bread', '2', '5.10'],
+        ['Coffee', '1', '11.99'],
+    ]
+    if not selected or 'eng-table' in selected:
+        font = load_font('latin', 32)
+        path = os.path.join(CORPUS_DIR, 'eng-table.png')
+        render_table_image(path, table_rows, font, 260, 70)
+        cases.append({'name': 'eng-table', 'language': 'eng', 'label': 'English',
+                      'kind': 'table', 'path': path,
+                      'truth': '\n'.join(' '.join(row) for row in table_rows)})
+
+    return cases
+
+
+# ==========================================
+# Accuracy
+# ==========================================
+
+def edit_distance(reference, hypothesis):
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref_item in enumerate(reference, 1):
+        current = [i]
+        for j, hyp_item in enumerate(hypothesis, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_item != hyp_item),
+            ))
+        previous = current
+    return previous[-1]
+
+
+def normalize(text):
+    return ' '.join(text.split())
+
+
+def error_rates(truth, output, by_char=False):
+    reference = normalize(truth)
+    hypothesis = normalize(output)
+    if by_char:
+        # CJK has no word spaces (Tesseract inserts some anyway); score
+        # "words" per character
+        reference = reference.replace(' ', '')
+        hypothesis = hypothesis.replace(' ', '')
+        ref_words, hyp_words = list(reference), list(hypothesis)
+    else:
+        ref_words, hyp_words = reference.split(), hypothesis.split()
+    cer = edit_distance(reference, hypothesis) / max(1, len(reference))
+    wer = edit_distance(ref_words, hyp_words) / max(1, len(ref_words))
+    return round(cer, 4), round(wer, 4)
+
+
+# ==========================================
+# Runners
+# ==========================================
+
+def select_language(page, label):
+    trigger = page.locator('button[role="combobox"]').first
+    trigger.click()
+    page.locator(f'[role="option"]:has-text("{label}")').first.click()
+
+
+def run_browser_case(browser, base_url, case, timeout_ms):
+    # Fresh context per run: the OCR result cache lives in IndexedDB
+    context = browser.new_context(viewport={'width': 1280, 'height': 800})
+    page = context.new_page()
+    cdp = context.new_cdp_session(page)
+    cdp.send('Performance.enable')
+
+    try:
+        page.goto(base_url, timeout=30000)
+        page.wait_for_load_state('networkidle', timeout=15000)
+        select_language(page, case['label'])
+        page.locator('input[type="file"]').set_input_files(case['path'])
+        convert = page.locator('button:has-text("Convert")')
+        convert.wait_for(state='visible', timeout=10000)
+
+        page.evaluate('window.__benchStart = performance.now()')
+        convert.click()
+
+        first = page.wait_for_function(FIRST_PROGRESS_JS, timeout=timeout_ms, polling=50)
+        first_progress = first.json_value()
+        done = page.wait_for_function(RESULT_JS, timeout=timeout_ms, polling=50).json_value()
+
+        metrics = {m['name']: m['value'] for m in cdp.send('Performance.getMetrics')['metrics']}
+        if done['failed']:
+            return {'error': 'OCR failed in page'}
+
+        output = page.locator('p.whitespace-pre-wrap').first.inner_text(timeout=10000)
+        cer, wer = error_rates(case['truth'], output, case['language'] in CJK_LANGUAGES)
+        return {
+            'time_to_first_progress_ms': round(first_progress, 1),
+            'time_to_result_ms': round(done['elapsed'], 1),
+            'cer': cer,
+            'wer': wer,
+            'js_heap_bytes': int(metrics.get('JSHeapUsedSize', 0)),
+            'output': output[:200],
+        }
+    except Exception as e:
+        return {'error': str(e)[:200]}
+    finally:
+        context.close()
+
+
+def run_api_case(base_url, api_key, case, timeout_s):
+    # A unique copy per run keeps the server's result cache cold, like the
+    # fresh browser context does for the browser path
+    with open(case['path'], 'rb') as f:
+        body, content_type = build_multipart(make_unique(f.read()),
+                                             os.path.basename(case['path']), case['language'])
+    req = urllib.request.Request(f'{base_url}/api/v1/ocr', data=body, method='POST')
+    req.add_header('x-api-key', api_key)
+    req.add_header('Content-Type', content_type)
+
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout_s) as resp:
+            # urlopen returns once the status line and headers have arrived
+            first_byte = time.perf_counter() - start
+            payload = json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return {'error': f'HTTP {e.code}'}
+    except Exception as e:
+        return {'error': str(e)[:200]}
+    elapsed = time.perf_counter() - start
+
+    output = payload.get('data', {}).get('text', '')
+    cer, wer = error_rates(case['truth'], output, case['language'] in CJK_LANGUAGES)
+    return {
+        'time_to_first_progress_ms': round(first_byte * 1000, 1),
+        'time_to_result_ms': round(elapsed * 1000, 1),
+        'cer': cer,
+        'wer': wer,
+        'js_heap_bytes': None,
+        'output': output[:200],
+    }
+
+
+def aggregate(runs):
+    """Median of each metric over the successful runs."""
+    ok = [r for r in runs if 'error' not in r]
+    if not ok:
+        return {'error': runs[-1]['error'], 'runs': len(runs)}
+
+    result = {'runs': len(runs), 'failed_runs': len(runs) - len(ok), 'output': ok[-1]['output']}
+    for key in ('time_to_first_progress_ms', 'time_to_result_ms', 'cer', 'wer', 'js_heap_bytes'):
+        values = [r[key] for r in ok if r[key] is not None]
+        result[key] = statistics.median(values) if values else None
+    return result
+
+
+# ==========================================
+# Baseline comparison
+# ==========================================
+
+def compare(report, baseline, args):
+    current = {(r['case'], r['mode']): r for r in report['results']}
+    regressions = []
+
+    for base in baseline['results']:
+        key = (base['case'], base['mode'])
+        now = current.get(key)
+        label = f"{base['case']} [{base['mode']}]"
+        if now is None:
+            continue
+        if 'error' in now:
+            if 'error' not in base:
+                regressions.append(f"{label}: now failing ({now['error']})")
+            continue
+        if 'error' in base:
+            continue
+
+        for metric in ('time_to_first_progress_ms', 'time_to_result_ms'):
+            if base.get(metric) is None or now.get(metric) is None:
+                continue
+            limit = base[metric] * (1 + args.time_tolerance) + args.time_slack_ms
+            if now[metric] > limit:
+                regressions.append(f"{label}: {metric} {now[metric]:.0f} > {limit:.0f} "
+                                   f"(baseline {base[metric]:.0f})")
+        for metric in ('cer', 'wer'):
+            limit = base[metric] + args.accuracy_tolerance
+            if now[metric] > limit:
+                regressions.append(f"{label}: {metric} {now[metric]:.3f} > {limit:.3f} "
+                                   f"(baseline {base[metric]:.3f})")
+        if base.get('js_heap_bytes') and now.get('js_heap_bytes'):
+            limit = base['js_heap_bytes'] * (1 + args.memory_tolerance)
+            if now['js_heap_bytes'] > limit:
+                regressions.append(f"{label}: js_heap_bytes {now['js_heap_bytes'] / 1e6:.1f}MB "
+                                   f"> {limit / 1e6:.1f}MB")
+
+    return regressions
+
+
+def print_summary(report):
+    print("\n" + "="*90)
+    print("OCR BENCHMARK")
+    print("="*90)
+    print(f"{'case':<16}{'mode':<9}{'first(ms)':>11}{'result(ms)':>12}{'CER':>8}{'WER':>8}{'heap(MB)':>10}")
+    for r in report['results']:
+        if 'error' in r:
+            print(f"{r['case']:<16}{r['mode']:<9}  ERROR: {r['error'][:60]}")
+            continue
+        first = f"{r['time_to_first_progress_ms']:.0f}" if r['time_to_first_progress_ms'] else '-'
+        heap = f"{r['js_heap_bytes'] / 1e6:.1f}" if r['js_heap_bytes'] else '-'
+        print(f"{r['case']:<16}{r['mode']:<9}{first:>11}{r['time_to_result_ms']:>12.0f}"
+              f"{r['cer']:>8.3f}{r['wer']:>8.3f}{heap:>10}")
+    print("="*90)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark OCR speed and accuracy')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--api-key', default=os.environ.get('OCR_API_KEY', ''))
+    parser.add_argument('--modes', default='browser', help='Comma-separated: browser,api')
+    parser.add_argument('--cases', help='Comma-separated case names (default: all)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per case; medians are reported')
+    parser.add_argument('--timeout', type=float, default=120, help='Per-run timeout in seconds')
+    parser.add_argument('--report', default=DEFAULT_REPORT)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--update-baseline', action='store_true')
+    parser.add_argument('--require-baseline', action='store_true',
+                        help='Exit non-zero when no baseline exists to compare against')
+    parser.add_argument('--time-tolerance', type=float, default=0.25,
+                        help='Allowed relative slowdown (0.25 = 25%%)')
+    parser.add_argument('--time-slack-ms', type=float, default=250,
+                        help='Absolute slack added to time limits, for tiny cases')
+    parser.add_argument('--accuracy-tolerance', type=float, default=0.02,
+                        help='Allowed absolute increase in CER/WER')
+    parser.add_argument('--memory-tolerance', type=float, default=0.3)
+    args = parser.parse_args()
+
+    # Fail before spending a full run when there is nothing to compare to
+    if args.require_baseline and not args.update_baseline and not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        sys.exit(1)
+
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    if 'api' in modes and not args.api_key:
+        raise SystemExit('--api-key (or OCR_API_KEY) is required for the api mode')
+
+    print("Generating corpus...")
+    cases = build_corpus(set(args.cases.split(',')) if args.cases else None)
+    print(f"  {len(cases)} cases in {CORPUS_DIR}")
+
+    results = []
+    if 'browser' in modes:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            for case in cases:
+                print(f"  browser: {case['name']}")
+                runs = [run_browser_case(browser, args.base_url, case, args.timeout * 1000)
+                        for _ in range(args.runs)]
+                results.append({'case': case['name'], 'mode': 'browser',
+                                'language': case['language'], 'kind': case['kind'],
+                                **aggregate(runs)})
+            browser.close()
+
+    if 'api' in modes:
+        for case in cases:
+            print(f"  api: {case['name']}")
+            runs = [run_api_case(args.base_url, args.api_key, case, args.timeout)
+                    for _ in range(args.runs)]
+            results.append({'case': case['name'], 'mode': 'api',
+                            'language': case['language'], 'kind': case['kind'],
+                            **aggregate(runs)})
+
+    report = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'base_url': args.base_url,
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+    with open(args.report, 'w') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print_summary(report)
+    print(f"Report written to {args.report}")
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        baseline = {**report, 'results': [
+            {k: v for k, v in r.items() if k != 'output'} for r in results
+        ]}
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, ensure_ascii=False)
+        print(f"Baseline updated: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(report, baseline, args)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against {args.baseline}:")
+        for line in regressions:
+            print(f"  ✗ {line}")
+        sys.exit(1)
+    print(f"\n✓ No regressions against {args.baseline}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+"""Load test for the /api/v1/ocr endpoint.
+
+Fires concurrent multipart requests at the API and reports latency
+percentiles and throughput. Every request carries a slightly different
+image so the server's result cache doesn't answer it; pass --same-image
+to measure cache hits instead.
+
+Usage:
+    python load_test_ocr.py --api-key YOUR_KEY --requests 200 --concurrency 16
+"""
+import argparse
+import os
+import struct
+import time
+import uuid
+import zlib
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_URL = 'http://localhost:3000/api/v1/ocr'
+TEST_IMAGE_PATH = '/tmp/test_load_ocr_image.png'
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+PNG_IEND = b'\x00\x00\x00\x00IEND\xaeB`\x82'
+
+
+def create_test_image(path):
+    try:
+        from PIL import Image, ImageDraw
+    except ImportError:
+        raise SystemExit('PIL is required to generate the test image (or pass --image)')
+
+    img = Image.new('RGB', (800, 200), color='white')
+    draw = ImageDraw.Draw(img)
+    draw.text((40, 60), "Load Test 12345 The quick brown fox", fill='black')
+    img.save(path)
+    return path
+
+
+def make_unique(image_bytes):
+    """Return the image with a random nonce added to its bytes.
+
+    Results are cached by content hash, so identical uploads never reach
+    the queue. PNGs get a tEXt chunk before IEND; other formats get the
+    nonce appended after the image data, which decoders ignore.
+    """
+    nonce = uuid.uuid4().hex.encode()
+    if image_bytes.startswith(PNG_SIGNATURE) and image_bytes.endswith(PNG_IEND):
+        data = b'nonce\x00' + nonce
+        chunk = (struct.pack('>I', len(data)) + b'tEXt' + data
+                 + struct.pack('>I', zlib.crc32(b'tEXt' + data)))
+        return image_bytes[:-len(PNG_IEND)] + chunk + PNG_IEND
+    return image_bytes + nonce
+
+
+def build_multipart(image_bytes, filename, language):
+    boundary = uuid.uuid4().hex
+    parts = [
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="language"\r\n\r\n'
+        f'{language}\r\n'.encode(),
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="image"; filename="{filename}"\r\n'
+        f'Content-Type: image/png\r\n\r\n'.encode(),
+        image_bytes,
+        f'\r\n--{boundary}--\r\n'.encode(),
+    ]
+    return b''.join(parts), f'multipart/form-data; boundary={boundary}'
+
+
+def send_request(url, api_key, body, content_type, timeout):
+    req = urllib.request.Request(url, data=body, method='POST')
+    req.add_header('x-api-key', api_key)
+    req.add_header('Content-Type', content_type)
+
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except Exception:
+        status = 0
+    return status, time.perf_counter() - start
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lower = int(k)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (k - lower)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the OCR API')
+    parser.add_argument('--url', default=DEFAULT_URL)
+    parser.add_argument('--api-key', default=os.environ.get('OCR_API_KEY', ''))
+    parser.add_argument('--image', help='Image to upload (generated if omitted)')
+    parser.add_argument('--language', default='eng')
+    parser.add_argument('--requests', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--timeout', type=float, default=60)
+    parser.add_argument('--same-image', action='store_true',
+                        help='Send identical bytes every time (measures cache hits)')
+    args = parser.parse_args()
+
+    image_path = args.image or create_test_image(TEST_IMAGE_PATH)
+    with open(image_path, 'rb') as f:
+        image_bytes = f.read()
+    filename = os.path.basename(image_path)
+
+    def send():
+        # Built per request so memory stays flat for large runs
+        payload = image_bytes if args.same_image else make_unique(image_bytes)
+        body, content_type = build_multipart(payload, filename, args.language)
+        return send_request(args.url, args.api_key, body, content_type, args.timeout)
+
+    print(f"Sending {args.requests} requests to {args.url} "
+          f"with concurrency {args.concurrency}...")
+
+    results = []
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        futures = [pool.submit(send) for _ in range(args.requests)]
+        for future in as_completed(futures):
+            results.append(future.result())
+    elapsed = time.perf_counter() - started
+
+    status_counts = {}
+    for status, _ in results:
+        status_counts[status] = status_counts.get(status, 0) + 1
+
+    ok_latencies = sorted(latency for status, latency in results if status == 200)
+
+    print("\n" + "="*60)
+    print("LOAD TEST SUMMARY")
+    print("="*60)
+    print(f"Total time:   {elapsed:.2f}s")
+    print(f"Throughput:   {len(ok_latencies) / elapsed:.2f} successful req/s "
+          f"({len(results) / elapsed:.2f} total req/s)")
+    print("Status codes: " + ", ".join(
+        f"{code or 'conn-error'}={count}" for code, count in sorted(status_counts.items())))
+    if ok_latencies:
+        print(f"Latency p50:  {percentile(ok_latencies, 50) * 1000:.0f} ms")
+        print(f"Latency p95:  {percentile(ok_latencies, 95) * 1000:.0f} ms")
+        print(f"Latency p99:  {percentile(ok_latencies, 99) * 1000:.0f} ms")
+        print(f"Latency max:  {ok_latencies[-1] * 1000:.0f} ms")
+    else:
+        print("No successful requests")
+    print("="*60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+// Benchmark for the table layout engine on synthetic OCR word lists.
+//
+//   node --experimental-strip-types scripts/bench-table-layout.ts [scale]
+//
+// Generates pages of stacked tables (10k-100k words) at the given render
+// scale, checks that the expected grid is recovered and prints the time per
+// 1k words, which should stay roughly flat as the input grows.
+
+import { detectTables, type LayoutWord } from "../src/lib/convert/table-layout.ts";
+
+const SIZES = [10_000, 25_000, 50_000, 100_000];
+const COLUMNS = 6;
+const ROWS_PER_TABLE = 200;
+const RUNS = 5;
+
+// Deterministic PRNG so runs are comparable
+function mulberry32(seed: number) {
+  return () => {
+    seed |= 0;
+    seed = (seed + 0x6d2b79f5) | 0;
+    let t = Math.imul(seed ^ (seed >>> 15), 1 | seed);
+    t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+    return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+  };
+}
+
+function generateWords(count: number, scale: number, seed = 1): LayoutWord[] {
+  const random = mulberry32(seed);
+  const glyph = 12 * scale;
+  const charWidth = 6 * scale;
+  const columnWidth = 140 * scale;
+  const rowHeight = glyph * 1.6;
+  const words: LayoutWord[] = [];
+
+  let top = 0;
+  let row = 0;
+  while (words.length < count) {
+    if (row > 0 && row % ROWS_PER_TABLE === 0) top += glyph * 5; // next table
+    const jitter = () => (random() - 0.5) * glyph * 0.2;
+
+    for (let column = 0; column < COLUMNS && words.length < count; column++) {
+      // One or two words per cell, always narrower than the column
+      let x = column * columnWidth + random() * 4 * scale;
+      const parts = random() < 0.3 ? 2 : 1;
+      for (let part = 0; part < parts; part++) {
+        const length = 2 + Math.floor(random() * 6);
+        const y0 = top + jitter();
+        words.push({
+          text: `r${row}c${column}`,
+          bbox: { x0: x, y0, x1: x + length * charWidth, y1: y0 + glyph },
+        });
+        x += (length + 1) * charWidth;
+      }
+    }
+
+    top += rowHeight;
+    row++;
+  }
+
+  // OCR output isn't guaranteed to be in reading order
+  for (let i = words.length - 1; i > 0; i--) {
+    const j = Math.floor(random() * (i + 1));
+    [words[i], words[j]] = [words[j], words[i]];
+  }
+  return words;
+}
+
+const scale = Number(process.argv[2] ?? 1) || 1;
+console.log(`Render scale ${scale}x, ${COLUMNS} columns, ${ROWS_PER_TABLE} rows per table`);
+console.log("words      tables  columns  median ms  ms/1k words");
+
+let baseline = 0;
+for (const size of SIZES) {
+  const words = generateWords(size, scale);
+  detectTables(words); // warm up
+
+  const times: number[] = [];
+  let tables = detectTables(words);
+  for (let run = 0; run < RUNS; run++) {
+    const startedAt = performance.now();
+    tables = detectTables(words);
+    times.push(performance.now() - startedAt);
+  }
+  times.sort((a, b) => a - b);
+  const median = times[RUNS >> 1];
+  const perThousand = median / (size / 1000);
+  if (!baseline) baseline = perThousand;
+
+  const columns = new Set(tables.map((table) => table.boundaries.length + 1));
+  console.log(
+    `${String(size).padEnd(10)} ${String(tables.length).padEnd(7)} ${[...columns]
+      .join(",")
+      .padEnd(8)} ${median.toFixed(1).padStart(9)}  ${perThousand.toFixed(3)} (${(
+      perThousand / baseline
+    ).toFixed(2)}x)`
+  );
+
+  if (columns.size !== 1 || !columns.has(COLUMNS)) {
+    console.error(`Expected ${COLUMNS} columns in every table`);
+    process.exitCode = 1;
+  }
+}
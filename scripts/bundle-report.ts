@@ -0,0 +1,122 @@
+// First-load JS per route, from a finished `next build`.
+//
+//   node --experimental-strip-types scripts/bundle-report.ts [--save file] [--compare file]
+//
+// Reads every pre-rendered page under .next/server/app, collects the
+// scripts its HTML loads up front and sums their raw and gzipped sizes.
+// Chunks loaded later (lazy locales, dynamic imports) are not counted, which
+// is the point. --save writes the numbers as JSON; --compare prints the
+// change against a saved report, e.g. one taken on the main branch.
+
+import { existsSync, readFileSync, readdirSync, writeFileSync } from "node:fs";
+import path from "node:path";
+import { gzipSync } from "node:zlib";
+
+interface RouteSize {
+  scripts: number;
+  raw: number;
+  gzip: number;
+}
+
+type Report = Record<string, RouteSize>;
+
+const NEXT_DIR = path.resolve(".next");
+const APP_DIR = path.join(NEXT_DIR, "server", "app");
+// Deployment ids may be appended as a query string
+const SCRIPT_SRC = /<script[^>]*\ssrc="([^"?]+\.js)(?:\?[^"]*)?"/g;
+
+function parseArgs(argv: string[]) {
+  const options: { save?: string; compare?: string } = {};
+  for (let i = 0; i < argv.length; i++) {
+    if (argv[i] === "--save") options.save = argv[++i];
+    else if (argv[i] === "--compare") options.compare = argv[++i];
+  }
+  return options;
+}
+
+function* htmlFiles(dir: string): Generator<string> {
+  for (const entry of readdirSync(dir, { withFileTypes: true })) {
+    const full = path.join(dir, entry.name);
+    if (entry.isDirectory()) yield* htmlFiles(full);
+    else if (entry.name.endsWith(".html")) yield full;
+  }
+}
+
+function routeOf(file: string): string {
+  const route = path.relative(APP_DIR, file).replace(/\\/g, "/").replace(/\.html$/, "");
+  return route === "index" ? "/" : `/${route}`;
+}
+
+// Sizes are memoised; most chunks are shared by every route
+const chunkSizes = new Map<string, { raw: number; gzip: number }>();
+
+function chunkSize(src: string): { raw: number; gzip: number } {
+  let size = chunkSizes.get(src);
+  if (!size) {
+    const relative = decodeURIComponent(src.replace(/^.*?\/_next\//, ""));
+    const file = path.join(NEXT_DIR, relative);
+    const data = existsSync(file) ? readFileSync(file) : Buffer.alloc(0);
+    size = { raw: data.length, gzip: data.length > 0 ? gzipSync(data, { level: 9 }).length : 0 };
+    chunkSizes.set(src, size);
+  }
+  return size;
+}
+
+function measure(): Report {
+  const report: Report = {};
+  for (const file of htmlFiles(APP_DIR)) {
+    const html = readFileSync(file, "utf8");
+    const scripts = new Set(Array.from(html.matchAll(SCRIPT_SRC), (match) => match[1]));
+    const total: RouteSize = { scripts: scripts.size, raw: 0, gzip: 0 };
+    for (const src of scripts) {
+      const { raw, gzip } = chunkSize(src);
+      total.raw += raw;
+      total.gzip += gzip;
+    }
+    report[routeOf(file)] = total;
+  }
+  return report;
+}
+
+function kb(bytes: number): string {
+  return `${(bytes / 1024).toFixed(1)} kB`;
+}
+
+function delta(bytes: number): string {
+  if (bytes === 0) return "";
+  return `${bytes > 0 ? "+" : "-"}${kb(Math.abs(bytes))}`;
+}
+
+function main() {
+  const options = parseArgs(process.argv.slice(2));
+  if (!existsSync(APP_DIR)) {
+    console.error("No build output found; run `next build` first.");
+    process.exit(1);
+  }
+
+  const report = measure();
+  const baseline: Report | null = options.compare
+    ? JSON.parse(readFileSync(options.compare, "utf8"))
+    : null;
+
+  const routes = Object.keys(report).sort();
+  const width = Math.max(5, ...routes.map((route) => route.length));
+  console.log(
+    `${"Route".padEnd(width)}  ${"Scripts".padStart(7)}  ${"Raw".padStart(10)}  ${"Gzip".padStart(10)}${baseline ? "  Gzip change" : ""}`
+  );
+  for (const route of routes) {
+    const { scripts, raw, gzip } = report[route];
+    const before = baseline?.[route];
+    const change = baseline ? `  ${before ? delta(gzip - before.gzip) : "new"}` : "";
+    console.log(
+      `${route.padEnd(width)}  ${String(scripts).padStart(7)}  ${kb(raw).padStart(10)}  ${kb(gzip).padStart(10)}${change}`
+    );
+  }
+
+  if (options.save) {
+    writeFileSync(options.save, `${JSON.stringify(report, null, 2)}\n`);
+    console.log(`\nSaved to ${options.save}`);
+  }
+}
+
+main();
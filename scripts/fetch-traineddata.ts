@@ -0,0 +1,61 @@
+// Self-host the Tesseract language data.
+//
+//   npm run tessdata [-- lang ...]
+//
+// Downloads the traineddata for every UI language (or just the ones named)
+// into public/tessdata/<version>, which the browser loads before falling
+// back to the CDN. This is an explicit step for deployments that want to
+// serve the files themselves; builds do not run it. Files already present
+// are kept, and failures only warn: the app still works from the CDN.
+
+import { existsSync, mkdirSync, writeFileSync } from "node:fs";
+import path from "node:path";
+import {
+  TESSDATA_LANGUAGES,
+  TESSDATA_PATH,
+  tessdataCdnUrl,
+  tessdataFileName,
+} from "../src/lib/ocr/tessdata.ts";
+
+const OUTPUT_DIR = path.resolve("public", TESSDATA_PATH);
+
+async function fetchLanguage(lang: string): Promise<boolean> {
+  const file = path.join(OUTPUT_DIR, tessdataFileName(lang));
+  if (existsSync(file)) return true;
+
+  try {
+    const response = await fetch(tessdataCdnUrl(lang));
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    const data = Buffer.from(await response.arrayBuffer());
+    writeFileSync(file, data);
+    console.log(`${lang}: ${(data.length / 1024 / 1024).toFixed(1)} MB`);
+    return true;
+  } catch (error) {
+    console.warn(`${lang}: download failed (${error instanceof Error ? error.message : error})`);
+    return false;
+  }
+}
+
+async function main() {
+  const requested = process.argv.slice(2);
+  const unknown = requested.filter((lang) => !TESSDATA_LANGUAGES.includes(lang));
+  if (unknown.length > 0) {
+    console.error(`Unknown languages: ${unknown.join(", ")}`);
+    process.exit(1);
+  }
+
+  mkdirSync(OUTPUT_DIR, { recursive: true });
+  const languages = requested.length > 0 ? requested : TESSDATA_LANGUAGES;
+  let failed = 0;
+  // A few at a time; the CJK files are large
+  for (let i = 0; i < languages.length; i += 4) {
+    const results = await Promise.all(languages.slice(i, i + 4).map(fetchLanguage));
+    failed += results.filter((ok) => !ok).length;
+  }
+
+  if (failed > 0) {
+    console.warn(`${failed} language(s) missing from ${OUTPUT_DIR}; browsers will use the CDN for those.`);
+  }
+}
+
+main();
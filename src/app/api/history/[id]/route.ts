@@ -0,0 +1,59 @@
+import { NextRequest, NextResponse } from "next/server";
+import { createClient } from "@/lib/supabase/server";
+
+export const runtime = "nodejs";
+
+// Full text of a single conversion, fetched when a history item is opened
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ id: string }> }
+) {
+  try {
+    const supabase = await createClient();
+
+    const { data: { user }, error: authError } = await supabase.auth.getUser();
+
+    if (authError || !user) {
+      return NextResponse.json(
+        { error: "Unauthorized" },
+        { status: 401 }
+      );
+    }
+
+    const { id } = await params;
+
+    const { data, error } = await supabase
+      .from("conversions")
+      .select("id, output_text")
+      .eq("id", id)
+      .eq("user_id", user.id)
+      .maybeSingle();
+
+    if (error) {
+      console.error("Error fetching conversion:", error);
+      return NextResponse.json(
+        { error: "Failed to fetch conversion" },
+        { status: 500 }
+      );
+    }
+
+    if (!data) {
+      return NextResponse.json(
+        { error: "Conversion not found" },
+        { status: 404 }
+      );
+    }
+
+    // Conversions are never edited, so the text can be cached by the browser
+    return NextResponse.json(
+      { id: data.id, output_text: data.output_text },
+      { headers: { "Cache-Control": "private, max-age=3600" } }
+    );
+  } catch (error) {
+    console.error("History API error:", error);
+    return NextResponse.json(
+      { error: "Internal server error" },
+      { status: 500 }
+    );
+  }
+}
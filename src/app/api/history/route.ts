@@ -1,12 +1,51 @@
+import { createHash } from "crypto";
 import { NextRequest, NextResponse } from "next/server";
+import { Timings } from "@/lib/metrics/timings";
 import { createClient } from "@/lib/supabase/server";
-import type { ConversionType } from "@/lib/supabase/database.types";
+import type { ConversionSummary, ConversionType } from "@/lib/supabase/database.types";
+
+export const runtime = "nodejs";
+
+// List rows carry a snippet and length; the full text is served by
+// /api/history/[id]
+const SUMMARY_COLUMNS = "id, type, input_filename, language, snippet, char_count, created_at";
+const DEFAULT_PAGE_SIZE = 20;
+const MAX_PAGE_SIZE = 100;
+const MAX_QUERY_LENGTH = 200;
+
+interface Cursor {
+  createdAt: string;
+  id: string;
+}
+
+// Opaque keyset cursor: the (created_at, id) of the last row on a page
+function encodeCursor(cursor: Cursor): string {
+  return Buffer.from(`${cursor.createdAt}|${cursor.id}`).toString("base64url");
+}
+
+function decodeCursor(value: string): Cursor | null {
+  const [createdAt, id] = Buffer.from(value, "base64url").toString().split("|");
+  if (!createdAt || !id || Number.isNaN(Date.parse(createdAt))) return null;
+  if (!/^[0-9a-f-]{36}$/i.test(id)) return null;
+  return { createdAt, id };
+}
+
+// Whole milliseconds, or null when the client didn't measure it
+function toProcessingTime(value: unknown): number | null {
+  return typeof value === "number" && Number.isFinite(value) && value >= 0
+    ? Math.round(value)
+    : null;
+}
+
+export async function GET(request: NextRequest) {
+  const timings = new Timings("history");
 
-export async function GET() {
   try {
     const supabase = await createClient();
 
-    const { data: { user }, error: authError } = await supabase.auth.getUser();
+    const { data: { user }, error: authError } = await timings.time("auth", () =>
+      supabase.auth.getUser()
+    );
 
     if (authError || !user) {
       return NextResponse.json(
@@ -15,12 +54,46 @@ export async function GET() {
       );
     }
 
-    const { data, error } = await supabase
+    const { searchParams } = new URL(request.url);
+    const limit = Math.min(
+      Math.max(1, Number(searchParams.get("limit")) || DEFAULT_PAGE_SIZE),
+      MAX_PAGE_SIZE
+    );
+    const search = searchParams.get("q")?.trim().slice(0, MAX_QUERY_LENGTH);
+    const cursorParam = searchParams.get("cursor");
+    const cursor = cursorParam ? decodeCursor(cursorParam) : null;
+
+    if (cursorParam && !cursor) {
+      return NextResponse.json(
+        { error: "Invalid cursor" },
+        { status: 400 }
+      );
+    }
+
+    // (created_at, id) descending matches idx_conversions_user_created, so
+    // every page is an index range scan however deep it is
+    let query = supabase
       .from("conversions")
-      .select("*")
+      .select(SUMMARY_COLUMNS)
       .eq("user_id", user.id)
       .order("created_at", { ascending: false })
-      .limit(50);
+      .order("id", { ascending: false })
+      .limit(limit + 1);
+
+    if (cursor) {
+      query = query.or(
+        `created_at.lt."${cursor.createdAt}",and(created_at.eq."${cursor.createdAt}",id.lt.${cursor.id})`
+      );
+    }
+
+    if (search) {
+      query = query.textSearch("search_vector", search, {
+        type: "websearch",
+        config: "simple",
+      });
+    }
+
+    const { data, error } = await timings.time("db", async () => await query);
 
     if (error) {
       console.error("Error fetching history:", error);
@@ -30,7 +103,27 @@ export async function GET() {
       );
     }
 
-    return NextResponse.json({ history: data });
+    const rows = (data ?? []) as ConversionSummary[];
+    const items = rows.slice(0, limit);
+    const last = items[items.length - 1];
+    const nextCursor =
+      rows.length > limit && last
+        ? encodeCursor({ createdAt: last.created_at, id: last.id })
+        : null;
+
+    const body = JSON.stringify({ history: items, nextCursor });
+    const etag = `W/"${createHash("sha1").update(body).digest("base64url")}"`;
+    // Private and always revalidated: an unchanged page costs a 304
+    const headers = { ETag: etag, "Cache-Control": "private, no-cache", ...timings.headers() };
+
+    const ifNoneMatch = request.headers.get("if-none-match");
+    if (ifNoneMatch?.split(/\s*,\s*/).includes(etag)) {
+      return new NextResponse(null, { status: 304, headers });
+    }
+
+    return new NextResponse(body, {
+      headers: { ...headers, "Content-Type": "application/json" },
+    });
   } catch (error) {
     console.error("History API error:", error);
     return NextResponse.json(
@@ -41,10 +134,14 @@ export async function GET() {
 }
 
 export async function POST(request: NextRequest) {
+  const timings = new Timings("history");
+
   try {
     const supabase = await createClient();
 
-    const { data: { user }, error: authError } = await supabase.auth.getUser();
+    const { data: { user }, error: authError } = await timings.time("auth", () =>
+      supabase.auth.getUser()
+    );
 
     if (authError || !user) {
       return NextResponse.json(
@@ -54,12 +151,14 @@ export async function POST(request: NextRequest) {
     }
 
     const body = await request.json();
-    const { type, input_filename, input_format, output_text, language } = body as {
+    const { type, input_filename, input_format, output_text, language, processing_time } = body as {
       type: ConversionType;
       input_filename: string;
       input_format: string;
       output_text: string;
       language: string;
+      // Client-measured conversion time in ms (OCRResult.timings.total)
+      processing_time?: number;
     };
 
     if (!type || !input_filename || !output_text) {
@@ -69,18 +168,21 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    const { data, error } = await supabase
-      .from("conversions")
-      .insert({
-        user_id: user.id,
-        type,
-        input_filename,
-        input_format: input_format || "unknown",
-        output_text,
-        language: language || "eng",
-      })
-      .select()
-      .single();
+    const { data, error } = await timings.time("db", async () =>
+      await supabase
+        .from("conversions")
+        .insert({
+          user_id: user.id,
+          type,
+          input_filename,
+          input_format: input_format || "unknown",
+          output_text,
+          language: language || "eng",
+          processing_time: toProcessingTime(processing_time),
+        })
+        .select(SUMMARY_COLUMNS)
+        .single()
+    );
 
     if (error) {
       console.error("Error saving conversion:", error);
@@ -90,7 +192,7 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    return NextResponse.json({ conversion: data });
+    return NextResponse.json({ conversion: data }, { headers: timings.headers() });
   } catch (error) {
     console.error("History API error:", error);
     return NextResponse.json(
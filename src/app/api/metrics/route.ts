@@ -0,0 +1,69 @@
+import { NextRequest, NextResponse } from "next/server";
+import { renderMetric, renderStageHistograms } from "@/lib/metrics/registry";
+import { getQueueStats } from "@/lib/ocr/server";
+import { cloudOCRCache, serverOCRCache } from "@/lib/ocr/server-cache";
+
+// Counters live in this process, so the worker pool and queue state must too
+export const runtime = "nodejs";
+
+// Scrapers must send "Authorization: Bearer <token>"; without a configured
+// token the endpoint is disabled rather than public
+const METRICS_TOKEN = process.env.METRICS_TOKEN;
+
+export async function GET(request: NextRequest) {
+  try {
+    if (!METRICS_TOKEN || request.headers.get("authorization") !== `Bearer ${METRICS_TOKEN}`) {
+      return NextResponse.json(
+        { error: "Unauthorized" },
+        { status: 401 }
+      );
+    }
+
+    const queue = getQueueStats();
+    const caches = { tesseract: serverOCRCache.stats, cloud: cloudOCRCache.stats };
+
+    const body = [
+      renderStageHistograms(),
+      renderMetric("ocr_queue_pending_jobs", "gauge", "OCR jobs queued or running", [
+        { value: queue.pendingJobs },
+      ]),
+      renderMetric("ocr_queue_max_pending_jobs", "gauge", "Queue size at which requests get 429", [
+        { value: queue.maxPendingJobs },
+      ]),
+      renderMetric("ocr_workers", "gauge", "Tesseract workers per language pool", [
+        { value: queue.workers },
+      ]),
+      renderMetric("ocr_job_duration_average_seconds", "gauge", "Moving average of OCR job time", [
+        { value: queue.averageJobMs / 1000 },
+      ]),
+      renderMetric(
+        "ocr_cache_hits_total",
+        "counter",
+        "OCR result cache hits by tier",
+        Object.entries(caches).flatMap(([cache, stats]) => [
+          { labels: { cache, tier: "memory" }, value: stats.memoryHits },
+          { labels: { cache, tier: "persistent" }, value: stats.persistentHits },
+        ])
+      ),
+      renderMetric(
+        "ocr_cache_misses_total",
+        "counter",
+        "OCR result cache misses",
+        Object.entries(caches).map(([cache, stats]) => ({ labels: { cache }, value: stats.misses }))
+      ),
+    ].join("\n\n");
+
+    return new NextResponse(`${body}\n`, {
+      headers: {
+        "Content-Type": "text/plain; version=0.0.4; charset=utf-8",
+        "Cache-Control": "no-store",
+      },
+    });
+  } catch (error) {
+    console.error("Metrics error:", error);
+    return NextResponse.json(
+      { error: "Internal server error" },
+      { status: 500 }
+    );
+  }
+}
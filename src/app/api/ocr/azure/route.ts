@@ -1,15 +1,26 @@
 import { NextResponse } from "next/server";
 import { createClient } from "@/lib/supabase/server";
+import { sha256Hex } from "@/lib/cache/hash";
+import { Timings, wantsTimings } from "@/lib/metrics/timings";
+import { getOCRCacheKey, isCloudLanguageHint } from "@/lib/ocr/cache";
+import { cloudOCRCache } from "@/lib/ocr/server-cache";
 
 const AZURE_ENDPOINT = process.env.AZURE_VISION_ENDPOINT;
 const AZURE_KEY = process.env.AZURE_VISION_KEY;
 
 export async function POST(request: Request) {
+  const timings = new Timings("azure");
+  // Results carry a Server-Timing header, and a timings field on request
+  const respond = (body: Record<string, unknown>, headers: Record<string, string> = {}) =>
+    NextResponse.json(wantsTimings(request) ? { ...body, timings: timings.toJSON() } : body, {
+      headers: { ...headers, ...timings.headers() },
+    });
+
   try {
     const supabase = await createClient();
     const {
       data: { user },
-    } = await supabase.auth.getUser();
+    } = await timings.time("auth", () => supabase.auth.getUser());
 
     if (!user) {
       return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
@@ -22,6 +33,7 @@ export async function POST(request: Request) {
       );
     }
 
+    const parseStartedAt = performance.now();
     const formData = await request.formData();
     const file = formData.get("file") as File;
     const language = formData.get("language") as string || "en";
@@ -30,58 +42,73 @@ export async function POST(request: Request) {
       return NextResponse.json({ error: "No file provided" }, { status: 400 });
     }
 
-    const arrayBuffer = await file.arrayBuffer();
-    const buffer = Buffer.from(arrayBuffer);
-
-    const analyzeUrl = `${AZURE_ENDPOINT}/vision/v3.2/read/analyze?language=${language}`;
-
-    const analyzeResponse = await fetch(analyzeUrl, {
-      method: "POST",
-      headers: {
-        "Ocp-Apim-Subscription-Key": AZURE_KEY,
-        "Content-Type": "application/octet-stream",
-      },
-      body: buffer,
-    });
-
-    if (!analyzeResponse.ok) {
-      throw new Error(`Azure API error: ${analyzeResponse.statusText}`);
+    if (!isCloudLanguageHint(language)) {
+      return NextResponse.json({ error: `Unsupported language: ${language}` }, { status: 400 });
     }
 
-    const operationLocation = analyzeResponse.headers.get("Operation-Location");
+    const arrayBuffer = await file.arrayBuffer();
+    const buffer = Buffer.from(arrayBuffer);
+    timings.record("parse", performance.now() - parseStartedAt);
 
-    if (!operationLocation) {
-      throw new Error("No operation location returned");
+    // Identical images are answered from cache without another paid API call
+    const cacheKey = getOCRCacheKey(
+      await timings.time("hash", () => sha256Hex(buffer)),
+      "azure",
+      language
+    );
+    const cached = await timings.time("cache", () => cloudOCRCache.get(cacheKey));
+    if (cached) {
+      return respond(cached, { "X-Cache": "HIT" });
     }
 
-    let result = null;
-    let attempts = 0;
-    const maxAttempts = 30;
-
-    while (attempts < maxAttempts) {
-      await new Promise((resolve) => setTimeout(resolve, 1000));
+    const analyzeUrl = `${AZURE_ENDPOINT}/vision/v3.2/read/analyze?language=${language}`;
 
-      const resultResponse = await fetch(operationLocation, {
+    // Submission and polling together make up the cloud call
+    const result = await timings.time("cloud", async () => {
+      const analyzeResponse = await fetch(analyzeUrl, {
+        method: "POST",
         headers: {
           "Ocp-Apim-Subscription-Key": AZURE_KEY,
+          "Content-Type": "application/octet-stream",
         },
+        body: buffer,
       });
 
-      const resultData = await resultResponse.json();
+      if (!analyzeResponse.ok) {
+        throw new Error(`Azure API error: ${analyzeResponse.statusText}`);
+      }
+
+      const operationLocation = analyzeResponse.headers.get("Operation-Location");
 
-      if (resultData.status === "succeeded") {
-        result = resultData;
-        break;
-      } else if (resultData.status === "failed") {
-        throw new Error("OCR processing failed");
+      if (!operationLocation) {
+        throw new Error("No operation location returned");
       }
 
-      attempts++;
-    }
+      let attempts = 0;
+      const maxAttempts = 30;
+
+      while (attempts < maxAttempts) {
+        await new Promise((resolve) => setTimeout(resolve, 1000));
+
+        const resultResponse = await fetch(operationLocation, {
+          headers: {
+            "Ocp-Apim-Subscription-Key": AZURE_KEY,
+          },
+        });
+
+        const resultData = await resultResponse.json();
+
+        if (resultData.status === "succeeded") {
+          return resultData;
+        } else if (resultData.status === "failed") {
+          throw new Error("OCR processing failed");
+        }
+
+        attempts++;
+      }
 
-    if (!result) {
       throw new Error("OCR timeout");
-    }
+    });
 
     const extractedText = result.analyzeResult?.readResults
       ?.map((page: { lines: { text: string }[] }) =>
@@ -89,10 +116,13 @@ export async function POST(request: Request) {
       )
       .join("\n\n") || "";
 
-    return NextResponse.json({
+    const response = {
       text: extractedText,
       confidence: 0.95,
-    });
+    };
+
+    void cloudOCRCache.set(cacheKey, response);
+    return respond(response);
   } catch (error) {
     console.error("Azure OCR error:", error);
     return NextResponse.json(
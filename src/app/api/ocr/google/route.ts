@@ -1,9 +1,20 @@
 import { NextRequest, NextResponse } from "next/server";
+import { sha256Hex } from "@/lib/cache/hash";
+import { Timings, wantsTimings } from "@/lib/metrics/timings";
+import { getOCRCacheKey, isCloudLanguageHint } from "@/lib/ocr/cache";
+import { cloudOCRCache } from "@/lib/ocr/server-cache";
 
 const GOOGLE_VISION_API_KEY = process.env.GOOGLE_CLOUD_API_KEY;
 const GOOGLE_VISION_URL = `https://vision.googleapis.com/v1/images:annotate?key=${GOOGLE_VISION_API_KEY}`;
 
 export async function POST(request: NextRequest) {
+  const timings = new Timings("google");
+  // Results carry a Server-Timing header, and a timings field on request
+  const respond = (body: Record<string, unknown>, headers: Record<string, string> = {}) =>
+    NextResponse.json(wantsTimings(request) ? { ...body, timings: timings.toJSON() } : body, {
+      headers: { ...headers, ...timings.headers() },
+    });
+
   try {
     if (!GOOGLE_VISION_API_KEY) {
       return NextResponse.json(
@@ -12,6 +23,7 @@ export async function POST(request: NextRequest) {
       );
     }
 
+    const parseStartedAt = performance.now();
     const formData = await request.formData();
     const file = formData.get("image") as File | null;
     const languageHints = formData.get("language") as string | null;
@@ -23,8 +35,29 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Convert file to base64
+    if (languageHints && !isCloudLanguageHint(languageHints)) {
+      return NextResponse.json(
+        { error: `Unsupported language: ${languageHints}` },
+        { status: 400 }
+      );
+    }
+
     const bytes = await file.arrayBuffer();
+    timings.record("parse", performance.now() - parseStartedAt);
+
+    // Identical images are answered from cache without another paid API call
+    const cacheKey = getOCRCacheKey(
+      await timings.time("hash", () => sha256Hex(bytes)),
+      "google",
+      languageHints || "auto",
+      true
+    );
+    const cached = await timings.time("cache", () => cloudOCRCache.get(cacheKey));
+    if (cached) {
+      return respond(cached, { "X-Cache": "HIT" });
+    }
+
+    // Convert file to base64
     const base64 = Buffer.from(bytes).toString("base64");
 
     // Prepare request body
@@ -50,35 +83,37 @@ export async function POST(request: NextRequest) {
     };
 
     // Call Google Vision API
-    const response = await fetch(GOOGLE_VISION_URL, {
-      method: "POST",
-      headers: {
-        "Content-Type": "application/json",
-      },
-      body: JSON.stringify(requestBody),
+    const { ok, status, data } = await timings.time("cloud", async () => {
+      const response = await fetch(GOOGLE_VISION_URL, {
+        method: "POST",
+        headers: {
+          "Content-Type": "application/json",
+        },
+        body: JSON.stringify(requestBody),
+      });
+      return { ok: response.ok, status: response.status, data: await response.json() };
     });
 
-    if (!response.ok) {
-      const errorData = await response.json();
-      console.error("Google Vision API error:", errorData);
+    if (!ok) {
+      console.error("Google Vision API error:", data);
       return NextResponse.json(
         { error: "Google Vision API request failed" },
-        { status: response.status }
+        { status, headers: timings.headers() }
       );
     }
 
-    const data = await response.json();
-
     // Extract text from response
     const textAnnotations = data.responses?.[0]?.textAnnotations;
     const fullTextAnnotation = data.responses?.[0]?.fullTextAnnotation;
 
     if (!textAnnotations || textAnnotations.length === 0) {
-      return NextResponse.json({
+      const emptyResult = {
         text: "",
         confidence: 0,
         message: "No text detected in image",
-      });
+      };
+      void cloudOCRCache.set(cacheKey, emptyResult);
+      return respond(emptyResult);
     }
 
     // First annotation contains the full text
@@ -100,14 +135,17 @@ export async function POST(request: NextRequest) {
       }
     }
 
-    return NextResponse.json({
+    const result = {
       text: extractedText,
       confidence,
       words: textAnnotations.slice(1).map((annotation: { description: string; boundingPoly?: { vertices?: Array<{ x: number; y: number }> } }) => ({
         text: annotation.description,
         boundingBox: annotation.boundingPoly?.vertices,
       })),
-    });
+    };
+
+    void cloudOCRCache.set(cacheKey, result);
+    return respond(result);
   } catch (error) {
     console.error("Google Vision OCR error:", error);
     return NextResponse.json(
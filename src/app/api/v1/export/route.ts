@@ -0,0 +1,195 @@
+import { PassThrough, Readable } from "node:stream";
+import { NextRequest, NextResponse } from "next/server";
+import { validateApiKey } from "@/lib/api/keys";
+import { Timings } from "@/lib/metrics/timings";
+import { writeExcelStream } from "@/lib/convert/stream-excel";
+import { writeWordDocument } from "@/lib/convert/stream-docx";
+import { parseTableLine, XLSX_MIME_TYPE } from "@/lib/convert/to-excel";
+import { DOCX_MIME_TYPE } from "@/lib/convert/to-word";
+import type { ZipSink } from "@/lib/zip/writer";
+
+// ExcelJS's streaming writer needs Node.js streams
+export const runtime = "nodejs";
+
+// The request text is the only thing held in full; the documents themselves
+// are generated and sent incrementally
+const MAX_TEXT_LENGTH = 10 * 1024 * 1024;
+// Request body limit: the text plus room for the other fields and escaping
+const MAX_BODY_BYTES = MAX_TEXT_LENGTH + 64 * 1024;
+
+// Read the body as text, giving up (null) as soon as it passes `limit` bytes
+// so an oversized upload is never buffered in full
+async function readBodyText(request: Request, limit: number): Promise<string | null> {
+  const declared = Number(request.headers.get("content-length"));
+  if (declared > limit) return null;
+  if (!request.body) return "";
+
+  const reader = request.body.getReader();
+  const chunks: Uint8Array[] = [];
+  let size = 0;
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    size += value.byteLength;
+    if (size > limit) {
+      await reader.cancel();
+      return null;
+    }
+    chunks.push(value);
+  }
+
+  const bytes = new Uint8Array(size);
+  let offset = 0;
+  for (const chunk of chunks) {
+    bytes.set(chunk, offset);
+    offset += chunk.byteLength;
+  }
+  return new TextDecoder().decode(bytes);
+}
+
+// Lines of the text, produced lazily so rows are generated as they are written
+function* textLines(text: string): Generator<string> {
+  let start = 0;
+  while (start <= text.length) {
+    const end = text.indexOf("\n", start);
+    if (end === -1) {
+      yield text.slice(start);
+      return;
+    }
+    yield text.slice(start, end);
+    start = end + 1;
+  }
+}
+
+function* tableRows(text: string, parseTable: boolean): Generator<string[]> {
+  for (const line of textLines(text)) {
+    if (!parseTable) {
+      yield [line];
+      continue;
+    }
+    const cells = parseTableLine(line);
+    if (cells.length > 0) yield cells;
+  }
+}
+
+// Page-sized blocks (split on form feeds) for the DOCX writer
+function* textBlocks(text: string): Generator<string> {
+  let start = 0;
+  while (start < text.length) {
+    const end = text.indexOf("\f", start);
+    yield text.slice(start, end === -1 ? text.length : end);
+    if (end === -1) return;
+    start = end + 1;
+  }
+}
+
+function exportFilename(name: unknown, extension: string): string {
+  const base =
+    typeof name === "string"
+      ? name.replace(/\.[^.]*$/, "").replace(/[^\w.-]+/g, "_").slice(0, 100)
+      : "";
+  return `${base || "extracted"}.${extension}`;
+}
+
+export async function POST(request: NextRequest) {
+  const timings = new Timings("export");
+
+  try {
+    const apiKey = request.headers.get("x-api-key");
+    const validation = await timings.time("auth", () => validateApiKey(apiKey));
+
+    if (!validation.valid) {
+      return NextResponse.json(
+        { error: validation.error },
+        { status: validation.status ?? 401, headers: validation.headers }
+      );
+    }
+
+    const raw = await readBodyText(request, MAX_BODY_BYTES);
+    if (raw === null) {
+      return NextResponse.json(
+        { error: "Text is too large" },
+        { status: 413 }
+      );
+    }
+
+    const body = JSON.parse(raw);
+    const { format, text, filename } = body;
+
+    if (format !== "xlsx" && format !== "docx") {
+      return NextResponse.json(
+        { error: "format must be \"xlsx\" or \"docx\"" },
+        { status: 400 }
+      );
+    }
+    if (typeof text !== "string" || !text) {
+      return NextResponse.json(
+        { error: "Text is required" },
+        { status: 400 }
+      );
+    }
+    if (text.length > MAX_TEXT_LENGTH) {
+      return NextResponse.json(
+        { error: "Text is too large" },
+        { status: 413 }
+      );
+    }
+
+    // Documents are still being written when the headers go out, so the
+    // write stage only reaches /api/metrics
+    const writeTimings = new Timings(format);
+
+    if (format === "xlsx") {
+      const output = new PassThrough();
+      writeExcelStream(tableRows(text, body.parseTable !== false), output, {
+        sheetName: typeof body.sheetName === "string" ? body.sheetName : undefined,
+        timings: writeTimings,
+      }).catch((error) => {
+        console.error("XLSX export error:", error);
+        output.destroy(error);
+      });
+
+      return new Response(Readable.toWeb(output) as ReadableStream<Uint8Array>, {
+        headers: {
+          ...validation.headers,
+          ...timings.headers(),
+          "Content-Type": XLSX_MIME_TYPE,
+          "Content-Disposition": `attachment; filename="${exportFilename(filename, "xlsx")}"`,
+        },
+      });
+    }
+
+    const { readable, writable } = new TransformStream<Uint8Array, Uint8Array>();
+    const writer = writable.getWriter();
+    const sink: ZipSink = {
+      write: async (chunk) => {
+        await writer.write(chunk instanceof Blob ? new Uint8Array(await chunk.arrayBuffer()) : chunk);
+      },
+      close: () => writer.close(),
+    };
+
+    writeWordDocument(sink, textBlocks(text), {
+      title: typeof body.title === "string" ? body.title : undefined,
+      formatted: body.formatted !== false,
+      timings: writeTimings,
+    }).catch((error) => {
+      console.error("DOCX export error:", error);
+      writer.abort(error).catch(() => {});
+    });
+
+    return new Response(readable, {
+      headers: {
+        ...validation.headers,
+        ...timings.headers(),
+        "Content-Type": DOCX_MIME_TYPE,
+        "Content-Disposition": `attachment; filename="${exportFilename(filename, "docx")}"`,
+      },
+    });
+  } catch (error) {
+    console.error("API export error:", error);
+    return NextResponse.json(
+      { error: "Internal server error" },
+      { status: 500 }
+    );
+  }
+}
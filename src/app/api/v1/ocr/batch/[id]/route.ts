@@ -0,0 +1,44 @@
+import { NextRequest, NextResponse } from "next/server";
+import { validateApiKey } from "@/lib/api/keys";
+import { getBatchJob, summarizeBatchJob } from "@/lib/ocr/batch";
+
+export const runtime = "nodejs";
+
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ id: string }> }
+) {
+  try {
+    const apiKey = request.headers.get("x-api-key");
+    const validation = await validateApiKey(apiKey, 0);
+
+    if (!validation.valid || !validation.userId) {
+      return NextResponse.json(
+        { error: validation.error },
+        { status: validation.status ?? 401, headers: validation.headers }
+      );
+    }
+
+    const { id } = await params;
+    const job = getBatchJob(id, validation.userId);
+
+    if (!job) {
+      return NextResponse.json(
+        { error: "Batch job not found" },
+        { status: 404 }
+      );
+    }
+
+    return NextResponse.json({
+      success: true,
+      job: summarizeBatchJob(job),
+      files: job.files,
+    });
+  } catch (error) {
+    console.error("Batch OCR status error:", error);
+    return NextResponse.json(
+      { error: "Internal server error" },
+      { status: 500 }
+    );
+  }
+}
@@ -0,0 +1,89 @@
+import { NextRequest, NextResponse } from "next/server";
+import { validateApiKey } from "@/lib/api/keys";
+import {
+  getBatchJob,
+  subscribeToBatchJob,
+  type BatchFileResult,
+} from "@/lib/ocr/batch";
+
+export const runtime = "nodejs";
+
+// Streams each file's result as soon as it finishes. Responds with
+// Server-Sent Events when the client accepts text/event-stream and with
+// newline-delimited JSON otherwise. Every payload carries `type` ("file" or
+// "done"), the same as the SSE event name.
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ id: string }> }
+) {
+  try {
+    const apiKey = request.headers.get("x-api-key");
+    const validation = await validateApiKey(apiKey, 0);
+
+    if (!validation.valid || !validation.userId) {
+      return NextResponse.json(
+        { error: validation.error },
+        { status: validation.status ?? 401, headers: validation.headers }
+      );
+    }
+
+    const { id } = await params;
+    const job = getBatchJob(id, validation.userId);
+
+    if (!job) {
+      return NextResponse.json(
+        { error: "Batch job not found" },
+        { status: 404 }
+      );
+    }
+
+    const useSSE = (request.headers.get("accept") || "").includes("text/event-stream");
+    const encoder = new TextEncoder();
+    const total = job.files.length;
+    let unsubscribe = () => {};
+
+    const stream = new ReadableStream<Uint8Array>({
+      start(controller) {
+        let sent = 0;
+
+        const send = (event: "file" | "done", payload: object) => {
+          const json = JSON.stringify({ type: event, ...payload });
+          controller.enqueue(
+            encoder.encode(useSSE ? `event: ${event}\ndata: ${json}\n\n` : `${json}\n`)
+          );
+        };
+
+        const onFile = (file: BatchFileResult) => {
+          send("file", file);
+          sent++;
+          if (sent === total) {
+            send("done", { id: job.id, status: "completed", total });
+            unsubscribe();
+            controller.close();
+          }
+        };
+
+        unsubscribe = subscribeToBatchJob(job, onFile);
+
+        request.signal.addEventListener("abort", () => unsubscribe());
+      },
+      cancel() {
+        unsubscribe();
+      },
+    });
+
+    return new Response(stream, {
+      headers: {
+        "Content-Type": useSSE ? "text/event-stream" : "application/x-ndjson",
+        "Cache-Control": "no-cache, no-transform",
+        Connection: "keep-alive",
+      },
+    });
+  } catch (error) {
+    console.error("Batch OCR stream error:", error);
+    return NextResponse.json(
+      { error: "Internal server error" },
+      { status: 500 }
+    );
+  }
+}
@@ -0,0 +1,126 @@
+import { NextRequest, NextResponse } from "next/server";
+import { validateApiKey } from "@/lib/api/keys";
+import { isLanguageCode } from "@/lib/ocr/tesseract";
+import {
+  createBatchJob,
+  summarizeBatchJob,
+  MAX_BATCH_FILES,
+  type BatchInputFile,
+} from "@/lib/ocr/batch";
+import { readZipEntries, ZipError } from "@/lib/zip/reader";
+
+export const runtime = "nodejs";
+
+const MAX_FILE_SIZE = 20 * 1024 * 1024;
+const IMAGE_EXTENSIONS = /\.(jpe?g|jfif|png|gif|webp|bmp|tiff?)$/i;
+
+function isZip(file: File) {
+  return file.type === "application/zip" || file.name.toLowerCase().endsWith(".zip");
+}
+
+export async function POST(request: NextRequest) {
+  try {
+    // Authenticate only; the batch is charged per image once it is parsed
+    const apiKey = request.headers.get("x-api-key");
+    const validation = await validateApiKey(apiKey, 0);
+
+    if (!validation.valid || !validation.userId) {
+      return NextResponse.json(
+        { error: validation.error },
+        { status: validation.status ?? 401, headers: validation.headers }
+      );
+    }
+
+    const contentType = request.headers.get("content-type") || "";
+    if (!contentType.includes("multipart/form-data")) {
+      return NextResponse.json(
+        { error: "Unsupported content type" },
+        { status: 415 }
+      );
+    }
+
+    const formData = await request.formData();
+    const language = (formData.get("language") as string) || "eng";
+
+    if (!isLanguageCode(language)) {
+      return NextResponse.json(
+        { error: `Unsupported language: ${language}` },
+        { status: 400 }
+      );
+    }
+
+    // Accept any number of "images" fields and/or zip archives of images
+    const uploads = [...formData.getAll("images"), ...formData.getAll("image")]
+      .filter((value): value is File => typeof value !== "string");
+    const files: BatchInputFile[] = [];
+
+    for (const upload of uploads) {
+      const data = Buffer.from(await upload.arrayBuffer());
+
+      if (isZip(upload)) {
+        const entries = readZipEntries(data, {
+          maxEntries: MAX_BATCH_FILES,
+          maxEntrySize: MAX_FILE_SIZE,
+          filter: (name) => IMAGE_EXTENSIONS.test(name),
+        });
+        files.push(...entries);
+      } else {
+        if (data.length > MAX_FILE_SIZE) {
+          return NextResponse.json(
+            { error: `${upload.name} exceeds the maximum file size` },
+            { status: 413 }
+          );
+        }
+        files.push({ name: upload.name, data });
+      }
+
+      if (files.length > MAX_BATCH_FILES) {
+        return NextResponse.json(
+          { error: `A batch can contain at most ${MAX_BATCH_FILES} images` },
+          { status: 400 }
+        );
+      }
+    }
+
+    if (files.length === 0) {
+      return NextResponse.json(
+        { error: "At least one image is required" },
+        { status: 400 }
+      );
+    }
+
+    const charge = await validateApiKey(apiKey, files.length);
+    if (!charge.valid) {
+      return NextResponse.json(
+        { error: charge.error },
+        { status: charge.status ?? 429, headers: charge.headers }
+      );
+    }
+
+    const job = createBatchJob(validation.userId, files, language);
+
+    return NextResponse.json(
+      {
+        success: true,
+        job: summarizeBatchJob(job),
+        links: {
+          status: `/api/v1/ocr/batch/${job.id}`,
+          stream: `/api/v1/ocr/batch/${job.id}/stream`,
+        },
+        usage: {
+          credits_used: files.length,
+        },
+      },
+      { status: 202, headers: charge.headers }
+    );
+  } catch (error) {
+    if (error instanceof ZipError) {
+      return NextResponse.json({ error: error.message }, { status: 400 });
+    }
+    console.error("Batch OCR API error:", error);
+    return NextResponse.json(
+      { error: "Internal server error" },
+      { status: 500 }
+    );
+  }
+}
@@ -1,69 +1,42 @@
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
-
-// API Key validation
-async function validateApiKey(apiKey: string | null) {
-  if (!apiKey) {
-    return { valid: false, error: "API key is required" };
-  }
-
-  const supabase = await createClient();
-
-  // Check if API key exists and is valid
-  const { data, error } = await supabase
-    .from("api_keys")
-    .select("id, user_id, name, rate_limit, requests_today, last_reset")
-    .eq("key", apiKey)
-    .eq("is_active", true)
-    .single();
-
-  if (error || !data) {
-    return { valid: false, error: "Invalid API key" };
-  }
-
-  // Check rate limit
-  const now = new Date();
-  const lastReset = new Date(data.last_reset);
-  const shouldReset = now.getDate() !== lastReset.getDate();
-
-  if (shouldReset) {
-    // Reset daily counter
-    await supabase
-      .from("api_keys")
-      .update({ requests_today: 0, last_reset: now.toISOString() })
-      .eq("id", data.id);
-    data.requests_today = 0;
-  }
-
-  if (data.requests_today >= data.rate_limit) {
-    return { valid: false, error: "Rate limit exceeded" };
-  }
-
-  // Increment request count
-  await supabase
-    .from("api_keys")
-    .update({ requests_today: data.requests_today + 1 })
-    .eq("id", data.id);
-
-  return { valid: true, userId: data.user_id };
+import { validateApiKey } from "@/lib/api/keys";
+import { Timings, wantsTimings } from "@/lib/metrics/timings";
+import { isLanguageCode, type OCRResult } from "@/lib/ocr/tesseract";
+import {
+  recognizeBuffer,
+  OCRQueueFullError,
+  OCRTimeoutError,
+} from "@/lib/ocr/server";
+
+// Tesseract workers need the Node.js runtime
+export const runtime = "nodejs";
+
+// Decode a base64 data URL (or bare base64 string) into raw bytes
+function decodeImageData(image: string): Buffer {
+  const commaIndex = image.indexOf(",");
+  const base64 = image.startsWith("data:") ? image.slice(commaIndex + 1) : image;
+  return Buffer.from(base64, "base64");
 }
 
 export async function POST(request: NextRequest) {
+  const timings = new Timings("tesseract");
+
   try {
     // Get API key from header
     const apiKey = request.headers.get("x-api-key");
-    const validation = await validateApiKey(apiKey);
+    const validation = await timings.time("auth", () => validateApiKey(apiKey));
 
     if (!validation.valid) {
       return NextResponse.json(
         { error: validation.error },
-        { status: 401 }
+        { status: validation.status ?? 401, headers: validation.headers }
       );
     }
 
     // Parse request body
+    const parseStartedAt = performance.now();
     const contentType = request.headers.get("content-type") || "";
-    let imageData: string | null = null;
+    let image: Buffer | null = null;
     let language = "eng";
 
     if (contentType.includes("multipart/form-data")) {
@@ -78,21 +51,19 @@ export async function POST(request: NextRequest) {
         );
       }
 
-      const bytes = await file.arrayBuffer();
-      const base64 = Buffer.from(bytes).toString("base64");
-      const mimeType = file.type || "image/jpeg";
-      imageData = `data:${mimeType};base64,${base64}`;
+      image = Buffer.from(await file.arrayBuffer());
     } else if (contentType.includes("application/json")) {
       const body = await request.json();
-      imageData = body.image; // Expect base64 data URL
       language = body.language || "eng";
 
-      if (!imageData) {
+      if (!body.image) {
         return NextResponse.json(
           { error: "Image data is required" },
           { status: 400 }
         );
       }
+
+      image = decodeImageData(body.image); // Expect base64 data URL
     } else {
       return NextResponse.json(
         { error: "Unsupported content type" },
@@ -100,20 +71,55 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // For now, return a placeholder response
-    // In production, this would call Azure Vision API or similar
+    timings.record("parse", performance.now() - parseStartedAt);
+
+    if (!isLanguageCode(language)) {
+      return NextResponse.json(
+        { error: `Unsupported language: ${language}` },
+        { status: 400 }
+      );
+    }
+
+    let result: OCRResult;
+    try {
+      result = await recognizeBuffer(image, language, { includeWordData: true, timings });
+    } catch (error) {
+      if (error instanceof OCRQueueFullError) {
+        return NextResponse.json(
+          { error: "Server is busy, please retry later" },
+          {
+            status: 429,
+            headers: {
+              ...validation.headers,
+              ...timings.headers(),
+              "Retry-After": String(error.retryAfter),
+            },
+          }
+        );
+      }
+      if (error instanceof OCRTimeoutError) {
+        return NextResponse.json(
+          { error: "OCR processing timed out" },
+          { status: 504, headers: { ...validation.headers, ...timings.headers() } }
+        );
+      }
+      throw error;
+    }
+
     return NextResponse.json({
       success: true,
       data: {
-        text: "API OCR processing is available for Pro and Enterprise plans. This is a placeholder response.",
-        confidence: 0.95,
+        text: result.text.trim(),
+        confidence: result.confidence / 100,
         language,
-        words: [],
+        words: result.words || [],
+        preprocessing: result.preprocessing ?? null,
+        ...(wantsTimings(request) && { timings: timings.toJSON() }),
       },
       usage: {
         credits_used: 1,
       },
-    });
+    }, { headers: { ...validation.headers, ...timings.headers() } });
   } catch (error) {
     console.error("API OCR error:", error);
     return NextResponse.json(
@@ -136,6 +142,13 @@ export async function GET() {
           "x-api-key": "Your API key (required)",
           "Content-Type": "multipart/form-data or application/json",
         },
+        rateLimit:
+          "Responses carry X-RateLimit-Limit, X-RateLimit-Remaining and X-RateLimit-Reset (UTC epoch seconds)",
+        timing:
+          "Responses carry a Server-Timing header (auth, parse, hash, cache, queue, init, preprocess, recognize, total)",
+        query: {
+          timings: "Set to 1 to also return the stage durations (ms) as data.timings",
+        },
         body: {
           image: "Image file or base64 data URL",
           language: "OCR language code (default: eng)",
@@ -144,6 +157,61 @@ export async function GET() {
           text: "Extracted text",
           confidence: "Confidence score (0-1)",
           language: "Detected/used language",
+          words: "Recognized words with bounding boxes",
+        },
+        errors: {
+          401: "Missing or invalid API key",
+          429: "Daily rate limit exceeded or OCR queue full; retry after the Retry-After header (seconds)",
+          504: "OCR processing timed out",
+        },
+      },
+      batch: {
+        method: "POST",
+        path: "/api/v1/ocr/batch",
+        description: "Submit many images (or zip archives of images) for asynchronous OCR",
+        headers: {
+          "x-api-key": "Your API key (required)",
+          "Content-Type": "multipart/form-data",
+        },
+        body: {
+          images: "One or more image files or .zip archives",
+          language: "OCR language code (default: eng)",
+        },
+        response: {
+          job: "Batch job summary including its id",
+          links: "Status and stream URLs for the job",
+        },
+      },
+      batchStatus: {
+        method: "GET",
+        path: "/api/v1/ocr/batch/{id}",
+        description: "Job status and every finished file result",
+      },
+      batchStream: {
+        method: "GET",
+        path: "/api/v1/ocr/batch/{id}/stream",
+        description:
+          "NDJSON stream of file results as they finish, then a final line; each line has type \"file\" or \"done\" (SSE with Accept: text/event-stream)",
+      },
+      export: {
+        method: "POST",
+        path: "/api/v1/export",
+        description:
+          "Convert text to XLSX or DOCX, streamed as it is generated (memory use does not grow with document size)",
+        headers: {
+          "x-api-key": "Your API key (required)",
+          "Content-Type": "application/json",
+        },
+        body: {
+          format: "\"xlsx\" or \"docx\"",
+          text: "Text to convert (up to 10MB; form feeds separate pages)",
+          filename: "Download file name (optional)",
+          parseTable: "xlsx: split lines into cells (default: true)",
+          title: "docx: document title (optional)",
+          formatted: "docx: one paragraph per line (default: true)",
+        },
+        errors: {
+          413: "Text is too large",
         },
       },
     },
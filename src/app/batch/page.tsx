@@ -17,10 +17,16 @@ export default function BatchPage() {
   const [language, setLanguage] = useState<LanguageCode>("auto");
 
   const handleProcess = useCallback(
-    async (file: File, onProgress: (progress: number) => void): Promise<string> => {
+    async (
+      file: File,
+      onProgress: (progress: number) => void,
+      signal?: AbortSignal
+    ): Promise<string> => {
       const ocrResult = await recognizeText(file, language, (p) => {
-        onProgress(p.progress);
+        onProgress(p.progress / 100);
       });
+      // Recognition can't be interrupted; drop the result of a cancelled file
+      signal?.throwIfAborted();
 
       return formatOCRResult(ocrResult, ocrMode === "formatted");
     },
@@ -69,7 +75,7 @@ export default function BatchPage() {
           <CardContent className="p-4 md:p-6">
             <BatchUploader
               onProcess={handleProcess}
-              maxFiles={10}
+              maxFiles={500}
             />
           </CardContent>
         </Card>
@@ -82,7 +88,7 @@ export default function BatchPage() {
         <div className="grid md:grid-cols-3 gap-6 pt-4">
           <FeatureCard
             title="Batch Processing"
-            description="Upload up to 10 images and process them all at once with a single click."
+            description="Upload up to 500 images and process them all at once with a single click."
           />
           <FeatureCard
             title="Progress Tracking"
@@ -9,6 +9,7 @@ import {
   getAllPosts,
   getRelatedPosts,
 } from "@/lib/blog/posts";
+import { getPostContent } from "@/lib/blog/content";
 import ReactMarkdown from "react-markdown";
 import remarkGfm from "remark-gfm";
 
@@ -16,6 +17,10 @@ interface BlogPostPageProps {
   params: Promise<{ slug: string }>;
 }
 
+// Every post is pre-rendered at build time; other slugs are a 404 without
+// rendering
+export const dynamicParams = false;
+
 // Generate static params for all blog posts
 export async function generateStaticParams() {
   const posts = getAllPosts();
@@ -58,8 +63,9 @@ export async function generateMetadata({
 export default async function BlogPostPage({ params }: BlogPostPageProps) {
   const { slug } = await params;
   const post = getPostBySlug(slug);
+  const content = await getPostContent(slug);
 
-  if (!post) {
+  if (!post || content === undefined) {
     notFound();
   }
 
@@ -107,7 +113,7 @@ export default async function BlogPostPage({ params }: BlogPostPageProps) {
           {/* Post Content */}
           <div className="prose prose-lg dark:prose-invert max-w-none mb-12">
             <ReactMarkdown remarkPlugins={[remarkGfm]}>
-              {post.content}
+              {content}
             </ReactMarkdown>
           </div>
 
@@ -51,7 +51,15 @@ const planLabels = {
 export default function DashboardPage() {
   const router = useRouter();
   const supabase = useMemo(() => createClient(), []);
-  const { history, isLoading: historyLoading, deleteConversion } = useHistory();
+  const {
+    history,
+    isLoading: historyLoading,
+    isLoadingMore,
+    hasMore,
+    loadMore,
+    getConversionText,
+    deleteConversion,
+  } = useHistory();
 
   const [user, setUser] = useState<SupabaseUser | null>(null);
   const [loading, setLoading] = useState(true);
@@ -261,6 +269,10 @@ export default function DashboardPage() {
           history={history}
           isLoading={historyLoading}
           onDelete={deleteConversion}
+          onLoadText={getConversionText}
+          hasMore={hasMore}
+          isLoadingMore={isLoadingMore}
+          onLoadMore={loadMore}
         />
 
         {stats.plan === "free" && (
@@ -68,7 +68,7 @@ const faqs = [
   {
     question: "Do you offer batch processing?",
     answer:
-      "Yes! You can upload and process up to 10 images at once using our Batch Upload feature. All results can be downloaded as a single combined file.",
+      "Yes! You can upload and process up to 500 images at once using our Batch Upload feature. All results can be downloaded as a single combined file.",
   },
 ];
 
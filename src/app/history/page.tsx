@@ -10,7 +10,17 @@ import { useAuth } from "@/hooks/use-auth";
 
 export default function HistoryPage() {
   const { user, isLoading: authLoading } = useAuth();
-  const { history, isLoading, deleteConversion } = useHistory();
+  const {
+    history,
+    isLoading,
+    isLoadingMore,
+    hasMore,
+    query,
+    search,
+    loadMore,
+    getConversionText,
+    deleteConversion,
+  } = useHistory();
 
   if (authLoading) {
     return (
@@ -81,6 +91,12 @@ export default function HistoryPage() {
           history={history}
           isLoading={isLoading}
           onDelete={deleteConversion}
+          onLoadText={getConversionText}
+          hasMore={hasMore}
+          isLoadingMore={isLoadingMore}
+          onLoadMore={loadMore}
+          query={query}
+          onSearch={search}
         />
       </div>
     </div>
@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useCallback } from "react";
+import { useState, useCallback, useMemo } from "react";
 import { useDropzone } from "react-dropzone";
 import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
@@ -23,7 +23,12 @@ import {
 } from "lucide-react";
 import { cn } from "@/lib/utils";
 import { toast } from "sonner";
-import { PDFDocument } from "pdf-lib";
+import {
+  createPdfFromImages,
+  estimateImagePdfSize,
+  type ImagePdfOptions,
+  type PageSize,
+} from "@/lib/pdf/from-images";
 
 interface ImageFile {
   id: string;
@@ -34,9 +39,20 @@ interface ImageFile {
 
 export default function ImageToPDFPage() {
   const [images, setImages] = useState<ImageFile[]>([]);
-  const [pageSize, setPageSize] = useState("a4");
-  const [orientation, setOrientation] = useState("portrait");
+  const [pageSize, setPageSize] = useState<PageSize>("a4");
+  const [orientation, setOrientation] = useState<"portrait" | "landscape">("portrait");
+  const [dpi, setDpi] = useState("150");
   const [isGenerating, setIsGenerating] = useState(false);
+  const [generated, setGenerated] = useState(0);
+
+  const pdfOptions: ImagePdfOptions = useMemo(
+    () => ({ pageSize, orientation, dpi: Number(dpi) }),
+    [pageSize, orientation, dpi]
+  );
+  const estimatedSize = useMemo(
+    () => estimateImagePdfSize(images.map((img) => img.file), pdfOptions),
+    [images, pdfOptions]
+  );
 
   const onDrop = useCallback((acceptedFiles: File[]) => {
     const newImages = acceptedFiles.map((file) => ({
@@ -80,60 +96,13 @@ export default function ImageToPDFPage() {
     }
 
     setIsGenerating(true);
+    setGenerated(0);
 
     try {
-      const pdfDoc = await PDFDocument.create();
-
-      // Page dimensions
-      const pageSizes: Record<string, [number, number]> = {
-        a4: [595.28, 841.89],
-        letter: [612, 792],
-        a3: [841.89, 1190.55],
-      };
-
-      let [width, height] = pageSizes[pageSize] || pageSizes.a4;
-      if (orientation === "landscape") {
-        [width, height] = [height, width];
-      }
-
-      for (const img of images) {
-        const imageBytes = await img.file.arrayBuffer();
-        let pdfImage;
-
-        if (img.file.type === "image/png") {
-          pdfImage = await pdfDoc.embedPng(imageBytes);
-        } else {
-          pdfImage = await pdfDoc.embedJpg(imageBytes);
-        }
-
-        const page = pdfDoc.addPage([width, height]);
-
-        // Calculate scaling to fit image on page with margins
-        const margin = 20;
-        const maxWidth = width - margin * 2;
-        const maxHeight = height - margin * 2;
-
-        const imgWidth = pdfImage.width;
-        const imgHeight = pdfImage.height;
-
-        const scale = Math.min(maxWidth / imgWidth, maxHeight / imgHeight);
-        const scaledWidth = imgWidth * scale;
-        const scaledHeight = imgHeight * scale;
-
-        // Center image on page
-        const x = (width - scaledWidth) / 2;
-        const y = (height - scaledHeight) / 2;
-
-        page.drawImage(pdfImage, {
-          x,
-          y,
-          width: scaledWidth,
-          height: scaledHeight,
-        });
-      }
-
-      const pdfBytes = await pdfDoc.save();
-      const blob = new Blob([new Uint8Array(pdfBytes)], { type: "application/pdf" });
+      const blob = await createPdfFromImages(
+        images.map((img) => img.file),
+        { ...pdfOptions, onProgress: (completed) => setGenerated(completed) }
+      );
       const url = URL.createObjectURL(blob);
 
       const a = document.createElement("a");
@@ -221,6 +190,8 @@ export default function ImageToPDFPage() {
                     <img
                       src={img.preview}
                       alt={img.name}
+                      loading="lazy"
+                      decoding="async"
                       className="w-full h-full object-cover"
                     />
                     <div className="absolute inset-0 bg-black/50 opacity-0 group-hover:opacity-100 transition-opacity flex items-center justify-center">
@@ -240,10 +211,13 @@ export default function ImageToPDFPage() {
                 ))}
               </div>
 
-              <div className="grid grid-cols-1 sm:grid-cols-2 gap-4 pt-4">
+              <div className="grid grid-cols-1 sm:grid-cols-3 gap-4 pt-4">
                 <div className="space-y-2">
                   <Label>Page Size</Label>
-                  <Select value={pageSize} onValueChange={setPageSize}>
+                  <Select
+                    value={pageSize}
+                    onValueChange={(value) => setPageSize(value as PageSize)}
+                  >
                     <SelectTrigger>
                       <SelectValue />
                     </SelectTrigger>
@@ -256,7 +230,10 @@ export default function ImageToPDFPage() {
                 </div>
                 <div className="space-y-2">
                   <Label>Orientation</Label>
-                  <Select value={orientation} onValueChange={setOrientation}>
+                  <Select
+                    value={orientation}
+                    onValueChange={(value) => setOrientation(value as "portrait" | "landscape")}
+                  >
                     <SelectTrigger>
                       <SelectValue />
                     </SelectTrigger>
@@ -266,8 +243,25 @@ export default function ImageToPDFPage() {
                     </SelectContent>
                   </Select>
                 </div>
+                <div className="space-y-2">
+                  <Label>Image Quality</Label>
+                  <Select value={dpi} onValueChange={setDpi}>
+                    <SelectTrigger>
+                      <SelectValue />
+                    </SelectTrigger>
+                    <SelectContent>
+                      <SelectItem value="96">Screen (96 DPI)</SelectItem>
+                      <SelectItem value="150">Standard (150 DPI)</SelectItem>
+                      <SelectItem value="300">Print (300 DPI)</SelectItem>
+                    </SelectContent>
+                  </Select>
+                </div>
               </div>
 
+              <p className="text-sm text-muted-foreground">
+                Estimated PDF size: up to {(estimatedSize / (1024 * 1024)).toFixed(1)} MB
+              </p>
+
               <Button
                 onClick={generatePDF}
                 disabled={isGenerating}
@@ -277,7 +271,7 @@ export default function ImageToPDFPage() {
                 {isGenerating ? (
                   <>
                     <Loader2 className="h-4 w-4 mr-2 animate-spin" />
-                    Generating PDF...
+                    Generating PDF... ({generated}/{images.length})
                   </>
                 ) : (
                   <>
@@ -92,7 +92,13 @@ export default function ImageTranslatorPage() {
         const translated = await translateText(
           ocrResult.text.trim(),
           fromLang,
-          targetLanguage
+          targetLanguage,
+          {
+            onProgress: (completed, total) => {
+              setProgress(70 + Math.round((completed / total) * 30));
+              setProgressStatus(`Translating... (${completed}/${total})`);
+            },
+          }
         );
 
         setTranslatedText(translated);
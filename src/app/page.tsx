@@ -9,7 +9,10 @@ import {
   formatOCRResult,
   type LanguageCode,
   type OCRProgress,
+  type WordData,
 } from "@/lib/ocr/tesseract";
+import { createSearchablePdf } from "@/lib/convert/to-searchable-pdf";
+import { downloadBlob } from "@/lib/convert/to-word";
 import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Progress } from "@/components/ui/progress";
@@ -42,9 +45,11 @@ import {
   ChevronDown,
   FileText,
   Files,
+  FileSearch,
 } from "lucide-react";
 import { Input } from "@/components/ui/input";
 import { cn } from "@/lib/utils";
+import { useKeyedProgress } from "@/hooks/use-keyed-progress";
 import { toast } from "sonner";
 
 interface ImageFile {
@@ -54,8 +59,9 @@ interface ImageFile {
   name: string;
   size: string;
   status: "pending" | "processing" | "done" | "error";
-  progress: number;
   result?: string;
+  // Word boxes, kept for the searchable PDF export
+  words?: WordData[];
   error?: string;
 }
 
@@ -85,6 +91,7 @@ export default function Home() {
   const [urlError, setUrlError] = useState("");
   const [previewImage, setPreviewImage] = useState<string | null>(null);
   const [copiedId, setCopiedId] = useState<string | null>(null);
+  const { progress, reportProgress, flushProgress } = useKeyedProgress();
   const inputRef = useRef<HTMLInputElement>(null);
 
   const addImages = useCallback((files: File[]) => {
@@ -97,7 +104,6 @@ export default function Home() {
       name: file.name,
       size: formatFileSize(file.size),
       status: "pending",
-      progress: 0,
     }));
     setImages((prev) => [...prev, ...newImages]);
   }, []);
@@ -169,21 +175,17 @@ export default function Home() {
     const processImage = async (img: ImageFile) => {
       setImages((prev) =>
         prev.map((item) =>
-          item.id === img.id ? { ...item, status: "processing", progress: 0 } : item
+          item.id === img.id ? { ...item, status: "processing" } : item
         )
       );
+      reportProgress(img.id, 0);
 
       try {
         const ocrResult = await recognizeText(
           img.file,
           language,
-          (p: OCRProgress) => {
-            setImages((prev) =>
-              prev.map((item) =>
-                item.id === img.id ? { ...item, progress: p.progress } : item
-              )
-            );
-          }
+          (p: OCRProgress) => reportProgress(img.id, p.progress),
+          true
         );
 
         const formattedText = formatOCRResult(ocrResult, ocrMode === "formatted");
@@ -191,7 +193,7 @@ export default function Home() {
         setImages((prev) =>
           prev.map((item) =>
             item.id === img.id
-              ? { ...item, status: "done", progress: 100, result: formattedText }
+              ? { ...item, status: "done", result: formattedText, words: ocrResult.words }
               : item
           )
         );
@@ -213,6 +215,7 @@ export default function Home() {
       await Promise.all(batch.map(processImage));
     }
 
+    flushProgress();
     setIsProcessing(false);
   };
 
@@ -286,6 +289,26 @@ export default function Home() {
     toast.success(`Downloading ${completedImages.length} files...`);
   };
 
+  const handleDownloadSearchablePdf = async () => {
+    // PDFs uploaded here are OCR'd as a whole; only images get a page each
+    const pages = completedImages
+      .filter((img) => img.file.type.startsWith("image/"))
+      .map((img) => ({ image: img.file as Blob, words: img.words ?? [] }));
+    if (pages.length === 0) {
+      toast.error("No images to include in the PDF");
+      return;
+    }
+
+    try {
+      const blob = await createSearchablePdf(pages, { title: "Extracted Text" });
+      downloadBlob(blob, "searchable.pdf");
+      toast.success("Searchable PDF downloaded!");
+    } catch (error) {
+      console.error("Searchable PDF error:", error);
+      toast.error("Failed to create searchable PDF");
+    }
+  };
+
   const handleStartOver = () => {
     clearAll();
   };
@@ -430,7 +453,7 @@ export default function Home() {
                           <p className="text-sm font-medium truncate">{img.name}</p>
                           <p className="text-xs text-muted-foreground">{img.size}</p>
                           {img.status === "processing" && (
-                            <Progress value={img.progress} className="h-1 mt-1" />
+                            <Progress value={progress.get(img.id) ?? 0} className="h-1 mt-1" />
                           )}
                           {img.status === "done" && (
                             <span className="text-xs text-green-500">Done</span>
@@ -521,6 +544,10 @@ export default function Home() {
                       <FileText className="h-4 w-4 mr-2" />
                       Download Merged
                     </DropdownMenuItem>
+                    <DropdownMenuItem onClick={handleDownloadSearchablePdf}>
+                      <FileSearch className="h-4 w-4 mr-2" />
+                      Searchable PDF
+                    </DropdownMenuItem>
                   </DropdownMenuContent>
                 </DropdownMenu>
               </div>
@@ -7,8 +7,10 @@ import {
   recognizeText,
   type LanguageCode,
   type OCRProgress,
+  type WordData,
 } from "@/lib/ocr/tesseract";
-import { createExcelDocument, downloadBlob } from "@/lib/convert/to-excel";
+import { extractPdf, isPdfFile } from "@/lib/pdf/extract";
+import { createExcelDocument, createExcelFromWords, downloadBlob } from "@/lib/convert/to-excel";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Progress } from "@/components/ui/progress";
@@ -29,32 +31,31 @@ export default function PdfToExcelPage() {
   const [progress, setProgress] = useState(0);
   const [progressStatus, setProgressStatus] = useState("");
   const [result, setResult] = useState("");
+  const [words, setWords] = useState<WordData[]>([]);
   const [copied, setCopied] = useState(false);
 
   const handleImageSelect = useCallback(
     async (file: File) => {
-      if (file.type === "application/pdf") {
-        toast.info(
-          "PDF files are processed page by page. For best results, upload images of individual pages."
-        );
-      }
-
       setIsProcessing(true);
       setProgress(0);
       setProgressStatus("Processing file...");
       setResult("");
+      setWords([]);
 
       try {
-        const ocrResult = await recognizeText(
-          file,
-          language,
-          (p: OCRProgress) => {
-            setProgress(Math.round(p.progress * 0.8));
-            setProgressStatus(p.status);
-          }
-        );
+        const onProgress = (p: OCRProgress) => {
+          setProgress(Math.round(p.progress * 0.8));
+          setProgressStatus(p.status);
+        };
+
+        // PDFs use their text layer where present and OCR only scanned pages.
+        // Word boxes drive the table layout of the spreadsheet.
+        const ocrResult = isPdfFile(file)
+          ? await extractPdf(file, { language, onProgress, includeWordData: true })
+          : await recognizeText(file, language, onProgress, true);
 
         setResult(ocrResult.text.trim());
+        setWords(ocrResult.words ?? []);
         setProgress(100);
       } catch (error) {
         console.error("Error:", error);
@@ -70,10 +71,14 @@ export default function PdfToExcelPage() {
     if (!result) return;
 
     try {
-      const blob = await createExcelDocument(result, {
-        sheetName: "PDF Data",
-        parseTable: true,
-      });
+      // Use word position data if available for better table extraction
+      const blob =
+        words.length > 0
+          ? await createExcelFromWords(words, { sheetName: "PDF Data" })
+          : await createExcelDocument(result, {
+              sheetName: "PDF Data",
+              parseTable: true,
+            });
       downloadBlob(blob, "pdf-data.xlsx");
       toast.success("Excel file downloaded!");
     } catch (error) {
@@ -95,6 +100,7 @@ export default function PdfToExcelPage() {
 
   const handleReset = () => {
     setResult("");
+    setWords([]);
     setProgress(0);
   };
 
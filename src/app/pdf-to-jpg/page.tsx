@@ -22,25 +22,55 @@ import {
   ImageIcon,
 } from "lucide-react";
 import { cn } from "@/lib/utils";
+import type { PDFDocumentProxy } from "pdfjs-dist";
+import {
+  CanvasPool,
+  DEFAULT_PAGE_CONCURRENCY,
+  forEachPage,
+  loadPdfDocument,
+  renderPageToBlob,
+} from "@/lib/pdf/pipeline";
+import { ZipWriter, createBlobSink } from "@/lib/zip/writer";
 import { toast } from "sonner";
 
 interface ConvertedImage {
   page: number;
-  dataUrl: string;
+  url: string;
+}
+
+// Only the first pages are previewed (and kept as object URLs); every page
+// goes into the ZIP as soon as it is encoded
+const PREVIEW_PAGES = 12;
+
+function revokeImages(images: ConvertedImage[]) {
+  images.forEach((img) => URL.revokeObjectURL(img.url));
 }
 
 export default function PDFToJPGPage() {
   const [file, setFile] = useState<File | null>(null);
   const [images, setImages] = useState<ConvertedImage[]>([]);
+  const [archive, setArchive] = useState<{ blob: Blob; pages: number } | null>(null);
   const [isProcessing, setIsProcessing] = useState(false);
   const [progress, setProgress] = useState(0);
   const [quality, setQuality] = useState("0.9");
   const [scale, setScale] = useState("2");
 
+  const resetOutput = () => {
+    setImages((prev) => {
+      revokeImages(prev);
+      return [];
+    });
+    setArchive(null);
+  };
+
   const onDrop = useCallback((acceptedFiles: File[]) => {
     if (acceptedFiles.length > 0) {
       setFile(acceptedFiles[0]);
-      setImages([]);
+      setImages((prev) => {
+        revokeImages(prev);
+        return [];
+      });
+      setArchive(null);
     }
   }, []);
 
@@ -52,74 +82,115 @@ export default function PDFToJPGPage() {
     disabled: isProcessing,
   });
 
+  const baseName = file?.name.replace(/\.pdf$/i, "") || "document";
+
   const convertToImages = async () => {
     if (!file) return;
 
     setIsProcessing(true);
     setProgress(0);
-    setImages([]);
+    resetOutput();
 
+    let pdf: PDFDocumentProxy | null = null;
     try {
-      const pdfjsLib = await import("pdfjs-dist");
-      pdfjsLib.GlobalWorkerOptions.workerSrc = `//cdnjs.cloudflare.com/ajax/libs/pdf.js/${pdfjsLib.version}/pdf.worker.min.js`;
-
-      const arrayBuffer = await file.arrayBuffer();
-      const pdf = await pdfjsLib.getDocument({ data: arrayBuffer }).promise;
-      const totalPages = pdf.numPages;
-      const convertedImages: ConvertedImage[] = [];
+      pdf = await loadPdfDocument(file);
+      const canvasPool = new CanvasPool();
       const scaleValue = parseFloat(scale);
       const qualityValue = parseFloat(quality);
+      const { sink, getBlob } = createBlobSink();
+      const zip = new ZipWriter(sink);
 
-      for (let i = 1; i <= totalPages; i++) {
-        const page = await pdf.getPage(i);
-        const viewport = page.getViewport({ scale: scaleValue });
+      // Pages render in parallel and finish out of order. Each is written to
+      // the ZIP in page order, so only pages that arrive ahead of the next
+      // one due are held, and the writes are chained so they never overlap.
+      // A runner whose page would grow the held set past the page concurrency
+      // waits for writes first. The page due next is never one of those, so
+      // the wait always ends.
+      const early = new Map<number, Blob>();
+      let nextToWrite = 1;
+      let writing = Promise.resolve();
+      const wakeRunners: (() => void)[] = [];
+      const aborted = new AbortController();
+      const wake = () => wakeRunners.splice(0).forEach((resolve) => resolve());
 
-        const canvas = document.createElement("canvas");
-        const context = canvas.getContext("2d")!;
-        canvas.width = viewport.width;
-        canvas.height = viewport.height;
+      const writeReadyPages = async () => {
+        for (let blob = early.get(nextToWrite); blob; blob = early.get(nextToWrite)) {
+          early.delete(nextToWrite);
+          const pageNumber = nextToWrite++;
+          await zip.addFile(`${baseName}_page_${pageNumber}.jpg`, blob);
+          if (pageNumber <= PREVIEW_PAGES) {
+            const image = { page: pageNumber, url: URL.createObjectURL(blob) };
+            setImages((prev) => [...prev, image]);
+          }
+          wake();
+        }
+      };
 
-        await page.render({
-          canvasContext: context,
-          viewport: viewport,
-          canvas: canvas,
-        }).promise;
+      await forEachPage(
+        pdf,
+        (page) =>
+          renderPageToBlob(page, canvasPool, {
+            scale: scaleValue,
+            quality: qualityValue,
+          }),
+        {
+          signal: aborted.signal,
+          onPage: async ({ blob }, pageNumber, completed, total) => {
+            early.set(pageNumber, blob);
+            writing = writing.then(writeReadyPages);
+            // A failed write stops the remaining pages; the error is thrown
+            // from forEachPage or the final await below
+            writing.catch((error) => {
+              aborted.abort(error);
+              wake();
+            });
+            setProgress(Math.round((completed / total) * 100));
 
-        const dataUrl = canvas.toDataURL("image/jpeg", qualityValue);
-        convertedImages.push({ page: i, dataUrl });
+            while (early.size >= DEFAULT_PAGE_CONCURRENCY) {
+              aborted.signal.throwIfAborted();
+              await new Promise<void>((resolve) => wakeRunners.push(resolve));
+            }
+          },
+        }
+      );
+      await writing;
+      await zip.close();
 
-        setProgress(Math.round((i / totalPages) * 100));
-      }
-
-      setImages(convertedImages);
-      toast.success(`Converted ${totalPages} pages to images!`);
+      setArchive({ blob: getBlob(), pages: pdf.numPages });
+      toast.success(`Converted ${pdf.numPages} pages to images!`);
     } catch (error) {
       console.error("PDF conversion error:", error);
       toast.error("Failed to convert PDF");
     } finally {
+      await pdf?.destroy();
       setIsProcessing(false);
     }
   };
 
   const downloadImage = (img: ConvertedImage) => {
     const a = document.createElement("a");
-    a.href = img.dataUrl;
-    a.download = `${file?.name.replace(/\.pdf$/i, "")}_page_${img.page}.jpg`;
+    a.href = img.url;
+    a.download = `${baseName}_page_${img.page}.jpg`;
     document.body.appendChild(a);
     a.click();
     document.body.removeChild(a);
   };
 
   const downloadAll = () => {
-    images.forEach((img, index) => {
-      setTimeout(() => downloadImage(img), index * 200);
-    });
-    toast.success(`Downloading ${images.length} images...`);
+    if (!archive) return;
+    const url = URL.createObjectURL(archive.blob);
+    const a = document.createElement("a");
+    a.href = url;
+    a.download = `${baseName}_pages.zip`;
+    document.body.appendChild(a);
+    a.click();
+    document.body.removeChild(a);
+    URL.revokeObjectURL(url);
   };
 
   const clearAll = () => {
     setFile(null);
-    setImages([]);
+    resetOutput();
     setProgress(0);
   };
 
@@ -256,11 +327,17 @@ export default function PDFToJPGPage() {
             <CardContent className="p-6 space-y-4">
               <div className="flex items-center justify-between">
                 <h2 className="font-semibold">
-                  Converted Images ({images.length})
+                  {archive && archive.pages > images.length
+                    ? `Converted Images (first ${images.length} of ${archive.pages})`
+                    : `Converted Images (${images.length})`}
                 </h2>
-                <Button onClick={downloadAll} variant="outline">
+                <Button
+                  onClick={downloadAll}
+                  variant="outline"
+                  disabled={isProcessing || !archive}
+                >
                   <Download className="h-4 w-4 mr-2" />
-                  Download All
+                  Download All (ZIP)
                 </Button>
               </div>
 
@@ -271,8 +348,10 @@ export default function PDFToJPGPage() {
                     className="relative group aspect-[3/4] bg-muted rounded-lg overflow-hidden border"
                   >
                     <img
-                      src={img.dataUrl}
+                      src={img.url}
                       alt={`Page ${img.page}`}
+                      loading="lazy"
+                      decoding="async"
                       className="w-full h-full object-contain"
                     />
                     <div className="absolute inset-0 bg-black/50 opacity-0 group-hover:opacity-100 transition-opacity flex items-center justify-center">
@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useCallback } from "react";
+import { useState, useCallback, useMemo } from "react";
 import { useDropzone } from "react-dropzone";
 import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
@@ -13,13 +13,21 @@ import {
   Download,
   Check,
   Trash2,
+  FileSearch,
 } from "lucide-react";
 import { cn } from "@/lib/utils";
+import { LanguageSelector } from "@/components/ocr/language-selector";
+import type { LanguageCode } from "@/lib/ocr/tesseract";
+import { extractPdf } from "@/lib/pdf/extract";
+import { createSearchablePdf, recognizePdfPages } from "@/lib/convert/to-searchable-pdf";
+import { downloadBlob } from "@/lib/convert/to-word";
 import { toast } from "sonner";
 
 export default function PDFToTextPage() {
   const [file, setFile] = useState<File | null>(null);
-  const [extractedText, setExtractedText] = useState("");
+  const [language, setLanguage] = useState<LanguageCode>("auto");
+  // Page texts indexed by page number - 1; filled in as pages complete
+  const [pageTexts, setPageTexts] = useState<string[]>([]);
   const [isProcessing, setIsProcessing] = useState(false);
   const [progress, setProgress] = useState(0);
   const [copied, setCopied] = useState(false);
@@ -27,7 +35,7 @@ export default function PDFToTextPage() {
   const onDrop = useCallback((acceptedFiles: File[]) => {
     if (acceptedFiles.length > 0) {
       setFile(acceptedFiles[0]);
-      setExtractedText("");
+      setPageTexts([]);
     }
   }, []);
 
@@ -39,34 +47,44 @@ export default function PDFToTextPage() {
     disabled: isProcessing,
   });
 
+  const extractedText = useMemo(
+    () =>
+      pageTexts
+        .map((text, index) =>
+          text === undefined ? "" : `--- Page ${index + 1} ---\n${text}\n\n`
+        )
+        .join("")
+        .trim(),
+    [pageTexts]
+  );
+
   const extractText = async () => {
     if (!file) return;
 
     setIsProcessing(true);
     setProgress(0);
-    setExtractedText("");
+    setPageTexts([]);
 
     try {
-      const pdfjsLib = await import("pdfjs-dist");
-      pdfjsLib.GlobalWorkerOptions.workerSrc = `//cdnjs.cloudflare.com/ajax/libs/pdf.js/${pdfjsLib.version}/pdf.worker.min.js`;
-
-      const arrayBuffer = await file.arrayBuffer();
-      const pdf = await pdfjsLib.getDocument({ data: arrayBuffer }).promise;
-      const totalPages = pdf.numPages;
-      let fullText = "";
-
-      for (let i = 1; i <= totalPages; i++) {
-        const page = await pdf.getPage(i);
-        const textContent = await page.getTextContent();
-        const pageText = textContent.items
-          .map((item: any) => item.str)
-          .join(" ");
-        fullText += `--- Page ${i} ---\n${pageText}\n\n`;
-        setProgress(Math.round((i / totalPages) * 100));
-      }
-
-      setExtractedText(fullText.trim());
-      toast.success(`Extracted text from ${totalPages} pages!`);
+      // Pages with a text layer are read directly and scanned pages go
+      // through OCR; each page is shown as soon as it is done
+      const { pages, ocrPageCount } = await extractPdf(file, {
+        language,
+        onProgress: (p) => setProgress(p.progress),
+        onPage: (page) => {
+          setPageTexts((prev) => {
+            const next = prev.slice();
+            next[page.pageNumber - 1] = page.text;
+            return next;
+          });
+        },
+      });
+
+      toast.success(
+        ocrPageCount > 0
+          ? `Extracted text from ${pages.length} pages (${ocrPageCount} by OCR)!`
+          : `Extracted text from ${pages.length} pages!`
+      );
     } catch (error) {
       console.error("PDF extraction error:", error);
       toast.error("Failed to extract text from PDF");
@@ -75,6 +93,32 @@ export default function PDFToTextPage() {
     }
   };
 
+  // Copy of the PDF with a text layer; only pages without one are OCRed
+  const makeSearchable = async () => {
+    if (!file) return;
+
+    setIsProcessing(true);
+    setProgress(0);
+
+    try {
+      let total = 1;
+      const pages = recognizePdfPages(file, language, {
+        onLoad: (pageCount) => (total = pageCount),
+      });
+      const blob = await createSearchablePdf(pages, {
+        title: file.name.replace(/\.pdf$/i, ""),
+        onPage: (completed) => setProgress(Math.round((completed / total) * 100)),
+      });
+      downloadBlob(blob, file.name.replace(/\.pdf$/i, "") + "-searchable.pdf");
+      toast.success("Searchable PDF created!");
+    } catch (error) {
+      console.error("Searchable PDF error:", error);
+      toast.error("Failed to create searchable PDF");
+    } finally {
+      setIsProcessing(false);
+    }
+  };
+
   const handleCopy = async () => {
     try {
       await navigator.clipboard.writeText(extractedText);
@@ -101,7 +145,7 @@ export default function PDFToTextPage() {
 
   const clearAll = () => {
     setFile(null);
-    setExtractedText("");
+    setPageTexts([]);
     setProgress(0);
   };
 
@@ -171,6 +215,15 @@ export default function PDFToTextPage() {
                   </Button>
                 </div>
 
+                <div className="flex items-center justify-center gap-4">
+                  <span className="text-sm text-muted-foreground">Language:</span>
+                  <LanguageSelector
+                    value={language}
+                    onChange={setLanguage}
+                    disabled={isProcessing}
+                  />
+                </div>
+
                 {isProcessing && (
                   <div className="space-y-2">
                     <Progress value={progress} />
@@ -194,6 +247,16 @@ export default function PDFToTextPage() {
                     "Extract Text"
                   )}
                 </Button>
+
+                <Button
+                  onClick={makeSearchable}
+                  disabled={isProcessing}
+                  variant="outline"
+                  className="w-full"
+                >
+                  <FileSearch className="h-4 w-4 mr-2" />
+                  Make Searchable PDF (OCR scanned pages)
+                </Button>
               </div>
             )}
           </CardContent>
@@ -8,6 +8,7 @@ import {
   type LanguageCode,
   type OCRProgress,
 } from "@/lib/ocr/tesseract";
+import { extractPdf, isPdfFile } from "@/lib/pdf/extract";
 import { createWordDocument, downloadBlob } from "@/lib/convert/to-word";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
@@ -39,14 +40,15 @@ export default function PdfToWordPage() {
       setResult("");
 
       try {
-        const ocrResult = await recognizeText(
-          file,
-          language,
-          (p: OCRProgress) => {
-            setProgress(Math.round(p.progress * 0.8));
-            setProgressStatus(p.status);
-          }
-        );
+        const onProgress = (p: OCRProgress) => {
+          setProgress(Math.round(p.progress * 0.8));
+          setProgressStatus(p.status);
+        };
+
+        // PDFs use their text layer where present and OCR only scanned pages
+        const ocrResult = isPdfFile(file)
+          ? await extractPdf(file, { language, onProgress })
+          : await recognizeText(file, language, onProgress);
 
         setResult(ocrResult.text.trim());
         setProgress(100);
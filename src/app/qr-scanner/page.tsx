@@ -16,43 +16,7 @@ import {
 } from "lucide-react";
 import { toast } from "sonner";
 import { cn } from "@/lib/utils";
-
-// Simple QR code detection using canvas and jsQR
-async function decodeQRCode(file: File): Promise<string | null> {
-  return new Promise((resolve) => {
-    const img = new Image();
-    img.onload = () => {
-      const canvas = document.createElement("canvas");
-      const ctx = canvas.getContext("2d");
-      if (!ctx) {
-        resolve(null);
-        return;
-      }
-
-      canvas.width = img.width;
-      canvas.height = img.height;
-      ctx.drawImage(img, 0, 0);
-
-      const imageData = ctx.getImageData(0, 0, canvas.width, canvas.height);
-
-      // Try to use jsQR if available (loaded dynamically)
-      import("jsqr")
-        .then((jsQR) => {
-          const code = jsQR.default(
-            imageData.data,
-            imageData.width,
-            imageData.height
-          );
-          resolve(code?.data || null);
-        })
-        .catch(() => {
-          resolve(null);
-        });
-    };
-    img.onerror = () => resolve(null);
-    img.src = URL.createObjectURL(file);
-  });
-}
+import { decodeQRCode } from "@/lib/workers/image-pipeline";
 
 export default function QRScannerPage() {
   const [isProcessing, setIsProcessing] = useState(false);
@@ -1,8 +1,9 @@
 "use client";
 
-import { useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
+import { Input } from "@/components/ui/input";
 import {
   Dialog,
   DialogContent,
@@ -19,9 +20,10 @@ import {
   Loader2,
   Clock,
   Layers,
+  Search,
 } from "lucide-react";
 import { toast } from "sonner";
-import type { Conversion, ConversionType } from "@/lib/supabase/database.types";
+import type { ConversionSummary, ConversionType } from "@/lib/supabase/database.types";
 
 const typeIcons: Record<ConversionType, React.ReactNode> = {
   image_to_text: <FileText className="h-4 w-4" />,
@@ -41,19 +43,67 @@ const typeLabels: Record<ConversionType, string> = {
   batch: "Batch Processing",
 };
 
+const SEARCH_DEBOUNCE_MS = 300;
+
 interface HistoryListProps {
-  history: Conversion[];
+  history: ConversionSummary[];
   isLoading: boolean;
   onDelete: (id: string) => Promise<boolean>;
+  onLoadText: (id: string) => Promise<string>;
+  hasMore?: boolean;
+  isLoadingMore?: boolean;
+  onLoadMore?: () => void;
+  query?: string;
+  onSearch?: (query: string) => void;
 }
 
-export function HistoryList({ history, isLoading, onDelete }: HistoryListProps) {
-  const [previewItem, setPreviewItem] = useState<Conversion | null>(null);
+export function HistoryList({
+  history,
+  isLoading,
+  onDelete,
+  onLoadText,
+  hasMore = false,
+  isLoadingMore = false,
+  onLoadMore,
+  query = "",
+  onSearch,
+}: HistoryListProps) {
+  const [previewItem, setPreviewItem] = useState<ConversionSummary | null>(null);
+  const [previewText, setPreviewText] = useState<string | null>(null);
   const [deletingId, setDeletingId] = useState<string | null>(null);
+  const [searchInput, setSearchInput] = useState(query);
+  const previewId = useRef<string | null>(null);
+
+  useEffect(() => {
+    if (!onSearch || searchInput.trim() === query) return;
+    const timer = setTimeout(() => onSearch(searchInput.trim()), SEARCH_DEBOUNCE_MS);
+    return () => clearTimeout(timer);
+  }, [searchInput, query, onSearch]);
+
+  const openPreview = async (item: ConversionSummary) => {
+    previewId.current = item.id;
+    setPreviewItem(item);
+    setPreviewText(null);
+    try {
+      const text = await onLoadText(item.id);
+      if (previewId.current === item.id) setPreviewText(text);
+    } catch {
+      toast.error("Failed to load text");
+    }
+  };
+
+  const closePreview = () => {
+    previewId.current = null;
+    setPreviewItem(null);
+  };
 
-  const handleCopy = (text: string) => {
-    navigator.clipboard.writeText(text);
-    toast.success("Copied to clipboard!");
+  const handleCopy = async (id: string) => {
+    try {
+      await navigator.clipboard.writeText(await onLoadText(id));
+      toast.success("Copied to clipboard!");
+    } catch {
+      toast.error("Failed to copy");
+    }
   };
 
   const handleDelete = async (id: string) => {
@@ -77,7 +127,8 @@ export function HistoryList({ history, isLoading, onDelete }: HistoryListProps)
     }).format(date);
   };
 
-  if (isLoading) {
+  // Keep the list (and search box) mounted while a search is loading
+  if (isLoading && !query) {
     return (
       <Card>
         <CardContent className="py-12 text-center">
@@ -88,7 +139,7 @@ export function HistoryList({ history, isLoading, onDelete }: HistoryListProps)
     );
   }
 
-  if (history.length === 0) {
+  if (history.length === 0 && !query) {
     return (
       <Card>
         <CardContent className="py-12 text-center">
@@ -110,9 +161,30 @@ export function HistoryList({ history, isLoading, onDelete }: HistoryListProps)
             <Clock className="h-5 w-5" />
             Conversion History
           </CardTitle>
+          {onSearch && (
+            <div className="relative mt-2">
+              <Search className="absolute left-3 top-1/2 -translate-y-1/2 h-4 w-4 text-muted-foreground" />
+              <Input
+                value={searchInput}
+                onChange={(e) => setSearchInput(e.target.value)}
+                placeholder="Search file names and text..."
+                className="pl-9"
+              />
+            </div>
+          )}
         </CardHeader>
         <CardContent className="space-y-2">
-          {history.map((item) => (
+          {isLoading && (
+            <div className="py-6 text-center">
+              <Loader2 className="h-6 w-6 animate-spin mx-auto text-muted-foreground" />
+            </div>
+          )}
+          {!isLoading && history.length === 0 && (
+            <p className="py-6 text-center text-sm text-muted-foreground">
+              No conversions match &quot;{query}&quot;
+            </p>
+          )}
+          {!isLoading && history.map((item) => (
             <div
               key={item.id}
               className="flex items-center gap-3 p-3 bg-muted/50 rounded-lg hover:bg-muted transition-colors"
@@ -129,21 +201,28 @@ export function HistoryList({ history, isLoading, onDelete }: HistoryListProps)
                   <span>{typeLabels[item.type]}</span>
                   <span>•</span>
                   <span>{formatDate(item.created_at)}</span>
+                  <span>•</span>
+                  <span>{item.char_count.toLocaleString()} chars</span>
                 </div>
+                {item.snippet && (
+                  <p className="text-xs text-muted-foreground truncate mt-0.5">
+                    {item.snippet}
+                  </p>
+                )}
               </div>
 
               <div className="flex items-center gap-1">
                 <Button
                   variant="ghost"
                   size="icon"
-                  onClick={() => setPreviewItem(item)}
+                  onClick={() => openPreview(item)}
                 >
                   <Eye className="h-4 w-4" />
                 </Button>
                 <Button
                   variant="ghost"
                   size="icon"
-                  onClick={() => handleCopy(item.output_text)}
+                  onClick={() => handleCopy(item.id)}
                 >
                   <Copy className="h-4 w-4" />
                 </Button>
@@ -162,10 +241,21 @@ export function HistoryList({ history, isLoading, onDelete }: HistoryListProps)
               </div>
             </div>
           ))}
+          {!isLoading && hasMore && onLoadMore && (
+            <Button
+              variant="outline"
+              className="w-full"
+              onClick={onLoadMore}
+              disabled={isLoadingMore}
+            >
+              {isLoadingMore && <Loader2 className="h-4 w-4 mr-2 animate-spin" />}
+              Load more
+            </Button>
+          )}
         </CardContent>
       </Card>
 
-      <Dialog open={!!previewItem} onOpenChange={() => setPreviewItem(null)}>
+      <Dialog open={!!previewItem} onOpenChange={closePreview}>
         <DialogContent className="max-w-2xl max-h-[80vh] overflow-hidden flex flex-col">
           <DialogHeader>
             <DialogTitle className="flex items-center gap-2">
@@ -175,20 +265,29 @@ export function HistoryList({ history, isLoading, onDelete }: HistoryListProps)
           </DialogHeader>
           <div className="flex-1 overflow-auto">
             <div className="bg-muted p-4 rounded-lg">
-              <pre className="text-sm whitespace-pre-wrap break-words">
-                {previewItem?.output_text}
-              </pre>
+              {previewText === null ? (
+                <div className="space-y-2">
+                  <pre className="text-sm whitespace-pre-wrap break-words text-muted-foreground">
+                    {previewItem?.snippet}
+                  </pre>
+                  <Loader2 className="h-4 w-4 animate-spin text-muted-foreground" />
+                </div>
+              ) : (
+                <pre className="text-sm whitespace-pre-wrap break-words">
+                  {previewText}
+                </pre>
+              )}
             </div>
           </div>
           <div className="flex justify-end gap-2 pt-4">
             <Button
               variant="outline"
-              onClick={() => previewItem && handleCopy(previewItem.output_text)}
+              onClick={() => previewItem && handleCopy(previewItem.id)}
             >
               <Copy className="h-4 w-4 mr-2" />
               Copy
             </Button>
-            <Button onClick={() => setPreviewItem(null)}>Close</Button>
+            <Button onClick={closePreview}>Close</Button>
           </div>
         </DialogContent>
       </Dialog>
@@ -1,5 +1,6 @@
 "use client";
 
+import { useEffect } from "react";
 import {
   Select,
   SelectContent,
@@ -8,6 +9,11 @@ import {
   SelectValue,
 } from "@/components/ui/select";
 import { LANGUAGES, type LanguageCode } from "@/lib/ocr/tesseract";
+import {
+  prefetchLanguageData,
+  prefetchLikelyLanguages,
+  rememberLanguage,
+} from "@/lib/ocr/language-data";
 
 interface LanguageSelectorProps {
   value: LanguageCode;
@@ -20,10 +26,19 @@ export function LanguageSelector({
   onChange,
   disabled = false,
 }: LanguageSelectorProps) {
+  // Have the traineddata cached before the first image arrives
+  useEffect(() => {
+    if (value === "auto") prefetchLikelyLanguages();
+    else prefetchLanguageData([value]);
+  }, [value]);
+
   return (
     <Select
       value={value}
-      onValueChange={(v) => onChange(v as LanguageCode)}
+      onValueChange={(v) => {
+        rememberLanguage(v as LanguageCode);
+        onChange(v as LanguageCode);
+      }}
       disabled={disabled}
     >
       <SelectTrigger className="w-[200px]">
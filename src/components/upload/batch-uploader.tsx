@@ -1,6 +1,6 @@
 "use client";
 
-import { useCallback, useState, useRef } from "react";
+import { memo, useCallback, useEffect, useState, useRef } from "react";
 import { useDropzone } from "react-dropzone";
 import { Button } from "@/components/ui/button";
 import { Progress } from "@/components/ui/progress";
@@ -15,6 +15,9 @@ import {
   Download,
   ChevronDown,
   Files,
+  Pause,
+  Play,
+  Square,
 } from "lucide-react";
 import { cn } from "@/lib/utils";
 import {
@@ -24,24 +27,35 @@ import {
   DropdownMenuTrigger,
 } from "@/components/ui/dropdown-menu";
 import { toast } from "sonner";
-
-interface FileItem {
-  id: string;
-  file: File;
+import { useKeyedProgress } from "@/hooks/use-keyed-progress";
+import {
+  BatchScheduler,
+  type BatchEvent,
+  type BatchOrder,
+  type BatchStats,
+} from "@/lib/batch/scheduler";
+import {
+  clearQueue,
+  deleteQueuedFile,
+  loadQueue,
+  saveQueuedFiles,
+  updateQueuedFile,
+  type QueuedFile,
+} from "@/lib/batch/queue-store";
+
+interface FileItem extends QueuedFile {
   preview: string | null;
-  status: "pending" | "processing" | "completed" | "error";
-  progress: number;
-  result?: string;
-  error?: string;
 }
 
 interface BatchUploaderProps {
   onProcess: (
     file: File,
-    onProgress: (progress: number) => void
+    onProgress: (progress: number) => void,
+    signal?: AbortSignal
   ) => Promise<string>;
   maxFiles?: number;
   maxSize?: number;
+  order?: BatchOrder;
   disabled?: boolean;
 }
 
@@ -54,36 +68,145 @@ const ACCEPTED_FORMATS = {
   "application/pdf": [".pdf"],
 };
 
+function createPreview(file: File): string | null {
+  return file.type.startsWith("image/") ? URL.createObjectURL(file) : null;
+}
+
+function formatDuration(ms: number): string {
+  const seconds = Math.round(ms / 1000);
+  if (seconds < 60) return `${seconds}s`;
+  const minutes = Math.floor(seconds / 60);
+  if (minutes < 60) return `${minutes}m ${seconds % 60}s`;
+  return `${Math.floor(minutes / 60)}h ${minutes % 60}m`;
+}
+
+// Memoized so a progress flush only re-renders the rows whose value changed
+const FileRow = memo(function FileRow({
+  fileItem,
+  progress,
+  canRemove,
+  onRemove,
+}: {
+  fileItem: FileItem;
+  progress: number;
+  canRemove: boolean;
+  onRemove: (id: string) => void;
+}) {
+  return (
+    <div className="flex items-center gap-3 p-3 bg-card rounded-lg border">
+      {fileItem.preview ? (
+        <img
+          src={fileItem.preview}
+          alt={fileItem.file.name}
+          loading="lazy"
+          decoding="async"
+          className="w-12 h-12 object-cover rounded"
+        />
+      ) : (
+        <div className="w-12 h-12 flex items-center justify-center bg-muted rounded">
+          <FileText className="h-6 w-6 text-muted-foreground" />
+        </div>
+      )}
+
+      <div className="flex-1 min-w-0">
+        <p className="text-sm font-medium truncate">
+          {fileItem.file.name}
+        </p>
+        <p className="text-xs text-muted-foreground">
+          {(fileItem.file.size / 1024).toFixed(1)} KB
+        </p>
+        {fileItem.status === "processing" && (
+          <Progress value={progress} className="h-1 mt-1" />
+        )}
+        {fileItem.status === "error" && (
+          <p className="text-xs text-destructive mt-1">
+            {fileItem.error}
+          </p>
+        )}
+      </div>
+
+      <div className="flex items-center gap-2">
+        {fileItem.status === "pending" && (
+          <span className="text-xs text-muted-foreground">Pending</span>
+        )}
+        {fileItem.status === "processing" && (
+          <Loader2 className="h-4 w-4 animate-spin text-primary" />
+        )}
+        {fileItem.status === "completed" && (
+          <CheckCircle className="h-4 w-4 text-green-500" />
+        )}
+        {fileItem.status === "error" && (
+          <AlertCircle className="h-4 w-4 text-destructive" />
+        )}
+
+        {canRemove && (
+          <button
+            onClick={() => onRemove(fileItem.id)}
+            className="p-1 hover:bg-muted rounded"
+          >
+            <X className="h-4 w-4" />
+          </button>
+        )}
+      </div>
+    </div>
+  );
+});
+
 export function BatchUploader({
   onProcess,
-  maxFiles = 10,
+  maxFiles = 500,
   maxSize = 10 * 1024 * 1024,
+  order = "largest-first",
   disabled = false,
 }: BatchUploaderProps) {
   const [files, setFiles] = useState<FileItem[]>([]);
   const [isProcessing, setIsProcessing] = useState(false);
+  const [isPaused, setIsPaused] = useState(false);
+  const [stats, setStats] = useState<BatchStats | null>(null);
+  const { progress, reportProgress, flushProgress } = useKeyedProgress();
   const inputRef = useRef<HTMLInputElement>(null);
+  const schedulerRef = useRef<BatchScheduler | null>(null);
+
+  // Restore a batch interrupted by a reload; files that were mid-flight
+  // start over
+  useEffect(() => {
+    let cancelled = false;
+    loadQueue()
+      .then((entries) => {
+        if (cancelled || entries.length === 0) return;
+        const restored = entries.map((entry) => ({
+          ...entry,
+          status: entry.status === "processing" ? ("pending" as const) : entry.status,
+          preview: createPreview(entry.file),
+        }));
+        setFiles((prev) => [...restored, ...prev].slice(0, maxFiles));
+      })
+      .catch((error) => console.error("Failed to restore batch queue:", error));
+    return () => {
+      cancelled = true;
+    };
+  }, [maxFiles]);
+
+  useEffect(() => () => schedulerRef.current?.cancel(), []);
 
   const onDrop = useCallback(
     (acceptedFiles: File[]) => {
-      const newFiles: FileItem[] = acceptedFiles.slice(0, maxFiles - files.length).map((file) => {
-        const id = Math.random().toString(36).substring(7);
-        let preview: string | null = null;
-
-        if (file.type.startsWith("image/")) {
-          preview = URL.createObjectURL(file);
-        }
-
-        return {
-          id,
+      const now = Date.now();
+      const entries: QueuedFile[] = acceptedFiles
+        .slice(0, maxFiles - files.length)
+        .map((file, index) => ({
+          id: Math.random().toString(36).substring(7),
           file,
-          preview,
           status: "pending" as const,
-          progress: 0,
-        };
-      });
+          attempts: 0,
+          addedAt: now + index,
+        }));
+      const newFiles = entries.map((entry) => ({ ...entry, preview: createPreview(entry.file) }));
 
       setFiles((prev) => [...prev, ...newFiles].slice(0, maxFiles));
+      saveQueuedFiles(entries).catch((error) =>
+        console.error("Failed to persist batch queue:", error)
+      );
     },
     [files.length, maxFiles]
   );
@@ -96,7 +219,7 @@ export function BatchUploader({
     disabled: disabled || isProcessing,
   });
 
-  const removeFile = (id: string) => {
+  const removeFile = useCallback((id: string) => {
     setFiles((prev) => {
       const file = prev.find((f) => f.id === id);
       if (file?.preview) {
@@ -104,62 +227,87 @@ export function BatchUploader({
       }
       return prev.filter((f) => f.id !== id);
     });
+    deleteQueuedFile(id).catch((error) =>
+      console.error("Failed to persist batch queue:", error)
+    );
+  }, []);
+
+  // Status changes are rare (a few per file); progress goes through the
+  // throttled keyed map instead
+  const updateFile = (id: string, patch: Partial<Omit<QueuedFile, "id" | "file">>) => {
+    setFiles((prev) => prev.map((f) => (f.id === id ? { ...f, ...patch } : f)));
+    updateQueuedFile(id, patch).catch((error) =>
+      console.error("Failed to persist batch queue:", error)
+    );
+  };
+
+  const handleEvent = (event: BatchEvent) => {
+    switch (event.type) {
+      case "start":
+        updateFile(event.id, { status: "processing", error: undefined });
+        reportProgress(event.id, 0);
+        break;
+      case "progress":
+        reportProgress(event.id, Math.round(event.progress * 100));
+        break;
+      case "complete":
+        reportProgress(event.id, 100);
+        updateFile(event.id, { status: "completed", result: event.result });
+        break;
+      case "retry":
+        updateFile(event.id, { status: "pending", attempts: event.attempts });
+        break;
+      case "error":
+        updateFile(event.id, {
+          status: "error",
+          attempts: event.attempts,
+          error: event.error,
+        });
+        break;
+      case "cancelled":
+        updateFile(event.id, { status: "pending" });
+        break;
+    }
   };
 
   const processAllFiles = async () => {
     if (files.length === 0 || isProcessing) return;
 
+    const pendingFiles = files.filter((f) => f.status !== "completed");
+    const scheduler = new BatchScheduler({
+      order,
+      process: (file, { signal, onProgress }) => onProcess(file, onProgress, signal),
+      onEvent: handleEvent,
+    });
+    schedulerRef.current = scheduler;
     setIsProcessing(true);
+    setIsPaused(false);
 
-    const pendingFiles = files.filter((f) => f.status !== "completed");
-    const CONCURRENCY = 3; // Process 3 files in parallel
-
-    // Process files in parallel with limited concurrency
-    const processFile = async (fileItem: FileItem) => {
-      setFiles((prev) =>
-        prev.map((f) =>
-          f.id === fileItem.id ? { ...f, status: "processing" as const, progress: 0 } : f
-        )
+    const statsTimer = setInterval(() => setStats(scheduler.stats), 1000);
+    try {
+      await scheduler.run(
+        pendingFiles.map((f) => ({ id: f.id, file: f.file, attempts: 0 }))
       );
-
-      try {
-        const result = await onProcess(fileItem.file, (progress) => {
-          setFiles((prev) =>
-            prev.map((f) =>
-              f.id === fileItem.id ? { ...f, progress: Math.round(progress * 100) } : f
-            )
-          );
-        });
-
-        setFiles((prev) =>
-          prev.map((f) =>
-            f.id === fileItem.id
-              ? { ...f, status: "completed" as const, progress: 100, result }
-              : f
-          )
-        );
-      } catch (error) {
-        setFiles((prev) =>
-          prev.map((f) =>
-            f.id === fileItem.id
-              ? {
-                  ...f,
-                  status: "error" as const,
-                  error: error instanceof Error ? error.message : "Processing failed",
-                }
-              : f
-          )
-        );
-      }
-    };
-
-    // Process in batches of CONCURRENCY
-    for (let i = 0; i < pendingFiles.length; i += CONCURRENCY) {
-      const batch = pendingFiles.slice(i, i + CONCURRENCY);
-      await Promise.all(batch.map(processFile));
+    } finally {
+      clearInterval(statsTimer);
+      setStats(scheduler.stats);
+      schedulerRef.current = null;
+      flushProgress();
+      setIsProcessing(false);
+      setIsPaused(false);
     }
+  };
 
-    setIsProcessing(false);
+  const togglePause = () => {
+    const scheduler = schedulerRef.current;
+    if (!scheduler) return;
+    if (scheduler.isPaused) scheduler.resume();
+    else scheduler.pause();
+    setIsPaused(scheduler.isPaused);
+  };
+
+  const cancelProcessing = () => {
+    schedulerRef.current?.cancel();
   };
 
   const downloadAllMerged = () => {
@@ -205,6 +353,8 @@ export function BatchUploader({
       if (f.preview) URL.revokeObjectURL(f.preview);
     });
     setFiles([]);
+    setStats(null);
+    clearQueue().catch((error) => console.error("Failed to clear batch queue:", error));
   };
 
   const completedCount = files.filter((f) => f.status === "completed").length;
@@ -265,6 +415,14 @@ export function BatchUploader({
           <div className="flex items-center justify-between">
             <span className="text-sm text-muted-foreground">
               {files.length} file(s) selected • {completedCount} completed
+              {stats && stats.filesPerMinute > 0 && (
+                <>
+                  {" "}• {stats.filesPerMinute.toFixed(1)} files/min
+                  {isProcessing && stats.etaMs !== null && (
+                    <> • ~{formatDuration(stats.etaMs)} left</>
+                  )}
+                </>
+              )}
             </span>
             <div className="flex gap-2">
               {hasResults && (
@@ -301,83 +459,46 @@ export function BatchUploader({
 
           <div className="space-y-2 max-h-[300px] overflow-y-auto">
             {files.map((fileItem) => (
-              <div
+              <FileRow
                 key={fileItem.id}
-                className="flex items-center gap-3 p-3 bg-card rounded-lg border"
-              >
-                {fileItem.preview ? (
-                  <img
-                    src={fileItem.preview}
-                    alt={fileItem.file.name}
-                    className="w-12 h-12 object-cover rounded"
-                  />
-                ) : (
-                  <div className="w-12 h-12 flex items-center justify-center bg-muted rounded">
-                    <FileText className="h-6 w-6 text-muted-foreground" />
-                  </div>
-                )}
-
-                <div className="flex-1 min-w-0">
-                  <p className="text-sm font-medium truncate">
-                    {fileItem.file.name}
-                  </p>
-                  <p className="text-xs text-muted-foreground">
-                    {(fileItem.file.size / 1024).toFixed(1)} KB
-                  </p>
-                  {fileItem.status === "processing" && (
-                    <Progress value={fileItem.progress} className="h-1 mt-1" />
-                  )}
-                  {fileItem.status === "error" && (
-                    <p className="text-xs text-destructive mt-1">
-                      {fileItem.error}
-                    </p>
-                  )}
-                </div>
-
-                <div className="flex items-center gap-2">
-                  {fileItem.status === "pending" && (
-                    <span className="text-xs text-muted-foreground">Pending</span>
-                  )}
-                  {fileItem.status === "processing" && (
-                    <Loader2 className="h-4 w-4 animate-spin text-primary" />
-                  )}
-                  {fileItem.status === "completed" && (
-                    <CheckCircle className="h-4 w-4 text-green-500" />
-                  )}
-                  {fileItem.status === "error" && (
-                    <AlertCircle className="h-4 w-4 text-destructive" />
-                  )}
-
-                  {!isProcessing && (
-                    <button
-                      onClick={() => removeFile(fileItem.id)}
-                      className="p-1 hover:bg-muted rounded"
-                    >
-                      <X className="h-4 w-4" />
-                    </button>
-                  )}
-                </div>
-              </div>
+                fileItem={fileItem}
+                progress={progress.get(fileItem.id) ?? 0}
+                canRemove={!isProcessing}
+                onRemove={removeFile}
+              />
             ))}
           </div>
 
-          <Button
-            onClick={processAllFiles}
-            disabled={isProcessing || files.every((f) => f.status === "completed")}
-            className="w-full"
-          >
-            {isProcessing ? (
-              <>
-                <Loader2 className="h-4 w-4 mr-2 animate-spin" />
-                Processing...
-              </>
-            ) : (
-              <>
-                <FileText className="h-4 w-4 mr-2" />
-                Process All Files
-              </>
-            )}
-          </Button>
+          {isProcessing ? (
+            <div className="flex gap-2">
+              <Button onClick={togglePause} variant="outline" className="flex-1">
+                {isPaused ? (
+                  <>
+                    <Play className="h-4 w-4 mr-2" />
+                    Resume
+                  </>
+                ) : (
+                  <>
+                    <Pause className="h-4 w-4 mr-2" />
+                    Pause
+                  </>
+                )}
+              </Button>
+              <Button onClick={cancelProcessing} variant="destructive">
+                <Square className="h-4 w-4 mr-2" />
+                Cancel
+              </Button>
+            </div>
+          ) : (
+            <Button
+              onClick={processAllFiles}
+              disabled={files.every((f) => f.status === "completed")}
+              className="w-full"
+            >
+              <FileText className="h-4 w-4 mr-2" />
+              Process All Files
+            </Button>
+          )}
         </div>
       )}
     </div>
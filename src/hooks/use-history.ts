@@ -1,31 +1,95 @@
 "use client";
 
-import { useState, useEffect, useCallback } from "react";
-import type { Conversion, ConversionType } from "@/lib/supabase/database.types";
+import { useState, useEffect, useCallback, useRef } from "react";
+import type { ConversionSummary, ConversionType } from "@/lib/supabase/database.types";
+
+interface HistoryPage {
+  history: ConversionSummary[];
+  nextCursor: string | null;
+}
+
+async function fetchHistoryPage(query: string, cursor: string | null): Promise<HistoryPage> {
+  const params = new URLSearchParams();
+  if (query) params.set("q", query);
+  if (cursor) params.set("cursor", cursor);
+
+  // The browser revalidates with If-None-Match, so an unchanged page is a 304
+  const response = await fetch(`/api/history?${params}`);
+  const data = await response.json();
+
+  if (!response.ok) {
+    throw new Error(data.error || "Failed to fetch history");
+  }
+
+  return { history: data.history || [], nextCursor: data.nextCursor ?? null };
+}
 
 export function useHistory() {
-  const [history, setHistory] = useState<Conversion[]>([]);
+  const [history, setHistory] = useState<ConversionSummary[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [query, setQuery] = useState("");
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  // Full texts fetched so far, by conversion id
+  const textCache = useRef(new Map<string, Promise<string>>());
+  // Ignores responses for a query that has since changed
+  const requestId = useRef(0);
 
   const fetchHistory = useCallback(async () => {
+    const id = ++requestId.current;
     setIsLoading(true);
     setError(null);
 
     try {
-      const response = await fetch("/api/history");
-      const data = await response.json();
+      const page = await fetchHistoryPage(query, null);
+      if (id !== requestId.current) return;
+      setHistory(page.history);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      if (id !== requestId.current) return;
+      setError(err instanceof Error ? err.message : "Unknown error");
+    } finally {
+      if (id === requestId.current) setIsLoading(false);
+    }
+  }, [query]);
 
-      if (!response.ok) {
-        throw new Error(data.error || "Failed to fetch history");
-      }
+  const loadMore = useCallback(async () => {
+    if (!nextCursor || isLoadingMore) return;
+    const id = requestId.current;
+    setIsLoadingMore(true);
 
-      setHistory(data.history || []);
+    try {
+      const page = await fetchHistoryPage(query, nextCursor);
+      if (id !== requestId.current) return;
+      setHistory((prev) => {
+        const seen = new Set(prev.map((item) => item.id));
+        return [...prev, ...page.history.filter((item) => !seen.has(item.id))];
+      });
+      setNextCursor(page.nextCursor);
     } catch (err) {
+      if (id !== requestId.current) return;
       setError(err instanceof Error ? err.message : "Unknown error");
     } finally {
-      setIsLoading(false);
+      setIsLoadingMore(false);
+    }
+  }, [query, nextCursor, isLoadingMore]);
+
+  const getConversionText = useCallback((id: string) => {
+    let text = textCache.current.get(id);
+    if (!text) {
+      text = fetch(`/api/history/${id}`).then(async (response) => {
+        const data = await response.json();
+        if (!response.ok) {
+          throw new Error(data.error || "Failed to fetch conversion");
+        }
+        return data.output_text as string;
+      });
+      // Don't keep failures around; the next call retries
+      text.catch(() => textCache.current.delete(id));
+      textCache.current.set(id, text);
     }
+    return text;
   }, []);
 
   const saveConversion = useCallback(
@@ -35,6 +99,8 @@ export function useHistory() {
       input_format: string;
       output_text: string;
       language: string;
+      // OCRResult.timings.total, when recognizeText was asked for timings
+      processing_time?: number;
     }) => {
       try {
         const response = await fetch("/api/history", {
@@ -53,6 +119,7 @@ export function useHistory() {
 
         // Add to local state
         if (data.conversion) {
+          textCache.current.set(data.conversion.id, Promise.resolve(params.output_text));
           setHistory((prev) => [data.conversion, ...prev]);
         }
 
@@ -76,6 +143,7 @@ export function useHistory() {
         throw new Error(data.error || "Failed to delete conversion");
       }
 
+      textCache.current.delete(id);
       setHistory((prev) => prev.filter((item) => item.id !== id));
       return true;
     } catch (err) {
@@ -91,8 +159,14 @@ export function useHistory() {
   return {
     history,
     isLoading,
+    isLoadingMore,
+    hasMore: nextCursor !== null,
     error,
+    query,
+    search: setQuery,
     fetchHistory,
+    loadMore,
+    getConversionText,
     saveConversion,
     deleteConversion,
   };
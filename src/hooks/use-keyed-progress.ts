@@ -0,0 +1,26 @@
+"use client";
+
+import { useState, useEffect } from "react";
+import { createProgressBatcher } from "@/lib/progress";
+
+// Per-item progress kept in a Map keyed by item id and updated at a fixed
+// rate, so progress ticks neither remap the item list nor re-render on
+// every event
+export function useKeyedProgress(intervalMs = 100) {
+  const [progress, setProgress] = useState<ReadonlyMap<string, number>>(
+    () => new Map()
+  );
+  const [batcher] = useState(() =>
+    createProgressBatcher<string, number>((updates) => {
+      setProgress((prev) => {
+        const next = new Map(prev);
+        updates.forEach((value, key) => next.set(key, value));
+        return next;
+      });
+    }, intervalMs)
+  );
+
+  useEffect(() => () => batcher.cancel(), [batcher]);
+
+  return { progress, reportProgress: batcher.report, flushProgress: batcher.flush };
+}
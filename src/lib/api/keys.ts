@@ -0,0 +1,241 @@
+import { LRUCache } from "@/lib/cache/lru";
+import { observeDuration } from "@/lib/metrics/registry";
+import { createAdminClient } from "@/lib/supabase/admin";
+
+// API key validation and daily rate limiting.
+//
+// Key metadata is cached in-process for KEY_CACHE_TTL_MS and requests are
+// counted locally, so the hot path makes no database round-trips. Counts are
+// flushed every FLUSH_INTERVAL_MS through the increment_api_key_usage RPC,
+// which adds them atomically and resets the counter on a new UTC day. Counts
+// belong to the day they were made on; ones still unflushed when that day
+// ends are dropped rather than charged to the next day. With
+// several server instances a key can overshoot its limit by at most the
+// requests made on other instances within one flush/TTL window.
+
+// Bounds memory when many unknown keys are tried
+const MAX_CACHED_KEYS = 10_000;
+const KEY_CACHE_TTL_MS = 60 * 1000;
+const INVALID_KEY_TTL_MS = 10 * 1000;
+const FLUSH_INTERVAL_MS = 5 * 1000;
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+interface KeyEntry {
+  id: string;
+  userId: string;
+  limit: number;
+  // Requests counted in the database when the entry was last synced
+  used: number;
+  // Requests counted here on `day` but not yet flushed
+  pending: number;
+  // Requests sent in a flush whose result hasn't come back; still counted
+  inFlight: number;
+  // Start of the UTC day `used` refers to
+  day: number;
+  expiresAt: number;
+}
+
+type CachedKey = KeyEntry | { invalid: true; expiresAt: number };
+
+export interface ApiKeyValidation {
+  valid: boolean;
+  error?: string;
+  userId?: string;
+  // HTTP status to use when the key is rejected (401 or 429)
+  status?: number;
+  // X-RateLimit-* (and Retry-After when limited) response headers
+  headers: Record<string, string>;
+}
+
+const keys = new LRUCache<CachedKey>({ maxEntries: MAX_CACHED_KEYS });
+// Only concurrent lookups are held here; each is removed once it settles
+const inflight = new Map<string, Promise<CachedKey>>();
+// Entries with requests not yet recorded in the database. Held separately
+// so evicting a key from the cache never drops its counts.
+const unflushed = new Set<KeyEntry>();
+let flushTimer: ReturnType<typeof setInterval> | null = null;
+
+function startOfUTCDay(time: number): number {
+  const date = new Date(time);
+  return Date.UTC(date.getUTCFullYear(), date.getUTCMonth(), date.getUTCDate());
+}
+
+async function fetchKey(apiKey: string): Promise<CachedKey> {
+  const supabase = createAdminClient();
+  const startedAt = performance.now();
+  const { data, error } = await supabase
+    .from("api_keys")
+    .select("id, user_id, rate_limit, requests_today, last_reset")
+    .eq("key", apiKey)
+    .eq("is_active", true)
+    .single();
+  // Only cache misses reach the database; the route's "auth" span covers both
+  observeDuration("api_key_lookup", "supabase", performance.now() - startedAt);
+
+  const now = Date.now();
+  if (error || !data) {
+    return { invalid: true, expiresAt: now + INVALID_KEY_TTL_MS };
+  }
+
+  const today = startOfUTCDay(now);
+  const lastReset = data.last_reset ? startOfUTCDay(new Date(data.last_reset).getTime()) : 0;
+
+  return {
+    id: data.id,
+    userId: data.user_id,
+    limit: data.rate_limit ?? 100,
+    // A counter from an earlier day is stale; the RPC resets it on next flush
+    used: lastReset === today ? data.requests_today ?? 0 : 0,
+    pending: 0,
+    inFlight: 0,
+    day: today,
+    expiresAt: now + KEY_CACHE_TTL_MS,
+  };
+}
+
+async function getKey(apiKey: string): Promise<CachedKey> {
+  const cached = keys.get(apiKey);
+  if (cached && cached.expiresAt > Date.now()) return cached;
+
+  // Concurrent misses for the same key share one lookup
+  let pending = inflight.get(apiKey);
+  if (!pending) {
+    pending = fetchKey(apiKey)
+      .then((entry) => {
+        // Refresh a known key in place, so its local counts and any flush
+        // in progress keep applying to the entry that is checked
+        if (cached && !("invalid" in cached) && !("invalid" in entry)) {
+          cached.userId = entry.userId;
+          cached.limit = entry.limit;
+          cached.expiresAt = entry.expiresAt;
+          if (cached.inFlight === 0 && cached.day === entry.day) {
+            cached.used = Math.max(cached.used, entry.used);
+          }
+          entry = cached;
+        }
+        keys.set(apiKey, entry);
+        return entry;
+      })
+      .finally(() => inflight.delete(apiKey));
+    inflight.set(apiKey, pending);
+  }
+  return pending;
+}
+
+export async function flushApiKeyUsage(): Promise<void> {
+  const supabase = createAdminClient();
+
+  await Promise.all(
+    Array.from(unflushed).map(async (entry) => {
+      if (entry.pending === 0) {
+        if (entry.inFlight === 0) unflushed.delete(entry);
+        return;
+      }
+
+      // Counts from a day that has ended no longer apply to any limit
+      const day = entry.day;
+      if (day !== startOfUTCDay(Date.now())) {
+        entry.pending = 0;
+        if (entry.inFlight === 0) unflushed.delete(entry);
+        return;
+      }
+
+      // Sent requests stay counted against the limit until `used` includes them
+      const count = entry.pending;
+      entry.pending = 0;
+      entry.inFlight += count;
+      let data: unknown = null;
+      let error: unknown = null;
+      try {
+        ({ data, error } = await supabase.rpc("increment_api_key_usage", {
+          p_key_id: entry.id,
+          p_count: count,
+          p_day: new Date(day).toISOString().slice(0, 10),
+        }));
+      } catch (reason) {
+        error = reason;
+      } finally {
+        entry.inFlight -= count;
+      }
+
+      if (error) {
+        // Keep the requests for the next flush, unless their day has ended
+        if (entry.day === day) entry.pending += count;
+        console.error("API key usage flush error:", error);
+        return;
+      }
+      // NULL means the day ended before the RPC ran and nothing was added
+      if (entry.day === day && typeof data === "number") {
+        entry.used = Math.max(entry.used, data);
+      }
+      if (entry.pending === 0 && entry.inFlight === 0) unflushed.delete(entry);
+    })
+  );
+}
+
+function scheduleFlush() {
+  if (flushTimer) return;
+  flushTimer = setInterval(() => {
+    flushApiKeyUsage().catch((error) => console.error("API key usage flush error:", error));
+  }, FLUSH_INTERVAL_MS);
+  // Don't keep the process alive just to flush counters
+  flushTimer.unref?.();
+}
+
+function countedRequests(entry: KeyEntry): number {
+  return entry.used + entry.pending + entry.inFlight;
+}
+
+function rateLimitHeaders(entry: KeyEntry): Record<string, string> {
+  const remaining = Math.max(0, entry.limit - countedRequests(entry));
+  return {
+    "X-RateLimit-Limit": String(entry.limit),
+    "X-RateLimit-Remaining": String(remaining),
+    "X-RateLimit-Reset": String(Math.ceil((entry.day + DAY_MS) / 1000)),
+  };
+}
+
+// API Key validation. `cost` is the number of requests charged against the
+// daily quota (one per image for batches); status/polling endpoints pass 0,
+// which only authenticates so results already paid for stay reachable.
+export async function validateApiKey(
+  apiKey: string | null,
+  cost = 1
+): Promise<ApiKeyValidation> {
+  if (!apiKey) {
+    return { valid: false, error: "API key is required", status: 401, headers: {} };
+  }
+
+  const entry = await getKey(apiKey);
+  if ("invalid" in entry) {
+    return { valid: false, error: "Invalid API key", status: 401, headers: {} };
+  }
+
+  // Daily window rolls over at UTC midnight
+  const now = Date.now();
+  const today = startOfUTCDay(now);
+  if (entry.day !== today) {
+    entry.day = today;
+    entry.used = 0;
+    entry.pending = 0;
+  }
+
+  if (cost > 0) {
+    const remaining = entry.limit - countedRequests(entry);
+    if (cost > remaining) {
+      const headers = rateLimitHeaders(entry);
+      headers["Retry-After"] = String(Math.ceil((today + DAY_MS - now) / 1000));
+      const error =
+        cost > 1 && remaining > 0
+          ? `Rate limit exceeded: this request needs ${cost} requests but ${remaining} remain today`
+          : "Rate limit exceeded";
+      return { valid: false, error, status: 429, headers };
+    }
+
+    entry.pending += cost;
+    unflushed.add(entry);
+    scheduleFlush();
+  }
+
+  return { valid: true, userId: entry.userId, headers: rateLimitHeaders(entry) };
+}
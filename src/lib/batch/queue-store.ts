@@ -0,0 +1,78 @@
+import { promisify } from "@/lib/cache/indexeddb";
+
+// Persisted batch queue, so a long batch survives a reload. Files are stored
+// as Blobs (IndexedDB keeps them on disk, not in memory) next to their status
+// and result.
+
+export interface QueuedFile {
+  id: string;
+  file: File;
+  status: "pending" | "processing" | "completed" | "error";
+  attempts: number;
+  result?: string;
+  error?: string;
+  addedAt: number;
+}
+
+const DB_NAME = "batch-queue";
+const STORE = "files";
+
+let dbPromise: Promise<IDBDatabase> | null = null;
+
+function open(): Promise<IDBDatabase> | null {
+  if (typeof indexedDB === "undefined") return null;
+  if (!dbPromise) {
+    const request = indexedDB.open(DB_NAME, 1);
+    request.onupgradeneeded = () => {
+      request.result.createObjectStore(STORE, { keyPath: "id" });
+    };
+    dbPromise = promisify(request);
+  }
+  return dbPromise;
+}
+
+export async function loadQueue(): Promise<QueuedFile[]> {
+  const db = await open();
+  if (!db) return [];
+  const entries = await promisify<QueuedFile[]>(
+    db.transaction(STORE, "readonly").objectStore(STORE).getAll()
+  );
+  return entries.sort((a, b) => a.addedAt - b.addedAt);
+}
+
+export async function saveQueuedFiles(entries: QueuedFile[]): Promise<void> {
+  const db = await open();
+  if (!db || entries.length === 0) return;
+  const transaction = db.transaction(STORE, "readwrite");
+  const store = transaction.objectStore(STORE);
+  for (const entry of entries) store.put(entry);
+  await new Promise<void>((resolve, reject) => {
+    transaction.oncomplete = () => resolve();
+    transaction.onerror = () => reject(transaction.error);
+    transaction.onabort = () => reject(transaction.error);
+  });
+}
+
+// Merge a status change into the stored entry
+export async function updateQueuedFile(
+  id: string,
+  patch: Partial<Omit<QueuedFile, "id" | "file">>
+): Promise<void> {
+  const db = await open();
+  if (!db) return;
+  const store = db.transaction(STORE, "readwrite").objectStore(STORE);
+  const entry = await promisify<QueuedFile | undefined>(store.get(id));
+  if (entry) await promisify(store.put({ ...entry, ...patch }));
+}
+
+export async function deleteQueuedFile(id: string): Promise<void> {
+  const db = await open();
+  if (!db) return;
+  await promisify(db.transaction(STORE, "readwrite").objectStore(STORE).delete(id));
+}
+
+export async function clearQueue(): Promise<void> {
+  const db = await open();
+  if (!db) return;
+  await promisify(db.transaction(STORE, "readwrite").objectStore(STORE).clear());
+}
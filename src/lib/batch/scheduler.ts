@@ -0,0 +1,282 @@
+// Client-side batch scheduler. Concurrency follows the device (cores and
+// reported memory) and a memory budget per file, work is ordered to shorten
+// the batch, and runs can be paused, resumed and cancelled.
+
+export type BatchOrder = "largest-first" | "shortest-first" | "fifo";
+
+export interface BatchTask {
+  id: string;
+  file: File;
+  // Failed attempts so far
+  attempts: number;
+}
+
+export interface BatchTaskContext {
+  signal: AbortSignal;
+  onProgress: (progress: number) => void;
+}
+
+export interface BatchStats {
+  total: number;
+  completed: number;
+  failed: number;
+  running: number;
+  filesPerMinute: number;
+  // Estimated time left, from bytes processed per active millisecond
+  etaMs: number | null;
+}
+
+export type BatchEvent =
+  | { type: "start"; id: string }
+  | { type: "progress"; id: string; progress: number }
+  | { type: "complete"; id: string; result: string }
+  | { type: "retry"; id: string; attempts: number; error: string }
+  | { type: "error"; id: string; attempts: number; error: string }
+  | { type: "cancelled"; id: string };
+
+export interface BatchSchedulerOptions {
+  process: (file: File, context: BatchTaskContext) => Promise<string>;
+  onEvent: (event: BatchEvent) => void;
+  concurrency?: number;
+  order?: BatchOrder;
+  maxRetries?: number;
+  retryDelayMs?: number;
+  // Memory the batch may hold in decoded images at once
+  memoryBudgetBytes?: number;
+}
+
+const MAX_CONCURRENCY = 8;
+// Decoded RGBA plus preprocessing copies, relative to the compressed size
+const DECODE_EXPANSION = 12;
+const MIN_TASK_MEMORY = 32 * 1024 * 1024;
+
+function deviceMemoryGB(): number {
+  const memory =
+    typeof navigator !== "undefined"
+      ? (navigator as Navigator & { deviceMemory?: number }).deviceMemory
+      : undefined;
+  // Chromium only; assume a mid-range device elsewhere
+  return memory ?? 4;
+}
+
+// One job per spare core, and no more than ~2 jobs per GB of device memory
+export function defaultBatchConcurrency(): number {
+  const cores =
+    typeof navigator !== "undefined" && navigator.hardwareConcurrency
+      ? navigator.hardwareConcurrency
+      : 2;
+  const byCores = Math.max(1, cores - 1);
+  const byMemory = Math.max(1, Math.floor(deviceMemoryGB() * 2));
+  return Math.min(MAX_CONCURRENCY, byCores, byMemory);
+}
+
+function defaultMemoryBudget(): number {
+  // A quarter of device memory for in-flight images
+  return deviceMemoryGB() * 1024 * 1024 * 1024 * 0.25;
+}
+
+function estimateTaskMemory(file: File): number {
+  return Math.max(MIN_TASK_MEMORY, file.size * DECODE_EXPANSION);
+}
+
+// Settle with the task, or reject as soon as the signal aborts
+function raceAbort<T>(promise: Promise<T>, signal: AbortSignal): Promise<T> {
+  if (signal.aborted) return Promise.reject(signal.reason);
+  return new Promise((resolve, reject) => {
+    const onAbort = () => reject(signal.reason);
+    signal.addEventListener("abort", onAbort, { once: true });
+    promise.then(resolve, reject).finally(() => signal.removeEventListener("abort", onAbort));
+  });
+}
+
+export class BatchScheduler {
+  private readonly options: Required<Omit<BatchSchedulerOptions, "concurrency" | "memoryBudgetBytes">>;
+  private readonly concurrency: number;
+  private readonly memoryBudget: number;
+  private queue: BatchTask[] = [];
+  private running = new Map<string, { controller: AbortController; memory: number }>();
+  private reservedMemory = 0;
+  private paused = false;
+  private retries = new Map<string, { task: BatchTask; timer: ReturnType<typeof setTimeout> }>();
+  private idleWaiters: (() => void)[] = [];
+
+  // Throughput accounting; time only runs while tasks are in flight
+  private completed = 0;
+  private failed = 0;
+  private total = 0;
+  private completedBytes = 0;
+  private remainingBytes = 0;
+  private activeMs = 0;
+  private activeSince: number | null = null;
+
+  constructor(options: BatchSchedulerOptions) {
+    this.options = {
+      order: "largest-first",
+      maxRetries: 2,
+      retryDelayMs: 1000,
+      ...options,
+    };
+    this.concurrency = Math.max(1, options.concurrency ?? defaultBatchConcurrency());
+    this.memoryBudget = options.memoryBudgetBytes ?? defaultMemoryBudget();
+  }
+
+  get isPaused(): boolean {
+    return this.paused;
+  }
+
+  get isIdle(): boolean {
+    return this.queue.length === 0 && this.running.size === 0 && this.retries.size === 0;
+  }
+
+  get stats(): BatchStats {
+    const elapsed = this.activeMs + (this.activeSince ? performance.now() - this.activeSince : 0);
+    const bytesPerMs = elapsed > 0 ? this.completedBytes / elapsed : 0;
+    return {
+      total: this.total,
+      completed: this.completed,
+      failed: this.failed,
+      running: this.running.size,
+      filesPerMinute: elapsed > 0 ? (this.completed / elapsed) * 60_000 : 0,
+      etaMs: bytesPerMs > 0 ? this.remainingBytes / bytesPerMs : null,
+    };
+  }
+
+  // Queue tasks and start as many as the limits allow. Resolves when the
+  // queue is drained (or cancelled).
+  run(tasks: BatchTask[]): Promise<void> {
+    this.queue.push(...tasks);
+    this.total += tasks.length;
+    this.remainingBytes += tasks.reduce((sum, task) => sum + task.file.size, 0);
+    this.sortQueue();
+
+    const done = new Promise<void>((resolve) => this.idleWaiters.push(resolve));
+    this.pump();
+    return done;
+  }
+
+  pause() {
+    this.paused = true;
+  }
+
+  resume() {
+    this.paused = false;
+    this.pump();
+  }
+
+  // Abort running tasks and drop queued ones; every dropped task is reported
+  // as cancelled so callers can mark it pending again
+  cancel() {
+    for (const task of this.queue) {
+      this.remainingBytes -= task.file.size;
+      this.options.onEvent({ type: "cancelled", id: task.id });
+    }
+    for (const { task, timer } of this.retries.values()) {
+      clearTimeout(timer);
+      this.remainingBytes -= task.file.size;
+      this.options.onEvent({ type: "cancelled", id: task.id });
+    }
+    this.total -= this.queue.length + this.retries.size;
+    this.queue = [];
+    this.retries.clear();
+    for (const { controller } of this.running.values()) {
+      controller.abort(new DOMException("Batch cancelled", "AbortError"));
+    }
+    this.paused = false;
+    this.settleIfIdle();
+  }
+
+  private sortQueue() {
+    const { order } = this.options;
+    if (order === "largest-first") {
+      // Longest-processing-time first keeps the last wave of workers short
+      this.queue.sort((a, b) => b.file.size - a.file.size);
+    } else if (order === "shortest-first") {
+      // Minimises the average time until each file is done
+      this.queue.sort((a, b) => a.file.size - b.file.size);
+    }
+  }
+
+  private canStart(task: BatchTask): boolean {
+    if (this.running.size >= this.concurrency) return false;
+    // Always let one task run, however large
+    if (this.running.size === 0) return true;
+    return this.reservedMemory + estimateTaskMemory(task.file) <= this.memoryBudget;
+  }
+
+  private pump() {
+    while (!this.paused && this.queue.length > 0 && this.canStart(this.queue[0])) {
+      this.start(this.queue.shift()!);
+    }
+    this.settleIfIdle();
+  }
+
+  private start(task: BatchTask) {
+    const controller = new AbortController();
+    const memory = estimateTaskMemory(task.file);
+    this.running.set(task.id, { controller, memory });
+    this.reservedMemory += memory;
+    if (this.activeSince === null) this.activeSince = performance.now();
+
+    this.options.onEvent({ type: "start", id: task.id });
+
+    const work = this.options.process(task.file, {
+      signal: controller.signal,
+      onProgress: (progress) => this.options.onEvent({ type: "progress", id: task.id, progress }),
+    });
+
+    raceAbort(work, controller.signal)
+      .then((result) => {
+        this.finish(task);
+        this.completed++;
+        this.completedBytes += task.file.size;
+        this.options.onEvent({ type: "complete", id: task.id, result });
+      })
+      .catch((error) => {
+        this.finish(task);
+        if (controller.signal.aborted) {
+          this.options.onEvent({ type: "cancelled", id: task.id });
+          this.total--;
+          return;
+        }
+
+        const message = error instanceof Error ? error.message : "Processing failed";
+        const attempts = task.attempts + 1;
+        if (attempts <= this.options.maxRetries) {
+          // Back off, then requeue at the end so other files make progress
+          this.remainingBytes += task.file.size;
+          this.options.onEvent({ type: "retry", id: task.id, attempts, error: message });
+          const timer = setTimeout(() => {
+            this.retries.delete(task.id);
+            this.queue.push({ ...task, attempts });
+            this.pump();
+          }, this.options.retryDelayMs * 2 ** (attempts - 1));
+          this.retries.set(task.id, { task, timer });
+          return;
+        }
+
+        this.failed++;
+        this.options.onEvent({ type: "error", id: task.id, attempts, error: message });
+      })
+      .finally(() => this.pump());
+  }
+
+  private finish(task: BatchTask) {
+    const entry = this.running.get(task.id);
+    if (entry) {
+      this.reservedMemory -= entry.memory;
+      this.running.delete(task.id);
+    }
+    this.remainingBytes -= task.file.size;
+    if (this.running.size === 0 && this.activeSince !== null) {
+      this.activeMs += performance.now() - this.activeSince;
+      this.activeSince = null;
+    }
+  }
+
+  private settleIfIdle() {
+    if (!this.isIdle) return;
+    const waiters = this.idleWaiters;
+    this.idleWaiters = [];
+    waiters.forEach((resolve) => resolve());
+  }
+}
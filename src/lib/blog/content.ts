@@ -0,0 +1,13 @@
+import { readFile } from "node:fs/promises";
+import path from "node:path";
+import { getPostBySlug } from "./posts";
+
+// Server only: post bodies are read from disk when blog/[slug] is
+// pre-rendered, so no page bundle carries them
+const CONTENT_DIR = path.join(process.cwd(), "src/lib/blog/content");
+
+export async function getPostContent(slug: string): Promise<string | undefined> {
+  // Only known slugs map to files, so a slug can never escape CONTENT_DIR
+  if (!getPostBySlug(slug)) return undefined;
+  return readFile(path.join(CONTENT_DIR, `${slug}.md`), "utf8");
+}
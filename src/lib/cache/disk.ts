@@ -0,0 +1,115 @@
+import { createHash } from "node:crypto";
+import { mkdir, readFile, readdir, rename, stat, unlink, writeFile } from "node:fs/promises";
+import path from "node:path";
+import type { CacheStore } from "./tiered";
+
+export interface DiskStoreOptions {
+  ttlMs?: number;
+  maxEntries?: number;
+  maxBytes?: number;
+}
+
+// Server persistent cache tier: one JSON file per key, named by the key's
+// SHA-256 so any key is filesystem-safe, and sharded by the first two hex
+// characters so no directory grows too large. The directory is bounded by
+// entry count and total bytes; the least recently used files are deleted.
+export function createDiskStore<V>(
+  directory: string,
+  options: DiskStoreOptions = {}
+): CacheStore<V> {
+  const {
+    ttlMs = 7 * 24 * 60 * 60 * 1000,
+    maxEntries = 10_000,
+    maxBytes = 512 * 1024 * 1024,
+  } = options;
+
+  // File path -> size in bytes, least recently used first
+  const index = new Map<string, number>();
+  let totalBytes = 0;
+  let loaded: Promise<void> | null = null;
+
+  const fileFor = (key: string) => {
+    const name = createHash("sha256").update(key).digest("hex");
+    return path.join(directory, name.slice(0, 2), `${name}.json`);
+  };
+
+  const untrack = (file: string) => {
+    const size = index.get(file);
+    if (size !== undefined) {
+      index.delete(file);
+      totalBytes -= size;
+    }
+  };
+
+  const track = (file: string, size: number) => {
+    untrack(file);
+    index.set(file, size);
+    totalBytes += size;
+  };
+
+  const evict = async () => {
+    const victims: string[] = [];
+    for (const file of index.keys()) {
+      if (index.size <= maxEntries && totalBytes <= maxBytes) break;
+      untrack(file);
+      victims.push(file);
+    }
+    await Promise.all(victims.map((file) => unlink(file).catch(() => {})));
+  };
+
+  // Files left by earlier runs are indexed once, oldest first
+  const load = () => {
+    if (!loaded) {
+      loaded = (async () => {
+        const found: { file: string; size: number; mtimeMs: number }[] = [];
+        const shards = await readdir(directory).catch(() => [] as string[]);
+        for (const shard of shards) {
+          const names = await readdir(path.join(directory, shard)).catch(() => [] as string[]);
+          for (const name of names) {
+            if (!name.endsWith(".json")) continue;
+            const file = path.join(directory, shard, name);
+            const info = await stat(file).catch(() => null);
+            if (info) found.push({ file, size: info.size, mtimeMs: info.mtimeMs });
+          }
+        }
+        found.sort((a, b) => a.mtimeMs - b.mtimeMs);
+        for (const { file, size } of found) track(file, size);
+        await evict();
+      })();
+    }
+    return loaded;
+  };
+
+  return {
+    async get(key) {
+      await load();
+      const file = fileFor(key);
+      try {
+        const raw = await readFile(file, "utf8");
+        const record = JSON.parse(raw) as { value: V; expiresAt: number };
+        if (record.expiresAt <= Date.now()) {
+          untrack(file);
+          await unlink(file).catch(() => {});
+          return undefined;
+        }
+        track(file, Buffer.byteLength(raw));
+        return record.value;
+      } catch {
+        untrack(file);
+        return undefined;
+      }
+    },
+    async set(key, value) {
+      await load();
+      const file = fileFor(key);
+      const data = JSON.stringify({ value, expiresAt: Date.now() + ttlMs });
+      await mkdir(path.dirname(file), { recursive: true });
+      // Write then rename so concurrent readers never see a partial file
+      const tmp = `${file}.${process.pid}.tmp`;
+      await writeFile(tmp, data);
+      await rename(tmp, file);
+      track(file, Buffer.byteLength(data));
+      await evict();
+    },
+  };
+}
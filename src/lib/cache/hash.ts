@@ -0,0 +1,18 @@
+// SHA-256 hex digest using Web Crypto, available in browsers and Node.js
+export async function sha256Hex(
+  data: ArrayBuffer | Uint8Array | Blob | string
+): Promise<string> {
+  let bytes: ArrayBuffer | Uint8Array;
+  if (typeof data === "string") {
+    bytes = new TextEncoder().encode(data);
+  } else if (data instanceof Blob) {
+    bytes = await data.arrayBuffer();
+  } else {
+    bytes = data;
+  }
+
+  const digest = await crypto.subtle.digest("SHA-256", bytes as BufferSource);
+  return Array.from(new Uint8Array(digest))
+    .map((byte) => byte.toString(16).padStart(2, "0"))
+    .join("");
+}
@@ -0,0 +1,57 @@
+import type { CacheStore } from "./tiered";
+
+interface StoredRecord<V> {
+  key: string;
+  value: V;
+  expiresAt: number;
+}
+
+export function promisify<T>(request: IDBRequest<T>): Promise<T> {
+  return new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+  });
+}
+
+// Browser persistent cache tier. Each store lives in its own database so
+// versions can be bumped independently.
+export function createIndexedDBStore<V>(
+  dbName: string,
+  ttlMs: number = 7 * 24 * 60 * 60 * 1000
+): CacheStore<V> | undefined {
+  if (typeof indexedDB === "undefined") return undefined;
+
+  const STORE = "entries";
+  let dbPromise: Promise<IDBDatabase> | null = null;
+
+  const open = () => {
+    if (!dbPromise) {
+      const request = indexedDB.open(dbName, 1);
+      request.onupgradeneeded = () => {
+        request.result.createObjectStore(STORE, { keyPath: "key" });
+      };
+      dbPromise = promisify(request);
+    }
+    return dbPromise;
+  };
+
+  return {
+    async get(key) {
+      const db = await open();
+      const record = await promisify<StoredRecord<V> | undefined>(
+        db.transaction(STORE, "readonly").objectStore(STORE).get(key)
+      );
+      if (!record) return undefined;
+      if (record.expiresAt <= Date.now()) {
+        db.transaction(STORE, "readwrite").objectStore(STORE).delete(key);
+        return undefined;
+      }
+      return record.value;
+    },
+    async set(key, value) {
+      const db = await open();
+      const record: StoredRecord<V> = { key, value, expiresAt: Date.now() + ttlMs };
+      await promisify(db.transaction(STORE, "readwrite").objectStore(STORE).put(record));
+    },
+  };
+}
@@ -0,0 +1,77 @@
+export interface LRUCacheOptions<V> {
+  maxEntries?: number;
+  maxSize?: number;
+  ttlMs?: number;
+  sizeOf?: (value: V) => number;
+}
+
+interface Entry<V> {
+  value: V;
+  size: number;
+  expiresAt: number;
+}
+
+// Map-backed LRU cache bounded by entry count, total size and age.
+// A Map iterates in insertion order, so re-inserting on access keeps the
+// least recently used entry first.
+export class LRUCache<V> {
+  private entries = new Map<string, Entry<V>>();
+  private totalSize = 0;
+  private readonly maxEntries: number;
+  private readonly maxSize: number;
+  private readonly ttlMs: number;
+  private readonly sizeOf: (value: V) => number;
+
+  constructor(options: LRUCacheOptions<V> = {}) {
+    this.maxEntries = options.maxEntries ?? 500;
+    this.maxSize = options.maxSize ?? Infinity;
+    this.ttlMs = options.ttlMs ?? Infinity;
+    this.sizeOf = options.sizeOf ?? (() => 1);
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get(key: string): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+
+    if (entry.expiresAt <= Date.now()) {
+      this.delete(key);
+      return undefined;
+    }
+
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: string, value: V) {
+    this.delete(key);
+
+    const size = this.sizeOf(value);
+    if (size > this.maxSize) return;
+
+    this.entries.set(key, { value, size, expiresAt: Date.now() + this.ttlMs });
+    this.totalSize += size;
+
+    for (const oldest of this.entries.keys()) {
+      if (this.entries.size <= this.maxEntries && this.totalSize <= this.maxSize) break;
+      this.delete(oldest);
+    }
+  }
+
+  delete(key: string) {
+    const entry = this.entries.get(key);
+    if (entry) {
+      this.entries.delete(key);
+      this.totalSize -= entry.size;
+    }
+  }
+
+  clear() {
+    this.entries.clear();
+    this.totalSize = 0;
+  }
+}
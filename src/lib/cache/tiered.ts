@@ -0,0 +1,95 @@
+import { LRUCache } from "./lru";
+
+// Optional second tier behind the in-memory LRU (IndexedDB, disk, ...)
+export interface CacheStore<V> {
+  get(key: string): Promise<V | undefined>;
+  set(key: string, value: V): Promise<void>;
+}
+
+export interface CacheStats {
+  hits: number;
+  memoryHits: number;
+  persistentHits: number;
+  misses: number;
+}
+
+export class TieredCache<V> {
+  private readonly memory: LRUCache<V>;
+  private readonly persistent?: CacheStore<V>;
+  private inFlight = new Map<string, Promise<V>>();
+  private counters: CacheStats = {
+    hits: 0,
+    memoryHits: 0,
+    persistentHits: 0,
+    misses: 0,
+  };
+
+  constructor(memory: LRUCache<V>, persistent?: CacheStore<V>) {
+    this.memory = memory;
+    this.persistent = persistent;
+  }
+
+  get stats(): CacheStats {
+    return { ...this.counters };
+  }
+
+  async get(key: string): Promise<V | undefined> {
+    const cached = this.memory.get(key);
+    if (cached !== undefined) {
+      this.counters.hits++;
+      this.counters.memoryHits++;
+      return cached;
+    }
+
+    if (this.persistent) {
+      try {
+        const stored = await this.persistent.get(key);
+        if (stored !== undefined) {
+          this.counters.hits++;
+          this.counters.persistentHits++;
+          this.memory.set(key, stored);
+          return stored;
+        }
+      } catch (error) {
+        console.error("Cache read error:", error);
+      }
+    }
+
+    this.counters.misses++;
+    return undefined;
+  }
+
+  async set(key: string, value: V): Promise<void> {
+    this.memory.set(key, value);
+    if (this.persistent) {
+      try {
+        await this.persistent.set(key, value);
+      } catch (error) {
+        console.error("Cache write error:", error);
+      }
+    }
+  }
+
+  // Returns the cached value or computes and stores it. Concurrent calls
+  // for the same key share a single computation.
+  async getOrCompute(key: string, compute: () => Promise<V>): Promise<V> {
+    const pending = this.inFlight.get(key);
+    if (pending) return pending;
+
+    const promise = (async () => {
+      const cached = await this.get(key);
+      if (cached !== undefined) return cached;
+
+      const value = await compute();
+      void this.set(key, value);
+      return value;
+    })();
+
+    this.inFlight.set(key, promise);
+    try {
+      return await promise;
+    } finally {
+      this.inFlight.delete(key);
+    }
+  }
+}
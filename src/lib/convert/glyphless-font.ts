@@ -0,0 +1,143 @@
+// A minimal TrueType font with two empty glyphs (.notdef and a blank), the
+// same idea as the GlyphLessFont Tesseract embeds in its PDF output. The
+// invisible text layer maps every code to the blank glyph, so strict viewers
+// get an embedded font program instead of substituting one.
+
+export const GLYPHLESS_UNITS_PER_EM = 1000;
+
+interface Table {
+  tag: string;
+  data: Uint8Array;
+}
+
+function table(tag: string, size: number, fill: (view: DataView) => void): Table {
+  const data = new Uint8Array(size);
+  fill(new DataView(data.buffer));
+  return { tag, data };
+}
+
+function checksum(data: Uint8Array): number {
+  const padded = new Uint8Array((data.length + 3) & ~3);
+  padded.set(data);
+  const view = new DataView(padded.buffer);
+  let sum = 0;
+  for (let i = 0; i < padded.length; i += 4) {
+    sum = (sum + view.getUint32(i)) >>> 0;
+  }
+  return sum;
+}
+
+function utf16be(text: string): Uint8Array {
+  const bytes = new Uint8Array(text.length * 2);
+  for (let i = 0; i < text.length; i++) {
+    bytes[i * 2] = text.charCodeAt(i) >> 8;
+    bytes[i * 2 + 1] = text.charCodeAt(i) & 0xff;
+  }
+  return bytes;
+}
+
+// Both glyphs advance by `advance` units and have no outline
+export function buildGlyphlessFont(name: string, advance: number): Uint8Array {
+  const tables: Table[] = [
+    // Format 4 subtable with only the required 0xFFFF end segment
+    table("cmap", 36, (v) => {
+      v.setUint16(2, 1); // one encoding record
+      v.setUint16(4, 3); // Windows
+      v.setUint16(6, 1); // Unicode BMP
+      v.setUint32(8, 12);
+      v.setUint16(12, 4); // format
+      v.setUint16(14, 24); // length
+      v.setUint16(18, 2); // segCountX2
+      v.setUint16(20, 2); // searchRange
+      v.setUint16(26, 0xffff); // endCode
+      v.setUint16(30, 0xffff); // startCode
+      v.setUint16(32, 1); // idDelta
+    }),
+    { tag: "glyf", data: new Uint8Array(0) },
+    table("head", 54, (v) => {
+      v.setUint32(0, 0x00010000);
+      v.setUint32(4, 0x00010000);
+      v.setUint32(12, 0x5f0f3cf5);
+      v.setUint16(16, 0x000b);
+      v.setUint16(18, GLYPHLESS_UNITS_PER_EM);
+      v.setInt16(40, advance); // xMax
+      v.setInt16(42, GLYPHLESS_UNITS_PER_EM); // yMax
+      v.setUint16(46, 3); // lowestRecPPEM
+      v.setInt16(48, 2); // fontDirectionHint
+    }),
+    table("hhea", 36, (v) => {
+      v.setUint32(0, 0x00010000);
+      v.setInt16(4, GLYPHLESS_UNITS_PER_EM); // ascender
+      v.setUint16(10, advance); // advanceWidthMax
+      v.setInt16(16, advance); // xMaxExtent
+      v.setInt16(18, 1); // caretSlopeRise
+      v.setUint16(34, 2); // numberOfHMetrics
+    }),
+    table("hmtx", 8, (v) => {
+      v.setUint16(0, advance);
+      v.setUint16(4, advance);
+    }),
+    // Short offsets; every glyph is empty so all point at 0
+    table("loca", 6, () => {}),
+    table("maxp", 32, (v) => {
+      v.setUint32(0, 0x00010000);
+      v.setUint16(4, 2); // numGlyphs
+      v.setUint16(14, 2); // maxZones
+    }),
+    (() => {
+      const family = utf16be(name);
+      const records = [1, 4, 6];
+      return table("name", 6 + records.length * 12 + family.length, (v) => {
+        v.setUint16(2, records.length);
+        v.setUint16(4, 6 + records.length * 12);
+        records.forEach((nameId, i) => {
+          const record = 6 + i * 12;
+          v.setUint16(record, 3);
+          v.setUint16(record + 2, 1);
+          v.setUint16(record + 4, 0x0409);
+          v.setUint16(record + 6, nameId);
+          v.setUint16(record + 8, family.length);
+          // All records share the one string
+          v.setUint16(record + 10, 0);
+        });
+        new Uint8Array(v.buffer).set(family, 6 + records.length * 12);
+      });
+    })(),
+    table("post", 32, (v) => {
+      v.setUint32(0, 0x00030000);
+      v.setUint32(12, 1); // isFixedPitch
+    }),
+  ];
+
+  const headerSize = 12 + tables.length * 16;
+  let size = headerSize;
+  const offsets = tables.map((t) => {
+    const offset = size;
+    size += (t.data.length + 3) & ~3;
+    return offset;
+  });
+
+  const font = new Uint8Array(size);
+  const view = new DataView(font.buffer);
+  const entrySelector = Math.floor(Math.log2(tables.length));
+  const searchRange = 2 ** entrySelector * 16;
+  view.setUint32(0, 0x00010000);
+  view.setUint16(4, tables.length);
+  view.setUint16(6, searchRange);
+  view.setUint16(8, entrySelector);
+  view.setUint16(10, tables.length * 16 - searchRange);
+
+  // Tables are already in tag order, as the directory requires
+  tables.forEach((t, i) => {
+    const record = 12 + i * 16;
+    for (let c = 0; c < 4; c++) font[record + c] = t.tag.charCodeAt(c);
+    view.setUint32(record + 4, checksum(t.data));
+    view.setUint32(record + 8, offsets[i]);
+    view.setUint32(record + 12, t.data.length);
+    font.set(t.data, offsets[i]);
+  });
+
+  const head = offsets[tables.findIndex((t) => t.tag === "head")];
+  view.setUint32(head + 8, (0xb1b0afba - checksum(font)) >>> 0);
+  return font;
+}
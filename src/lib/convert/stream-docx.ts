@@ -0,0 +1,141 @@
+import { Timings } from "@/lib/metrics/timings";
+import { ZipWriter, type ZipSink } from "@/lib/zip/writer";
+import type { WordOptions } from "./to-word";
+
+// Streaming DOCX writer. Instead of building a docx object graph, the
+// WordprocessingML is generated as text and deflated into the ZIP sink in
+// chunks of CHUNK_SIZE characters. Memory stays bounded by one chunk plus the
+// deflate window (~64KB + ~300KB) whatever the length of the document; only
+// the current text block passed in by the caller is held on top of that.
+
+const CHUNK_SIZE = 64 * 1024;
+
+const CONTENT_TYPES = `<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"><Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/><Default Extension="xml" ContentType="application/xml"/><Override PartName="/word/document.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/><Override PartName="/word/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/></Types>`;
+
+const PACKAGE_RELS = `<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="word/document.xml"/></Relationships>`;
+
+const DOCUMENT_RELS = `<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/></Relationships>`;
+
+// Same heading look as the docx package's defaults used by createWordDocument
+const STYLES = `<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Calibri" w:hAnsi="Calibri" w:eastAsia="Calibri" w:cs="Calibri"/><w:sz w:val="22"/></w:rPr></w:rPrDefault></w:docDefaults><w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/></w:style><w:style w:type="paragraph" w:styleId="Heading1"><w:name w:val="heading 1"/><w:basedOn w:val="Normal"/><w:next w:val="Normal"/><w:qFormat/><w:pPr><w:keepNext/><w:outlineLvl w:val="0"/></w:pPr><w:rPr><w:b/><w:color w:val="2E74B5"/><w:sz w:val="32"/></w:rPr></w:style><w:style w:type="paragraph" w:styleId="Heading2"><w:name w:val="heading 2"/><w:basedOn w:val="Normal"/><w:next w:val="Normal"/><w:qFormat/><w:pPr><w:keepNext/><w:outlineLvl w:val="1"/></w:pPr><w:rPr><w:b/><w:color w:val="2E74B5"/><w:sz w:val="26"/></w:rPr></w:style></w:styles>`;
+
+const DOCUMENT_START = `<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>`;
+
+// A4 with 1" margins, matching the docx package defaults
+const DOCUMENT_END = `<w:sectPr><w:pgSz w:w="11906" w:h="16838"/><w:pgMar w:top="1440" w:right="1440" w:bottom="1440" w:left="1440" w:header="708" w:footer="708" w:gutter="0"/></w:sectPr></w:body></w:document>`;
+
+function escapeXml(text: string): string {
+  return text
+    // Control characters are not allowed in XML 1.0
+    .replace(/[\u0000-\u0008\u000b\u000c\u000e-\u001f]/g, "")
+    .replace(/&/g, "&amp;")
+    .replace(/</g, "&lt;")
+    .replace(/>/g, "&gt;");
+}
+
+interface ParagraphProps {
+  style?: string;
+  align?: "center" | "right";
+  before?: number;
+  after?: number;
+}
+
+function paragraph(runs: string, props: ParagraphProps = {}): string {
+  const properties = [
+    props.style ? `<w:pStyle w:val="${props.style}"/>` : "",
+    props.before || props.after
+      ? `<w:spacing${props.before ? ` w:before="${props.before}"` : ""}${
+          props.after ? ` w:after="${props.after}"` : ""
+        }/>`
+      : "",
+    props.align ? `<w:jc w:val="${props.align}"/>` : "",
+  ].join("");
+
+  return `<w:p>${properties ? `<w:pPr>${properties}</w:pPr>` : ""}${runs}</w:p>`;
+}
+
+function run(text: string, properties = ""): string {
+  return `<w:r>${properties ? `<w:rPr>${properties}</w:rPr>` : ""}<w:t xml:space="preserve">${escapeXml(text)}</w:t></w:r>`;
+}
+
+// Yield the body XML block by block, mirroring createWordDocument's layout
+async function* documentParts(
+  blocks: Iterable<string> | AsyncIterable<string>,
+  options: WordOptions
+): AsyncGenerator<string> {
+  const { title = "Extracted Text", formatted = false } = options;
+
+  yield DOCUMENT_START;
+  yield paragraph(run(title), { style: "Heading1", align: "center", after: 400 });
+  yield paragraph(run("Extracted Text:"), { style: "Heading2", before: 400, after: 200 });
+
+  if (formatted) {
+    for await (const block of blocks) {
+      for (const para of block.split(/\n\n+/)) {
+        for (const line of para.split(/\n/)) {
+          yield paragraph(run(line.trim()), { after: 100 });
+        }
+        yield paragraph("");
+      }
+    }
+  } else {
+    // One paragraph for the whole text, with line breaks between lines
+    yield "<w:p>";
+    let first = true;
+    for await (const block of blocks) {
+      for (const line of block.split(/\n/)) {
+        yield `${first ? "" : "<w:r><w:br/></w:r>"}${run(line)}`;
+        first = false;
+      }
+    }
+    yield "</w:p>";
+  }
+
+  yield paragraph("", { before: 400 });
+  yield paragraph(
+    run(`Generated on ${new Date().toLocaleString()}`, '<w:color w:val="808080"/><w:sz w:val="18"/>'),
+    { align: "right" }
+  );
+  yield DOCUMENT_END;
+}
+
+// Batch small XML fragments into CHUNK_SIZE pieces before encoding
+async function* encodeChunks(parts: AsyncIterable<string>): AsyncGenerator<Uint8Array> {
+  const encoder = new TextEncoder();
+  let buffer = "";
+  for await (const part of parts) {
+    buffer += part;
+    if (buffer.length >= CHUNK_SIZE) {
+      yield encoder.encode(buffer);
+      buffer = "";
+    }
+  }
+  if (buffer) yield encoder.encode(buffer);
+}
+
+// Write a DOCX to the sink. `blocks` are pieces of the text (for example one
+// per PDF page) and may be produced lazily.
+export async function writeWordDocument(
+  sink: ZipSink,
+  blocks: Iterable<string> | AsyncIterable<string>,
+  options: WordOptions = {}
+): Promise<void> {
+  const encoder = new TextEncoder();
+  const zip = new ZipWriter(sink);
+  const timings = options.timings ?? new Timings("docx");
+
+  // Includes the time spent producing lazy blocks and waiting on the sink
+  await timings.time("write", async () => {
+    await zip.addFile("[Content_Types].xml", encoder.encode(CONTENT_TYPES));
+    await zip.addFile("_rels/.rels", encoder.encode(PACKAGE_RELS));
+    await zip.addFile("word/_rels/document.xml.rels", encoder.encode(DOCUMENT_RELS));
+    await zip.addFile("word/styles.xml", encoder.encode(STYLES));
+    await zip.addStream("word/document.xml", encodeChunks(documentParts(blocks, options)));
+    await zip.close();
+  });
+}
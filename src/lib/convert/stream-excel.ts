@@ -0,0 +1,123 @@
+import { once } from "node:events";
+import type { Writable } from "node:stream";
+import ExcelJS from "exceljs";
+import { Timings } from "@/lib/metrics/timings";
+import { CELL_STYLE, HEADER_STYLE } from "./to-excel";
+import type { MergedCell } from "./table-layout";
+
+// Streaming XLSX export for the server, built on ExcelJS's WorkbookWriter.
+// Each row is committed (serialized and deflated into the output stream) as
+// soon as it is written, shared strings are disabled and every cell points at
+// one of two shared style objects. Memory is bounded by the SAMPLE_ROWS rows
+// buffered to size the columns plus the zip deflate buffers (well under
+// 10MB), independent of the number of rows.
+
+// Rows read ahead to pick column widths; widths must be fixed before the
+// first row is committed
+const SAMPLE_ROWS = 200;
+// Rows between yielding to the event loop so the zip stream can flush and a
+// slow consumer can apply backpressure
+const FLUSH_EVERY = 1000;
+
+export interface ExcelStreamOptions {
+  sheetName?: string;
+  // Indexes of rows styled as headers (default: the first row)
+  headerRows?: Iterable<number>;
+  merges?: MergedCell[];
+  maxColumnWidth?: number;
+  // Receives the "write" span
+  timings?: Timings;
+}
+
+// Includes the time spent producing lazy rows and waiting on the stream
+export async function writeExcelStream(
+  rows: Iterable<string[]> | AsyncIterable<string[]>,
+  stream: Writable,
+  options: ExcelStreamOptions = {}
+): Promise<void> {
+  const timings = options.timings ?? new Timings("xlsx");
+  await timings.time("write", () => writeWorkbook(rows, stream, options));
+}
+
+async function writeWorkbook(
+  rows: Iterable<string[]> | AsyncIterable<string[]>,
+  stream: Writable,
+  options: ExcelStreamOptions
+): Promise<void> {
+  const { sheetName = "Extracted Data", merges = [], maxColumnWidth = 60 } = options;
+  const headerRows = new Set(options.headerRows ?? [0]);
+
+  const workbook = new ExcelJS.stream.xlsx.WorkbookWriter({
+    stream,
+    useStyles: true,
+    useSharedStrings: false,
+  });
+  workbook.creator = "Image to Text";
+  workbook.created = new Date();
+
+  const worksheet = workbook.addWorksheet(sheetName);
+  const pending: string[][] = [];
+  let rowIndex = 0;
+  let sized = false;
+
+  const sizeColumns = () => {
+    const widths: number[] = [];
+    for (const row of pending) {
+      row.forEach((cell, colIndex) => {
+        widths[colIndex] = Math.max(widths[colIndex] ?? 10, Math.min(cell.length, maxColumnWidth));
+      });
+    }
+    worksheet.columns = widths.map((width) => ({ width: width + 2 }));
+    sized = true;
+  };
+
+  const commitRow = (cells: string[]) => {
+    const row = worksheet.getRow(rowIndex + 1);
+    const style = headerRows.has(rowIndex) ? HEADER_STYLE : CELL_STYLE;
+    cells.forEach((value, colIndex) => {
+      const cell = row.getCell(colIndex + 1);
+      cell.value = value;
+      cell.style = style;
+    });
+    row.commit();
+    rowIndex++;
+  };
+
+  const flush = async () => {
+    await new Promise((resolve) => setImmediate(resolve));
+    if (stream.writableNeedDrain) {
+      await Promise.race([once(stream, "drain"), once(stream, "close")]);
+    }
+    if (stream.destroyed) throw new Error("Output stream closed");
+  };
+
+  for await (const cells of rows) {
+    if (sized) {
+      commitRow(cells);
+      if (rowIndex % FLUSH_EVERY === 0) await flush();
+      continue;
+    }
+    pending.push(cells);
+    if (pending.length >= SAMPLE_ROWS) {
+      sizeColumns();
+      pending.splice(0).forEach(commitRow);
+    }
+  }
+  if (!sized) {
+    sizeColumns();
+    pending.splice(0).forEach(commitRow);
+  }
+
+  // Merges are kept as ranges and written with the sheet footer
+  for (const merge of merges) {
+    worksheet.mergeCells(
+      merge.row + 1,
+      merge.startColumn + 1,
+      merge.row + 1,
+      merge.endColumn + 1
+    );
+  }
+
+  worksheet.commit();
+  await workbook.commit();
+}
@@ -0,0 +1,231 @@
+// Table reconstruction from positioned words (Tesseract or PDF text layer).
+//
+// All thresholds are relative to the median glyph height, so the same
+// document scanned at 150 or 600 DPI produces the same table. Every step is
+// a sort, a linear sweep or a binary search, keeping the whole pass at
+// O(n log n) in the number of words.
+
+export interface LayoutWord {
+  text: string;
+  bbox: { x0: number; y0: number; x1: number; y1: number };
+}
+
+export interface MergedCell {
+  row: number;
+  startColumn: number;
+  endColumn: number;
+}
+
+export interface TableLayout {
+  rows: string[][];
+  merges: MergedCell[];
+  // Column separators in page coordinates (length = columns - 1)
+  boundaries: number[];
+}
+
+// Rows whose vertical centers are within this many glyph heights share a band
+const ROW_TOLERANCE = 0.6;
+// A vertical gap larger than this many glyph heights starts a new table
+const TABLE_GAP = 2.5;
+// Minimum width of an empty vertical strip to count as a column gap
+const COLUMN_GAP = 1.0;
+// Fraction of rows allowed to cross a column gap (spanning/merged cells)
+const SPAN_TOLERANCE = 0.1;
+
+function median(values: number[]): number {
+  if (values.length === 0) return 0;
+  const sorted = Float64Array.from(values).sort();
+  const mid = sorted.length >> 1;
+  return sorted.length % 2 ? sorted[mid] : (sorted[mid - 1] + sorted[mid]) / 2;
+}
+
+// Index of the first boundary greater than x, i.e. the column containing x
+function findColumn(boundaries: number[], x: number): number {
+  let lo = 0;
+  let hi = boundaries.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (boundaries[mid] <= x) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+interface Band<W extends LayoutWord> {
+  words: W[];
+  top: number;
+  bottom: number;
+  center: number;
+}
+
+// Sweep words ordered by vertical center, opening a new band whenever a word
+// sits too far below the running center of the current one
+function bandRows<W extends LayoutWord>(words: W[], glyphHeight: number): Band<W>[] {
+  const sorted = [...words].sort(
+    (a, b) => a.bbox.y0 + a.bbox.y1 - (b.bbox.y0 + b.bbox.y1)
+  );
+  const tolerance = glyphHeight * ROW_TOLERANCE;
+  const bands: Band<W>[] = [];
+  let current: Band<W> | null = null;
+  let centerSum = 0;
+
+  for (const word of sorted) {
+    const center = (word.bbox.y0 + word.bbox.y1) / 2;
+    if (current && center - current.center <= tolerance) {
+      current.words.push(word);
+      current.top = Math.min(current.top, word.bbox.y0);
+      current.bottom = Math.max(current.bottom, word.bbox.y1);
+      centerSum += center;
+      current.center = centerSum / current.words.length;
+    } else {
+      current = { words: [word], top: word.bbox.y0, bottom: word.bbox.y1, center };
+      centerSum = center;
+      bands.push(current);
+    }
+  }
+
+  for (const band of bands) {
+    band.words.sort((a, b) => a.bbox.x0 - b.bbox.x0);
+  }
+  return bands;
+}
+
+// Split bands into separate tables at unusually large vertical gaps
+function splitTables<W extends LayoutWord>(bands: Band<W>[], glyphHeight: number): Band<W>[][] {
+  const tables: Band<W>[][] = [];
+  let current: Band<W>[] = [];
+
+  for (const band of bands) {
+    const previous = current[current.length - 1];
+    if (previous && band.top - previous.bottom > glyphHeight * TABLE_GAP) {
+      tables.push(current);
+      current = [];
+    }
+    current.push(band);
+  }
+  if (current.length > 0) tables.push(current);
+  return tables;
+}
+
+// Column separators from a coverage histogram: the middle of every strip of
+// x positions that (almost) no row covers with a word
+function detectColumns<W extends LayoutWord>(bands: Band<W>[], glyphHeight: number): number[] {
+  let minX = Infinity;
+  let maxX = -Infinity;
+  for (const band of bands) {
+    for (const word of band.words) {
+      minX = Math.min(minX, word.bbox.x0);
+      maxX = Math.max(maxX, word.bbox.x1);
+    }
+  }
+  if (!isFinite(minX) || maxX <= minX) return [];
+
+  const bucket = Math.max(1, glyphHeight / 4);
+  const size = Math.ceil((maxX - minX) / bucket) + 2;
+  // Difference array: +1 where a row's coverage starts, -1 where it ends
+  const delta = new Int32Array(size + 1);
+
+  for (const band of bands) {
+    // Merge overlapping words first so each row counts at most once per bucket
+    let start = -1;
+    let end = -1;
+    for (const word of band.words) {
+      const s = Math.floor((word.bbox.x0 - minX) / bucket);
+      const e = Math.ceil((word.bbox.x1 - minX) / bucket);
+      if (s > end) {
+        if (end >= 0) {
+          delta[start]++;
+          delta[end]--;
+        }
+        start = s;
+        end = e;
+      } else {
+        end = Math.max(end, e);
+      }
+    }
+    if (end >= 0) {
+      delta[start]++;
+      delta[end]--;
+    }
+  }
+
+  const allowed = Math.floor(bands.length * SPAN_TOLERANCE);
+  const minGapBuckets = Math.max(1, Math.round((glyphHeight * COLUMN_GAP) / bucket));
+  const boundaries: number[] = [];
+  let coverage = 0;
+  let gapStart = -1;
+  let seenContent = false;
+
+  for (let i = 0; i < size; i++) {
+    coverage += delta[i];
+    if (coverage <= allowed) {
+      if (gapStart < 0) gapStart = i;
+    } else {
+      if (seenContent && gapStart >= 0 && i - gapStart >= minGapBuckets) {
+        boundaries.push(minX + ((gapStart + i) / 2) * bucket);
+      }
+      gapStart = -1;
+      seenContent = true;
+    }
+  }
+
+  return boundaries;
+}
+
+function layoutTable<W extends LayoutWord>(bands: Band<W>[], glyphHeight: number): TableLayout {
+  const boundaries = detectColumns(bands, glyphHeight);
+  const columnCount = boundaries.length + 1;
+  const rows: string[][] = [];
+  const merges: MergedCell[] = [];
+
+  bands.forEach((band, rowIndex) => {
+    const cells: string[] = new Array(columnCount).fill("");
+
+    for (const word of band.words) {
+      const startColumn = findColumn(boundaries, word.bbox.x0);
+      const endColumn = findColumn(boundaries, word.bbox.x1);
+      cells[startColumn] = cells[startColumn]
+        ? `${cells[startColumn]} ${word.text}`
+        : word.text;
+
+      // A word crossing a column gap belongs to a merged (spanning) cell
+      if (endColumn > startColumn) {
+        const last = merges[merges.length - 1];
+        if (last && last.row === rowIndex && last.endColumn >= startColumn) {
+          last.endColumn = Math.max(last.endColumn, endColumn);
+        } else {
+          merges.push({ row: rowIndex, startColumn, endColumn });
+        }
+      }
+    }
+
+    // Fold the text of covered cells into the merged cell so nothing is hidden
+    for (let i = merges.length - 1; i >= 0 && merges[i].row === rowIndex; i--) {
+      const { startColumn, endColumn } = merges[i];
+      for (let column = startColumn + 1; column <= endColumn; column++) {
+        if (cells[column]) {
+          cells[startColumn] = `${cells[startColumn]} ${cells[column]}`;
+          cells[column] = "";
+        }
+      }
+    }
+
+    rows.push(cells);
+  });
+
+  return { rows, merges, boundaries };
+}
+
+// Detect every table on a page. Blocks separated by large vertical gaps are
+// laid out independently, each with its own columns.
+export function detectTables(words: LayoutWord[]): TableLayout[] {
+  const usable = words.filter(
+    (word) => word.text.trim() && word.bbox.y1 > word.bbox.y0 && word.bbox.x1 >= word.bbox.x0
+  );
+  if (usable.length === 0) return [];
+
+  const glyphHeight = Math.max(1, median(usable.map((w) => w.bbox.y1 - w.bbox.y0)));
+  const bands = bandRows(usable, glyphHeight);
+
+  return splitTables(bands, glyphHeight).map((table) => layoutTable(table, glyphHeight));
+}
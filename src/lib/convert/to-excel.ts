@@ -1,58 +1,94 @@
 import ExcelJS from "exceljs";
+import { Timings } from "@/lib/metrics/timings";
+import { detectTables, type LayoutWord, type MergedCell } from "./table-layout";
 
 export interface ExcelOptions {
   sheetName?: string;
   parseTable?: boolean;
+  // Receives the "layout" and "write" spans
+  timings?: Timings;
 }
 
-function parseTextToTable(text: string): string[][] {
-  const lines = text.split("\n").filter((line) => line.trim());
-  const rows: string[][] = [];
-
-  for (const line of lines) {
-    let cells: string[];
-
-    // Try different delimiters in order of priority
-    if (line.includes("\t")) {
-      // Tab-separated
-      cells = line.split("\t").map((cell) => cell.trim());
-    } else if (line.includes("|")) {
-      // Pipe-separated (markdown tables)
-      cells = line
-        .split("|")
-        .map((cell) => cell.trim())
-        .filter((cell) => cell);
-    } else if (/\s{3,}/.test(line)) {
-      // Multiple spaces (3+) as column separator
-      cells = line.split(/\s{3,}/).map((cell) => cell.trim());
-    } else if (/^\d+\s+/.test(line)) {
-      // Line starts with a number followed by space - treat as row number + content
-      const match = line.match(/^(\d+)\s+(.+)$/);
-      if (match) {
-        cells = [match[1], match[2].trim()];
-      } else {
-        cells = [line.trim()];
-      }
-    } else if (/^[A-Z]\s+/.test(line)) {
-      // Line starts with a single letter followed by space (like column headers)
-      const match = line.match(/^([A-Z])\s+(.+)$/);
-      if (match) {
-        cells = [match[1], match[2].trim()];
-      } else {
-        cells = [line.trim()];
-      }
+// Shared style objects: ExcelJS keeps one style record per distinct style, and
+// reusing the same objects avoids allocating fresh style objects per cell
+export const CELL_STYLE: Partial<ExcelJS.Style> = {
+  border: {
+    top: { style: "thin" },
+    left: { style: "thin" },
+    bottom: { style: "thin" },
+    right: { style: "thin" },
+  },
+  alignment: { wrapText: true, vertical: "top" },
+};
+
+export const HEADER_STYLE: Partial<ExcelJS.Style> = {
+  ...CELL_STYLE,
+  font: { bold: true },
+  fill: {
+    type: "pattern",
+    pattern: "solid",
+    fgColor: { argb: "FFE0E0E0" },
+  },
+};
+
+export const XLSX_MIME_TYPE =
+  "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet";
+
+// Split one line of OCR text into cells; returns [] for blank lines
+export function parseTableLine(line: string): string[] {
+  if (!line.trim()) return [];
+  let cells: string[];
+
+  // Try different delimiters in order of priority
+  if (line.includes("\t")) {
+    // Tab-separated
+    cells = line.split("\t").map((cell) => cell.trim());
+  } else if (line.includes("|")) {
+    // Pipe-separated (markdown tables)
+    cells = line
+      .split("|")
+      .map((cell) => cell.trim())
+      .filter((cell) => cell);
+  } else if (/\s{3,}/.test(line)) {
+    // Multiple spaces (3+) as column separator
+    cells = line.split(/\s{3,}/).map((cell) => cell.trim());
+  } else if (/^\d+\s+/.test(line)) {
+    // Line starts with a number followed by space - treat as row number + content
+    const match = line.match(/^(\d+)\s+(.+)$/);
+    if (match) {
+      cells = [match[1], match[2].trim()];
+    } else {
+      cells = [line.trim()];
+    }
+  } else if (/^[A-Z]\s+/.test(line)) {
+    // Line starts with a single letter followed by space (like column headers)
+    const match = line.match(/^([A-Z])\s+(.+)$/);
+    if (match) {
+      cells = [match[1], match[2].trim()];
     } else {
-      // Single cell
       cells = [line.trim()];
     }
+  } else {
+    // Single cell
+    cells = [line.trim()];
+  }
+
+  return cells.some((c) => c) ? cells : [];
+}
+
+function parseTextToTable(text: string): string[][] {
+  const rows: string[][] = [];
+  let maxCols = 0;
 
-    if (cells.length > 0 && cells.some((c) => c)) {
+  for (const line of text.split("\n")) {
+    const cells = parseTableLine(line);
+    if (cells.length > 0) {
       rows.push(cells);
+      maxCols = Math.max(maxCols, cells.length);
     }
   }
 
-  // Normalize column count - find max columns and pad shorter rows
-  const maxCols = Math.max(...rows.map((r) => r.length));
+  // Normalize column count - pad shorter rows
   rows.forEach((row) => {
     while (row.length < maxCols) {
       row.push("");
@@ -62,93 +98,70 @@ function parseTextToTable(text: string): string[][] {
   return rows;
 }
 
-// Parse table from Tesseract word data with position information
-export function parseTableFromWords(
-  words: Array<{
-    text: string;
-    bbox: { x0: number; y0: number; x1: number; y1: number };
-  }>
-): string[][] {
-  if (!words || words.length === 0) return [];
-
-  // Sort words by Y position (top to bottom), then X position (left to right)
-  const sortedWords = [...words].sort((a, b) => {
-    const yDiff = a.bbox.y0 - b.bbox.y0;
-    if (Math.abs(yDiff) > 10) return yDiff; // Different rows
-    return a.bbox.x0 - b.bbox.x0; // Same row, sort by X
+// Write rows with shared styles in a single pass, sizing columns to content
+function addTableRows(
+  worksheet: ExcelJS.Worksheet,
+  rows: string[][],
+  isHeader: (rowIndex: number) => boolean,
+  maxColumnWidth: number
+) {
+  const widths: number[] = [];
+
+  rows.forEach((row, rowIndex) => {
+    const style = isHeader(rowIndex) ? HEADER_STYLE : CELL_STYLE;
+    row.forEach((cell, colIndex) => {
+      const excelCell = worksheet.getCell(rowIndex + 1, colIndex + 1);
+      excelCell.value = cell;
+      excelCell.style = style;
+      widths[colIndex] = Math.max(widths[colIndex] ?? 10, Math.min(cell.length, maxColumnWidth));
+    });
   });
 
-  // Group words into rows based on Y position
-  const rows: Array<typeof words> = [];
-  let currentRow: typeof words = [];
-  let currentY = sortedWords[0]?.bbox.y0 || 0;
-
-  for (const word of sortedWords) {
-    if (Math.abs(word.bbox.y0 - currentY) > 15) {
-      // New row threshold
-      if (currentRow.length > 0) {
-        rows.push(currentRow);
-      }
-      currentRow = [word];
-      currentY = word.bbox.y0;
-    } else {
-      currentRow.push(word);
-    }
-  }
-  if (currentRow.length > 0) {
-    rows.push(currentRow);
-  }
-
-  // Detect column boundaries based on X positions
-  const allXPositions = words.map((w) => w.bbox.x0);
-  const xClusters = clusterPositions(allXPositions, 50); // 50px threshold for column separation
-
-  // Convert each row to cells based on column boundaries
-  const tableData: string[][] = rows.map((row) => {
-    const cells: string[] = new Array(xClusters.length).fill("");
-    for (const word of row) {
-      const colIndex = findClosestCluster(word.bbox.x0, xClusters);
-      cells[colIndex] = (cells[colIndex] + " " + word.text).trim();
-    }
-    return cells;
+  widths.forEach((width, colIndex) => {
+    worksheet.getColumn(colIndex + 1).width = width + 2;
   });
-
-  return tableData;
 }
 
-function clusterPositions(positions: number[], threshold: number): number[] {
-  if (positions.length === 0) return [];
-
-  const sorted = [...new Set(positions)].sort((a, b) => a - b);
-  const clusters: number[] = [sorted[0]];
-
-  for (let i = 1; i < sorted.length; i++) {
-    if (sorted[i] - clusters[clusters.length - 1] > threshold) {
-      clusters.push(sorted[i]);
+// Lay out every table on the page and stack them into one grid, separated by
+// an empty row. Merged cells are returned in the stacked grid's coordinates.
+function layoutWords(words: LayoutWord[]): {
+  rows: string[][];
+  merges: MergedCell[];
+  // Index of each table's first row, styled as a header
+  headers: number[];
+} {
+  const tables = detectTables(words);
+  const width = Math.max(0, ...tables.map((table) => table.boundaries.length + 1));
+  const rows: string[][] = [];
+  const merges: MergedCell[] = [];
+  const headers: number[] = [];
+
+  tables.forEach((table, index) => {
+    if (index > 0) rows.push(new Array(width).fill(""));
+    const offset = rows.length;
+    headers.push(offset);
+    for (const row of table.rows) {
+      rows.push(row.concat(new Array(width - row.length).fill("")));
     }
-  }
+    for (const merge of table.merges) {
+      merges.push({ ...merge, row: merge.row + offset });
+    }
+  });
 
-  return clusters;
+  return { rows, merges, headers };
 }
 
-function findClosestCluster(x: number, clusters: number[]): number {
-  let minDist = Infinity;
-  let closest = 0;
-  for (let i = 0; i < clusters.length; i++) {
-    const dist = Math.abs(x - clusters[i]);
-    if (dist < minDist) {
-      minDist = dist;
-      closest = i;
-    }
-  }
-  return closest;
+// Parse table from Tesseract word data with position information
+export function parseTableFromWords(words: LayoutWord[]): string[][] {
+  if (!words || words.length === 0) return [];
+  return layoutWords(words).rows;
 }
 
 export async function createExcelDocument(
   text: string,
   options: ExcelOptions = {}
 ): Promise<Blob> {
-  const { sheetName = "Extracted Data", parseTable = true } = options;
+  const { sheetName = "Extracted Data", parseTable = true, timings = new Timings("xlsx") } = options;
 
   const workbook = new ExcelJS.Workbook();
   workbook.creator = "Image to Text";
@@ -157,48 +170,8 @@ export async function createExcelDocument(
   const worksheet = workbook.addWorksheet(sheetName);
 
   if (parseTable) {
-    const tableData = parseTextToTable(text);
-
-    tableData.forEach((row, rowIndex) => {
-      row.forEach((cell, colIndex) => {
-        const excelCell = worksheet.getCell(rowIndex + 1, colIndex + 1);
-        excelCell.value = cell;
-
-        // Style header row
-        if (rowIndex === 0) {
-          excelCell.font = { bold: true };
-          excelCell.fill = {
-            type: "pattern",
-            pattern: "solid",
-            fgColor: { argb: "FFE0E0E0" },
-          };
-        }
-      });
-    });
-
-    // Auto-fit column width based on content
-    const maxColumns = Math.max(...tableData.map((row) => row.length));
-    for (let i = 1; i <= maxColumns; i++) {
-      let maxLength = 10;
-      tableData.forEach((row) => {
-        const cell = row[i - 1] || "";
-        maxLength = Math.max(maxLength, Math.min(cell.length, 50));
-      });
-      worksheet.getColumn(i).width = maxLength + 2;
-    }
-
-    // Add borders
-    worksheet.eachRow((row) => {
-      row.eachCell((cell) => {
-        cell.border = {
-          top: { style: "thin" },
-          left: { style: "thin" },
-          bottom: { style: "thin" },
-          right: { style: "thin" },
-        };
-        cell.alignment = { wrapText: true, vertical: "top" };
-      });
-    });
+    const rows = await timings.time("layout", () => parseTextToTable(text));
+    addTableRows(worksheet, rows, (rowIndex) => rowIndex === 0, 50);
   } else {
     const lines = text.split("\n");
     lines.forEach((line, index) => {
@@ -207,21 +180,16 @@ export async function createExcelDocument(
     worksheet.getColumn(1).width = 100;
   }
 
-  const buffer = await workbook.xlsx.writeBuffer();
-  return new Blob([buffer], {
-    type: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-  });
+  const buffer = await timings.time("write", () => workbook.xlsx.writeBuffer());
+  return new Blob([buffer], { type: XLSX_MIME_TYPE });
 }
 
 // Create Excel from word position data (better for tables)
 export async function createExcelFromWords(
-  words: Array<{
-    text: string;
-    bbox: { x0: number; y0: number; x1: number; y1: number };
-  }>,
+  words: LayoutWord[],
   options: ExcelOptions = {}
 ): Promise<Blob> {
-  const { sheetName = "Extracted Data" } = options;
+  const { sheetName = "Extracted Data", timings = new Timings("xlsx") } = options;
 
   const workbook = new ExcelJS.Workbook();
   workbook.creator = "Image to Text";
@@ -229,54 +197,27 @@ export async function createExcelFromWords(
 
   const worksheet = workbook.addWorksheet(sheetName);
 
-  const tableData = parseTableFromWords(words);
+  const { rows: tableData, merges, headers } = await timings.time("layout", () =>
+    layoutWords(words)
+  );
+  const headerRows = new Set(headers);
 
   if (tableData.length > 0) {
-    tableData.forEach((row, rowIndex) => {
-      row.forEach((cell, colIndex) => {
-        const excelCell = worksheet.getCell(rowIndex + 1, colIndex + 1);
-        excelCell.value = cell;
-
-        if (rowIndex === 0) {
-          excelCell.font = { bold: true };
-          excelCell.fill = {
-            type: "pattern",
-            pattern: "solid",
-            fgColor: { argb: "FFE0E0E0" },
-          };
-        }
-      });
-    });
-
-    // Auto-fit column width
-    const maxColumns = Math.max(...tableData.map((row) => row.length));
-    for (let i = 1; i <= maxColumns; i++) {
-      let maxLength = 10;
-      tableData.forEach((row) => {
-        const cell = row[i - 1] || "";
-        maxLength = Math.max(maxLength, Math.min(cell.length, 60));
-      });
-      worksheet.getColumn(i).width = maxLength + 2;
+    addTableRows(worksheet, tableData, (rowIndex) => headerRows.has(rowIndex), 60);
+
+    // Spanning cells detected in the layout
+    for (const merge of merges) {
+      worksheet.mergeCells(
+        merge.row + 1,
+        merge.startColumn + 1,
+        merge.row + 1,
+        merge.endColumn + 1
+      );
     }
-
-    // Add borders and alignment
-    worksheet.eachRow((row) => {
-      row.eachCell((cell) => {
-        cell.border = {
-          top: { style: "thin" },
-          left: { style: "thin" },
-          bottom: { style: "thin" },
-          right: { style: "thin" },
-        };
-        cell.alignment = { wrapText: true, vertical: "top" };
-      });
-    });
   }
 
-  const buffer = await workbook.xlsx.writeBuffer();
-  return new Blob([buffer], {
-    type: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-  });
+  const buffer = await timings.time("write", () => workbook.xlsx.writeBuffer());
+  return new Blob([buffer], { type: XLSX_MIME_TYPE });
 }
 
 export function downloadBlob(blob: Blob, filename: string) {
@@ -0,0 +1,307 @@
+import {
+  PDFDocument,
+  PDFHexString,
+  PDFString,
+  type PDFImage,
+  type PDFName,
+  type PDFPage,
+  type PDFRef,
+  beginText,
+  endText,
+  popGraphicsState,
+  pushGraphicsState,
+  setCharacterSqueeze,
+  setFontAndSize,
+  setTextMatrix,
+  setTextRenderingMode,
+  showText,
+  TextRenderingMode,
+} from "pdf-lib";
+import { Timings } from "@/lib/metrics/timings";
+import { canvasToBlob, createCanvas, getContext } from "@/lib/ocr/preprocess";
+import { CanvasPool, loadPdfDocument } from "@/lib/pdf/pipeline";
+import { extractPdfPage, PDF_PAGE_SCALE } from "@/lib/pdf/extract";
+import { recognizeText, type LanguageCode, type WordData } from "@/lib/ocr/tesseract";
+import { buildGlyphlessFont } from "./glyphless-font";
+
+// Searchable PDF: each page is the original image with the OCR words laid
+// over it as invisible text (render mode 3), so viewers can search, select
+// and copy while showing the scan.
+
+export interface SearchablePage {
+  image: Blob;
+  // Word boxes in the image's pixel coordinates
+  words: WordData[];
+  // Pixels per inch of the image, which sets the page size
+  dpi?: number;
+}
+
+export interface SearchablePdfOptions {
+  title?: string;
+  dpi?: number;
+  signal?: AbortSignal;
+  onPage?: (completed: number) => void;
+  // Receives the "embed" (summed over pages) and "write" spans; OCR of lazy
+  // pages is left to the page source
+  timings?: Timings;
+}
+
+export const PDF_MIME_TYPE = "application/pdf";
+
+const DEFAULT_DPI = 300;
+// Glyph advance of the text-layer font, in 1/1000 em
+const GLYPH_WIDTH = 500;
+
+// Identity mapping from 2-byte codes to UTF-16 code units
+const TO_UNICODE_CMAP = `/CIDInit /ProcSet findresource begin
+12 dict begin
+begincmap
+/CIDSystemInfo << /Registry (Adobe) /Ordering (UCS) /Supplement 0 >> def
+/CMapName /Adobe-Identity-UCS def
+/CMapType 2 def
+1 begincodespacerange
+<0000> <FFFF>
+endcodespacerange
+1 beginbfrange
+<0000> <FFFF> <0000>
+endbfrange
+endcmap
+CMapName currentdict /CMap defineresource pop
+end
+end`;
+
+// Every 2-byte code maps to glyph 1, the blank glyph of the embedded font
+function glyphlessCidToGidMap(): Uint8Array {
+  const map = new Uint8Array(0x10000 * 2);
+  for (let i = 1; i < map.length; i += 2) map[i] = 1;
+  return map;
+}
+
+// A Type0 font whose glyphs are all blank: codes are UTF-16 code units and
+// every glyph has the same advance. The text layer is never drawn, so this
+// covers every OCR language with a tiny embedded font program.
+function registerTextLayerFont(doc: PDFDocument): PDFRef {
+  const { context } = doc;
+  const toUnicode = context.register(context.flateStream(TO_UNICODE_CMAP));
+  const fontProgram = buildGlyphlessFont("GlyphLessFont", GLYPH_WIDTH);
+  const fontFile = context.register(
+    context.flateStream(fontProgram, { Length1: fontProgram.length })
+  );
+  const descriptor = context.register(
+    context.obj({
+      Type: "FontDescriptor",
+      FontName: "GlyphLessFont",
+      Flags: 5,
+      FontBBox: [0, 0, GLYPH_WIDTH, 1000],
+      ItalicAngle: 0,
+      Ascent: 1000,
+      Descent: 0,
+      CapHeight: 1000,
+      StemV: 80,
+      FontFile2: fontFile,
+    })
+  );
+  const cidFont = context.register(
+    context.obj({
+      Type: "Font",
+      Subtype: "CIDFontType2",
+      BaseFont: "GlyphLessFont",
+      CIDSystemInfo: {
+        Registry: PDFString.of("Adobe"),
+        Ordering: PDFString.of("Identity"),
+        Supplement: 0,
+      },
+      FontDescriptor: descriptor,
+      CIDToGIDMap: context.register(context.flateStream(glyphlessCidToGidMap())),
+      DW: GLYPH_WIDTH,
+    })
+  );
+  return context.register(
+    context.obj({
+      Type: "Font",
+      Subtype: "Type0",
+      BaseFont: "GlyphLessFont",
+      Encoding: "Identity-H",
+      DescendantFonts: [cidFont],
+      ToUnicode: toUnicode,
+    })
+  );
+}
+
+function toUtf16Hex(text: string): string {
+  let hex = "";
+  for (let i = 0; i < text.length; i++) {
+    hex += text.charCodeAt(i).toString(16).padStart(4, "0");
+  }
+  return hex;
+}
+
+// EXIF orientation of a JPEG (1 when absent). Browsers apply it when
+// decoding, so OCR boxes are in the rotated frame and the raw bytes can only
+// be embedded when no rotation is needed.
+function jpegOrientation(bytes: Uint8Array): number {
+  const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+  let offset = 2;
+  while (offset + 4 < bytes.length && bytes[offset] === 0xff) {
+    const marker = bytes[offset + 1];
+    const length = view.getUint16(offset + 2);
+    if (marker === 0xe1 && view.getUint32(offset + 4) === 0x45786966) {
+      const tiff = offset + 10;
+      const little = view.getUint16(tiff) === 0x4949;
+      const ifd = tiff + view.getUint32(tiff + 4, little);
+      const entries = view.getUint16(ifd, little);
+      for (let i = 0; i < entries; i++) {
+        const entry = ifd + 2 + i * 12;
+        if (view.getUint16(entry, little) === 0x0112) {
+          return view.getUint16(entry + 8, little);
+        }
+      }
+      return 1;
+    }
+    // Start of scan: no more metadata segments
+    if (marker === 0xda) break;
+    offset += 2 + length;
+  }
+  return 1;
+}
+
+// JPEG and PNG are embedded as-is; other formats (and rotated JPEGs) are
+// decoded and re-encoded as JPEG
+async function embedPageImage(doc: PDFDocument, image: Blob): Promise<PDFImage> {
+  const bytes = new Uint8Array(await image.arrayBuffer());
+  const isJpeg = bytes[0] === 0xff && bytes[1] === 0xd8;
+  const isPng = bytes[0] === 0x89 && bytes[1] === 0x50;
+
+  if (isPng) return doc.embedPng(bytes);
+  if (isJpeg && jpegOrientation(bytes) === 1) return doc.embedJpg(bytes);
+
+  const bitmap = await createImageBitmap(image);
+  const canvas = createCanvas(bitmap.width, bitmap.height);
+  const ctx = getContext(canvas);
+  ctx.fillStyle = "#ffffff";
+  ctx.fillRect(0, 0, bitmap.width, bitmap.height);
+  ctx.drawImage(bitmap, 0, 0);
+  bitmap.close();
+  const jpeg = await canvasToBlob(canvas, "image/jpeg", 0.9);
+  canvas.width = 0;
+  canvas.height = 0;
+  return doc.embedJpg(new Uint8Array(await jpeg.arrayBuffer()));
+}
+
+function drawTextLayer(
+  page: PDFPage,
+  fontName: PDFName,
+  words: WordData[],
+  scale: number,
+  pageHeight: number
+) {
+  const operators = [pushGraphicsState(), beginText(), setTextRenderingMode(TextRenderingMode.Invisible)];
+
+  for (const word of words) {
+    const text = word.text.trim();
+    if (!text) continue;
+
+    const { x0, y0, x1, y1 } = word.bbox;
+    const width = (x1 - x0) * scale;
+    const size = Math.max(1, (y1 - y0) * scale);
+    // Stretch the fixed-width glyphs so the word spans its box, which is
+    // what text selection highlights
+    const naturalWidth = (text.length * GLYPH_WIDTH * size) / 1000;
+    const squeeze = naturalWidth > 0 ? (width / naturalWidth) * 100 : 100;
+
+    operators.push(
+      setFontAndSize(fontName, size),
+      setCharacterSqueeze(squeeze),
+      setTextMatrix(1, 0, 0, 1, x0 * scale, pageHeight - y1 * scale),
+      // Trailing space so extracted text keeps word breaks
+      showText(PDFHexString.of(toUtf16Hex(`${text} `)))
+    );
+  }
+
+  operators.push(endText(), popGraphicsState());
+  page.pushOperators(...operators);
+}
+
+// Pages are consumed one at a time, so a generator that OCRs or renders
+// lazily never has more than one source image in memory
+export async function createSearchablePdf(
+  pages: Iterable<SearchablePage> | AsyncIterable<SearchablePage>,
+  options: SearchablePdfOptions = {}
+): Promise<Blob> {
+  const {
+    title,
+    dpi: defaultDpi = DEFAULT_DPI,
+    signal,
+    onPage,
+    timings = new Timings("pdf"),
+  } = options;
+  const doc = await PDFDocument.create();
+  if (title) doc.setTitle(title);
+  doc.setProducer("Image to Text");
+
+  const fontRef = registerTextLayerFont(doc);
+  let completed = 0;
+
+  for await (const { image, words, dpi = defaultDpi } of pages) {
+    signal?.throwIfAborted();
+
+    await timings.time("embed", async () => {
+      const embedded = await embedPageImage(doc, image);
+      const scale = 72 / dpi;
+      const width = embedded.width * scale;
+      const height = embedded.height * scale;
+
+      const page = doc.addPage([width, height]);
+      page.drawImage(embedded, { x: 0, y: 0, width, height });
+      drawTextLayer(page, page.node.newFontDictionary("OCR", fontRef), words, scale, height);
+    });
+
+    onPage?.(++completed);
+  }
+
+  const bytes = await timings.time("write", () => doc.save());
+  return new Blob([new Uint8Array(bytes)], { type: PDF_MIME_TYPE });
+}
+
+// OCR each image as it is needed
+export async function* recognizeImagePages(
+  images: Blob[],
+  language: LanguageCode | LanguageCode[] = "auto"
+): AsyncGenerator<SearchablePage> {
+  for (const image of images) {
+    const result = await recognizeText(image, language, undefined, true);
+    yield { image, words: result.words ?? [] };
+  }
+}
+
+// Render a PDF one page at a time with the hybrid extraction: pages with a
+// text layer take their word boxes from it and only scanned pages are OCRed
+export async function* recognizePdfPages(
+  file: File,
+  language: LanguageCode | LanguageCode[] = "auto",
+  options: { onLoad?: (pageCount: number) => void } = {}
+): AsyncGenerator<SearchablePage> {
+  const pdf = await loadPdfDocument(file);
+  const canvasPool = new CanvasPool();
+  options.onLoad?.(pdf.numPages);
+
+  try {
+    for (let pageNumber = 1; pageNumber <= pdf.numPages; pageNumber++) {
+      const page = await pdf.getPage(pageNumber);
+      try {
+        const { image, words } = await extractPdfPage(page, pageNumber, {
+          language,
+          includeWordData: true,
+          canvasPool,
+          render: { type: "image/jpeg", quality: 0.9 },
+        });
+        // Rendered at PDF_PAGE_SCALE x 72 DPI, so pages keep their original size
+        yield { image: image!, words, dpi: 72 * PDF_PAGE_SCALE };
+      } finally {
+        page.cleanup();
+      }
+    }
+  } finally {
+    await pdf.destroy();
+  }
+}
@@ -6,19 +6,37 @@ import {
   HeadingLevel,
   AlignmentType,
 } from "docx";
+import { Timings } from "@/lib/metrics/timings";
+import { createBlobSink } from "@/lib/zip/writer";
+import { writeWordDocument } from "./stream-docx";
 
 export interface WordOptions {
   title?: string;
   includeImage?: boolean;
   formatted?: boolean;
+  // Receives the "write" span
+  timings?: Timings;
 }
 
+export const DOCX_MIME_TYPE =
+  "application/vnd.openxmlformats-officedocument.wordprocessingml.document";
+
+// Longer texts go through the streaming writer instead of building a
+// Paragraph object per line (multi-hundred-page PDFs)
+const STREAMING_THRESHOLD = 200_000;
+
 export async function createWordDocument(
   text: string,
   imageBase64?: string,
   options: WordOptions = {}
 ): Promise<Blob> {
-  const { title = "Extracted Text", formatted = false } = options;
+  const { title = "Extracted Text", formatted = false, timings = new Timings("docx") } = options;
+
+  if (text.length > STREAMING_THRESHOLD && !imageBase64) {
+    const { sink, getBlob } = createBlobSink(DOCX_MIME_TYPE);
+    await writeWordDocument(sink, [text], { title, formatted, timings });
+    return getBlob();
+  }
 
   const children: Paragraph[] = [];
 
@@ -98,7 +116,7 @@ export async function createWordDocument(
     ],
   });
 
-  return await Packer.toBlob(doc);
+  return await timings.time("write", () => Packer.toBlob(doc));
 }
 
 export function downloadBlob(blob: Blob, filename: string) {
@@ -6,14 +6,18 @@ import {
   useState,
   useEffect,
   useCallback,
+  useRef,
   type ReactNode,
 } from "react";
-import { translations, type Locale } from "./translations";
-
-// All supported locales
-const SUPPORTED_LOCALES: Locale[] = ["en", "zh", "es", "pt", "id", "fr", "de"];
-
-type Translations = (typeof translations)[Locale];
+import {
+  DEFAULT_LOCALE,
+  defaultTranslations,
+  getLoadedTranslations,
+  isLocale,
+  loadTranslations,
+  type Locale,
+  type Translations,
+} from "./translations";
 
 interface I18nContextType {
   locale: Locale;
@@ -36,33 +40,57 @@ function detectLocaleFromBrowser(browserLang: string): Locale | null {
   return null;
 }
 
+// Saved choice first, then the browser language
+function detectLocale(): Locale {
+  const savedLocale = localStorage.getItem("locale");
+  if (isLocale(savedLocale)) return savedLocale;
+  return detectLocaleFromBrowser(navigator.language.toLowerCase()) ?? DEFAULT_LOCALE;
+}
+
+// Start fetching the visitor's dictionary as soon as this module runs,
+// rather than after hydration
+if (typeof window !== "undefined") {
+  loadTranslations(detectLocale()).catch(() => {});
+}
+
 export function I18nProvider({ children }: { children: ReactNode }) {
-  const [locale, setLocaleState] = useState<Locale>("en");
+  // The server renders English; the detected locale replaces it once loaded
+  const [state, setState] = useState<{ locale: Locale; t: Translations }>({
+    locale: DEFAULT_LOCALE,
+    t: defaultTranslations,
+  });
+  // Only the most recent request wins when switching quickly
+  const requested = useRef<Locale>(DEFAULT_LOCALE);
 
-  useEffect(() => {
-    // Load saved locale from localStorage
-    const savedLocale = localStorage.getItem("locale") as Locale | null;
-    if (savedLocale && SUPPORTED_LOCALES.includes(savedLocale)) {
-      setLocaleState(savedLocale);
-    } else {
-      // Detect browser language and map to supported locale
-      const browserLang = navigator.language.toLowerCase();
-      const detectedLocale = detectLocaleFromBrowser(browserLang);
-      if (detectedLocale) {
-        setLocaleState(detectedLocale);
+  const applyLocale = useCallback(async (locale: Locale) => {
+    requested.current = locale;
+    try {
+      const t = getLoadedTranslations(locale) ?? (await loadTranslations(locale));
+      if (requested.current === locale) {
+        setState({ locale, t });
       }
+    } catch (error) {
+      console.error("Failed to load translations:", error);
     }
   }, []);
 
-  const setLocale = useCallback((newLocale: Locale) => {
-    setLocaleState(newLocale);
-    localStorage.setItem("locale", newLocale);
-  }, []);
+  useEffect(() => {
+    const locale = detectLocale();
+    if (locale !== DEFAULT_LOCALE) {
+      void applyLocale(locale);
+    }
+  }, [applyLocale]);
 
-  const t = translations[locale];
+  const setLocale = useCallback(
+    (newLocale: Locale) => {
+      localStorage.setItem("locale", newLocale);
+      void applyLocale(newLocale);
+    },
+    [applyLocale]
+  );
 
   return (
-    <I18nContext.Provider value={{ locale, setLocale, t }}>
+    <I18nContext.Provider value={{ locale: state.locale, setLocale, t: state.t }}>
       {children}
     </I18nContext.Provider>
   );
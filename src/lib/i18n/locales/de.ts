@@ -0,0 +1,164 @@
+import type { Translations } from "../translations";
+
+const de: Translations = {
+  nav: {
+    imageToText: "Bild zu Text",
+    batchUpload: "Stapel-Upload",
+    imageTranslator: "Bildübersetzer",
+    jpgToWord: "JPG zu Word",
+    jpgToExcel: "JPG zu Excel",
+    pdfToExcel: "PDF zu Excel",
+    pdfToWord: "PDF zu Word",
+    pdfToText: "PDF zu Text",
+    textToPdf: "Text zu PDF",
+    imageToPdf: "Bild zu PDF",
+    pdfToJpg: "PDF zu JPG",
+    textToImage: "Text zu Bild",
+    qrScanner: "QR-Scanner",
+    history: "Verlauf",
+    pricing: "Preise",
+    login: "Anmelden",
+    blog: "Blog",
+  },
+  home: {
+    title: "Bild zu Text Konverter",
+    subtitle: "Online-Konverter zum Extrahieren von Text aus Bildern.",
+    dropzone: {
+      title: "Bilder Ziehen, Hochladen oder Einfügen",
+      dragActive: "Bild hier ablegen",
+      formats: "Unterstützte Formate: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
+      browse: "Durchsuchen",
+    },
+    mode: {
+      simple: "Einfache OCR",
+      formatted: "Formatierter Text",
+    },
+    language: "Sprache:",
+    privacy: "*Ihre Privatsphäre ist geschützt! Keine Daten werden übertragen oder gespeichert.",
+    features: {
+      formats: {
+        title: "Mehrere Formate",
+        description: "Unterstützt JPG, PNG, GIF, JFIF, HEIC, PDF und weitere Bildformate.",
+      },
+      languages: {
+        title: "Mehrsprachige OCR",
+        description: "Text in Englisch, Chinesisch, Japanisch, Koreanisch und 15+ Sprachen extrahieren.",
+      },
+      privacy: {
+        title: "100% Privatsphäre",
+        description: "Alle Verarbeitung erfolgt in Ihrem Browser. Keine Daten werden auf Server hochgeladen.",
+      },
+    },
+    rating: "Dieses Tool bewerten",
+  },
+  result: {
+    title: "Extrahierter Text",
+    processing: "Verarbeitung...",
+    copy: "Kopieren",
+    download: "Herunterladen",
+    reset: "Neues Bild",
+    copied: "In die Zwischenablage kopiert!",
+    noText: "Kein Text im Bild erkannt.",
+  },
+  batch: {
+    title: "Stapel Bild zu Text",
+    subtitle: "Laden Sie mehrere Bilder hoch und extrahieren Sie Text aus allen auf einmal.",
+    settings: "OCR-Einstellungen",
+    selectFiles: "Dateien Auswählen",
+    processAll: "Alle Verarbeiten",
+    downloadAll: "Alle Herunterladen",
+    clearAll: "Alle Löschen",
+    pending: "Ausstehend",
+    processing: "Verarbeitung...",
+    completed: "abgeschlossen",
+    features: {
+      batch: {
+        title: "Stapelverarbeitung",
+        description: "Laden Sie bis zu 500 Bilder hoch und verarbeiten Sie alle mit einem Klick.",
+      },
+      progress: {
+        title: "Fortschrittsverfolgung",
+        description: "Sehen Sie den Echtzeit-Fortschritt für jede verarbeitete Datei.",
+      },
+      download: {
+        title: "Alle Herunterladen",
+        description: "Laden Sie den gesamten extrahierten Text als eine kombinierte Datei herunter.",
+      },
+    },
+  },
+  login: {
+    welcome: "Willkommen Zurück",
+    createAccount: "Konto Erstellen",
+    signIn: "Melden Sie sich bei Ihrem Konto an",
+    signUp: "Registrieren Sie sich für Premium-Funktionen",
+    email: "E-Mail",
+    password: "Passwort",
+    signInBtn: "Anmelden",
+    signUpBtn: "Konto Erstellen",
+    signingIn: "Anmeldung...",
+    creatingAccount: "Konto wird erstellt...",
+    orContinueWith: "oder mit E-Mail fortfahren",
+    alreadyHaveAccount: "Haben Sie bereits ein Konto?",
+    dontHaveAccount: "Haben Sie kein Konto?",
+    terms: "Nutzungsbedingungen",
+    privacy: "Datenschutzrichtlinie",
+    agreement: "Mit dem Fortfahren stimmen Sie unseren zu",
+  },
+  dashboard: {
+    title: "Dashboard",
+    subtitle: "Verwalten Sie Ihr Konto und Ihre Nutzung",
+    signOut: "Abmelden",
+    profile: "Profil",
+    dailyUsage: "Tägliche Nutzung",
+    totalConversions: "Gesamtkonvertierungen",
+    conversions: "Konvertierungen",
+    allTime: "Gesamte bisherige",
+    resetsDaily: "Wird täglich um Mitternacht UTC zurückgesetzt",
+    quickActions: "Schnellaktionen",
+    accountSettings: "Kontoeinstellungen",
+    upgradePlan: "Plan Upgraden",
+    comingSoon: "Demnächst",
+    upgradeTitle: "Auf Pro Upgraden",
+    upgradeDescription: "Erhalten Sie 500 Konvertierungen/Tag, hochpräzise OCR und Prioritäts-Support.",
+    upgradeNow: "Jetzt Upgraden",
+  },
+  pricing: {
+    title: "Einfache, Transparente Preise",
+    subtitle: "Wählen Sie den richtigen Plan für Sie",
+    monthly: "Monatlich",
+    yearly: "Jährlich",
+    perMonth: "/Monat",
+    current: "Aktueller Plan",
+    getStarted: "Loslegen",
+    subscribe: "Abonnieren",
+    contactUs: "Kontaktieren Sie uns",
+    features: {
+      conversions: "Konvertierungen/Tag",
+      unlimited: "Unbegrenzte Konvertierungen",
+      fileSize: "MB Dateigröße",
+      batch: "Dateien pro Stapel",
+      history: "Verlauf",
+      api: "API-Zugang",
+      support: "Support",
+    },
+  },
+  common: {
+    loading: "Laden...",
+    error: "Fehler",
+    success: "Erfolg",
+    cancel: "Abbrechen",
+    save: "Speichern",
+    delete: "Löschen",
+    close: "Schließen",
+    back: "Zurück",
+  },
+  footer: {
+    product: "Produkt",
+    legal: "Rechtliches",
+    termsOfService: "Nutzungsbedingungen",
+    privacyPolicy: "Datenschutzrichtlinie",
+    allRightsReserved: "Alle Rechte vorbehalten.",
+  },
+};
+
+export default de;
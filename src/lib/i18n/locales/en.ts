@@ -0,0 +1,164 @@
+// English is the server-rendered locale and the fallback while another
+// locale loads, so it is the only dictionary bundled with the provider
+const en = {
+  nav: {
+    imageToText: "Image To Text",
+    batchUpload: "Batch Upload",
+    imageTranslator: "Image Translator",
+    jpgToWord: "JPG To Word",
+    jpgToExcel: "JPG To Excel",
+    pdfToExcel: "PDF To Excel",
+    pdfToWord: "PDF To Word",
+    pdfToText: "PDF To Text",
+    textToPdf: "Text To PDF",
+    imageToPdf: "Image To PDF",
+    pdfToJpg: "PDF To JPG",
+    textToImage: "Text To Image",
+    qrScanner: "QR Scanner",
+    history: "History",
+    pricing: "Pricing",
+    login: "Login",
+    blog: "Blog",
+  },
+  home: {
+    title: "Image to Text Converter",
+    subtitle: "An online image to text converter to extract text from images.",
+    dropzone: {
+      title: "Drop, Upload or Paste Images",
+      dragActive: "Drop the image here",
+      formats: "Supported formats: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
+      browse: "Browse",
+    },
+    mode: {
+      simple: "Simple OCR",
+      formatted: "Formatted Text",
+    },
+    language: "Language:",
+    privacy: "*Your privacy is protected! No data is transmitted or stored.",
+    features: {
+      formats: {
+        title: "Multiple Formats",
+        description: "Supports JPG, PNG, GIF, JFIF, HEIC, PDF and more image formats.",
+      },
+      languages: {
+        title: "Multi-Language OCR",
+        description: "Extract text in English, Chinese, Japanese, Korean and 15+ languages.",
+      },
+      privacy: {
+        title: "100% Privacy",
+        description: "All processing happens in your browser. No data is uploaded to servers.",
+      },
+    },
+    rating: "Rate this tool",
+  },
+  result: {
+    title: "Extracted Text",
+    processing: "Processing...",
+    copy: "Copy",
+    download: "Download",
+    reset: "New Image",
+    copied: "Copied to clipboard!",
+    noText: "No text detected in the image.",
+  },
+  batch: {
+    title: "Batch Image to Text",
+    subtitle: "Upload multiple images and extract text from all of them at once.",
+    settings: "OCR Settings",
+    selectFiles: "Select Files",
+    processAll: "Process All Files",
+    downloadAll: "Download All",
+    clearAll: "Clear All",
+    pending: "Pending",
+    processing: "Processing...",
+    completed: "completed",
+    features: {
+      batch: {
+        title: "Batch Processing",
+        description: "Upload up to 500 images and process them all at once with a single click.",
+      },
+      progress: {
+        title: "Progress Tracking",
+        description: "See real-time progress for each file being processed.",
+      },
+      download: {
+        title: "Download All",
+        description: "Download all extracted text as a single combined file.",
+      },
+    },
+  },
+  login: {
+    welcome: "Welcome Back",
+    createAccount: "Create an Account",
+    signIn: "Sign in to your account",
+    signUp: "Sign up to access premium features",
+    email: "Email",
+    password: "Password",
+    signInBtn: "Sign In",
+    signUpBtn: "Create Account",
+    signingIn: "Signing in...",
+    creatingAccount: "Creating account...",
+    orContinueWith: "or continue with email",
+    alreadyHaveAccount: "Already have an account?",
+    dontHaveAccount: "Don't have an account?",
+    terms: "Terms of Service",
+    privacy: "Privacy Policy",
+    agreement: "By continuing, you agree to our",
+  },
+  dashboard: {
+    title: "Dashboard",
+    subtitle: "Manage your account and usage",
+    signOut: "Sign Out",
+    profile: "Profile",
+    dailyUsage: "Daily Usage",
+    totalConversions: "Total Conversions",
+    conversions: "conversions",
+    allTime: "All time conversions",
+    resetsDaily: "Resets daily at midnight UTC",
+    quickActions: "Quick Actions",
+    accountSettings: "Account Settings",
+    upgradePlan: "Upgrade Plan",
+    comingSoon: "Coming Soon",
+    upgradeTitle: "Upgrade to Pro",
+    upgradeDescription: "Get 500 conversions/day, high-precision OCR, and priority support.",
+    upgradeNow: "Upgrade Now",
+  },
+  pricing: {
+    title: "Simple, Transparent Pricing",
+    subtitle: "Choose the plan that's right for you",
+    monthly: "Monthly",
+    yearly: "Yearly",
+    perMonth: "/month",
+    current: "Current Plan",
+    getStarted: "Get Started",
+    subscribe: "Subscribe",
+    contactUs: "Contact Us",
+    features: {
+      conversions: "conversions/day",
+      unlimited: "Unlimited conversions",
+      fileSize: "MB file size",
+      batch: "files batch",
+      history: "history",
+      api: "API access",
+      support: "support",
+    },
+  },
+  common: {
+    loading: "Loading...",
+    error: "Error",
+    success: "Success",
+    cancel: "Cancel",
+    save: "Save",
+    delete: "Delete",
+    close: "Close",
+    back: "Back",
+  },
+  footer: {
+    product: "Product",
+    legal: "Legal",
+    termsOfService: "Terms of Service",
+    privacyPolicy: "Privacy Policy",
+    allRightsReserved: "All rights reserved.",
+  },
+};
+
+export default en;
@@ -0,0 +1,164 @@
+import type { Translations } from "../translations";
+
+const es: Translations = {
+  nav: {
+    imageToText: "Imagen a Texto",
+    batchUpload: "Carga por Lotes",
+    imageTranslator: "Traductor de Imágenes",
+    jpgToWord: "JPG a Word",
+    jpgToExcel: "JPG a Excel",
+    pdfToExcel: "PDF a Excel",
+    pdfToWord: "PDF a Word",
+    pdfToText: "PDF a Texto",
+    textToPdf: "Texto a PDF",
+    imageToPdf: "Imagen a PDF",
+    pdfToJpg: "PDF a JPG",
+    textToImage: "Texto a Imagen",
+    qrScanner: "Escáner QR",
+    history: "Historial",
+    pricing: "Precios",
+    login: "Iniciar Sesión",
+    blog: "Blog",
+  },
+  home: {
+    title: "Convertidor de Imagen a Texto",
+    subtitle: "Conversor en línea para extraer texto de imágenes.",
+    dropzone: {
+      title: "Arrastra, Sube o Pega Imágenes",
+      dragActive: "Suelta la imagen aquí",
+      formats: "Formatos soportados: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
+      browse: "Explorar",
+    },
+    mode: {
+      simple: "OCR Simple",
+      formatted: "Texto Formateado",
+    },
+    language: "Idioma:",
+    privacy: "*¡Tu privacidad está protegida! No se transmiten ni almacenan datos.",
+    features: {
+      formats: {
+        title: "Múltiples Formatos",
+        description: "Soporta JPG, PNG, GIF, JFIF, HEIC, PDF y más formatos de imagen.",
+      },
+      languages: {
+        title: "OCR Multilingüe",
+        description: "Extrae texto en inglés, chino, japonés, coreano y más de 15 idiomas.",
+      },
+      privacy: {
+        title: "100% Privacidad",
+        description: "Todo el procesamiento ocurre en tu navegador. No se suben datos a servidores.",
+      },
+    },
+    rating: "Califica esta herramienta",
+  },
+  result: {
+    title: "Texto Extraído",
+    processing: "Procesando...",
+    copy: "Copiar",
+    download: "Descargar",
+    reset: "Nueva Imagen",
+    copied: "¡Copiado al portapapeles!",
+    noText: "No se detectó texto en la imagen.",
+  },
+  batch: {
+    title: "Imagen a Texto por Lotes",
+    subtitle: "Sube múltiples imágenes y extrae texto de todas a la vez.",
+    settings: "Configuración OCR",
+    selectFiles: "Seleccionar Archivos",
+    processAll: "Procesar Todos",
+    downloadAll: "Descargar Todo",
+    clearAll: "Limpiar Todo",
+    pending: "Pendiente",
+    processing: "Procesando...",
+    completed: "completado",
+    features: {
+      batch: {
+        title: "Procesamiento por Lotes",
+        description: "Sube hasta 500 imágenes y procésalas todas con un solo clic.",
+      },
+      progress: {
+        title: "Seguimiento de Progreso",
+        description: "Ve el progreso en tiempo real de cada archivo procesado.",
+      },
+      download: {
+        title: "Descargar Todo",
+        description: "Descarga todo el texto extraído en un solo archivo combinado.",
+      },
+    },
+  },
+  login: {
+    welcome: "Bienvenido de Nuevo",
+    createAccount: "Crear una Cuenta",
+    signIn: "Inicia sesión en tu cuenta",
+    signUp: "Regístrate para acceder a funciones premium",
+    email: "Correo electrónico",
+    password: "Contraseña",
+    signInBtn: "Iniciar Sesión",
+    signUpBtn: "Crear Cuenta",
+    signingIn: "Iniciando sesión...",
+    creatingAccount: "Creando cuenta...",
+    orContinueWith: "o continúa con correo",
+    alreadyHaveAccount: "¿Ya tienes una cuenta?",
+    dontHaveAccount: "¿No tienes una cuenta?",
+    terms: "Términos de Servicio",
+    privacy: "Política de Privacidad",
+    agreement: "Al continuar, aceptas nuestros",
+  },
+  dashboard: {
+    title: "Panel de Control",
+    subtitle: "Administra tu cuenta y uso",
+    signOut: "Cerrar Sesión",
+    profile: "Perfil",
+    dailyUsage: "Uso Diario",
+    totalConversions: "Conversiones Totales",
+    conversions: "conversiones",
+    allTime: "Total histórico",
+    resetsDaily: "Se reinicia diariamente a medianoche UTC",
+    quickActions: "Acciones Rápidas",
+    accountSettings: "Configuración de Cuenta",
+    upgradePlan: "Mejorar Plan",
+    comingSoon: "Próximamente",
+    upgradeTitle: "Actualizar a Pro",
+    upgradeDescription: "Obtén 500 conversiones/día, OCR de alta precisión y soporte prioritario.",
+    upgradeNow: "Actualizar Ahora",
+  },
+  pricing: {
+    title: "Precios Simples y Transparentes",
+    subtitle: "Elige el plan adecuado para ti",
+    monthly: "Mensual",
+    yearly: "Anual",
+    perMonth: "/mes",
+    current: "Plan Actual",
+    getStarted: "Comenzar",
+    subscribe: "Suscribirse",
+    contactUs: "Contáctanos",
+    features: {
+      conversions: "conversiones/día",
+      unlimited: "Conversiones ilimitadas",
+      fileSize: "MB tamaño de archivo",
+      batch: "archivos por lote",
+      history: "historial",
+      api: "Acceso API",
+      support: "soporte",
+    },
+  },
+  common: {
+    loading: "Cargando...",
+    error: "Error",
+    success: "Éxito",
+    cancel: "Cancelar",
+    save: "Guardar",
+    delete: "Eliminar",
+    close: "Cerrar",
+    back: "Volver",
+  },
+  footer: {
+    product: "Producto",
+    legal: "Legal",
+    termsOfService: "Términos de Servicio",
+    privacyPolicy: "Política de Privacidad",
+    allRightsReserved: "Todos los derechos reservados.",
+  },
+};
+
+export default es;
@@ -0,0 +1,164 @@
+import type { Translations } from "../translations";
+
+const fr: Translations = {
+  nav: {
+    imageToText: "Image en Texte",
+    batchUpload: "Téléchargement par Lot",
+    imageTranslator: "Traducteur d'Images",
+    jpgToWord: "JPG en Word",
+    jpgToExcel: "JPG en Excel",
+    pdfToExcel: "PDF en Excel",
+    pdfToWord: "PDF en Word",
+    pdfToText: "PDF en Texte",
+    textToPdf: "Texte en PDF",
+    imageToPdf: "Image en PDF",
+    pdfToJpg: "PDF en JPG",
+    textToImage: "Texte en Image",
+    qrScanner: "Scanner QR",
+    history: "Historique",
+    pricing: "Tarifs",
+    login: "Connexion",
+    blog: "Blog",
+  },
+  home: {
+    title: "Convertisseur Image en Texte",
+    subtitle: "Convertisseur en ligne pour extraire le texte des images.",
+    dropzone: {
+      title: "Glissez, Téléchargez ou Collez des Images",
+      dragActive: "Déposez l'image ici",
+      formats: "Formats pris en charge : JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
+      browse: "Parcourir",
+    },
+    mode: {
+      simple: "OCR Simple",
+      formatted: "Texte Formaté",
+    },
+    language: "Langue :",
+    privacy: "*Votre vie privée est protégée ! Aucune donnée n'est transmise ou stockée.",
+    features: {
+      formats: {
+        title: "Formats Multiples",
+        description: "Prend en charge JPG, PNG, GIF, JFIF, HEIC, PDF et plus de formats d'image.",
+      },
+      languages: {
+        title: "OCR Multilingue",
+        description: "Extrayez du texte en anglais, chinois, japonais, coréen et plus de 15 langues.",
+      },
+      privacy: {
+        title: "100% Confidentialité",
+        description: "Tout le traitement se fait dans votre navigateur. Aucune donnée n'est envoyée aux serveurs.",
+      },
+    },
+    rating: "Évaluez cet outil",
+  },
+  result: {
+    title: "Texte Extrait",
+    processing: "Traitement...",
+    copy: "Copier",
+    download: "Télécharger",
+    reset: "Nouvelle Image",
+    copied: "Copié dans le presse-papiers !",
+    noText: "Aucun texte détecté dans l'image.",
+  },
+  batch: {
+    title: "Image en Texte par Lot",
+    subtitle: "Téléchargez plusieurs images et extrayez le texte de toutes en une fois.",
+    settings: "Paramètres OCR",
+    selectFiles: "Sélectionner des Fichiers",
+    processAll: "Traiter Tout",
+    downloadAll: "Tout Télécharger",
+    clearAll: "Tout Effacer",
+    pending: "En attente",
+    processing: "Traitement...",
+    completed: "terminé",
+    features: {
+      batch: {
+        title: "Traitement par Lot",
+        description: "Téléchargez jusqu'à 500 images et traitez-les toutes en un seul clic.",
+      },
+      progress: {
+        title: "Suivi de Progression",
+        description: "Voyez la progression en temps réel de chaque fichier traité.",
+      },
+      download: {
+        title: "Tout Télécharger",
+        description: "Téléchargez tout le texte extrait dans un seul fichier combiné.",
+      },
+    },
+  },
+  login: {
+    welcome: "Bienvenue",
+    createAccount: "Créer un Compte",
+    signIn: "Connectez-vous à votre compte",
+    signUp: "Inscrivez-vous pour accéder aux fonctionnalités premium",
+    email: "E-mail",
+    password: "Mot de passe",
+    signInBtn: "Se Connecter",
+    signUpBtn: "Créer un Compte",
+    signingIn: "Connexion...",
+    creatingAccount: "Création du compte...",
+    orContinueWith: "ou continuez avec e-mail",
+    alreadyHaveAccount: "Vous avez déjà un compte ?",
+    dontHaveAccount: "Vous n'avez pas de compte ?",
+    terms: "Conditions d'Utilisation",
+    privacy: "Politique de Confidentialité",
+    agreement: "En continuant, vous acceptez nos",
+  },
+  dashboard: {
+    title: "Tableau de Bord",
+    subtitle: "Gérez votre compte et votre utilisation",
+    signOut: "Déconnexion",
+    profile: "Profil",
+    dailyUsage: "Utilisation Quotidienne",
+    totalConversions: "Conversions Totales",
+    conversions: "conversions",
+    allTime: "Total historique",
+    resetsDaily: "Réinitialisé quotidiennement à minuit UTC",
+    quickActions: "Actions Rapides",
+    accountSettings: "Paramètres du Compte",
+    upgradePlan: "Améliorer le Plan",
+    comingSoon: "Bientôt Disponible",
+    upgradeTitle: "Passer à Pro",
+    upgradeDescription: "Obtenez 500 conversions/jour, OCR haute précision et support prioritaire.",
+    upgradeNow: "Améliorer Maintenant",
+  },
+  pricing: {
+    title: "Tarification Simple et Transparente",
+    subtitle: "Choisissez le plan qui vous convient",
+    monthly: "Mensuel",
+    yearly: "Annuel",
+    perMonth: "/mois",
+    current: "Plan Actuel",
+    getStarted: "Commencer",
+    subscribe: "S'abonner",
+    contactUs: "Contactez-nous",
+    features: {
+      conversions: "conversions/jour",
+      unlimited: "Conversions illimitées",
+      fileSize: "Mo taille de fichier",
+      batch: "fichiers par lot",
+      history: "historique",
+      api: "Accès API",
+      support: "support",
+    },
+  },
+  common: {
+    loading: "Chargement...",
+    error: "Erreur",
+    success: "Succès",
+    cancel: "Annuler",
+    save: "Enregistrer",
+    delete: "Supprimer",
+    close: "Fermer",
+    back: "Retour",
+  },
+  footer: {
+    product: "Produit",
+    legal: "Légal",
+    termsOfService: "Conditions d'Utilisation",
+    privacyPolicy: "Politique de Confidentialité",
+    allRightsReserved: "Tous droits réservés.",
+  },
+};
+
+export default fr;
@@ -0,0 +1,164 @@
+import type { Translations } from "../translations";
+
+const id: Translations = {
+  nav: {
+    imageToText: "Gambar ke Teks",
+    batchUpload: "Unggah Massal",
+    imageTranslator: "Penerjemah Gambar",
+    jpgToWord: "JPG ke Word",
+    jpgToExcel: "JPG ke Excel",
+    pdfToExcel: "PDF ke Excel",
+    pdfToWord: "PDF ke Word",
+    pdfToText: "PDF ke Teks",
+    textToPdf: "Teks ke PDF",
+    imageToPdf: "Gambar ke PDF",
+    pdfToJpg: "PDF ke JPG",
+    textToImage: "Teks ke Gambar",
+    qrScanner: "Pemindai QR",
+    history: "Riwayat",
+    pricing: "Harga",
+    login: "Masuk",
+    blog: "Blog",
+  },
+  home: {
+    title: "Konverter Gambar ke Teks",
+    subtitle: "Konverter online untuk mengekstrak teks dari gambar.",
+    dropzone: {
+      title: "Seret, Unggah atau Tempel Gambar",
+      dragActive: "Letakkan gambar di sini",
+      formats: "Format yang didukung: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
+      browse: "Telusuri",
+    },
+    mode: {
+      simple: "OCR Sederhana",
+      formatted: "Teks Terformat",
+    },
+    language: "Bahasa:",
+    privacy: "*Privasi Anda dilindungi! Tidak ada data yang dikirim atau disimpan.",
+    features: {
+      formats: {
+        title: "Berbagai Format",
+        description: "Mendukung JPG, PNG, GIF, JFIF, HEIC, PDF dan format gambar lainnya.",
+      },
+      languages: {
+        title: "OCR Multi-Bahasa",
+        description: "Ekstrak teks dalam bahasa Inggris, Cina, Jepang, Korea dan 15+ bahasa.",
+      },
+      privacy: {
+        title: "100% Privasi",
+        description: "Semua pemrosesan terjadi di browser Anda. Tidak ada data yang diunggah ke server.",
+      },
+    },
+    rating: "Nilai alat ini",
+  },
+  result: {
+    title: "Teks yang Diekstrak",
+    processing: "Memproses...",
+    copy: "Salin",
+    download: "Unduh",
+    reset: "Gambar Baru",
+    copied: "Disalin ke clipboard!",
+    noText: "Tidak ada teks yang terdeteksi dalam gambar.",
+  },
+  batch: {
+    title: "Gambar ke Teks Massal",
+    subtitle: "Unggah beberapa gambar dan ekstrak teks dari semuanya sekaligus.",
+    settings: "Pengaturan OCR",
+    selectFiles: "Pilih File",
+    processAll: "Proses Semua",
+    downloadAll: "Unduh Semua",
+    clearAll: "Hapus Semua",
+    pending: "Menunggu",
+    processing: "Memproses...",
+    completed: "selesai",
+    features: {
+      batch: {
+        title: "Pemrosesan Massal",
+        description: "Unggah hingga 500 gambar dan proses semuanya dengan satu klik.",
+      },
+      progress: {
+        title: "Pelacakan Kemajuan",
+        description: "Lihat kemajuan real-time untuk setiap file yang diproses.",
+      },
+      download: {
+        title: "Unduh Semua",
+        description: "Unduh semua teks yang diekstrak sebagai satu file gabungan.",
+      },
+    },
+  },
+  login: {
+    welcome: "Selamat Datang Kembali",
+    createAccount: "Buat Akun",
+    signIn: "Masuk ke akun Anda",
+    signUp: "Daftar untuk mengakses fitur premium",
+    email: "Email",
+    password: "Kata Sandi",
+    signInBtn: "Masuk",
+    signUpBtn: "Buat Akun",
+    signingIn: "Sedang masuk...",
+    creatingAccount: "Membuat akun...",
+    orContinueWith: "atau lanjutkan dengan email",
+    alreadyHaveAccount: "Sudah punya akun?",
+    dontHaveAccount: "Belum punya akun?",
+    terms: "Ketentuan Layanan",
+    privacy: "Kebijakan Privasi",
+    agreement: "Dengan melanjutkan, Anda menyetujui",
+  },
+  dashboard: {
+    title: "Dasbor",
+    subtitle: "Kelola akun dan penggunaan Anda",
+    signOut: "Keluar",
+    profile: "Profil",
+    dailyUsage: "Penggunaan Harian",
+    totalConversions: "Total Konversi",
+    conversions: "konversi",
+    allTime: "Total sepanjang waktu",
+    resetsDaily: "Reset setiap hari pada tengah malam UTC",
+    quickActions: "Tindakan Cepat",
+    accountSettings: "Pengaturan Akun",
+    upgradePlan: "Tingkatkan Paket",
+    comingSoon: "Segera Hadir",
+    upgradeTitle: "Tingkatkan ke Pro",
+    upgradeDescription: "Dapatkan 500 konversi/hari, OCR presisi tinggi, dan dukungan prioritas.",
+    upgradeNow: "Tingkatkan Sekarang",
+  },
+  pricing: {
+    title: "Harga Sederhana dan Transparan",
+    subtitle: "Pilih paket yang tepat untuk Anda",
+    monthly: "Bulanan",
+    yearly: "Tahunan",
+    perMonth: "/bulan",
+    current: "Paket Saat Ini",
+    getStarted: "Mulai",
+    subscribe: "Berlangganan",
+    contactUs: "Hubungi Kami",
+    features: {
+      conversions: "konversi/hari",
+      unlimited: "Konversi tak terbatas",
+      fileSize: "MB ukuran file",
+      batch: "file per batch",
+      history: "riwayat",
+      api: "Akses API",
+      support: "dukungan",
+    },
+  },
+  common: {
+    loading: "Memuat...",
+    error: "Kesalahan",
+    success: "Berhasil",
+    cancel: "Batal",
+    save: "Simpan",
+    delete: "Hapus",
+    close: "Tutup",
+    back: "Kembali",
+  },
+  footer: {
+    product: "Produk",
+    legal: "Hukum",
+    termsOfService: "Ketentuan Layanan",
+    privacyPolicy: "Kebijakan Privasi",
+    allRightsReserved: "Hak cipta dilindungi.",
+  },
+};
+
+export default id;
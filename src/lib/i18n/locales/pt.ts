@@ -0,0 +1,164 @@
+import type { Translations } from "../translations";
+
+const pt: Translations = {
+  nav: {
+    imageToText: "Imagem para Texto",
+    batchUpload: "Upload em Lote",
+    imageTranslator: "Tradutor de Imagens",
+    jpgToWord: "JPG para Word",
+    jpgToExcel: "JPG para Excel",
+    pdfToExcel: "PDF para Excel",
+    pdfToWord: "PDF para Word",
+    pdfToText: "PDF para Texto",
+    textToPdf: "Texto para PDF",
+    imageToPdf: "Imagem para PDF",
+    pdfToJpg: "PDF para JPG",
+    textToImage: "Texto para Imagem",
+    qrScanner: "Leitor QR",
+    history: "Histórico",
+    pricing: "Preços",
+    login: "Entrar",
+    blog: "Blog",
+  },
+  home: {
+    title: "Conversor de Imagem para Texto",
+    subtitle: "Conversor online para extrair texto de imagens.",
+    dropzone: {
+      title: "Arraste, Carregue ou Cole Imagens",
+      dragActive: "Solte a imagem aqui",
+      formats: "Formatos suportados: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
+      browse: "Procurar",
+    },
+    mode: {
+      simple: "OCR Simples",
+      formatted: "Texto Formatado",
+    },
+    language: "Idioma:",
+    privacy: "*Sua privacidade está protegida! Nenhum dado é transmitido ou armazenado.",
+    features: {
+      formats: {
+        title: "Múltiplos Formatos",
+        description: "Suporta JPG, PNG, GIF, JFIF, HEIC, PDF e mais formatos de imagem.",
+      },
+      languages: {
+        title: "OCR Multilíngue",
+        description: "Extraia texto em inglês, chinês, japonês, coreano e mais de 15 idiomas.",
+      },
+      privacy: {
+        title: "100% Privacidade",
+        description: "Todo o processamento acontece no seu navegador. Nenhum dado é enviado para servidores.",
+      },
+    },
+    rating: "Avalie esta ferramenta",
+  },
+  result: {
+    title: "Texto Extraído",
+    processing: "Processando...",
+    copy: "Copiar",
+    download: "Baixar",
+    reset: "Nova Imagem",
+    copied: "Copiado para a área de transferência!",
+    noText: "Nenhum texto detectado na imagem.",
+  },
+  batch: {
+    title: "Imagem para Texto em Lote",
+    subtitle: "Carregue múltiplas imagens e extraia texto de todas de uma vez.",
+    settings: "Configurações OCR",
+    selectFiles: "Selecionar Arquivos",
+    processAll: "Processar Todos",
+    downloadAll: "Baixar Tudo",
+    clearAll: "Limpar Tudo",
+    pending: "Pendente",
+    processing: "Processando...",
+    completed: "concluído",
+    features: {
+      batch: {
+        title: "Processamento em Lote",
+        description: "Carregue até 500 imagens e processe todas com um único clique.",
+      },
+      progress: {
+        title: "Acompanhamento de Progresso",
+        description: "Veja o progresso em tempo real de cada arquivo sendo processado.",
+      },
+      download: {
+        title: "Baixar Tudo",
+        description: "Baixe todo o texto extraído em um único arquivo combinado.",
+      },
+    },
+  },
+  login: {
+    welcome: "Bem-vindo de Volta",
+    createAccount: "Criar uma Conta",
+    signIn: "Entre na sua conta",
+    signUp: "Cadastre-se para acessar recursos premium",
+    email: "E-mail",
+    password: "Senha",
+    signInBtn: "Entrar",
+    signUpBtn: "Criar Conta",
+    signingIn: "Entrando...",
+    creatingAccount: "Criando conta...",
+    orContinueWith: "ou continue com e-mail",
+    alreadyHaveAccount: "Já tem uma conta?",
+    dontHaveAccount: "Não tem uma conta?",
+    terms: "Termos de Serviço",
+    privacy: "Política de Privacidade",
+    agreement: "Ao continuar, você concorda com nossos",
+  },
+  dashboard: {
+    title: "Painel de Controle",
+    subtitle: "Gerencie sua conta e uso",
+    signOut: "Sair",
+    profile: "Perfil",
+    dailyUsage: "Uso Diário",
+    totalConversions: "Conversões Totais",
+    conversions: "conversões",
+    allTime: "Total histórico",
+    resetsDaily: "Reinicia diariamente à meia-noite UTC",
+    quickActions: "Ações Rápidas",
+    accountSettings: "Configurações da Conta",
+    upgradePlan: "Atualizar Plano",
+    comingSoon: "Em Breve",
+    upgradeTitle: "Atualizar para Pro",
+    upgradeDescription: "Obtenha 500 conversões/dia, OCR de alta precisão e suporte prioritário.",
+    upgradeNow: "Atualizar Agora",
+  },
+  pricing: {
+    title: "Preços Simples e Transparentes",
+    subtitle: "Escolha o plano certo para você",
+    monthly: "Mensal",
+    yearly: "Anual",
+    perMonth: "/mês",
+    current: "Plano Atual",
+    getStarted: "Começar",
+    subscribe: "Assinar",
+    contactUs: "Contate-nos",
+    features: {
+      conversions: "conversões/dia",
+      unlimited: "Conversões ilimitadas",
+      fileSize: "MB tamanho de arquivo",
+      batch: "arquivos por lote",
+      history: "histórico",
+      api: "Acesso API",
+      support: "suporte",
+    },
+  },
+  common: {
+    loading: "Carregando...",
+    error: "Erro",
+    success: "Sucesso",
+    cancel: "Cancelar",
+    save: "Salvar",
+    delete: "Excluir",
+    close: "Fechar",
+    back: "Voltar",
+  },
+  footer: {
+    product: "Produto",
+    legal: "Legal",
+    termsOfService: "Termos de Serviço",
+    privacyPolicy: "Política de Privacidade",
+    allRightsReserved: "Todos os direitos reservados.",
+  },
+};
+
+export default pt;
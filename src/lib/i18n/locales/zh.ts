@@ -0,0 +1,164 @@
+import type { Translations } from "../translations";
+
+const zh: Translations = {
+  nav: {
+    imageToText: "图片转文字",
+    batchUpload: "批量上传",
+    imageTranslator: "图片翻译",
+    jpgToWord: "JPG转Word",
+    jpgToExcel: "JPG转Excel",
+    pdfToExcel: "PDF转Excel",
+    pdfToWord: "PDF转Word",
+    pdfToText: "PDF转文本",
+    textToPdf: "文本转PDF",
+    imageToPdf: "图片转PDF",
+    pdfToJpg: "PDF转图片",
+    textToImage: "文本转图片",
+    qrScanner: "二维码扫描",
+    history: "历史记录",
+    pricing: "价格",
+    login: "登录",
+    blog: "博客",
+  },
+  home: {
+    title: "图片转文字转换器",
+    subtitle: "在线图片文字识别工具，从图片中提取文字。",
+    dropzone: {
+      title: "拖放、上传或粘贴图片",
+      dragActive: "将图片放在这里",
+      formats: "支持格式：JPG、PNG、GIF、JFIF（JPEG）、HEIC、PDF",
+      browse: "浏览文件",
+    },
+    mode: {
+      simple: "简单OCR",
+      formatted: "格式化文本",
+    },
+    language: "语言：",
+    privacy: "*您的隐私受到保护！不会传输或存储任何数据。",
+    features: {
+      formats: {
+        title: "多种格式",
+        description: "支持JPG、PNG、GIF、JFIF、HEIC、PDF等多种图片格式。",
+      },
+      languages: {
+        title: "多语言OCR",
+        description: "支持英语、中文、日语、韩语等15+种语言的文字识别。",
+      },
+      privacy: {
+        title: "100%隐私保护",
+        description: "所有处理都在您的浏览器中完成，不会上传任何数据到服务器。",
+      },
+    },
+    rating: "给这个工具评分",
+  },
+  result: {
+    title: "提取的文字",
+    processing: "处理中...",
+    copy: "复制",
+    download: "下载",
+    reset: "新图片",
+    copied: "已复制到剪贴板！",
+    noText: "未在图片中检测到文字。",
+  },
+  batch: {
+    title: "批量图片转文字",
+    subtitle: "上传多张图片，一次性提取所有图片中的文字。",
+    settings: "OCR设置",
+    selectFiles: "选择文件",
+    processAll: "处理所有文件",
+    downloadAll: "下载全部",
+    clearAll: "清除全部",
+    pending: "等待中",
+    processing: "处理中...",
+    completed: "已完成",
+    features: {
+      batch: {
+        title: "批量处理",
+        description: "一次上传最多500张图片，一键处理所有图片。",
+      },
+      progress: {
+        title: "进度跟踪",
+        description: "实时查看每个文件的处理进度。",
+      },
+      download: {
+        title: "下载全部",
+        description: "将所有提取的文字下载为一个合并的文件。",
+      },
+    },
+  },
+  login: {
+    welcome: "欢迎回来",
+    createAccount: "创建账户",
+    signIn: "登录您的账户",
+    signUp: "注册以访问高级功能",
+    email: "邮箱",
+    password: "密码",
+    signInBtn: "登录",
+    signUpBtn: "创建账户",
+    signingIn: "正在登录...",
+    creatingAccount: "正在创建账户...",
+    orContinueWith: "或使用邮箱继续",
+    alreadyHaveAccount: "已有账户？",
+    dontHaveAccount: "没有账户？",
+    terms: "服务条款",
+    privacy: "隐私政策",
+    agreement: "继续即表示您同意我们的",
+  },
+  dashboard: {
+    title: "控制面板",
+    subtitle: "管理您的账户和使用情况",
+    signOut: "退出登录",
+    profile: "个人资料",
+    dailyUsage: "今日用量",
+    totalConversions: "总转换次数",
+    conversions: "次转换",
+    allTime: "历史总计",
+    resetsDaily: "每日UTC午夜重置",
+    quickActions: "快捷操作",
+    accountSettings: "账户设置",
+    upgradePlan: "升级套餐",
+    comingSoon: "即将推出",
+    upgradeTitle: "升级到专业版",
+    upgradeDescription: "获得每天500次转换、高精度OCR和优先支持。",
+    upgradeNow: "立即升级",
+  },
+  pricing: {
+    title: "简单透明的定价",
+    subtitle: "选择适合您的套餐",
+    monthly: "月付",
+    yearly: "年付",
+    perMonth: "/月",
+    current: "当前套餐",
+    getStarted: "开始使用",
+    subscribe: "订阅",
+    contactUs: "联系我们",
+    features: {
+      conversions: "次转换/天",
+      unlimited: "无限次转换",
+      fileSize: "MB文件大小",
+      batch: "个文件批量处理",
+      history: "历史记录",
+      api: "API访问",
+      support: "支持",
+    },
+  },
+  common: {
+    loading: "加载中...",
+    error: "错误",
+    success: "成功",
+    cancel: "取消",
+    save: "保存",
+    delete: "删除",
+    close: "关闭",
+    back: "返回",
+  },
+  footer: {
+    product: "产品",
+    legal: "法律",
+    termsOfService: "服务条款",
+    privacyPolicy: "隐私政策",
+    allRightsReserved: "保留所有权利。",
+  },
+};
+
+export default zh;
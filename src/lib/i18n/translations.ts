@@ -1,5 +1,15 @@
+import en from "./locales/en";
+
 export type Locale = "en" | "zh" | "es" | "pt" | "id" | "fr" | "de";
 
+export type Translations = typeof en;
+
+export type TranslationKey = keyof Translations;
+
+export const SUPPORTED_LOCALES: Locale[] = ["en", "zh", "es", "pt", "id", "fr", "de"];
+
+export const DEFAULT_LOCALE: Locale = "en";
+
 export const localeNames: Record<Locale, string> = {
   en: "English",
   zh: "中文",
@@ -10,1127 +20,45 @@ export const localeNames: Record<Locale, string> = {
   de: "Deutsch",
 };
 
-export const translations = {
-  en: {
-    nav: {
-      imageToText: "Image To Text",
-      batchUpload: "Batch Upload",
-      imageTranslator: "Image Translator",
-      jpgToWord: "JPG To Word",
-      jpgToExcel: "JPG To Excel",
-      pdfToExcel: "PDF To Excel",
-      pdfToWord: "PDF To Word",
-      pdfToText: "PDF To Text",
-      textToPdf: "Text To PDF",
-      imageToPdf: "Image To PDF",
-      pdfToJpg: "PDF To JPG",
-      textToImage: "Text To Image",
-      qrScanner: "QR Scanner",
-      history: "History",
-      pricing: "Pricing",
-      login: "Login",
-      blog: "Blog",
-    },
-    home: {
-      title: "Image to Text Converter",
-      subtitle: "An online image to text converter to extract text from images.",
-      dropzone: {
-        title: "Drop, Upload or Paste Images",
-        dragActive: "Drop the image here",
-        formats: "Supported formats: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
-        browse: "Browse",
-      },
-      mode: {
-        simple: "Simple OCR",
-        formatted: "Formatted Text",
-      },
-      language: "Language:",
-      privacy: "*Your privacy is protected! No data is transmitted or stored.",
-      features: {
-        formats: {
-          title: "Multiple Formats",
-          description: "Supports JPG, PNG, GIF, JFIF, HEIC, PDF and more image formats.",
-        },
-        languages: {
-          title: "Multi-Language OCR",
-          description: "Extract text in English, Chinese, Japanese, Korean and 15+ languages.",
-        },
-        privacy: {
-          title: "100% Privacy",
-          description: "All processing happens in your browser. No data is uploaded to servers.",
-        },
-      },
-      rating: "Rate this tool",
-    },
-    result: {
-      title: "Extracted Text",
-      processing: "Processing...",
-      copy: "Copy",
-      download: "Download",
-      reset: "New Image",
-      copied: "Copied to clipboard!",
-      noText: "No text detected in the image.",
-    },
-    batch: {
-      title: "Batch Image to Text",
-      subtitle: "Upload multiple images and extract text from all of them at once.",
-      settings: "OCR Settings",
-      selectFiles: "Select Files",
-      processAll: "Process All Files",
-      downloadAll: "Download All",
-      clearAll: "Clear All",
-      pending: "Pending",
-      processing: "Processing...",
-      completed: "completed",
-      features: {
-        batch: {
-          title: "Batch Processing",
-          description: "Upload up to 10 images and process them all at once with a single click.",
-        },
-        progress: {
-          title: "Progress Tracking",
-          description: "See real-time progress for each file being processed.",
-        },
-        download: {
-          title: "Download All",
-          description: "Download all extracted text as a single combined file.",
-        },
-      },
-    },
-    login: {
-      welcome: "Welcome Back",
-      createAccount: "Create an Account",
-      signIn: "Sign in to your account",
-      signUp: "Sign up to access premium features",
-      email: "Email",
-      password: "Password",
-      signInBtn: "Sign In",
-      signUpBtn: "Create Account",
-      signingIn: "Signing in...",
-      creatingAccount: "Creating account...",
-      orContinueWith: "or continue with email",
-      alreadyHaveAccount: "Already have an account?",
-      dontHaveAccount: "Don't have an account?",
-      terms: "Terms of Service",
-      privacy: "Privacy Policy",
-      agreement: "By continuing, you agree to our",
-    },
-    dashboard: {
-      title: "Dashboard",
-      subtitle: "Manage your account and usage",
-      signOut: "Sign Out",
-      profile: "Profile",
-      dailyUsage: "Daily Usage",
-      totalConversions: "Total Conversions",
-      conversions: "conversions",
-      allTime: "All time conversions",
-      resetsDaily: "Resets daily at midnight UTC",
-      quickActions: "Quick Actions",
-      accountSettings: "Account Settings",
-      upgradePlan: "Upgrade Plan",
-      comingSoon: "Coming Soon",
-      upgradeTitle: "Upgrade to Pro",
-      upgradeDescription: "Get 500 conversions/day, high-precision OCR, and priority support.",
-      upgradeNow: "Upgrade Now",
-    },
-    pricing: {
-      title: "Simple, Transparent Pricing",
-      subtitle: "Choose the plan that's right for you",
-      monthly: "Monthly",
-      yearly: "Yearly",
-      perMonth: "/month",
-      current: "Current Plan",
-      getStarted: "Get Started",
-      subscribe: "Subscribe",
-      contactUs: "Contact Us",
-      features: {
-        conversions: "conversions/day",
-        unlimited: "Unlimited conversions",
-        fileSize: "MB file size",
-        batch: "files batch",
-        history: "history",
-        api: "API access",
-        support: "support",
-      },
-    },
-    common: {
-      loading: "Loading...",
-      error: "Error",
-      success: "Success",
-      cancel: "Cancel",
-      save: "Save",
-      delete: "Delete",
-      close: "Close",
-      back: "Back",
-    },
-    footer: {
-      product: "Product",
-      legal: "Legal",
-      termsOfService: "Terms of Service",
-      privacyPolicy: "Privacy Policy",
-      allRightsReserved: "All rights reserved.",
-    },
-  },
-  zh: {
-    nav: {
-      imageToText: "图片转文字",
-      batchUpload: "批量上传",
-      imageTranslator: "图片翻译",
-      jpgToWord: "JPG转Word",
-      jpgToExcel: "JPG转Excel",
-      pdfToExcel: "PDF转Excel",
-      pdfToWord: "PDF转Word",
-      pdfToText: "PDF转文本",
-      textToPdf: "文本转PDF",
-      imageToPdf: "图片转PDF",
-      pdfToJpg: "PDF转图片",
-      textToImage: "文本转图片",
-      qrScanner: "二维码扫描",
-      history: "历史记录",
-      pricing: "价格",
-      login: "登录",
-      blog: "博客",
-    },
-    home: {
-      title: "图片转文字转换器",
-      subtitle: "在线图片文字识别工具，从图片中提取文字。",
-      dropzone: {
-        title: "拖放、上传或粘贴图片",
-        dragActive: "将图片放在这里",
-        formats: "支持格式：JPG、PNG、GIF、JFIF（JPEG）、HEIC、PDF",
-        browse: "浏览文件",
-      },
-      mode: {
-        simple: "简单OCR",
-        formatted: "格式化文本",
-      },
-      language: "语言：",
-      privacy: "*您的隐私受到保护！不会传输或存储任何数据。",
-      features: {
-        formats: {
-          title: "多种格式",
-          description: "支持JPG、PNG、GIF、JFIF、HEIC、PDF等多种图片格式。",
-        },
-        languages: {
-          title: "多语言OCR",
-          description: "支持英语、中文、日语、韩语等15+种语言的文字识别。",
-        },
-        privacy: {
-          title: "100%隐私保护",
-          description: "所有处理都在您的浏览器中完成，不会上传任何数据到服务器。",
-        },
-      },
-      rating: "给这个工具评分",
-    },
-    result: {
-      title: "提取的文字",
-      processing: "处理中...",
-      copy: "复制",
-      download: "下载",
-      reset: "新图片",
-      copied: "已复制到剪贴板！",
-      noText: "未在图片中检测到文字。",
-    },
-    batch: {
-      title: "批量图片转文字",
-      subtitle: "上传多张图片，一次性提取所有图片中的文字。",
-      settings: "OCR设置",
-      selectFiles: "选择文件",
-      processAll: "处理所有文件",
-      downloadAll: "下载全部",
-      clearAll: "清除全部",
-      pending: "等待中",
-      processing: "处理中...",
-      completed: "已完成",
-      features: {
-        batch: {
-          title: "批量处理",
-          description: "一次上传最多10张图片，一键处理所有图片。",
-        },
-        progress: {
-          title: "进度跟踪",
-          description: "实时查看每个文件的处理进度。",
-        },
-        download: {
-          title: "下载全部",
-          description: "将所有提取的文字下载为一个合并的文件。",
-        },
-      },
-    },
-    login: {
-      welcome: "欢迎回来",
-      createAccount: "创建账户",
-      signIn: "登录您的账户",
-      signUp: "注册以访问高级功能",
-      email: "邮箱",
-      password: "密码",
-      signInBtn: "登录",
-      signUpBtn: "创建账户",
-      signingIn: "正在登录...",
-      creatingAccount: "正在创建账户...",
-      orContinueWith: "或使用邮箱继续",
-      alreadyHaveAccount: "已有账户？",
-      dontHaveAccount: "没有账户？",
-      terms: "服务条款",
-      privacy: "隐私政策",
-      agreement: "继续即表示您同意我们的",
-    },
-    dashboard: {
-      title: "控制面板",
-      subtitle: "管理您的账户和使用情况",
-      signOut: "退出登录",
-      profile: "个人资料",
-      dailyUsage: "今日用量",
-      totalConversions: "总转换次数",
-      conversions: "次转换",
-      allTime: "历史总计",
-      resetsDaily: "每日UTC午夜重置",
-      quickActions: "快捷操作",
-      accountSettings: "账户设置",
-      upgradePlan: "升级套餐",
-      comingSoon: "即将推出",
-      upgradeTitle: "升级到专业版",
-      upgradeDescription: "获得每天500次转换、高精度OCR和优先支持。",
-      upgradeNow: "立即升级",
-    },
-    pricing: {
-      title: "简单透明的定价",
-      subtitle: "选择适合您的套餐",
-      monthly: "月付",
-      yearly: "年付",
-      perMonth: "/月",
-      current: "当前套餐",
-      getStarted: "开始使用",
-      subscribe: "订阅",
-      contactUs: "联系我们",
-      features: {
-        conversions: "次转换/天",
-        unlimited: "无限次转换",
-        fileSize: "MB文件大小",
-        batch: "个文件批量处理",
-        history: "历史记录",
-        api: "API访问",
-        support: "支持",
-      },
-    },
-    common: {
-      loading: "加载中...",
-      error: "错误",
-      success: "成功",
-      cancel: "取消",
-      save: "保存",
-      delete: "删除",
-      close: "关闭",
-      back: "返回",
-    },
-    footer: {
-      product: "产品",
-      legal: "法律",
-      termsOfService: "服务条款",
-      privacyPolicy: "隐私政策",
-      allRightsReserved: "保留所有权利。",
-    },
-  },
-  es: {
-    nav: {
-      imageToText: "Imagen a Texto",
-      batchUpload: "Carga por Lotes",
-      imageTranslator: "Traductor de Imágenes",
-      jpgToWord: "JPG a Word",
-      jpgToExcel: "JPG a Excel",
-      pdfToExcel: "PDF a Excel",
-      pdfToWord: "PDF a Word",
-      pdfToText: "PDF a Texto",
-      textToPdf: "Texto a PDF",
-      imageToPdf: "Imagen a PDF",
-      pdfToJpg: "PDF a JPG",
-      textToImage: "Texto a Imagen",
-      qrScanner: "Escáner QR",
-      history: "Historial",
-      pricing: "Precios",
-      login: "Iniciar Sesión",
-      blog: "Blog",
-    },
-    home: {
-      title: "Convertidor de Imagen a Texto",
-      subtitle: "Conversor en línea para extraer texto de imágenes.",
-      dropzone: {
-        title: "Arrastra, Sube o Pega Imágenes",
-        dragActive: "Suelta la imagen aquí",
-        formats: "Formatos soportados: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
-        browse: "Explorar",
-      },
-      mode: {
-        simple: "OCR Simple",
-        formatted: "Texto Formateado",
-      },
-      language: "Idioma:",
-      privacy: "*¡Tu privacidad está protegida! No se transmiten ni almacenan datos.",
-      features: {
-        formats: {
-          title: "Múltiples Formatos",
-          description: "Soporta JPG, PNG, GIF, JFIF, HEIC, PDF y más formatos de imagen.",
-        },
-        languages: {
-          title: "OCR Multilingüe",
-          description: "Extrae texto en inglés, chino, japonés, coreano y más de 15 idiomas.",
-        },
-        privacy: {
-          title: "100% Privacidad",
-          description: "Todo el procesamiento ocurre en tu navegador. No se suben datos a servidores.",
-        },
-      },
-      rating: "Califica esta herramienta",
-    },
-    result: {
-      title: "Texto Extraído",
-      processing: "Procesando...",
-      copy: "Copiar",
-      download: "Descargar",
-      reset: "Nueva Imagen",
-      copied: "¡Copiado al portapapeles!",
-      noText: "No se detectó texto en la imagen.",
-    },
-    batch: {
-      title: "Imagen a Texto por Lotes",
-      subtitle: "Sube múltiples imágenes y extrae texto de todas a la vez.",
-      settings: "Configuración OCR",
-      selectFiles: "Seleccionar Archivos",
-      processAll: "Procesar Todos",
-      downloadAll: "Descargar Todo",
-      clearAll: "Limpiar Todo",
-      pending: "Pendiente",
-      processing: "Procesando...",
-      completed: "completado",
-      features: {
-        batch: {
-          title: "Procesamiento por Lotes",
-          description: "Sube hasta 10 imágenes y procésalas todas con un solo clic.",
-        },
-        progress: {
-          title: "Seguimiento de Progreso",
-          description: "Ve el progreso en tiempo real de cada archivo procesado.",
-        },
-        download: {
-          title: "Descargar Todo",
-          description: "Descarga todo el texto extraído en un solo archivo combinado.",
-        },
-      },
-    },
-    login: {
-      welcome: "Bienvenido de Nuevo",
-      createAccount: "Crear una Cuenta",
-      signIn: "Inicia sesión en tu cuenta",
-      signUp: "Regístrate para acceder a funciones premium",
-      email: "Correo electrónico",
-      password: "Contraseña",
-      signInBtn: "Iniciar Sesión",
-      signUpBtn: "Crear Cuenta",
-      signingIn: "Iniciando sesión...",
-      creatingAccount: "Creando cuenta...",
-      orContinueWith: "o continúa con correo",
-      alreadyHaveAccount: "¿Ya tienes una cuenta?",
-      dontHaveAccount: "¿No tienes una cuenta?",
-      terms: "Términos de Servicio",
-      privacy: "Política de Privacidad",
-      agreement: "Al continuar, aceptas nuestros",
-    },
-    dashboard: {
-      title: "Panel de Control",
-      subtitle: "Administra tu cuenta y uso",
-      signOut: "Cerrar Sesión",
-      profile: "Perfil",
-      dailyUsage: "Uso Diario",
-      totalConversions: "Conversiones Totales",
-      conversions: "conversiones",
-      allTime: "Total histórico",
-      resetsDaily: "Se reinicia diariamente a medianoche UTC",
-      quickActions: "Acciones Rápidas",
-      accountSettings: "Configuración de Cuenta",
-      upgradePlan: "Mejorar Plan",
-      comingSoon: "Próximamente",
-      upgradeTitle: "Actualizar a Pro",
-      upgradeDescription: "Obtén 500 conversiones/día, OCR de alta precisión y soporte prioritario.",
-      upgradeNow: "Actualizar Ahora",
-    },
-    pricing: {
-      title: "Precios Simples y Transparentes",
-      subtitle: "Elige el plan adecuado para ti",
-      monthly: "Mensual",
-      yearly: "Anual",
-      perMonth: "/mes",
-      current: "Plan Actual",
-      getStarted: "Comenzar",
-      subscribe: "Suscribirse",
-      contactUs: "Contáctanos",
-      features: {
-        conversions: "conversiones/día",
-        unlimited: "Conversiones ilimitadas",
-        fileSize: "MB tamaño de archivo",
-        batch: "archivos por lote",
-        history: "historial",
-        api: "Acceso API",
-        support: "soporte",
-      },
-    },
-    common: {
-      loading: "Cargando...",
-      error: "Error",
-      success: "Éxito",
-      cancel: "Cancelar",
-      save: "Guardar",
-      delete: "Eliminar",
-      close: "Cerrar",
-      back: "Volver",
-    },
-    footer: {
-      product: "Producto",
-      legal: "Legal",
-      termsOfService: "Términos de Servicio",
-      privacyPolicy: "Política de Privacidad",
-      allRightsReserved: "Todos los derechos reservados.",
-    },
-  },
-  pt: {
-    nav: {
-      imageToText: "Imagem para Texto",
-      batchUpload: "Upload em Lote",
-      imageTranslator: "Tradutor de Imagens",
-      jpgToWord: "JPG para Word",
-      jpgToExcel: "JPG para Excel",
-      pdfToExcel: "PDF para Excel",
-      pdfToWord: "PDF para Word",
-      pdfToText: "PDF para Texto",
-      textToPdf: "Texto para PDF",
-      imageToPdf: "Imagem para PDF",
-      pdfToJpg: "PDF para JPG",
-      textToImage: "Texto para Imagem",
-      qrScanner: "Leitor QR",
-      history: "Histórico",
-      pricing: "Preços",
-      login: "Entrar",
-      blog: "Blog",
-    },
-    home: {
-      title: "Conversor de Imagem para Texto",
-      subtitle: "Conversor online para extrair texto de imagens.",
-      dropzone: {
-        title: "Arraste, Carregue ou Cole Imagens",
-        dragActive: "Solte a imagem aqui",
-        formats: "Formatos suportados: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
-        browse: "Procurar",
-      },
-      mode: {
-        simple: "OCR Simples",
-        formatted: "Texto Formatado",
-      },
-      language: "Idioma:",
-      privacy: "*Sua privacidade está protegida! Nenhum dado é transmitido ou armazenado.",
-      features: {
-        formats: {
-          title: "Múltiplos Formatos",
-          description: "Suporta JPG, PNG, GIF, JFIF, HEIC, PDF e mais formatos de imagem.",
-        },
-        languages: {
-          title: "OCR Multilíngue",
-          description: "Extraia texto em inglês, chinês, japonês, coreano e mais de 15 idiomas.",
-        },
-        privacy: {
-          title: "100% Privacidade",
-          description: "Todo o processamento acontece no seu navegador. Nenhum dado é enviado para servidores.",
-        },
-      },
-      rating: "Avalie esta ferramenta",
-    },
-    result: {
-      title: "Texto Extraído",
-      processing: "Processando...",
-      copy: "Copiar",
-      download: "Baixar",
-      reset: "Nova Imagem",
-      copied: "Copiado para a área de transferência!",
-      noText: "Nenhum texto detectado na imagem.",
-    },
-    batch: {
-      title: "Imagem para Texto em Lote",
-      subtitle: "Carregue múltiplas imagens e extraia texto de todas de uma vez.",
-      settings: "Configurações OCR",
-      selectFiles: "Selecionar Arquivos",
-      processAll: "Processar Todos",
-      downloadAll: "Baixar Tudo",
-      clearAll: "Limpar Tudo",
-      pending: "Pendente",
-      processing: "Processando...",
-      completed: "concluído",
-      features: {
-        batch: {
-          title: "Processamento em Lote",
-          description: "Carregue até 10 imagens e processe todas com um único clique.",
-        },
-        progress: {
-          title: "Acompanhamento de Progresso",
-          description: "Veja o progresso em tempo real de cada arquivo sendo processado.",
-        },
-        download: {
-          title: "Baixar Tudo",
-          description: "Baixe todo o texto extraído em um único arquivo combinado.",
-        },
-      },
-    },
-    login: {
-      welcome: "Bem-vindo de Volta",
-      createAccount: "Criar uma Conta",
-      signIn: "Entre na sua conta",
-      signUp: "Cadastre-se para acessar recursos premium",
-      email: "E-mail",
-      password: "Senha",
-      signInBtn: "Entrar",
-      signUpBtn: "Criar Conta",
-      signingIn: "Entrando...",
-      creatingAccount: "Criando conta...",
-      orContinueWith: "ou continue com e-mail",
-      alreadyHaveAccount: "Já tem uma conta?",
-      dontHaveAccount: "Não tem uma conta?",
-      terms: "Termos de Serviço",
-      privacy: "Política de Privacidade",
-      agreement: "Ao continuar, você concorda com nossos",
-    },
-    dashboard: {
-      title: "Painel de Controle",
-      subtitle: "Gerencie sua conta e uso",
-      signOut: "Sair",
-      profile: "Perfil",
-      dailyUsage: "Uso Diário",
-      totalConversions: "Conversões Totais",
-      conversions: "conversões",
-      allTime: "Total histórico",
-      resetsDaily: "Reinicia diariamente à meia-noite UTC",
-      quickActions: "Ações Rápidas",
-      accountSettings: "Configurações da Conta",
-      upgradePlan: "Atualizar Plano",
-      comingSoon: "Em Breve",
-      upgradeTitle: "Atualizar para Pro",
-      upgradeDescription: "Obtenha 500 conversões/dia, OCR de alta precisão e suporte prioritário.",
-      upgradeNow: "Atualizar Agora",
-    },
-    pricing: {
-      title: "Preços Simples e Transparentes",
-      subtitle: "Escolha o plano certo para você",
-      monthly: "Mensal",
-      yearly: "Anual",
-      perMonth: "/mês",
-      current: "Plano Atual",
-      getStarted: "Começar",
-      subscribe: "Assinar",
-      contactUs: "Contate-nos",
-      features: {
-        conversions: "conversões/dia",
-        unlimited: "Conversões ilimitadas",
-        fileSize: "MB tamanho de arquivo",
-        batch: "arquivos por lote",
-        history: "histórico",
-        api: "Acesso API",
-        support: "suporte",
-      },
-    },
-    common: {
-      loading: "Carregando...",
-      error: "Erro",
-      success: "Sucesso",
-      cancel: "Cancelar",
-      save: "Salvar",
-      delete: "Excluir",
-      close: "Fechar",
-      back: "Voltar",
-    },
-    footer: {
-      product: "Produto",
-      legal: "Legal",
-      termsOfService: "Termos de Serviço",
-      privacyPolicy: "Política de Privacidade",
-      allRightsReserved: "Todos os direitos reservados.",
-    },
-  },
-  id: {
-    nav: {
-      imageToText: "Gambar ke Teks",
-      batchUpload: "Unggah Massal",
-      imageTranslator: "Penerjemah Gambar",
-      jpgToWord: "JPG ke Word",
-      jpgToExcel: "JPG ke Excel",
-      pdfToExcel: "PDF ke Excel",
-      pdfToWord: "PDF ke Word",
-      pdfToText: "PDF ke Teks",
-      textToPdf: "Teks ke PDF",
-      imageToPdf: "Gambar ke PDF",
-      pdfToJpg: "PDF ke JPG",
-      textToImage: "Teks ke Gambar",
-      qrScanner: "Pemindai QR",
-      history: "Riwayat",
-      pricing: "Harga",
-      login: "Masuk",
-      blog: "Blog",
-    },
-    home: {
-      title: "Konverter Gambar ke Teks",
-      subtitle: "Konverter online untuk mengekstrak teks dari gambar.",
-      dropzone: {
-        title: "Seret, Unggah atau Tempel Gambar",
-        dragActive: "Letakkan gambar di sini",
-        formats: "Format yang didukung: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
-        browse: "Telusuri",
-      },
-      mode: {
-        simple: "OCR Sederhana",
-        formatted: "Teks Terformat",
-      },
-      language: "Bahasa:",
-      privacy: "*Privasi Anda dilindungi! Tidak ada data yang dikirim atau disimpan.",
-      features: {
-        formats: {
-          title: "Berbagai Format",
-          description: "Mendukung JPG, PNG, GIF, JFIF, HEIC, PDF dan format gambar lainnya.",
-        },
-        languages: {
-          title: "OCR Multi-Bahasa",
-          description: "Ekstrak teks dalam bahasa Inggris, Cina, Jepang, Korea dan 15+ bahasa.",
-        },
-        privacy: {
-          title: "100% Privasi",
-          description: "Semua pemrosesan terjadi di browser Anda. Tidak ada data yang diunggah ke server.",
-        },
-      },
-      rating: "Nilai alat ini",
-    },
-    result: {
-      title: "Teks yang Diekstrak",
-      processing: "Memproses...",
-      copy: "Salin",
-      download: "Unduh",
-      reset: "Gambar Baru",
-      copied: "Disalin ke clipboard!",
-      noText: "Tidak ada teks yang terdeteksi dalam gambar.",
-    },
-    batch: {
-      title: "Gambar ke Teks Massal",
-      subtitle: "Unggah beberapa gambar dan ekstrak teks dari semuanya sekaligus.",
-      settings: "Pengaturan OCR",
-      selectFiles: "Pilih File",
-      processAll: "Proses Semua",
-      downloadAll: "Unduh Semua",
-      clearAll: "Hapus Semua",
-      pending: "Menunggu",
-      processing: "Memproses...",
-      completed: "selesai",
-      features: {
-        batch: {
-          title: "Pemrosesan Massal",
-          description: "Unggah hingga 10 gambar dan proses semuanya dengan satu klik.",
-        },
-        progress: {
-          title: "Pelacakan Kemajuan",
-          description: "Lihat kemajuan real-time untuk setiap file yang diproses.",
-        },
-        download: {
-          title: "Unduh Semua",
-          description: "Unduh semua teks yang diekstrak sebagai satu file gabungan.",
-        },
-      },
-    },
-    login: {
-      welcome: "Selamat Datang Kembali",
-      createAccount: "Buat Akun",
-      signIn: "Masuk ke akun Anda",
-      signUp: "Daftar untuk mengakses fitur premium",
-      email: "Email",
-      password: "Kata Sandi",
-      signInBtn: "Masuk",
-      signUpBtn: "Buat Akun",
-      signingIn: "Sedang masuk...",
-      creatingAccount: "Membuat akun...",
-      orContinueWith: "atau lanjutkan dengan email",
-      alreadyHaveAccount: "Sudah punya akun?",
-      dontHaveAccount: "Belum punya akun?",
-      terms: "Ketentuan Layanan",
-      privacy: "Kebijakan Privasi",
-      agreement: "Dengan melanjutkan, Anda menyetujui",
-    },
-    dashboard: {
-      title: "Dasbor",
-      subtitle: "Kelola akun dan penggunaan Anda",
-      signOut: "Keluar",
-      profile: "Profil",
-      dailyUsage: "Penggunaan Harian",
-      totalConversions: "Total Konversi",
-      conversions: "konversi",
-      allTime: "Total sepanjang waktu",
-      resetsDaily: "Reset setiap hari pada tengah malam UTC",
-      quickActions: "Tindakan Cepat",
-      accountSettings: "Pengaturan Akun",
-      upgradePlan: "Tingkatkan Paket",
-      comingSoon: "Segera Hadir",
-      upgradeTitle: "Tingkatkan ke Pro",
-      upgradeDescription: "Dapatkan 500 konversi/hari, OCR presisi tinggi, dan dukungan prioritas.",
-      upgradeNow: "Tingkatkan Sekarang",
-    },
-    pricing: {
-      title: "Harga Sederhana dan Transparan",
-      subtitle: "Pilih paket yang tepat untuk Anda",
-      monthly: "Bulanan",
-      yearly: "Tahunan",
-      perMonth: "/bulan",
-      current: "Paket Saat Ini",
-      getStarted: "Mulai",
-      subscribe: "Berlangganan",
-      contactUs: "Hubungi Kami",
-      features: {
-        conversions: "konversi/hari",
-        unlimited: "Konversi tak terbatas",
-        fileSize: "MB ukuran file",
-        batch: "file per batch",
-        history: "riwayat",
-        api: "Akses API",
-        support: "dukungan",
-      },
-    },
-    common: {
-      loading: "Memuat...",
-      error: "Kesalahan",
-      success: "Berhasil",
-      cancel: "Batal",
-      save: "Simpan",
-      delete: "Hapus",
-      close: "Tutup",
-      back: "Kembali",
-    },
-    footer: {
-      product: "Produk",
-      legal: "Hukum",
-      termsOfService: "Ketentuan Layanan",
-      privacyPolicy: "Kebijakan Privasi",
-      allRightsReserved: "Hak cipta dilindungi.",
-    },
-  },
-  fr: {
-    nav: {
-      imageToText: "Image en Texte",
-      batchUpload: "Téléchargement par Lot",
-      imageTranslator: "Traducteur d'Images",
-      jpgToWord: "JPG en Word",
-      jpgToExcel: "JPG en Excel",
-      pdfToExcel: "PDF en Excel",
-      pdfToWord: "PDF en Word",
-      pdfToText: "PDF en Texte",
-      textToPdf: "Texte en PDF",
-      imageToPdf: "Image en PDF",
-      pdfToJpg: "PDF en JPG",
-      textToImage: "Texte en Image",
-      qrScanner: "Scanner QR",
-      history: "Historique",
-      pricing: "Tarifs",
-      login: "Connexion",
-      blog: "Blog",
-    },
-    home: {
-      title: "Convertisseur Image en Texte",
-      subtitle: "Convertisseur en ligne pour extraire le texte des images.",
-      dropzone: {
-        title: "Glissez, Téléchargez ou Collez des Images",
-        dragActive: "Déposez l'image ici",
-        formats: "Formats pris en charge : JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
-        browse: "Parcourir",
-      },
-      mode: {
-        simple: "OCR Simple",
-        formatted: "Texte Formaté",
-      },
-      language: "Langue :",
-      privacy: "*Votre vie privée est protégée ! Aucune donnée n'est transmise ou stockée.",
-      features: {
-        formats: {
-          title: "Formats Multiples",
-          description: "Prend en charge JPG, PNG, GIF, JFIF, HEIC, PDF et plus de formats d'image.",
-        },
-        languages: {
-          title: "OCR Multilingue",
-          description: "Extrayez du texte en anglais, chinois, japonais, coréen et plus de 15 langues.",
-        },
-        privacy: {
-          title: "100% Confidentialité",
-          description: "Tout le traitement se fait dans votre navigateur. Aucune donnée n'est envoyée aux serveurs.",
-        },
-      },
-      rating: "Évaluez cet outil",
-    },
-    result: {
-      title: "Texte Extrait",
-      processing: "Traitement...",
-      copy: "Copier",
-      download: "Télécharger",
-      reset: "Nouvelle Image",
-      copied: "Copié dans le presse-papiers !",
-      noText: "Aucun texte détecté dans l'image.",
-    },
-    batch: {
-      title: "Image en Texte par Lot",
-      subtitle: "Téléchargez plusieurs images et extrayez le texte de toutes en une fois.",
-      settings: "Paramètres OCR",
-      selectFiles: "Sélectionner des Fichiers",
-      processAll: "Traiter Tout",
-      downloadAll: "Tout Télécharger",
-      clearAll: "Tout Effacer",
-      pending: "En attente",
-      processing: "Traitement...",
-      completed: "terminé",
-      features: {
-        batch: {
-          title: "Traitement par Lot",
-          description: "Téléchargez jusqu'à 10 images et traitez-les toutes en un seul clic.",
-        },
-        progress: {
-          title: "Suivi de Progression",
-          description: "Voyez la progression en temps réel de chaque fichier traité.",
-        },
-        download: {
-          title: "Tout Télécharger",
-          description: "Téléchargez tout le texte extrait dans un seul fichier combiné.",
-        },
-      },
-    },
-    login: {
-      welcome: "Bienvenue",
-      createAccount: "Créer un Compte",
-      signIn: "Connectez-vous à votre compte",
-      signUp: "Inscrivez-vous pour accéder aux fonctionnalités premium",
-      email: "E-mail",
-      password: "Mot de passe",
-      signInBtn: "Se Connecter",
-      signUpBtn: "Créer un Compte",
-      signingIn: "Connexion...",
-      creatingAccount: "Création du compte...",
-      orContinueWith: "ou continuez avec e-mail",
-      alreadyHaveAccount: "Vous avez déjà un compte ?",
-      dontHaveAccount: "Vous n'avez pas de compte ?",
-      terms: "Conditions d'Utilisation",
-      privacy: "Politique de Confidentialité",
-      agreement: "En continuant, vous acceptez nos",
-    },
-    dashboard: {
-      title: "Tableau de Bord",
-      subtitle: "Gérez votre compte et votre utilisation",
-      signOut: "Déconnexion",
-      profile: "Profil",
-      dailyUsage: "Utilisation Quotidienne",
-      totalConversions: "Conversions Totales",
-      conversions: "conversions",
-      allTime: "Total historique",
-      resetsDaily: "Réinitialisé quotidiennement à minuit UTC",
-      quickActions: "Actions Rapides",
-      accountSettings: "Paramètres du Compte",
-      upgradePlan: "Améliorer le Plan",
-      comingSoon: "Bientôt Disponible",
-      upgradeTitle: "Passer à Pro",
-      upgradeDescription: "Obtenez 500 conversions/jour, OCR haute précision et support prioritaire.",
-      upgradeNow: "Améliorer Maintenant",
-    },
-    pricing: {
-      title: "Tarification Simple et Transparente",
-      subtitle: "Choisissez le plan qui vous convient",
-      monthly: "Mensuel",
-      yearly: "Annuel",
-      perMonth: "/mois",
-      current: "Plan Actuel",
-      getStarted: "Commencer",
-      subscribe: "S'abonner",
-      contactUs: "Contactez-nous",
-      features: {
-        conversions: "conversions/jour",
-        unlimited: "Conversions illimitées",
-        fileSize: "Mo taille de fichier",
-        batch: "fichiers par lot",
-        history: "historique",
-        api: "Accès API",
-        support: "support",
-      },
-    },
-    common: {
-      loading: "Chargement...",
-      error: "Erreur",
-      success: "Succès",
-      cancel: "Annuler",
-      save: "Enregistrer",
-      delete: "Supprimer",
-      close: "Fermer",
-      back: "Retour",
-    },
-    footer: {
-      product: "Produit",
-      legal: "Légal",
-      termsOfService: "Conditions d'Utilisation",
-      privacyPolicy: "Politique de Confidentialité",
-      allRightsReserved: "Tous droits réservés.",
-    },
-  },
-  de: {
-    nav: {
-      imageToText: "Bild zu Text",
-      batchUpload: "Stapel-Upload",
-      imageTranslator: "Bildübersetzer",
-      jpgToWord: "JPG zu Word",
-      jpgToExcel: "JPG zu Excel",
-      pdfToExcel: "PDF zu Excel",
-      pdfToWord: "PDF zu Word",
-      pdfToText: "PDF zu Text",
-      textToPdf: "Text zu PDF",
-      imageToPdf: "Bild zu PDF",
-      pdfToJpg: "PDF zu JPG",
-      textToImage: "Text zu Bild",
-      qrScanner: "QR-Scanner",
-      history: "Verlauf",
-      pricing: "Preise",
-      login: "Anmelden",
-      blog: "Blog",
-    },
-    home: {
-      title: "Bild zu Text Konverter",
-      subtitle: "Online-Konverter zum Extrahieren von Text aus Bildern.",
-      dropzone: {
-        title: "Bilder Ziehen, Hochladen oder Einfügen",
-        dragActive: "Bild hier ablegen",
-        formats: "Unterstützte Formate: JPG, PNG, GIF, JFIF (JPEG), HEIC, PDF",
-        browse: "Durchsuchen",
-      },
-      mode: {
-        simple: "Einfache OCR",
-        formatted: "Formatierter Text",
-      },
-      language: "Sprache:",
-      privacy: "*Ihre Privatsphäre ist geschützt! Keine Daten werden übertragen oder gespeichert.",
-      features: {
-        formats: {
-          title: "Mehrere Formate",
-          description: "Unterstützt JPG, PNG, GIF, JFIF, HEIC, PDF und weitere Bildformate.",
-        },
-        languages: {
-          title: "Mehrsprachige OCR",
-          description: "Text in Englisch, Chinesisch, Japanisch, Koreanisch und 15+ Sprachen extrahieren.",
-        },
-        privacy: {
-          title: "100% Privatsphäre",
-          description: "Alle Verarbeitung erfolgt in Ihrem Browser. Keine Daten werden auf Server hochgeladen.",
-        },
-      },
-      rating: "Dieses Tool bewerten",
-    },
-    result: {
-      title: "Extrahierter Text",
-      processing: "Verarbeitung...",
-      copy: "Kopieren",
-      download: "Herunterladen",
-      reset: "Neues Bild",
-      copied: "In die Zwischenablage kopiert!",
-      noText: "Kein Text im Bild erkannt.",
-    },
-    batch: {
-      title: "Stapel Bild zu Text",
-      subtitle: "Laden Sie mehrere Bilder hoch und extrahieren Sie Text aus allen auf einmal.",
-      settings: "OCR-Einstellungen",
-      selectFiles: "Dateien Auswählen",
-      processAll: "Alle Verarbeiten",
-      downloadAll: "Alle Herunterladen",
-      clearAll: "Alle Löschen",
-      pending: "Ausstehend",
-      processing: "Verarbeitung...",
-      completed: "abgeschlossen",
-      features: {
-        batch: {
-          title: "Stapelverarbeitung",
-          description: "Laden Sie bis zu 10 Bilder hoch und verarbeiten Sie alle mit einem Klick.",
-        },
-        progress: {
-          title: "Fortschrittsverfolgung",
-          description: "Sehen Sie den Echtzeit-Fortschritt für jede verarbeitete Datei.",
-        },
-        download: {
-          title: "Alle Herunterladen",
-          description: "Laden Sie den gesamten extrahierten Text als eine kombinierte Datei herunter.",
-        },
-      },
-    },
-    login: {
-      welcome: "Willkommen Zurück",
-      createAccount: "Konto Erstellen",
-      signIn: "Melden Sie sich bei Ihrem Konto an",
-      signUp: "Registrieren Sie sich für Premium-Funktionen",
-      email: "E-Mail",
-      password: "Passwort",
-      signInBtn: "Anmelden",
-      signUpBtn: "Konto Erstellen",
-      signingIn: "Anmeldung...",
-      creatingAccount: "Konto wird erstellt...",
-      orContinueWith: "oder mit E-Mail fortfahren",
-      alreadyHaveAccount: "Haben Sie bereits ein Konto?",
-      dontHaveAccount: "Haben Sie kein Konto?",
-      terms: "Nutzungsbedingungen",
-      privacy: "Datenschutzrichtlinie",
-      agreement: "Mit dem Fortfahren stimmen Sie unseren zu",
-    },
-    dashboard: {
-      title: "Dashboard",
-      subtitle: "Verwalten Sie Ihr Konto und Ihre Nutzung",
-      signOut: "Abmelden",
-      profile: "Profil",
-      dailyUsage: "Tägliche Nutzung",
-      totalConversions: "Gesamtkonvertierungen",
-      conversions: "Konvertierungen",
-      allTime: "Gesamte bisherige",
-      resetsDaily: "Wird täglich um Mitternacht UTC zurückgesetzt",
-      quickActions: "Schnellaktionen",
-      accountSettings: "Kontoeinstellungen",
-      upgradePlan: "Plan Upgraden",
-      comingSoon: "Demnächst",
-      upgradeTitle: "Auf Pro Upgraden",
-      upgradeDescription: "Erhalten Sie 500 Konvertierungen/Tag, hochpräzise OCR und Prioritäts-Support.",
-      upgradeNow: "Jetzt Upgraden",
-    },
-    pricing: {
-      title: "Einfache, Transparente Preise",
-      subtitle: "Wählen Sie den richtigen Plan für Sie",
-      monthly: "Monatlich",
-      yearly: "Jährlich",
-      perMonth: "/Monat",
-      current: "Aktueller Plan",
-      getStarted: "Loslegen",
-      subscribe: "Abonnieren",
-      contactUs: "Kontaktieren Sie uns",
-      features: {
-        conversions: "Konvertierungen/Tag",
-        unlimited: "Unbegrenzte Konvertierungen",
-        fileSize: "MB Dateigröße",
-        batch: "Dateien pro Stapel",
-        history: "Verlauf",
-        api: "API-Zugang",
-        support: "Support",
-      },
-    },
-    common: {
-      loading: "Laden...",
-      error: "Fehler",
-      success: "Erfolg",
-      cancel: "Abbrechen",
-      save: "Speichern",
-      delete: "Löschen",
-      close: "Schließen",
-      back: "Zurück",
-    },
-    footer: {
-      product: "Produkt",
-      legal: "Rechtliches",
-      termsOfService: "Nutzungsbedingungen",
-      privacyPolicy: "Datenschutzrichtlinie",
-      allRightsReserved: "Alle Rechte vorbehalten.",
-    },
-  },
-} as const;
+// Each locale other than English is its own chunk, fetched the first time
+// it is needed
+const loaders: Record<Exclude<Locale, "en">, () => Promise<{ default: Translations }>> = {
+  zh: () => import("./locales/zh"),
+  es: () => import("./locales/es"),
+  pt: () => import("./locales/pt"),
+  id: () => import("./locales/id"),
+  fr: () => import("./locales/fr"),
+  de: () => import("./locales/de"),
+};
+
+const loaded = new Map<Locale, Translations>([["en", en]]);
+const pending = new Map<Locale, Promise<Translations>>();
+
+export const defaultTranslations = en;
+
+export function isLocale(value: string | null | undefined): value is Locale {
+  return SUPPORTED_LOCALES.includes(value as Locale);
+}
+
+// The dictionary if it has already been loaded
+export function getLoadedTranslations(locale: Locale): Translations | undefined {
+  return loaded.get(locale);
+}
+
+export function loadTranslations(locale: Locale): Promise<Translations> {
+  const ready = loaded.get(locale);
+  if (ready) return Promise.resolve(ready);
 
-export type TranslationKey = keyof typeof translations.en;
+  let promise = pending.get(locale);
+  if (!promise) {
+    promise = loaders[locale as Exclude<Locale, "en">]()
+      .then((module) => {
+        loaded.set(locale, module.default);
+        return module.default;
+      })
+      // A failed chunk load (e.g. offline) can be retried later
+      .finally(() => pending.delete(locale));
+    pending.set(locale, promise);
+  }
+  return promise;
+}
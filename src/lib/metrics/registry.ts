@@ -0,0 +1,83 @@
+// In-process Prometheus registry. Stage durations are kept as fixed-bucket
+// histograms labelled by stage and engine, so memory stays constant however
+// many requests are observed. Served by /api/metrics.
+
+export type MetricLabels = Record<string, string>;
+
+export interface MetricSample {
+  labels?: MetricLabels;
+  value: number;
+}
+
+// Upper bounds in seconds, from a cache hit to a slow cloud call
+const BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60];
+
+interface Histogram {
+  stage: string;
+  engine: string;
+  // Observations per bucket (not cumulative); the last slot is +Inf
+  counts: number[];
+  sum: number;
+  count: number;
+}
+
+const histograms = new Map<string, Histogram>();
+
+export function observeDuration(stage: string, engine: string, durationMs: number) {
+  const key = `${stage}\n${engine}`;
+  let histogram = histograms.get(key);
+  if (!histogram) {
+    histogram = { stage, engine, counts: new Array(BUCKETS.length + 1).fill(0), sum: 0, count: 0 };
+    histograms.set(key, histogram);
+  }
+
+  const seconds = durationMs / 1000;
+  const bucket = BUCKETS.findIndex((bound) => seconds <= bound);
+  histogram.counts[bucket === -1 ? BUCKETS.length : bucket]++;
+  histogram.sum += seconds;
+  histogram.count++;
+}
+
+function escapeLabel(value: string): string {
+  return value.replace(/\\/g, "\\\\").replace(/"/g, '\\"').replace(/\n/g, "\\n");
+}
+
+function formatLabels(labels: MetricLabels = {}): string {
+  const pairs = Object.entries(labels).map(([name, value]) => `${name}="${escapeLabel(value)}"`);
+  return pairs.length > 0 ? `{${pairs.join(",")}}` : "";
+}
+
+// One metric family in the text exposition format
+export function renderMetric(
+  name: string,
+  type: "counter" | "gauge",
+  help: string,
+  samples: MetricSample[]
+): string {
+  const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} ${type}`];
+  for (const { labels, value } of samples) {
+    lines.push(`${name}${formatLabels(labels)} ${value}`);
+  }
+  return lines.join("\n");
+}
+
+export function renderStageHistograms(): string {
+  const name = "ocr_stage_duration_seconds";
+  const lines = [
+    `# HELP ${name} Time spent in each processing stage`,
+    `# TYPE ${name} histogram`,
+  ];
+
+  for (const { stage, engine, counts, sum, count } of histograms.values()) {
+    let cumulative = 0;
+    BUCKETS.forEach((bound, index) => {
+      cumulative += counts[index];
+      lines.push(`${name}_bucket${formatLabels({ stage, engine, le: String(bound) })} ${cumulative}`);
+    });
+    lines.push(`${name}_bucket${formatLabels({ stage, engine, le: "+Inf" })} ${count}`);
+    lines.push(`${name}_sum${formatLabels({ stage, engine })} ${sum}`);
+    lines.push(`${name}_count${formatLabels({ stage, engine })} ${count}`);
+  }
+
+  return lines.join("\n");
+}
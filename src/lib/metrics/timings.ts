@@ -0,0 +1,70 @@
+import { observeDuration } from "./registry";
+
+// Per-request stage timings. Spans are reported to the caller (Server-Timing
+// header or a `timings` field) and, on the server, folded into the
+// /api/metrics histograms as they finish.
+
+// Stage durations in milliseconds, plus `total` since the request started
+export type StageTimings = Record<string, number>;
+
+// Browsers have no metrics endpoint, so only the server keeps histograms
+const OBSERVE = typeof window === "undefined";
+
+function round(ms: number): number {
+  return Math.round(ms * 10) / 10;
+}
+
+export class Timings {
+  readonly engine: string;
+  private readonly startedAt = performance.now();
+  private spans = new Map<string, number>();
+
+  constructor(engine: string) {
+    this.engine = engine;
+  }
+
+  // Time a stage, including when it throws
+  async time<T>(stage: string, task: () => Promise<T> | T): Promise<T> {
+    const startedAt = performance.now();
+    try {
+      return await task();
+    } finally {
+      this.record(stage, performance.now() - startedAt);
+    }
+  }
+
+  // A stage recorded more than once (e.g. polling) adds up
+  record(stage: string, durationMs: number) {
+    this.spans.set(stage, (this.spans.get(stage) ?? 0) + durationMs);
+    if (OBSERVE) observeDuration(stage, this.engine, durationMs);
+  }
+
+  get totalMs(): number {
+    return performance.now() - this.startedAt;
+  }
+
+  toJSON(): StageTimings {
+    const timings: StageTimings = {};
+    for (const [stage, duration] of this.spans) {
+      timings[stage] = round(duration);
+    }
+    timings.total = round(this.totalMs);
+    return timings;
+  }
+
+  toServerTiming(): string {
+    return Object.entries(this.toJSON())
+      .map(([stage, duration]) => `${stage};dur=${duration}`)
+      .join(", ");
+  }
+
+  headers(): Record<string, string> {
+    return { "Server-Timing": this.toServerTiming() };
+  }
+}
+
+// Whether the caller asked for a `timings` field in the response body
+export function wantsTimings(request: Request): boolean {
+  const value = new URL(request.url).searchParams.get("timings");
+  return value === "1" || value === "true";
+}
@@ -0,0 +1,185 @@
+import { randomUUID } from "node:crypto";
+import { recognizeBuffer, OCRQueueFullError } from "./server";
+import type { LanguageCode, OCRResult } from "./tesseract";
+
+// In-process store for asynchronous batch OCR jobs. Files are processed on
+// the shared server worker pool and results are kept for JOB_TTL_MS.
+
+export type BatchFileStatus = "pending" | "processing" | "completed" | "error";
+export type BatchJobStatus = "queued" | "processing" | "completed";
+
+export interface BatchFileResult {
+  index: number;
+  name: string;
+  status: BatchFileStatus;
+  result?: OCRResult;
+  error?: string;
+}
+
+export interface BatchJob {
+  id: string;
+  userId: string;
+  language: LanguageCode;
+  status: BatchJobStatus;
+  files: BatchFileResult[];
+  createdAt: number;
+  completedAt?: number;
+}
+
+export interface BatchInputFile {
+  name: string;
+  data: Buffer;
+}
+
+type BatchListener = (file: BatchFileResult) => void;
+
+export const MAX_BATCH_FILES = Number(process.env.OCR_MAX_BATCH_FILES) || 50;
+const BATCH_CONCURRENCY = 4;
+const JOB_TTL_MS = 60 * 60 * 1000;
+// How long a file may wait for room in a full queue before it is failed
+const MAX_QUEUE_WAIT_MS = 5 * 60 * 1000;
+
+const jobs = new Map<string, BatchJob>();
+const listeners = new Map<string, Set<BatchListener>>();
+
+function pruneExpiredJobs() {
+  const cutoff = Date.now() - JOB_TTL_MS;
+  for (const [id, job] of jobs) {
+    if (job.completedAt && job.completedAt < cutoff) {
+      jobs.delete(id);
+      listeners.delete(id);
+    }
+  }
+}
+
+function notify(job: BatchJob, file: BatchFileResult) {
+  listeners.get(job.id)?.forEach((listener) => listener(file));
+}
+
+async function recognizeWithRetry(
+  data: Buffer,
+  language: LanguageCode
+): Promise<OCRResult> {
+  // A batch shares the queue with single-image requests, so back off
+  // instead of failing when it is momentarily full, but not indefinitely
+  const deadline = Date.now() + MAX_QUEUE_WAIT_MS;
+  for (;;) {
+    try {
+      return await recognizeBuffer(data, language, { includeWordData: true });
+    } catch (error) {
+      if (!(error instanceof OCRQueueFullError)) throw error;
+      const delay = error.retryAfter * 1000;
+      if (Date.now() + delay > deadline) {
+        throw new Error("Server busy: the OCR queue stayed full, try again later");
+      }
+      await new Promise((resolve) => setTimeout(resolve, delay));
+    }
+  }
+}
+
+async function runBatch(job: BatchJob, inputs: BatchInputFile[]) {
+  job.status = "processing";
+  let next = 0;
+
+  const processNext = async (): Promise<void> => {
+    while (next < inputs.length) {
+      const index = next++;
+      const file = job.files[index];
+      file.status = "processing";
+
+      try {
+        file.result = await recognizeWithRetry(inputs[index].data, job.language);
+        file.status = "completed";
+      } catch (error) {
+        file.status = "error";
+        file.error = error instanceof Error ? error.message : "Processing failed";
+      }
+
+      // Drop the reference to the upload as soon as it is processed
+      inputs[index] = { name: inputs[index].name, data: Buffer.alloc(0) };
+      notify(job, file);
+    }
+  };
+
+  const workers = Math.min(BATCH_CONCURRENCY, inputs.length);
+  await Promise.all(Array.from({ length: workers }, processNext));
+
+  job.status = "completed";
+  job.completedAt = Date.now();
+  listeners.delete(job.id);
+}
+
+export function createBatchJob(
+  userId: string,
+  files: BatchInputFile[],
+  language: LanguageCode
+): BatchJob {
+  pruneExpiredJobs();
+
+  const job: BatchJob = {
+    id: randomUUID(),
+    userId,
+    language,
+    status: "queued",
+    files: files.map((file, index) => ({
+      index,
+      name: file.name,
+      status: "pending",
+    })),
+    createdAt: Date.now(),
+  };
+  jobs.set(job.id, job);
+
+  void runBatch(job, [...files]).catch((error) => {
+    console.error("Batch OCR error:", error);
+  });
+
+  return job;
+}
+
+export function getBatchJob(id: string, userId: string): BatchJob | null {
+  const job = jobs.get(id);
+  return job && job.userId === userId ? job : null;
+}
+
+// Subscribe to per-file results. Files that already finished are replayed
+// immediately; the returned function unsubscribes.
+export function subscribeToBatchJob(
+  job: BatchJob,
+  listener: BatchListener
+): () => void {
+  job.files
+    .filter((file) => file.status === "completed" || file.status === "error")
+    .forEach(listener);
+
+  if (job.status === "completed") {
+    return () => {};
+  }
+
+  let set = listeners.get(job.id);
+  if (!set) {
+    set = new Set();
+    listeners.set(job.id, set);
+  }
+  set.add(listener);
+
+  return () => {
+    set.delete(listener);
+  };
+}
+
+export function summarizeBatchJob(job: BatchJob) {
+  const done = job.files.filter(
+    (file) => file.status === "completed" || file.status === "error"
+  ).length;
+
+  return {
+    id: job.id,
+    status: job.status,
+    language: job.language,
+    total: job.files.length,
+    completed: done,
+    created_at: new Date(job.createdAt).toISOString(),
+    completed_at: job.completedAt ? new Date(job.completedAt).toISOString() : null,
+  };
+}
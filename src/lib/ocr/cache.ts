@@ -0,0 +1,52 @@
+import { LRUCache } from "@/lib/cache/lru";
+import { TieredCache, type CacheStore } from "@/lib/cache/tiered";
+import type { OCRResult } from "./tesseract";
+
+export type OCREngine = "tesseract" | "google" | "azure";
+
+const MEMORY_MAX_ENTRIES = 200;
+const MEMORY_MAX_BYTES = 32 * 1024 * 1024;
+const MEMORY_TTL_MS = 60 * 60 * 1000;
+
+// Cache keys are content addressed: the same bytes recognized with the same
+// engine and settings (including preprocessing variant) always map to the same entry
+export function getOCRCacheKey(
+  imageHash: string,
+  engine: OCREngine,
+  language: string,
+  includeWordData: boolean = false,
+  variant: string = ""
+): string {
+  const key = `${imageHash}-${engine}-${language}-${includeWordData ? "w" : "t"}`;
+  return variant ? `${key}-${variant}` : key;
+}
+
+// Language hints for the cloud engines are BCP-47 tags ("en", "zh-Hans").
+// Request values end up in cache keys and provider URLs, so nothing else
+// is accepted.
+export function isCloudLanguageHint(value: string): boolean {
+  return /^[a-z]{2,3}(-[a-z0-9]{2,8}){0,2}$/i.test(value);
+}
+
+// Rough in-memory footprint, used to bound the LRU by size
+export function estimateResultSize(value: unknown): number {
+  if (value && typeof value === "object" && "text" in value) {
+    const result = value as OCRResult;
+    return result.text.length * 2 + (result.words?.length ?? 0) * 96 + 64;
+  }
+  return JSON.stringify(value ?? null).length * 2;
+}
+
+export function createOCRCache<V = OCRResult>(
+  persistent?: CacheStore<V>
+): TieredCache<V> {
+  return new TieredCache<V>(
+    new LRUCache<V>({
+      maxEntries: MEMORY_MAX_ENTRIES,
+      maxSize: MEMORY_MAX_BYTES,
+      ttlMs: MEMORY_TTL_MS,
+      sizeOf: estimateResultSize,
+    }),
+    persistent
+  );
+}
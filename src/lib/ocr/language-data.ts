@@ -0,0 +1,259 @@
+import type Tesseract from "tesseract.js";
+import { createIndexedDBStore } from "@/lib/cache/indexeddb";
+import type { CacheStore } from "@/lib/cache/tiered";
+import type { LanguageCode } from "./tesseract";
+import type { DetectedScript } from "./script-detect";
+import {
+  TESSDATA_LANGUAGES,
+  TESSDATA_PATH,
+  TESSDATA_VERSION,
+  tessdataCdnUrl,
+  tessdataFileName,
+} from "./tessdata";
+
+// Browser manager for Tesseract traineddata. Files come from this site
+// (public/tessdata, see scripts/fetch-traineddata.ts) with the CDN as a
+// fallback, are kept in a versioned Cache API cache (IndexedDB where that is
+// missing) and are handed to workers as bytes, so once a language has been
+// downloaded recognition needs no network at all.
+
+const CACHE_NAME = `tessdata-${TESSDATA_VERSION}`;
+const CACHE_PREFIX = "tessdata-";
+const TESSDATA_BASE_URL = process.env.NEXT_PUBLIC_TESSDATA_URL || `/${TESSDATA_PATH}`;
+const RECENT_KEY = "ocr-recent-languages";
+const MAX_RECENT = 3;
+const CJK_LANGUAGES: string[] = ["chi_sim", "chi_tra", "jpn", "kor"];
+
+// Browser language subtags mapped to traineddata
+const BROWSER_LANGUAGES: Record<string, LanguageCode> = {
+  en: "eng",
+  zh: "chi_sim",
+  ja: "jpn",
+  ko: "kor",
+  es: "spa",
+  fr: "fra",
+  de: "deu",
+  ru: "rus",
+  ar: "ara",
+  hi: "hin",
+  pt: "por",
+  it: "ita",
+  vi: "vie",
+  th: "tha",
+};
+
+const downloads = new Map<string, Promise<ArrayBuffer>>();
+const prefetched = new Set<string>();
+let fallbackStore: CacheStore<ArrayBuffer> | undefined | null = null;
+let staleRemoved = false;
+
+function isBrowser(): boolean {
+  return typeof window !== "undefined";
+}
+
+function hasCacheApi(): boolean {
+  return typeof caches !== "undefined";
+}
+
+function getFallbackStore(): CacheStore<ArrayBuffer> | undefined {
+  if (fallbackStore === null) {
+    fallbackStore = createIndexedDBStore<ArrayBuffer>(CACHE_NAME, 365 * 24 * 60 * 60 * 1000);
+  }
+  return fallbackStore;
+}
+
+function dataUrl(lang: string): string {
+  return `${TESSDATA_BASE_URL}/${tessdataFileName(lang)}`;
+}
+
+// Caches and databases left by earlier data versions are deleted once per page
+async function removeStaleVersions() {
+  if (staleRemoved) return;
+  staleRemoved = true;
+  try {
+    if (hasCacheApi()) {
+      for (const name of await caches.keys()) {
+        if (name.startsWith(CACHE_PREFIX) && name !== CACHE_NAME) await caches.delete(name);
+      }
+    }
+    if (typeof indexedDB !== "undefined" && indexedDB.databases) {
+      for (const { name } of await indexedDB.databases()) {
+        if (name?.startsWith(CACHE_PREFIX) && name !== CACHE_NAME) indexedDB.deleteDatabase(name);
+      }
+    }
+  } catch (error) {
+    console.warn("Language data cleanup failed:", error);
+  }
+}
+
+async function readCached(lang: string): Promise<ArrayBuffer | undefined> {
+  if (hasCacheApi()) {
+    const response = await (await caches.open(CACHE_NAME)).match(dataUrl(lang));
+    return response?.arrayBuffer();
+  }
+  return getFallbackStore()?.get(lang);
+}
+
+async function isCached(lang: string): Promise<boolean> {
+  if (hasCacheApi()) {
+    return Boolean(await (await caches.open(CACHE_NAME)).match(dataUrl(lang)));
+  }
+  return (await getFallbackStore()?.get(lang)) !== undefined;
+}
+
+async function writeCached(lang: string, data: ArrayBuffer) {
+  if (hasCacheApi()) {
+    const cache = await caches.open(CACHE_NAME);
+    await cache.put(
+      dataUrl(lang),
+      new Response(data, { headers: { "Content-Type": "application/gzip" } })
+    );
+    return;
+  }
+  await getFallbackStore()?.set(lang, data);
+}
+
+async function download(lang: string): Promise<ArrayBuffer> {
+  for (const url of [dataUrl(lang), tessdataCdnUrl(lang)]) {
+    try {
+      const response = await fetch(url);
+      if (response.ok) return await response.arrayBuffer();
+    } catch {
+      // Try the next source
+    }
+  }
+  throw new Error(`Failed to download language data for ${lang}`);
+}
+
+// Concurrent requests for the same language share one download
+function downloadAndCache(lang: string): Promise<ArrayBuffer> {
+  let pending = downloads.get(lang);
+  if (!pending) {
+    void removeStaleVersions();
+    pending = download(lang)
+      .then(async (data) => {
+        try {
+          await writeCached(lang, data);
+        } catch (error) {
+          // Storage may be full or disabled; the data is still usable
+          console.warn("Language data not cached:", error);
+        }
+        return data;
+      })
+      .finally(() => downloads.delete(lang));
+    downloads.set(lang, pending);
+  }
+  return pending;
+}
+
+export async function getLanguageData(lang: string): Promise<Uint8Array> {
+  const cached = await readCached(lang).catch(() => undefined);
+  return new Uint8Array(cached ?? (await downloadAndCache(lang)));
+}
+
+// What a new Tesseract worker is given: cached bytes in the browser, the
+// plain language string on the server (tesseract.js caches on disk there)
+export async function loadWorkerLanguages(
+  langString: string
+): Promise<string | Tesseract.Lang[]> {
+  if (!isBrowser()) return langString;
+  return Promise.all(
+    langString.split("+").map(async (code) => ({ code, data: await getLanguageData(code) }))
+  );
+}
+
+function isTessdataLanguage(value: unknown): value is LanguageCode {
+  return typeof value === "string" && TESSDATA_LANGUAGES.includes(value);
+}
+
+function readRecentLanguages(): LanguageCode[] {
+  try {
+    const stored: unknown = JSON.parse(localStorage.getItem(RECENT_KEY) ?? "[]");
+    return Array.isArray(stored) ? stored.filter(isTessdataLanguage) : [];
+  } catch {
+    return [];
+  }
+}
+
+// Languages picked explicitly in the UI; they lead the likely list
+export function rememberLanguage(language: LanguageCode) {
+  if (!isBrowser() || !isTessdataLanguage(language)) return;
+  try {
+    const recent = [language, ...readRecentLanguages().filter((lang) => lang !== language)];
+    localStorage.setItem(RECENT_KEY, JSON.stringify(recent.slice(0, MAX_RECENT)));
+  } catch {
+    // Storage may be unavailable (private mode)
+  }
+}
+
+function fromBrowserLanguage(tag: string): LanguageCode | undefined {
+  const lower = tag.toLowerCase();
+  // Traditional Chinese by script subtag or region
+  if (/^zh-(hant|tw|hk|mo)/.test(lower)) return "chi_tra";
+  return BROWSER_LANGUAGES[lower.split("-")[0]];
+}
+
+// Recently picked languages first, then the browser's, then English
+export function getLikelyLanguages(): LanguageCode[] {
+  if (!isBrowser()) return ["eng"];
+  const browser = (navigator.languages?.length ? navigator.languages : [navigator.language])
+    .map(fromBrowserLanguage)
+    .filter((lang): lang is LanguageCode => lang !== undefined);
+  return [...new Set<LanguageCode>([...readRecentLanguages(), ...browser, "eng"])];
+}
+
+// Languages for "auto" once the script is known, plus English, which covers
+// the Latin text mixed into most documents. The script pass cannot tell
+// Chinese, Japanese and Korean apart, so CJK keeps all three with the
+// visitor's likely one first. Null keeps the full auto-detect set.
+export function chooseAutoLanguages(script: DetectedScript): LanguageCode[] | null {
+  if (script === "unknown") return null;
+  const likely = getLikelyLanguages();
+  if (script === "cjk") {
+    const chinese = likely.includes("chi_tra") && !likely.includes("chi_sim") ? "chi_tra" : "chi_sim";
+    const cjk: LanguageCode[] = [chinese, "jpn", "kor"];
+    const first = likely.find((lang) => cjk.includes(lang));
+    return [...new Set<LanguageCode>([...(first ? [first] : []), ...cjk, "eng"])];
+  }
+  const other = likely.find((lang) => lang !== "eng" && !CJK_LANGUAGES.includes(lang));
+  return other ? [other, "eng"] : ["eng"];
+}
+
+function shouldPrefetch(): boolean {
+  const connection = (
+    navigator as Navigator & { connection?: { saveData?: boolean; effectiveType?: string } }
+  ).connection;
+  return !connection?.saveData && !/2g/.test(connection?.effectiveType ?? "");
+}
+
+function whenIdle(callback: () => void) {
+  if ("requestIdleCallback" in window) {
+    window.requestIdleCallback(callback, { timeout: 10_000 });
+  } else {
+    setTimeout(callback, 2_000);
+  }
+}
+
+// Download languages that are not cached yet, one at a time while the
+// browser is idle. Skipped with Save-Data or on 2G connections.
+export function prefetchLanguageData(languages: string[]) {
+  if (!isBrowser() || !shouldPrefetch()) return;
+  const queue = languages.filter((lang) => isTessdataLanguage(lang) && !prefetched.has(lang));
+  queue.forEach((lang) => prefetched.add(lang));
+
+  const next = () => {
+    const lang = queue.shift();
+    if (!lang) return;
+    isCached(lang)
+      .then((cached) => (cached ? undefined : downloadAndCache(lang)))
+      .catch(() => prefetched.delete(lang))
+      .finally(() => whenIdle(next));
+  };
+  whenIdle(next);
+}
+
+// What "auto" will most likely load: English and the visitor's top language
+export function prefetchLikelyLanguages() {
+  if (!isBrowser()) return;
+  prefetchLanguageData(["eng", ...getLikelyLanguages().filter((lang) => lang !== "eng").slice(0, 1)]);
+}
@@ -0,0 +1,126 @@
+import {
+  adaptiveThreshold,
+  estimateSkewAngle,
+  DEFAULT_PREPROCESS_OPTIONS,
+  type PreprocessOptions,
+  type PreprocessReport,
+} from "./preprocess";
+
+type SharpModule = typeof import("sharp");
+
+let sharpModule: Promise<SharpModule | null> | null = null;
+
+// sharp's native binary can be missing on unsupported platforms; without it
+// images are passed to Tesseract unprocessed
+function loadSharp(): Promise<SharpModule | null> {
+  if (!sharpModule) {
+    sharpModule = import("sharp")
+      .then((mod) => mod.default)
+      .catch(() => null);
+  }
+  return sharpModule;
+}
+
+// Server pipeline on Buffers: auto-rotate from EXIF, downscale, grayscale
+// and optionally deskew / binarize
+export async function preprocessBuffer(
+  image: Buffer,
+  options: PreprocessOptions = {}
+): Promise<{ image: Buffer; report: PreprocessReport | null }> {
+  const sharp = await loadSharp();
+  if (!sharp) return { image, report: null };
+
+  const startedAt = performance.now();
+  const settings = { ...DEFAULT_PREPROCESS_OPTIONS, ...options };
+
+  // Reported in the auto-rotated frame the output is in; EXIF orientations
+  // 5-8 turn the image by 90 degrees, swapping width and height
+  const metadata = await sharp(image).metadata();
+  const quarterTurn = (metadata.orientation ?? 1) >= 5;
+  const originalWidth = (quarterTurn ? metadata.height : metadata.width) ?? 0;
+  const originalHeight = (quarterTurn ? metadata.width : metadata.height) ?? 0;
+
+  let pipeline = sharp(image)
+    .rotate()
+    .resize({
+      width: settings.maxDimension,
+      height: settings.maxDimension,
+      fit: "inside",
+      withoutEnlargement: true,
+    });
+
+  if (!settings.grayscale && !settings.binarize && !settings.deskew) {
+    const output = await pipeline.png().toBuffer({ resolveWithObject: true });
+    return {
+      image: output.data,
+      report: {
+        originalWidth,
+        originalHeight,
+        width: output.info.width,
+        height: output.info.height,
+        skewAngle: 0,
+        durationMs: Math.round(performance.now() - startedAt),
+      },
+    };
+  }
+
+  pipeline = pipeline.flatten({ background: "#ffffff" }).grayscale();
+  let { data, info } = await pipeline.raw().toBuffer({ resolveWithObject: true });
+  let gray = new Uint8Array(data.buffer, data.byteOffset, data.length);
+
+  let skewAngle = 0;
+  if (settings.deskew) {
+    skewAngle = estimateSkewAngle(gray, info.width, info.height);
+    if (skewAngle !== 0) {
+      const rotated = await sharp(data, {
+        raw: { width: info.width, height: info.height, channels: 1 },
+      })
+        .rotate(-skewAngle, { background: "#ffffff" })
+        .flatten({ background: "#ffffff" })
+        .grayscale()
+        .raw()
+        .toBuffer({ resolveWithObject: true });
+
+      // Rotation enlarges the canvas; crop back to the original size around the centre
+      ({ data, info } = await sharp(rotated.data, {
+        raw: {
+          width: rotated.info.width,
+          height: rotated.info.height,
+          channels: rotated.info.channels as 1 | 2 | 3 | 4,
+        },
+      })
+        .extract({
+          left: Math.floor((rotated.info.width - info.width) / 2),
+          top: Math.floor((rotated.info.height - info.height) / 2),
+          width: info.width,
+          height: info.height,
+        })
+        .grayscale()
+        .raw()
+        .toBuffer({ resolveWithObject: true }));
+      gray = new Uint8Array(data.buffer, data.byteOffset, data.length);
+    }
+  }
+
+  if (settings.binarize) {
+    gray = adaptiveThreshold(gray, info.width, info.height);
+  }
+
+  const output = await sharp(Buffer.from(gray.buffer, gray.byteOffset, gray.length), {
+    raw: { width: info.width, height: info.height, channels: 1 },
+  })
+    .png()
+    .toBuffer();
+
+  return {
+    image: output,
+    report: {
+      originalWidth,
+      originalHeight,
+      width: info.width,
+      height: info.height,
+      skewAngle,
+      durationMs: Math.round(performance.now() - startedAt),
+    },
+  };
+}
@@ -0,0 +1,275 @@
+// Image preprocessing before recognition. Large photos are downscaled to a
+// print-like resolution and converted to grayscale (optionally binarized and
+// deskewed), which is what Tesseract works on internally anyway.
+
+export interface PreprocessOptions {
+  // Longest side in pixels after downscaling; 2480px is A4 width at 300 DPI
+  maxDimension?: number;
+  grayscale?: boolean;
+  binarize?: boolean;
+  deskew?: boolean;
+}
+
+export interface PreprocessReport {
+  originalWidth: number;
+  originalHeight: number;
+  width: number;
+  height: number;
+  skewAngle: number;
+  durationMs: number;
+}
+
+export const DEFAULT_PREPROCESS_OPTIONS: Required<PreprocessOptions> = {
+  maxDimension: 2480,
+  grayscale: true,
+  binarize: false,
+  deskew: false,
+};
+
+export function resolvePreprocessOptions(
+  options: PreprocessOptions | boolean | undefined
+): Required<PreprocessOptions> | null {
+  if (options === false) return null;
+  if (options === true || options === undefined) return DEFAULT_PREPROCESS_OPTIONS;
+  return { ...DEFAULT_PREPROCESS_OPTIONS, ...options };
+}
+
+// Short, stable description of the options, used in cache keys
+export function describePreprocessOptions(
+  options: Required<PreprocessOptions> | null
+): string {
+  if (!options) return "raw";
+  return [
+    options.maxDimension,
+    options.grayscale ? "g" : "",
+    options.binarize ? "b" : "",
+    options.deskew ? "d" : "",
+  ].join("");
+}
+
+export function getScaledSize(
+  width: number,
+  height: number,
+  maxDimension: number
+): { width: number; height: number } {
+  const scale = Math.min(1, maxDimension / Math.max(width, height));
+  return {
+    width: Math.max(1, Math.round(width * scale)),
+    height: Math.max(1, Math.round(height * scale)),
+  };
+}
+
+// Luma of RGBA (channels=4) or already single-channel (channels=1) pixels
+export function toGrayscale(
+  pixels: Uint8Array | Uint8ClampedArray,
+  channels: number
+): Uint8Array {
+  if (channels === 1) return new Uint8Array(pixels);
+
+  const gray = new Uint8Array(pixels.length / channels);
+  for (let i = 0, p = 0; i < gray.length; i++, p += channels) {
+    gray[i] = (pixels[p] * 77 + pixels[p + 1] * 150 + pixels[p + 2] * 29) >> 8;
+  }
+  return gray;
+}
+
+// Bradley adaptive threshold using an integral image, so the cost is
+// linear in the pixel count regardless of the window size
+export function adaptiveThreshold(
+  gray: Uint8Array,
+  width: number,
+  height: number,
+  sensitivity: number = 0.15
+): Uint8Array {
+  const window = Math.max(8, Math.round(Math.max(width, height) / 16));
+  const half = window >> 1;
+  const integral = new Float64Array((width + 1) * (height + 1));
+
+  for (let y = 0; y < height; y++) {
+    let rowSum = 0;
+    for (let x = 0; x < width; x++) {
+      rowSum += gray[y * width + x];
+      integral[(y + 1) * (width + 1) + x + 1] = integral[y * (width + 1) + x + 1] + rowSum;
+    }
+  }
+
+  const output = new Uint8Array(gray.length);
+  for (let y = 0; y < height; y++) {
+    const y0 = Math.max(0, y - half);
+    const y1 = Math.min(height, y + half + 1);
+    for (let x = 0; x < width; x++) {
+      const x0 = Math.max(0, x - half);
+      const x1 = Math.min(width, x + half + 1);
+      const count = (x1 - x0) * (y1 - y0);
+      const sum =
+        integral[y1 * (width + 1) + x1] -
+        integral[y0 * (width + 1) + x1] -
+        integral[y1 * (width + 1) + x0] +
+        integral[y0 * (width + 1) + x0];
+      const i = y * width + x;
+      output[i] = gray[i] * count < sum * (1 - sensitivity) ? 0 : 255;
+    }
+  }
+  return output;
+}
+
+// Estimate page skew (degrees) by finding the rotation whose horizontal
+// projection profile of dark pixels is the most peaked
+export function estimateSkewAngle(
+  gray: Uint8Array,
+  width: number,
+  height: number,
+  maxAngle: number = 5,
+  step: number = 0.5
+): number {
+  // Sample dark pixels on a sparse grid to keep this cheap on large pages
+  const stride = Math.max(1, Math.round(Math.max(width, height) / 800));
+  const xs: number[] = [];
+  const ys: number[] = [];
+  for (let y = 0; y < height; y += stride) {
+    for (let x = 0; x < width; x += stride) {
+      if (gray[y * width + x] < 128) {
+        xs.push(x);
+        ys.push(y);
+      }
+    }
+  }
+  if (xs.length < 100) return 0;
+
+  const diagonal = Math.ceil(Math.hypot(width, height));
+  const bins = new Float64Array(diagonal * 2 + 1);
+  let bestAngle = 0;
+  let bestScore = -Infinity;
+
+  for (let angle = -maxAngle; angle <= maxAngle + 1e-9; angle += step) {
+    const radians = (angle * Math.PI) / 180;
+    const sin = Math.sin(radians);
+    const cos = Math.cos(radians);
+    bins.fill(0);
+
+    for (let i = 0; i < xs.length; i++) {
+      const row = Math.round(ys[i] * cos - xs[i] * sin) + diagonal;
+      bins[row]++;
+    }
+
+    let score = 0;
+    for (let i = 0; i < bins.length; i++) {
+      score += bins[i] * bins[i];
+    }
+    if (score > bestScore) {
+      bestScore = score;
+      bestAngle = angle;
+    }
+  }
+
+  return bestAngle;
+}
+
+export type Canvas2D = OffscreenCanvas | HTMLCanvasElement;
+
+export function createCanvas(width: number, height: number): Canvas2D {
+  if (typeof OffscreenCanvas !== "undefined") {
+    return new OffscreenCanvas(width, height);
+  }
+  const canvas = document.createElement("canvas");
+  canvas.width = width;
+  canvas.height = height;
+  return canvas;
+}
+
+export function getContext(canvas: Canvas2D) {
+  const ctx = canvas.getContext("2d", { willReadFrequently: true }) as
+    | OffscreenCanvasRenderingContext2D
+    | CanvasRenderingContext2D
+    | null;
+  if (!ctx) throw new Error("Canvas 2D context is not available");
+  return ctx;
+}
+
+export function canvasToBlob(
+  canvas: Canvas2D,
+  type: string = "image/png",
+  quality?: number
+): Promise<Blob> {
+  if ("convertToBlob" in canvas) {
+    return canvas.convertToBlob({ type, quality });
+  }
+  return new Promise((resolve, reject) =>
+    canvas.toBlob(
+      (blob) => (blob ? resolve(blob) : reject(new Error("Failed to encode image"))),
+      type,
+      quality
+    )
+  );
+}
+
+// Browser pipeline: decode, downscale, deskew and threshold on a canvas
+// (OffscreenCanvas where available, so it also runs inside a Web Worker)
+export async function preprocessImage(
+  image: Blob,
+  options: PreprocessOptions = {}
+): Promise<{ image: Blob; report: PreprocessReport }> {
+  const startedAt = performance.now();
+  const settings = { ...DEFAULT_PREPROCESS_OPTIONS, ...options };
+
+  const bitmap = await createImageBitmap(image);
+  const originalWidth = bitmap.width;
+  const originalHeight = bitmap.height;
+  const { width, height } = getScaledSize(
+    originalWidth,
+    originalHeight,
+    settings.maxDimension
+  );
+
+  let canvas = createCanvas(width, height);
+  let ctx = getContext(canvas);
+  ctx.fillStyle = "#ffffff";
+  ctx.fillRect(0, 0, width, height);
+  ctx.drawImage(bitmap, 0, 0, width, height);
+  bitmap.close();
+
+  let skewAngle = 0;
+  if (settings.deskew) {
+    const pixels = ctx.getImageData(0, 0, width, height).data;
+    skewAngle = estimateSkewAngle(toGrayscale(pixels, 4), width, height);
+
+    if (skewAngle !== 0) {
+      const rotated = createCanvas(width, height);
+      const rotatedCtx = getContext(rotated);
+      rotatedCtx.fillStyle = "#ffffff";
+      rotatedCtx.fillRect(0, 0, width, height);
+      rotatedCtx.translate(width / 2, height / 2);
+      rotatedCtx.rotate((-skewAngle * Math.PI) / 180);
+      rotatedCtx.drawImage(canvas, -width / 2, -height / 2);
+      canvas = rotated;
+      ctx = rotatedCtx;
+    }
+  }
+
+  if (settings.grayscale || settings.binarize) {
+    const imageData = ctx.getImageData(0, 0, width, height);
+    const pixels = imageData.data;
+    let gray = toGrayscale(pixels, 4);
+    if (settings.binarize) {
+      gray = adaptiveThreshold(gray, width, height);
+    }
+    for (let i = 0, p = 0; i < gray.length; i++, p += 4) {
+      pixels[p] = pixels[p + 1] = pixels[p + 2] = gray[i];
+    }
+    ctx.putImageData(imageData, 0, 0);
+  }
+
+  const output = await canvasToBlob(canvas);
+
+  return {
+    image: output,
+    report: {
+      originalWidth,
+      originalHeight,
+      width,
+      height,
+      skewAngle,
+      durationMs: Math.round(performance.now() - startedAt),
+    },
+  };
+}
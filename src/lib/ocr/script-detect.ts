@@ -0,0 +1,96 @@
+import {
+  adaptiveThreshold,
+  createCanvas,
+  getContext,
+  getScaledSize,
+  toGrayscale,
+} from "./preprocess";
+
+// Cheap script detection for "auto" mode, so recognition loads one or two
+// languages instead of four. Text lines are found from the row ink profile
+// and every inked column of a line is scored by how many separate strokes it
+// crosses: CJK glyphs stack many horizontal strokes, alphabetic scripts
+// rarely cross more than two. Needs no OCR and no language data.
+
+export type DetectedScript = "alphabetic" | "cjk" | "unknown";
+
+const DETECT_MAX_DIMENSION = 2000;
+// Shorter lines can't resolve CJK strokes, so they would read as alphabetic
+const MIN_LINE_HEIGHT = 16;
+// Inked line columns needed before trusting the average
+const MIN_COLUMNS = 200;
+// Mean strokes crossed per inked column; in between is left undecided
+const ALPHABETIC_MAX_CROSSINGS = 2.2;
+const CJK_MIN_CROSSINGS = 2.7;
+
+// `binary` is 0 for ink and 255 for paper, as from adaptiveThreshold
+export function classifyScript(
+  binary: Uint8Array,
+  width: number,
+  height: number
+): DetectedScript {
+  const rowInk = new Uint32Array(height);
+  for (let y = 0; y < height; y++) {
+    let count = 0;
+    for (let x = 0, i = y * width; x < width; x++, i++) {
+      if (binary[i] === 0) count++;
+    }
+    rowInk[y] = count;
+  }
+
+  // Rows with fewer dark pixels than this are gaps between lines (or specks)
+  const minRowInk = Math.max(2, Math.round(width * 0.002));
+  let columns = 0;
+  let crossings = 0;
+
+  for (let y = 0; y < height; ) {
+    if (rowInk[y] < minRowInk) {
+      y++;
+      continue;
+    }
+    const top = y;
+    while (y < height && rowInk[y] >= minRowInk) y++;
+
+    // Skip lines too small to read and blocks too tall to be one line
+    // (pictures, tables with rules)
+    const lineHeight = y - top;
+    if (lineHeight < MIN_LINE_HEIGHT || lineHeight > height / 4) continue;
+
+    for (let x = 0; x < width; x++) {
+      let runs = 0;
+      let inInk = false;
+      for (let row = top; row < y; row++) {
+        const ink = binary[row * width + x] === 0;
+        if (ink && !inInk) runs++;
+        inInk = ink;
+      }
+      if (runs > 0) {
+        columns++;
+        crossings += runs;
+      }
+    }
+  }
+
+  if (columns < MIN_COLUMNS) return "unknown";
+  const mean = crossings / columns;
+  if (mean >= CJK_MIN_CROSSINGS) return "cjk";
+  if (mean <= ALPHABETIC_MAX_CROSSINGS) return "alphabetic";
+  return "unknown";
+}
+
+export async function detectScript(image: Blob): Promise<DetectedScript> {
+  const bitmap = await createImageBitmap(image);
+  const { width, height } = getScaledSize(bitmap.width, bitmap.height, DETECT_MAX_DIMENSION);
+
+  const canvas = createCanvas(width, height);
+  const ctx = getContext(canvas);
+  ctx.fillStyle = "#ffffff";
+  ctx.fillRect(0, 0, width, height);
+  ctx.drawImage(bitmap, 0, 0, width, height);
+  bitmap.close();
+
+  const gray = toGrayscale(ctx.getImageData(0, 0, width, height).data, 4);
+  canvas.width = 0;
+  canvas.height = 0;
+  return classifyScript(adaptiveThreshold(gray, width, height), width, height);
+}
@@ -0,0 +1,27 @@
+import path from "node:path";
+import { createDiskStore, type DiskStoreOptions } from "@/lib/cache/disk";
+import { createOCRCache } from "./cache";
+import type { OCRResult } from "./tesseract";
+
+// Server-side OCR caches. The disk tier is enabled by setting OCR_CACHE_DIR;
+// OCR_CACHE_MAX_MB bounds each cache's share of it (default 512 MB).
+const CACHE_DIR = process.env.OCR_CACHE_DIR;
+const diskOptions: DiskStoreOptions = {
+  maxBytes: (Number(process.env.OCR_CACHE_MAX_MB) || 512) * 1024 * 1024,
+};
+
+export type CloudOCRResponse = Record<string, unknown>;
+
+// Each cache owns a subdirectory, so each size bound covers only its own files
+export const serverOCRCache = createOCRCache<OCRResult>(
+  CACHE_DIR
+    ? createDiskStore<OCRResult>(path.join(CACHE_DIR, "tesseract"), diskOptions)
+    : undefined
+);
+
+// Google Vision / Azure responses, cached as returned to the client
+export const cloudOCRCache = createOCRCache<CloudOCRResponse>(
+  CACHE_DIR
+    ? createDiskStore<CloudOCRResponse>(path.join(CACHE_DIR, "cloud"), diskOptions)
+    : undefined
+);
@@ -0,0 +1,162 @@
+import os from "node:os";
+import { sha256Hex } from "@/lib/cache/hash";
+import { Timings } from "@/lib/metrics/timings";
+import { configureWorkerPools, getWorkerPool } from "./worker-pool";
+import { getOCRCacheKey } from "./cache";
+import { serverOCRCache } from "./server-cache";
+import {
+  describePreprocessOptions,
+  resolvePreprocessOptions,
+  type PreprocessOptions,
+} from "./preprocess";
+import { preprocessBuffer } from "./preprocess-server";
+import {
+  getLanguageString,
+  toOCRResult,
+  withPreprocessReport,
+  type LanguageCode,
+  type OCRResult,
+} from "./tesseract";
+
+// Server-side OCR: a bounded in-process queue in front of the shared
+// Tesseract worker pool. Only import this from route handlers.
+
+const POOL_SIZE = Math.max(
+  1,
+  Number(process.env.OCR_WORKERS) || os.availableParallelism() - 1
+);
+const MAX_PENDING_JOBS = Number(process.env.OCR_MAX_PENDING_JOBS) || POOL_SIZE * 8;
+const DEFAULT_TIMEOUT_MS = Number(process.env.OCR_JOB_TIMEOUT_MS) || 30_000;
+
+configureWorkerPools({ size: POOL_SIZE, idleTimeoutMs: 5 * 60_000 });
+
+export class OCRQueueFullError extends Error {
+  retryAfter: number;
+
+  constructor(retryAfter: number) {
+    super("OCR queue is full");
+    this.name = "OCRQueueFullError";
+    this.retryAfter = retryAfter;
+  }
+}
+
+export class OCRTimeoutError extends Error {
+  constructor(timeoutMs: number) {
+    super(`OCR job timed out after ${timeoutMs}ms`);
+    this.name = "OCRTimeoutError";
+  }
+}
+
+export interface ServerOCROptions {
+  includeWordData?: boolean;
+  timeoutMs?: number;
+  preprocess?: PreprocessOptions | boolean;
+  // Stage spans are added here; by default they only feed /api/metrics
+  timings?: Timings;
+}
+
+let pendingJobs = 0;
+// Exponential moving average of job duration, used for Retry-After hints
+let averageJobMs = 2000;
+
+export function getQueueStats() {
+  return {
+    pendingJobs,
+    maxPendingJobs: MAX_PENDING_JOBS,
+    workers: POOL_SIZE,
+    averageJobMs: Math.round(averageJobMs),
+  };
+}
+
+function estimateRetryAfter(): number {
+  const seconds = (averageJobMs * pendingJobs) / POOL_SIZE / 1000;
+  return Math.max(1, Math.ceil(seconds));
+}
+
+export async function recognizeBuffer(
+  image: Buffer,
+  language: LanguageCode | LanguageCode[] = "eng",
+  options: ServerOCROptions = {}
+): Promise<OCRResult> {
+  const langString = getLanguageString(language);
+  const preprocess = resolvePreprocessOptions(options.preprocess);
+  const timings = options.timings ?? new Timings("tesseract");
+  const key = getOCRCacheKey(
+    await timings.time("hash", () => sha256Hex(image)),
+    "tesseract",
+    langString,
+    options.includeWordData,
+    describePreprocessOptions(preprocess)
+  );
+
+  // Cache hits never touch the queue
+  const startedAt = performance.now();
+  let computed = false;
+  const result = await serverOCRCache.getOrCompute(key, () => {
+    computed = true;
+    return runQueuedJob(image, langString, preprocess, options, timings);
+  });
+
+  if (!computed) {
+    timings.record("cache", performance.now() - startedAt);
+  }
+  return result;
+}
+
+async function runQueuedJob(
+  image: Buffer,
+  langString: string,
+  preprocess: Required<PreprocessOptions> | null,
+  options: ServerOCROptions,
+  timings: Timings
+): Promise<OCRResult> {
+  const { includeWordData = false, timeoutMs = DEFAULT_TIMEOUT_MS } = options;
+
+  if (pendingJobs >= MAX_PENDING_JOBS) {
+    throw new OCRQueueFullError(estimateRetryAfter());
+  }
+
+  pendingJobs++;
+  let timedOut = false;
+  let timer: ReturnType<typeof setTimeout> | undefined;
+
+  const job = getWorkerPool(langString).run(
+    async (worker) => {
+      // Skip the work entirely if the caller gave up while this job was queued
+      if (timedOut) {
+        throw new OCRTimeoutError(timeoutMs);
+      }
+
+      const startedAt = Date.now();
+      // Preprocess inside the slot so concurrent decodes stay bounded by the pool size
+      const processed = preprocess
+        ? await timings.time("preprocess", () => preprocessBuffer(image, preprocess))
+        : { image, report: null };
+      const result = await timings.time("recognize", () => worker.recognize(processed.image));
+      averageJobMs = averageJobMs * 0.8 + (Date.now() - startedAt) * 0.2;
+      return withPreprocessReport(
+        toOCRResult(result.data, includeWordData),
+        processed.report
+      );
+    },
+    undefined,
+    timings
+  );
+
+  const timeout = new Promise<never>((_, reject) => {
+    timer = setTimeout(() => {
+      timedOut = true;
+      reject(new OCRTimeoutError(timeoutMs));
+    }, timeoutMs);
+  });
+
+  try {
+    return await Promise.race([job, timeout]);
+  } finally {
+    clearTimeout(timer);
+    // Keep the slot counted until the worker is actually free again
+    job.catch(() => {}).finally(() => {
+      pendingJobs--;
+    });
+  }
+}
@@ -0,0 +1,36 @@
+// Tesseract language data, shared by the browser manager (language-data.ts)
+// and scripts/fetch-traineddata.ts, which self-hosts the files under
+// public/. Bumping TESSDATA_VERSION moves both the URL and the browser
+// cache, so stale data is never mixed with new.
+
+export const TESSDATA_VERSION = "4.0.0_best_int";
+
+// Every language offered in the UI ("auto" resolves to a subset of these)
+export const TESSDATA_LANGUAGES = [
+  "eng",
+  "chi_sim",
+  "chi_tra",
+  "jpn",
+  "kor",
+  "spa",
+  "fra",
+  "deu",
+  "rus",
+  "ara",
+  "hin",
+  "por",
+  "ita",
+  "vie",
+  "tha",
+];
+
+// Path under public/ (and the site root) of the self-hosted files
+export const TESSDATA_PATH = `tessdata/${TESSDATA_VERSION}`;
+
+export function tessdataFileName(lang: string): string {
+  return `${lang}.traineddata.gz`;
+}
+
+export function tessdataCdnUrl(lang: string): string {
+  return `https://cdn.jsdelivr.net/npm/@tesseract.js-data/${lang}/${TESSDATA_VERSION}/${tessdataFileName(lang)}`;
+}
@@ -1,4 +1,18 @@
-import Tesseract from "tesseract.js";
+import type Tesseract from "tesseract.js";
+import { sha256Hex } from "@/lib/cache/hash";
+import { createIndexedDBStore } from "@/lib/cache/indexeddb";
+import { Timings, type StageTimings } from "@/lib/metrics/timings";
+import type { TieredCache } from "@/lib/cache/tiered";
+import { detectScriptInWorker, preprocessInWorker } from "@/lib/workers/image-pipeline";
+import { chooseAutoLanguages } from "./language-data";
+import { getWorkerPool } from "./worker-pool";
+import { createOCRCache, getOCRCacheKey } from "./cache";
+import {
+  describePreprocessOptions,
+  resolvePreprocessOptions,
+  type PreprocessOptions,
+  type PreprocessReport,
+} from "./preprocess";
 
 export interface OCRProgress {
   status: string;
@@ -15,6 +29,16 @@ export interface OCRResult {
   text: string;
   confidence: number;
   words?: WordData[];
+  preprocessing?: PreprocessReport;
+  // Stage durations in ms, when requested; never cached
+  timings?: StageTimings;
+}
+
+export interface RecognizeOptions {
+  // Downscale/grayscale before recognition (on by default); false disables it
+  preprocess?: PreprocessOptions | boolean;
+  // Attach per-stage durations (detect, hash, preprocess, queue, init, recognize)
+  timings?: boolean;
 }
 
 export type LanguageCode =
@@ -59,6 +83,10 @@ export const LANGUAGES: { code: LanguageCode; name: string }[] = [
 
 ];
 
+export function isLanguageCode(value: string): value is LanguageCode {
+  return LANGUAGES.some((lang) => lang.code === value);
+}
+
 export function getLanguageString(language: LanguageCode | LanguageCode[]): string {
   if (language === "auto") {
     return AUTO_DETECT_LANGUAGES.join("+");
@@ -66,32 +94,148 @@ export function getLanguageString(language: LanguageCode | LanguageCode[]): stri
   return Array.isArray(language) ? language.join("+") : language;
 }
 
+// Script pre-pass for "auto", so one or two languages are loaded instead of
+// the full auto-detect set; null when the script is unclear
+async function detectAutoLanguages(image: Blob): Promise<LanguageCode[] | null> {
+  try {
+    return chooseAutoLanguages(await detectScriptInWorker(image));
+  } catch (error) {
+    console.warn("Script detection skipped:", error);
+    return null;
+  }
+}
+
+let resultCache: TieredCache<OCRResult> | null = null;
+
+// Memory + IndexedDB cache so re-uploading the same image skips recognition
+export function getOCRResultCache(): TieredCache<OCRResult> {
+  if (!resultCache) {
+    resultCache = createOCRCache<OCRResult>(
+      createIndexedDBStore<OCRResult>("ocr-result-cache")
+    );
+  }
+  return resultCache;
+}
+
 export async function recognizeText(
-  image: File | string,
+  image: File | Blob | Buffer | string,
   language: LanguageCode | LanguageCode[] = "auto",
   onProgress?: (progress: OCRProgress) => void,
-  includeWordData: boolean = false
+  includeWordData: boolean = false,
+  options: RecognizeOptions = {}
 ): Promise<OCRResult> {
+  const imageBlob = image instanceof Blob && image.type.startsWith("image/") ? image : null;
+  const preprocess = imageBlob ? resolvePreprocessOptions(options.preprocess) : null;
+
+  const timings = new Timings("tesseract");
+  // The cache key uses the requested languages, so "auto" results are found
+  // without running the script pass again
   const langString = getLanguageString(language);
+  const withTimings = (result: OCRResult): OCRResult =>
+    options.timings ? { ...result, timings: timings.toJSON() } : result;
+
+  const recognize = async () => {
+    let input: File | Blob | Buffer | string = image;
+    let report: PreprocessReport | undefined;
 
-  const result = await Tesseract.recognize(image, langString, {
-    logger: (m) => {
-      if (onProgress && m.status && typeof m.progress === "number") {
-        onProgress({
-          status: m.status,
-          progress: Math.round(m.progress * 100),
-        });
+    if (preprocess && image instanceof Blob) {
+      try {
+        // Decode and pixel work happen in the image pipeline worker
+        ({ image: input, report } = await timings.time("preprocess", () =>
+          preprocessInWorker(image, preprocess)
+        ));
+      } catch (error) {
+        // Formats the browser cannot decode (e.g. HEIC) go to Tesseract as-is
+        console.warn("Image preprocessing skipped:", error);
       }
-    },
+    }
+
+    // "auto" narrows to the detected script's languages, which only decides
+    // the worker pool
+    const poolLanguages =
+      language === "auto" && imageBlob
+        ? ((await timings.time("detect", () => detectAutoLanguages(imageBlob))) ?? language)
+        : language;
+
+    // Workers are shared across calls so only the first job per language pays
+    // for worker start-up and traineddata initialisation
+    const result = await getWorkerPool(getLanguageString(poolLanguages)).run(
+      (worker) => timings.time("recognize", () => worker.recognize(input)),
+      (m) => {
+        if (onProgress && m.status && typeof m.progress === "number") {
+          onProgress({
+            status: m.status,
+            progress: Math.round(m.progress * 100),
+          });
+        }
+      },
+      timings
+    );
+
+    return withPreprocessReport(toOCRResult(result.data, includeWordData), report);
+  };
+
+  // URLs and data URLs are passed through uncached
+  if (typeof image === "string") {
+    return withTimings(await recognize());
+  }
+
+  const key = getOCRCacheKey(
+    await timings.time("hash", () => sha256Hex(image)),
+    "tesseract",
+    langString,
+    includeWordData,
+    describePreprocessOptions(preprocess)
+  );
+  let computed = false;
+  const result = await getOCRResultCache().getOrCompute(key, () => {
+    computed = true;
+    return recognize();
   });
 
+  if (!computed) {
+    onProgress?.({ status: "loaded from cache", progress: 100 });
+  }
+  return withTimings(result);
+}
+
+// Attach the preprocessing report and map word boxes back to the
+// coordinates of the original (unscaled) image
+export function withPreprocessReport(
+  result: OCRResult,
+  report: PreprocessReport | null | undefined
+): OCRResult {
+  if (!report) return result;
+
+  const scaleX = report.originalWidth / report.width;
+  const scaleY = report.originalHeight / report.height;
+  if (result.words && (scaleX !== 1 || scaleY !== 1)) {
+    result.words = result.words.map((word) => ({
+      ...word,
+      bbox: {
+        x0: Math.round(word.bbox.x0 * scaleX),
+        y0: Math.round(word.bbox.y0 * scaleY),
+        x1: Math.round(word.bbox.x1 * scaleX),
+        y1: Math.round(word.bbox.y1 * scaleY),
+      },
+    }));
+  }
+
+  return { ...result, preprocessing: report };
+}
+
+// Map a Tesseract page to our result shape, optionally keeping word positions
+export function toOCRResult(
+  data: Tesseract.Page,
+  includeWordData: boolean = false
+): OCRResult {
   const ocrResult: OCRResult = {
-    text: result.data.text,
-    confidence: result.data.confidence,
+    text: data.text,
+    confidence: data.confidence,
   };
 
   // Extract word data with positions for table detection
-  const dataWithWords = result.data as { words?: Array<{ text: string; bbox: { x0: number; y0: number; x1: number; y1: number }; confidence: number }> };
+  const dataWithWords = data as { words?: Array<{ text: string; bbox: { x0: number; y0: number; x1: number; y1: number }; confidence: number }> };
   if (includeWordData && dataWithWords.words) {
     ocrResult.words = dataWithWords.words.map((word) => ({
       text: word.text,
@@ -0,0 +1,240 @@
+import Tesseract from "tesseract.js";
+import type { Timings } from "@/lib/metrics/timings";
+import { loadWorkerLanguages } from "./language-data";
+
+export interface WorkerPoolOptions {
+  size?: number;
+  idleTimeoutMs?: number;
+}
+
+type ProgressHandler = (message: Tesseract.LoggerMessage) => void;
+
+interface PoolSlot {
+  worker: Promise<Tesseract.Worker>;
+  onProgress?: ProgressHandler;
+  // Set once the worker has started and loaded its language data
+  ready?: boolean;
+}
+
+const MAX_POOL_SIZE = 4;
+const MAX_POOLS = 2; // Each pool keeps its own copy of the traineddata in memory
+const DEFAULT_IDLE_TIMEOUT_MS = 60_000;
+
+function defaultPoolSize(): number {
+  const cores =
+    typeof navigator !== "undefined" && navigator.hardwareConcurrency
+      ? navigator.hardwareConcurrency
+      : 2;
+  // Leave one core for the UI thread / request handling
+  return Math.max(1, Math.min(MAX_POOL_SIZE, cores - 1));
+}
+
+// A lazily grown set of Tesseract workers sharing one language string.
+// Workers are created on demand up to `size`, reused across jobs and
+// terminated together once the pool has been idle for `idleTimeoutMs`.
+export class WorkerPool {
+  readonly langString: string;
+  readonly size: number;
+  private readonly idleTimeoutMs: number;
+  private readonly onIdle: (pool: WorkerPool) => void;
+  private idle: PoolSlot[] = [];
+  private waiters: Array<(slot: PoolSlot) => void> = [];
+  private created = 0;
+  private idleTimer: ReturnType<typeof setTimeout> | null = null;
+  private closed = false;
+
+  constructor(
+    langString: string,
+    options: WorkerPoolOptions = {},
+    onIdle: (pool: WorkerPool) => void = () => {}
+  ) {
+    this.langString = langString;
+    this.size = Math.max(1, options.size ?? defaultPoolSize());
+    this.idleTimeoutMs = options.idleTimeoutMs ?? DEFAULT_IDLE_TIMEOUT_MS;
+    this.onIdle = onIdle;
+  }
+
+  get activeJobs(): number {
+    return this.created - this.idle.length;
+  }
+
+  get queuedJobs(): number {
+    return this.waiters.length;
+  }
+
+  // With `timings`, records the wait for a free slot ("queue") and, for a
+  // new worker, its start-up including loading the traineddata ("init")
+  async run<T>(
+    task: (worker: Tesseract.Worker) => Promise<T>,
+    onProgress?: ProgressHandler,
+    timings?: Timings
+  ): Promise<T> {
+    this.clearIdleTimer();
+    const queuedAt = performance.now();
+    const slot = await this.acquire();
+    timings?.record("queue", performance.now() - queuedAt);
+    slot.onProgress = onProgress;
+
+    let worker: Tesseract.Worker;
+    const initAt = performance.now();
+    try {
+      worker = await slot.worker;
+    } catch (error) {
+      this.discard(slot);
+      throw error;
+    }
+    if (!slot.ready) {
+      slot.ready = true;
+      timings?.record("init", performance.now() - initAt);
+    }
+
+    try {
+      return await task(worker);
+    } finally {
+      slot.onProgress = undefined;
+      this.release(slot);
+    }
+  }
+
+  async terminate(): Promise<void> {
+    this.closed = true;
+    this.clearIdleTimer();
+    const slots = this.idle;
+    this.idle = [];
+    this.created -= slots.length;
+    await Promise.all(
+      slots.map((slot) =>
+        slot.worker.then((worker) => worker.terminate()).catch(() => {})
+      )
+    );
+  }
+
+  private acquire(): Promise<PoolSlot> {
+    if (this.closed) {
+      return Promise.reject(new Error("Worker pool has been terminated"));
+    }
+
+    const free = this.idle.pop();
+    if (free) return Promise.resolve(free);
+
+    if (this.created < this.size) {
+      return Promise.resolve(this.spawn());
+    }
+
+    return new Promise((resolve) => this.waiters.push(resolve));
+  }
+
+  private release(slot: PoolSlot) {
+    // Already queued jobs are drained even after the pool is terminated
+    const next = this.waiters.shift();
+    if (next) {
+      next(slot);
+      return;
+    }
+
+    if (this.closed) {
+      this.discard(slot);
+      return;
+    }
+
+    this.idle.push(slot);
+    if (this.activeJobs === 0) {
+      this.scheduleIdle();
+    }
+  }
+
+  private discard(slot: PoolSlot) {
+    this.created--;
+    slot.worker.then((worker) => worker.terminate()).catch(() => {});
+
+    // Hand the freed capacity to the next waiting job
+    const next = this.waiters.shift();
+    if (next) {
+      next(this.spawn());
+    }
+  }
+
+  private spawn(): PoolSlot {
+    this.created++;
+    const slot: PoolSlot = {} as PoolSlot;
+    // In the browser the traineddata comes from our own versioned cache, so
+    // tesseract.js must not keep a second copy
+    slot.worker = loadWorkerLanguages(this.langString).then((langs) =>
+      Tesseract.createWorker(langs, undefined, {
+        // Route log messages to whichever job currently holds this worker
+        logger: (m) => slot.onProgress?.(m),
+        ...(typeof langs !== "string" && { cacheMethod: "none" }),
+      })
+    );
+    return slot;
+  }
+
+  private scheduleIdle() {
+    this.clearIdleTimer();
+    if (this.idleTimeoutMs <= 0) return;
+
+    this.idleTimer = setTimeout(() => {
+      this.idleTimer = null;
+      if (this.activeJobs === 0) {
+        this.onIdle(this);
+      }
+    }, this.idleTimeoutMs);
+  }
+
+  private clearIdleTimer() {
+    if (this.idleTimer) {
+      clearTimeout(this.idleTimer);
+      this.idleTimer = null;
+    }
+  }
+}
+
+// Pools are keyed by language string and kept in least-recently-used order
+const pools = new Map<string, WorkerPool>();
+let defaultOptions: WorkerPoolOptions = {};
+
+// Sets the options used for pools created from now on (e.g. a server-side
+// size derived from the host's CPU count)
+export function configureWorkerPools(options: WorkerPoolOptions) {
+  defaultOptions = { ...defaultOptions, ...options };
+}
+
+function evictPool(pool: WorkerPool) {
+  if (pools.get(pool.langString) === pool) {
+    pools.delete(pool.langString);
+  }
+  void pool.terminate();
+}
+
+export function getWorkerPool(
+  langString: string,
+  options?: WorkerPoolOptions
+): WorkerPool {
+  let pool = pools.get(langString);
+
+  if (pool) {
+    pools.delete(langString);
+  } else {
+    pool = new WorkerPool(
+      langString,
+      { ...defaultOptions, ...options },
+      evictPool
+    );
+  }
+  pools.set(langString, pool);
+
+  for (const [key, candidate] of pools) {
+    if (pools.size <= MAX_POOLS) break;
+    if (key !== langString && candidate.activeJobs === 0) {
+      evictPool(candidate);
+    }
+  }
+
+  return pool;
+}
+
+export async function terminateWorkerPools(): Promise<void> {
+  const active = [...pools.values()];
+  pools.clear();
+  await Promise.all(active.map((pool) => pool.terminate()));
+}
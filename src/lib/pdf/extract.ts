@@ -0,0 +1,277 @@
+import type { PDFPageProxy } from "pdfjs-dist";
+import {
+  recognizeText,
+  type LanguageCode,
+  type OCRProgress,
+  type WordData,
+} from "@/lib/ocr/tesseract";
+import {
+  CanvasPool,
+  DEFAULT_PAGE_CONCURRENCY,
+  forEachPage,
+  loadPdfDocument,
+  renderPageToBlob,
+} from "./pipeline";
+
+// Hybrid PDF extraction: pages with a text layer are read directly, and only
+// pages without one (scans) are rendered and sent through OCR.
+
+export type PageSource = "text-layer" | "ocr";
+
+export interface PdfPageResult {
+  pageNumber: number;
+  source: PageSource;
+  text: string;
+  confidence: number;
+  words: WordData[];
+  width: number;
+  height: number;
+}
+
+export interface PdfExtraction {
+  pages: PdfPageResult[];
+  text: string;
+  confidence: number;
+  // Words from every page, with pages stacked vertically in one coordinate space
+  words: WordData[];
+  ocrPageCount: number;
+}
+
+export interface PdfExtractOptions {
+  language?: LanguageCode | LanguageCode[];
+  includeWordData?: boolean;
+  concurrency?: number;
+  onProgress?: (progress: OCRProgress) => void;
+  onPage?: (page: PdfPageResult) => void;
+}
+
+// Render scale used for OCR (~216 DPI); text-layer boxes use the same scale
+// so both kinds of pages share one coordinate system
+export const PDF_PAGE_SCALE = 3;
+// Pages with fewer visible characters than this are treated as scans
+const MIN_TEXT_LAYER_CHARS = 16;
+
+interface TextItemLike {
+  str: string;
+  transform: number[];
+  width: number;
+  height: number;
+}
+
+function isTextItem(item: unknown): item is TextItemLike {
+  return typeof item === "object" && item !== null && "str" in item && "transform" in item;
+}
+
+// Split each text run into words, spreading the run's width across its
+// characters, and convert PDF user space to top-left viewport pixels
+function textItemsToWords(
+  items: TextItemLike[],
+  viewport: ReturnType<PDFPageProxy["getViewport"]>
+): WordData[] {
+  const words: WordData[] = [];
+
+  for (const item of items) {
+    if (!item.str.trim()) continue;
+
+    const [, , , , x, y] = item.transform;
+    const height = item.height || Math.hypot(item.transform[2], item.transform[3]);
+    const charWidth = item.width / Math.max(1, item.str.length);
+
+    const pattern = /\S+/g;
+    let match: RegExpExecArray | null;
+    while ((match = pattern.exec(item.str))) {
+      const left = x + match.index * charWidth;
+      const right = left + match[0].length * charWidth;
+      const [vx0, vy0, vx1, vy1] = viewport.convertToViewportRectangle([
+        left,
+        y,
+        right,
+        y + height,
+      ]);
+
+      words.push({
+        text: match[0],
+        bbox: {
+          x0: Math.round(Math.min(vx0, vx1)),
+          y0: Math.round(Math.min(vy0, vy1)),
+          x1: Math.round(Math.max(vx0, vx1)),
+          y1: Math.round(Math.max(vy0, vy1)),
+        },
+        confidence: 100,
+      });
+    }
+  }
+
+  return words;
+}
+
+// Rebuild line breaks from item positions; getTextContent marks them with hasEOL
+function textItemsToText(items: unknown[]): string {
+  return items
+    .map((item) => {
+      if (!isTextItem(item)) return "";
+      const eol = (item as { hasEOL?: boolean }).hasEOL;
+      return eol ? `${item.str}\n` : item.str;
+    })
+    .join("")
+    .replace(/[ \t]+\n/g, "\n")
+    .trim();
+}
+
+export interface PdfPageExtractOptions {
+  language?: LanguageCode | LanguageCode[];
+  includeWordData?: boolean;
+  canvasPool: CanvasPool;
+  onProgress?: (progress: OCRProgress) => void;
+  // Also render text-layer pages and return the image, in this format
+  // (scanned pages are then OCRed from the same image)
+  render?: { type: string; quality?: number };
+}
+
+export async function extractPdfPage(
+  page: PDFPageProxy,
+  pageNumber: number,
+  options: PdfPageExtractOptions
+): Promise<PdfPageResult & { image?: Blob }> {
+  const { language = "auto", includeWordData = false, canvasPool, onProgress, render } = options;
+  const viewport = page.getViewport({ scale: PDF_PAGE_SCALE });
+  const width = Math.floor(viewport.width);
+  const height = Math.floor(viewport.height);
+  const textContent = await page.getTextContent();
+  const items: TextItemLike[] = [];
+  for (const item of textContent.items) {
+    if (isTextItem(item)) items.push(item);
+  }
+  const visibleChars = items.reduce(
+    (count, item) => count + item.str.replace(/\s/g, "").length,
+    0
+  );
+
+  // PNG keeps glyph edges intact for recognition
+  const renderPage = async () =>
+    (
+      await renderPageToBlob(page, canvasPool, {
+        scale: PDF_PAGE_SCALE,
+        type: render?.type ?? "image/png",
+        quality: render?.quality,
+      })
+    ).blob;
+
+  if (visibleChars >= MIN_TEXT_LAYER_CHARS) {
+    return {
+      pageNumber,
+      source: "text-layer",
+      text: textItemsToText(textContent.items),
+      confidence: 100,
+      words: includeWordData ? textItemsToWords(items, viewport) : [],
+      width,
+      height,
+      image: render ? await renderPage() : undefined,
+    };
+  }
+
+  const image = await renderPage();
+  const result = await recognizeText(image, language, onProgress, includeWordData);
+
+  return {
+    pageNumber,
+    source: "ocr",
+    text: result.text.trim(),
+    confidence: result.confidence,
+    words: result.words ?? [],
+    width,
+    height,
+    image: render ? image : undefined,
+  };
+}
+
+export async function extractPdf(
+  file: File | ArrayBuffer,
+  options: PdfExtractOptions = {}
+): Promise<PdfExtraction> {
+  const {
+    language = "auto",
+    includeWordData = false,
+    concurrency = DEFAULT_PAGE_CONCURRENCY,
+    onProgress,
+    onPage,
+  } = options;
+
+  const pdf = await loadPdfDocument(file);
+  const total = pdf.numPages;
+  const canvasPool = new CanvasPool();
+  const pages: PdfPageResult[] = new Array(total);
+  // Per-page progress (0-1) so concurrent OCR pages add up to one overall value
+  const pageProgress = new Float64Array(total);
+
+  const report = (status: string) => {
+    if (!onProgress) return;
+    const sum = pageProgress.reduce((acc, value) => acc + value, 0);
+    onProgress({ status, progress: Math.round((sum / total) * 100) });
+  };
+
+  try {
+    await forEachPage(
+      pdf,
+      (page, pageNumber) =>
+        extractPdfPage(page, pageNumber, {
+          language,
+          includeWordData,
+          canvasPool,
+          onProgress: (p) => {
+            pageProgress[pageNumber - 1] = p.progress / 100;
+            report(`Page ${pageNumber}: ${p.status}`);
+          },
+        }),
+      {
+        concurrency,
+        onPage: (result, pageNumber) => {
+          pages[pageNumber - 1] = result;
+          pageProgress[pageNumber - 1] = 1;
+          report(`Processed page ${pageNumber} of ${total}`);
+          onPage?.(result);
+        },
+      }
+    );
+  } finally {
+    await pdf.destroy();
+  }
+
+  // Stack pages vertically so multi-page word data stays in one coordinate space
+  const words: WordData[] = [];
+  let offsetY = 0;
+  for (const page of pages) {
+    for (const word of page.words) {
+      words.push({
+        ...word,
+        bbox: {
+          ...word.bbox,
+          y0: word.bbox.y0 + offsetY,
+          y1: word.bbox.y1 + offsetY,
+        },
+      });
+    }
+    offsetY += page.height;
+  }
+
+  const weightedConfidence = pages.reduce(
+    (acc, page) => acc + page.confidence * Math.max(1, page.text.length),
+    0
+  );
+  const weight = pages.reduce((acc, page) => acc + Math.max(1, page.text.length), 0);
+
+  return {
+    pages,
+    text: pages
+      .map((page) => page.text)
+      .filter((text) => text.length > 0)
+      .join("\n\n"),
+    confidence: weight > 0 ? weightedConfidence / weight : 0,
+    words,
+    ocrPageCount: pages.filter((page) => page.source === "ocr").length,
+  };
+}
+
+export function isPdfFile(file: File): boolean {
+  return file.type === "application/pdf" || file.name.toLowerCase().endsWith(".pdf");
+}
@@ -0,0 +1,234 @@
+import { canvasToBlob, createCanvas, getContext } from "@/lib/ocr/preprocess";
+
+// Image-to-PDF writer. Each image is decoded, downsampled to the page's DPI
+// and re-encoded as JPEG (which also covers WebP, GIF and anything else the
+// browser can decode), then written straight out as a DCTDecode XObject.
+// The document is assembled from Blob parts, so encoded pages stay in
+// browser-managed storage and only `concurrency` decoded images are ever
+// held at once.
+
+export type PageSize = "a4" | "letter" | "a3";
+
+// Portrait width and height in points
+export const PAGE_SIZES: Record<PageSize, [number, number]> = {
+  a4: [595.28, 841.89],
+  letter: [612, 792],
+  a3: [841.89, 1190.55],
+};
+
+export interface ImagePdfOptions {
+  pageSize?: PageSize;
+  orientation?: "portrait" | "landscape";
+  // Image resolution on the page; images are never upscaled
+  dpi?: number;
+  margin?: number;
+  quality?: number;
+  concurrency?: number;
+  signal?: AbortSignal;
+  onProgress?: (completed: number, total: number) => void;
+}
+
+const DEFAULTS = {
+  pageSize: "a4" as PageSize,
+  orientation: "portrait" as const,
+  dpi: 150,
+  margin: 20,
+  quality: 0.85,
+  concurrency: 2,
+};
+
+// Typical JPEG density at quality ~0.85, for the up-front size estimate
+const JPEG_BYTES_PER_PIXEL = 0.2;
+// Per-page objects, xref entries and trailer
+const PAGE_OVERHEAD_BYTES = 400;
+
+interface EncodedImage {
+  data: Blob;
+  width: number;
+  height: number;
+}
+
+function resolveOptions(options: ImagePdfOptions) {
+  const resolved = { ...DEFAULTS, ...options };
+  let [width, height] = PAGE_SIZES[resolved.pageSize] ?? PAGE_SIZES.a4;
+  if (resolved.orientation === "landscape") [width, height] = [height, width];
+  return { ...resolved, pageWidth: width, pageHeight: height };
+}
+
+// Largest pixel size the image needs to fill the printable area at `dpi`
+function targetPixels(
+  imageWidth: number,
+  imageHeight: number,
+  boxWidth: number,
+  boxHeight: number,
+  dpi: number
+) {
+  const maxWidth = (boxWidth / 72) * dpi;
+  const maxHeight = (boxHeight / 72) * dpi;
+  const scale = Math.min(1, maxWidth / imageWidth, maxHeight / imageHeight);
+  return {
+    width: Math.max(1, Math.round(imageWidth * scale)),
+    height: Math.max(1, Math.round(imageHeight * scale)),
+  };
+}
+
+// Upper-bound estimate of the PDF size before any image is decoded: each
+// page costs at most a full-page JPEG at the target DPI, or the source file
+// if that is smaller
+export function estimateImagePdfSize(files: Blob[], options: ImagePdfOptions = {}): number {
+  const { pageWidth, pageHeight, margin, dpi } = resolveOptions(options);
+  const boxPixels =
+    ((pageWidth - margin * 2) / 72) * dpi * (((pageHeight - margin * 2) / 72) * dpi);
+  const pageBytes = boxPixels * JPEG_BYTES_PER_PIXEL;
+  return files.reduce(
+    (total, file) => total + Math.min(file.size, pageBytes) + PAGE_OVERHEAD_BYTES,
+    0
+  );
+}
+
+async function encodeImage(
+  file: Blob,
+  boxWidth: number,
+  boxHeight: number,
+  dpi: number,
+  quality: number
+): Promise<EncodedImage> {
+  const bitmap = await createImageBitmap(file);
+  const { width, height } = targetPixels(bitmap.width, bitmap.height, boxWidth, boxHeight, dpi);
+
+  const canvas = createCanvas(width, height);
+  const ctx = getContext(canvas);
+  // JPEG has no alpha; composite transparent images onto white paper
+  ctx.fillStyle = "#ffffff";
+  ctx.fillRect(0, 0, width, height);
+  ctx.imageSmoothingQuality = "high";
+  ctx.drawImage(bitmap, 0, 0, width, height);
+  bitmap.close();
+
+  const data = await canvasToBlob(canvas, "image/jpeg", quality);
+  // Release the pixel buffer now rather than at the next GC
+  canvas.width = 0;
+  canvas.height = 0;
+  return { data, width, height };
+}
+
+class PdfBlobWriter {
+  private parts: BlobPart[] = [];
+  private offset = 0;
+  private offsets: number[] = [];
+  private encoder = new TextEncoder();
+
+  write(part: string | Uint8Array<ArrayBuffer> | Blob) {
+    const chunk = typeof part === "string" ? this.encoder.encode(part) : part;
+    this.parts.push(chunk);
+    this.offset += chunk instanceof Blob ? chunk.size : chunk.byteLength;
+  }
+
+  beginObject(id: number) {
+    this.offsets[id] = this.offset;
+    this.write(`${id} 0 obj\n`);
+  }
+
+  object(id: number, body: string) {
+    this.beginObject(id);
+    this.write(`${body}\nendobj\n`);
+  }
+
+  finish(rootId: number): Blob {
+    const xrefOffset = this.offset;
+    const count = this.offsets.length;
+    let xref = `xref\n0 ${count}\n0000000000 65535 f \n`;
+    for (let id = 1; id < count; id++) {
+      xref += `${String(this.offsets[id] ?? 0).padStart(10, "0")} 00000 n \n`;
+    }
+    this.write(xref);
+    this.write(`trailer\n<< /Size ${count} /Root ${rootId} 0 R >>\nstartxref\n${xrefOffset}\n%%EOF\n`);
+    return new Blob(this.parts, { type: "application/pdf" });
+  }
+}
+
+function formatNumber(value: number): string {
+  return Number(value.toFixed(2)).toString();
+}
+
+export async function createPdfFromImages(
+  files: Blob[],
+  options: ImagePdfOptions = {}
+): Promise<Blob> {
+  const { pageWidth, pageHeight, margin, dpi, quality, concurrency, signal, onProgress } =
+    resolveOptions(options);
+  const boxWidth = pageWidth - margin * 2;
+  const boxHeight = pageHeight - margin * 2;
+
+  const writer = new PdfBlobWriter();
+  const CATALOG_ID = 1;
+  const PAGES_ID = 2;
+  const pageIds: number[] = [];
+  let nextId = 3;
+
+  writer.write("%PDF-1.4\n");
+  // Binary comment marks the file as binary for transfer tools
+  writer.write(new Uint8Array([0x25, 0xe2, 0xe3, 0xcf, 0xd3, 0x0a]));
+  writer.object(CATALOG_ID, `<< /Type /Catalog /Pages ${PAGES_ID} 0 R >>`);
+
+  const writePage = (image: EncodedImage) => {
+    const imageId = nextId++;
+    const contentId = nextId++;
+    const pageId = nextId++;
+
+    writer.beginObject(imageId);
+    writer.write(
+      `<< /Type /XObject /Subtype /Image /Width ${image.width} /Height ${image.height} ` +
+        `/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode /Length ${image.data.size} >>\nstream\n`
+    );
+    writer.write(image.data);
+    writer.write("\nendstream\nendobj\n");
+
+    // Fit the image's aspect ratio into the printable area, centred
+    const scale = Math.min(boxWidth / image.width, boxHeight / image.height);
+    const drawWidth = image.width * scale;
+    const drawHeight = image.height * scale;
+    const x = (pageWidth - drawWidth) / 2;
+    const y = (pageHeight - drawHeight) / 2;
+    const content = `q ${formatNumber(drawWidth)} 0 0 ${formatNumber(drawHeight)} ${formatNumber(x)} ${formatNumber(y)} cm /Im0 Do Q`;
+    writer.object(contentId, `<< /Length ${content.length} >>\nstream\n${content}\nendstream`);
+
+    writer.object(
+      pageId,
+      `<< /Type /Page /Parent ${PAGES_ID} 0 R /MediaBox [0 0 ${formatNumber(pageWidth)} ${formatNumber(pageHeight)}] ` +
+        `/Resources << /XObject << /Im0 ${imageId} 0 R >> >> /Contents ${contentId} 0 R >>`
+    );
+    pageIds.push(pageId);
+  };
+
+  // Sliding window: at most `concurrency` images are being decoded or
+  // waiting to be written, and pages are written in input order
+  const inFlight: Promise<EncodedImage>[] = [];
+  let completed = 0;
+  const writeNext = async () => {
+    writePage(await inFlight.shift()!);
+    onProgress?.(++completed, files.length);
+  };
+
+  try {
+    for (const file of files) {
+      signal?.throwIfAborted();
+      inFlight.push(encodeImage(file, boxWidth, boxHeight, dpi, quality));
+      if (inFlight.length >= Math.max(1, concurrency)) await writeNext();
+    }
+    while (inFlight.length > 0) {
+      signal?.throwIfAborted();
+      await writeNext();
+    }
+  } catch (error) {
+    // Don't leave rejected encodes unhandled
+    inFlight.forEach((pending) => pending.catch(() => {}));
+    throw error;
+  }
+
+  writer.object(
+    PAGES_ID,
+    `<< /Type /Pages /Kids [${pageIds.map((id) => `${id} 0 R`).join(" ")}] /Count ${pageIds.length} >>`
+  );
+  return writer.finish(CATALOG_ID);
+}
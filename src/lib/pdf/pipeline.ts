@@ -0,0 +1,129 @@
+import type { PDFDocumentProxy, PDFPageProxy } from "pdfjs-dist";
+
+// Shared PDF page pipeline: pages are processed with bounded concurrency and
+// handed to the caller as soon as each one completes, so large documents
+// never need every page in memory at once.
+
+export const DEFAULT_PAGE_CONCURRENCY = 3;
+
+export async function loadPdfDocument(
+  source: File | ArrayBuffer
+): Promise<PDFDocumentProxy> {
+  const pdfjsLib = await import("pdfjs-dist");
+  pdfjsLib.GlobalWorkerOptions.workerSrc = `//cdnjs.cloudflare.com/ajax/libs/pdf.js/${pdfjsLib.version}/pdf.worker.min.js`;
+
+  const data = source instanceof ArrayBuffer ? source : await source.arrayBuffer();
+  return pdfjsLib.getDocument({ data }).promise;
+}
+
+export interface PageTaskOptions<T> {
+  concurrency?: number;
+  signal?: AbortSignal;
+  // A returned promise holds the runner until it settles (back-pressure)
+  onPage?: (
+    result: T,
+    pageNumber: number,
+    completed: number,
+    total: number
+  ) => void | Promise<void>;
+}
+
+// Run `task` over every page, at most `concurrency` at a time. Results are
+// delivered through onPage in completion order; page resources are released
+// right after each task. When one page fails the other runners stop after
+// their current page, and this only rejects once they have, so the caller
+// can destroy the document safely.
+export async function forEachPage<T>(
+  pdf: PDFDocumentProxy,
+  task: (page: PDFPageProxy, pageNumber: number) => Promise<T>,
+  options: PageTaskOptions<T> = {}
+): Promise<void> {
+  const { concurrency = DEFAULT_PAGE_CONCURRENCY, signal, onPage } = options;
+  const total = pdf.numPages;
+  let nextPage = 1;
+  let completed = 0;
+  let failed = false;
+
+  const runner = async () => {
+    try {
+      while (nextPage <= total && !failed) {
+        signal?.throwIfAborted();
+        const pageNumber = nextPage++;
+        const page = await pdf.getPage(pageNumber);
+
+        try {
+          const result = await task(page, pageNumber);
+          completed++;
+          await onPage?.(result, pageNumber, completed, total);
+        } finally {
+          page.cleanup();
+        }
+      }
+    } catch (error) {
+      failed = true;
+      throw error;
+    }
+  };
+
+  const runners = Math.max(1, Math.min(concurrency, total));
+  const results = await Promise.allSettled(Array.from({ length: runners }, runner));
+  const failure = results.find(
+    (result): result is PromiseRejectedResult => result.status === "rejected"
+  );
+  if (failure) throw failure.reason;
+}
+
+export async function extractPageText(page: PDFPageProxy): Promise<string> {
+  const textContent = await page.getTextContent();
+  return textContent.items
+    .map((item) => ("str" in item ? item.str : ""))
+    .join(" ");
+}
+
+// Canvases are recycled between pages instead of allocating one per page
+export class CanvasPool {
+  private free: HTMLCanvasElement[] = [];
+
+  acquire(width: number, height: number): HTMLCanvasElement {
+    const canvas = this.free.pop() ?? document.createElement("canvas");
+    // Resizing also clears the previous page
+    canvas.width = width;
+    canvas.height = height;
+    return canvas;
+  }
+
+  release(canvas: HTMLCanvasElement) {
+    // Shrink so the backing store is freed while the canvas sits idle
+    canvas.width = 0;
+    canvas.height = 0;
+    this.free.push(canvas);
+  }
+}
+
+export async function renderPageToBlob(
+  page: PDFPageProxy,
+  canvasPool: CanvasPool,
+  options: { scale?: number; type?: string; quality?: number } = {}
+): Promise<{ blob: Blob; width: number; height: number }> {
+  const { scale = 2, type = "image/jpeg", quality = 0.9 } = options;
+  const viewport = page.getViewport({ scale });
+  const width = Math.floor(viewport.width);
+  const height = Math.floor(viewport.height);
+  const canvas = canvasPool.acquire(width, height);
+
+  try {
+    const context = canvas.getContext("2d")!;
+    await page.render({ canvasContext: context, viewport, canvas }).promise;
+
+    const blob = await new Promise<Blob>((resolve, reject) =>
+      canvas.toBlob(
+        (result) => (result ? resolve(result) : reject(new Error("Failed to encode page"))),
+        type,
+        quality
+      )
+    );
+    return { blob, width, height };
+  } finally {
+    canvasPool.release(canvas);
+  }
+}
@@ -0,0 +1,40 @@
+export interface ProgressBatcher<K, V> {
+  report(key: K, value: V): void;
+  flush(): void;
+  cancel(): void;
+}
+
+// Coalesce high-frequency progress updates (Tesseract reports many per second
+// per job) into at most one flush per interval, keeping only the latest value
+// for each key
+export function createProgressBatcher<K, V>(
+  flush: (updates: Map<K, V>) => void,
+  intervalMs = 100
+): ProgressBatcher<K, V> {
+  let updates = new Map<K, V>();
+  let timer: ReturnType<typeof setTimeout> | null = null;
+
+  const run = () => {
+    timer = null;
+    if (updates.size === 0) return;
+    const batch = updates;
+    updates = new Map();
+    flush(batch);
+  };
+
+  return {
+    report(key, value) {
+      updates.set(key, value);
+      if (!timer) timer = setTimeout(run, intervalMs);
+    },
+    flush() {
+      if (timer) clearTimeout(timer);
+      run();
+    },
+    cancel() {
+      if (timer) clearTimeout(timer);
+      timer = null;
+      updates.clear();
+    },
+  };
+}
@@ -0,0 +1,21 @@
+import jsQR from "jsqr";
+import { createCanvas, getContext, getScaledSize } from "@/lib/ocr/preprocess";
+
+// jsQR scans every pixel; QR modules stay readable well below this size
+const MAX_QR_DIMENSION = 2048;
+
+// Decode the first QR code in an image. Runs in the image pipeline worker,
+// or on the main thread where workers can't draw (no OffscreenCanvas).
+export async function decodeQRCode(image: Blob): Promise<string | null> {
+  const bitmap = await createImageBitmap(image);
+  const { width, height } = getScaledSize(bitmap.width, bitmap.height, MAX_QR_DIMENSION);
+
+  const canvas = createCanvas(width, height);
+  const ctx = getContext(canvas);
+  ctx.drawImage(bitmap, 0, 0, width, height);
+  bitmap.close();
+
+  const imageData = ctx.getImageData(0, 0, width, height);
+  const code = jsQR(imageData.data, width, height);
+  return code?.data || null;
+}
@@ -14,6 +14,19 @@ export interface Conversion {
   input_format: string;
   output_text: string;
   language: string;
+  // Milliseconds, when the client measured it
+  processing_time: number | null;
+  created_at: string;
+}
+
+// History list row: everything but the full text, which is loaded on demand
+export interface ConversionSummary {
+  id: string;
+  type: ConversionType;
+  input_filename: string;
+  language: string;
+  snippet: string;
+  char_count: number;
   created_at: string;
 }
 
@@ -48,6 +61,7 @@ CREATE TABLE conversions (
   input_format TEXT NOT NULL,
   output_text TEXT NOT NULL,
   language TEXT DEFAULT 'eng',
+  processing_time INTEGER, -- in milliseconds
   created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
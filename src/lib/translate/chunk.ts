@@ -0,0 +1,88 @@
+// Split text into translation-sized pieces without cutting sentences apart.
+// Each chunk keeps the whitespace that followed it in the source, so the
+// translated chunks can be joined back with the original line breaks.
+
+export interface TextChunk {
+  text: string;
+  separator: string;
+}
+
+const encoder = new TextEncoder();
+
+function byteLength(text: string): number {
+  return encoder.encode(text).length;
+}
+
+// Sentence boundaries via Intl.Segmenter where available (handles CJK and
+// Thai punctuation); otherwise split after . ! ? and their full-width forms
+function splitSentences(paragraph: string): string[] {
+  if (typeof Intl !== "undefined" && "Segmenter" in Intl) {
+    const segmenter = new Intl.Segmenter(undefined, { granularity: "sentence" });
+    return Array.from(segmenter.segment(paragraph), (segment) => segment.segment);
+  }
+  return paragraph.match(/[^.!?。！？]+[.!?。！？]*\s*/g) ?? [paragraph];
+}
+
+// Last resort for a single sentence over the limit: break at spaces, or at
+// any character for scripts without spaces
+function splitLongSentence(sentence: string, maxBytes: number): string[] {
+  const pieces: string[] = [];
+  let current = "";
+
+  for (const word of sentence.match(/\S+\s*|\s+/g) ?? [sentence]) {
+    if (current && byteLength(current + word) > maxBytes) {
+      pieces.push(current);
+      current = "";
+    }
+    if (byteLength(word) <= maxBytes) {
+      current += word;
+      continue;
+    }
+    for (const char of word) {
+      if (current && byteLength(current + char) > maxBytes) {
+        pieces.push(current);
+        current = "";
+      }
+      current += char;
+    }
+  }
+  if (current) pieces.push(current);
+  return pieces;
+}
+
+export function splitIntoChunks(text: string, maxBytes: number): TextChunk[] {
+  const chunks: TextChunk[] = [];
+  // Paragraphs with the line breaks after them
+  const paragraphs = text.match(/[^\n]+\n*|\n+/g) ?? [];
+
+  for (const block of paragraphs) {
+    const paragraph = block.replace(/\s+$/, "");
+    const separator = block.slice(paragraph.length);
+    if (!paragraph) {
+      if (chunks.length > 0) chunks[chunks.length - 1].separator += separator;
+      else chunks.push({ text: "", separator });
+      continue;
+    }
+
+    let current = "";
+    const flush = (trailing: string) => {
+      const trimmed = current.replace(/\s+$/, "");
+      if (trimmed) {
+        chunks.push({ text: trimmed, separator: current.slice(trimmed.length) + trailing });
+      }
+      current = "";
+    };
+
+    for (const sentence of splitSentences(paragraph)) {
+      const pieces =
+        byteLength(sentence) > maxBytes ? splitLongSentence(sentence, maxBytes) : [sentence];
+      for (const piece of pieces) {
+        if (current && byteLength(current + piece) > maxBytes) flush("");
+        current += piece;
+      }
+    }
+    flush(separator);
+  }
+
+  return chunks;
+}
@@ -1,3 +1,15 @@
+import { LRUCache } from "@/lib/cache/lru";
+import { TieredCache } from "@/lib/cache/tiered";
+import { sha256Hex } from "@/lib/cache/hash";
+import { splitIntoChunks } from "./chunk";
+import {
+  createMyMemoryProvider,
+  TranslationError,
+  type TranslationProvider,
+} from "./providers";
+
+export { createMyMemoryProvider, TranslationError, type TranslationProvider };
+
 export type TranslateLanguage =
   | "en"
   | "zh"
@@ -29,28 +41,122 @@ export const TRANSLATE_LANGUAGES: { code: TranslateLanguage; name: string }[] =
   { code: "th", name: "Thai" },
 ];
 
+export interface TranslateOptions {
+  provider?: TranslationProvider;
+  signal?: AbortSignal;
+  onProgress?: (completed: number, total: number) => void;
+}
+
+const MAX_RETRIES = 3;
+const RETRY_BASE_DELAY_MS = 500;
+
+const defaultProvider = createMyMemoryProvider();
+
+// Translated chunks keyed by provider, language pair and text hash, so
+// repeated phrases and re-runs on the same page cost nothing
+const chunkCache = new TieredCache<string>(
+  new LRUCache<string>({
+    maxEntries: 5000,
+    maxSize: 4 * 1024 * 1024,
+    ttlMs: 24 * 60 * 60 * 1000,
+    sizeOf: (value) => value.length,
+  })
+);
+
+interface ProviderSlots {
+  active: number;
+  waiters: (() => void)[];
+}
+
+// Requests in flight per provider, shared by every translateText call
+const providerSlots = new Map<TranslationProvider, ProviderSlots>();
+
+async function withProviderSlot<T>(
+  provider: TranslationProvider,
+  task: () => Promise<T>
+): Promise<T> {
+  const state = providerSlots.get(provider) ?? { active: 0, waiters: [] };
+  providerSlots.set(provider, state);
+
+  while (state.active >= provider.concurrency) {
+    await new Promise<void>((resolve) => state.waiters.push(resolve));
+  }
+  state.active++;
+  try {
+    return await task();
+  } finally {
+    state.active--;
+    state.waiters.shift()?.();
+  }
+}
+
+function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const timer = setTimeout(resolve, ms);
+    signal?.addEventListener(
+      "abort",
+      () => {
+        clearTimeout(timer);
+        reject(signal.reason);
+      },
+      { once: true }
+    );
+  });
+}
+
+// Exponential backoff with jitter for transient failures
+async function translateChunk(
+  provider: TranslationProvider,
+  text: string,
+  from: TranslateLanguage,
+  to: TranslateLanguage,
+  signal?: AbortSignal
+): Promise<string> {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await withProviderSlot(provider, () => provider.translate(text, from, to, signal));
+    } catch (error) {
+      const retryable = error instanceof TranslationError && error.retryable;
+      if (!retryable || attempt >= MAX_RETRIES || signal?.aborted) throw error;
+      const delay = RETRY_BASE_DELAY_MS * 2 ** attempt;
+      await sleep(delay / 2 + Math.random() * delay, signal);
+    }
+  }
+}
+
 export async function translateText(
   text: string,
   from: TranslateLanguage,
-  to: TranslateLanguage
+  to: TranslateLanguage,
+  options: TranslateOptions = {}
 ): Promise<string> {
   if (from === to) return text;
   if (!text.trim()) return "";
 
+  const { provider = defaultProvider, signal, onProgress } = options;
+
   try {
-    const url = `https://api.mymemory.translated.net/get?q=${encodeURIComponent(
-      text
-    )}&langpair=${from}|${to}`;
+    const chunks = splitIntoChunks(text, provider.maxChunkBytes);
+    const pending = chunks.filter((chunk) => chunk.text.trim()).length;
+    let completed = 0;
 
-    const response = await fetch(url);
-    const data = await response.json();
+    const translated = await Promise.all(
+      chunks.map(async (chunk) => {
+        if (!chunk.text.trim()) return chunk.text;
 
-    if (data.responseStatus === 200 && data.responseData?.translatedText) {
-      return data.responseData.translatedText;
-    }
+        const hash = await sha256Hex(chunk.text);
+        const result = await chunkCache.getOrCompute(
+          `${provider.name}:${from}:${to}:${hash}`,
+          () => translateChunk(provider, chunk.text, from, to, signal)
+        );
+        onProgress?.(++completed, pending);
+        return result;
+      })
+    );
 
-    throw new Error("Translation failed");
+    return translated.map((result, index) => result + chunks[index].separator).join("");
   } catch (error) {
+    if (signal?.aborted) throw error;
     console.error("Translation error:", error);
     throw new Error("Failed to translate text. Please try again.");
   }
@@ -0,0 +1,81 @@
+import type { TranslateLanguage } from "./index";
+
+// A translation backend. translateText handles chunking, caching, retries
+// and concurrency; providers only translate one chunk.
+export interface TranslationProvider {
+  // Part of the cache key, so results from different backends don't mix
+  name: string;
+  // Largest chunk the backend accepts, in UTF-8 bytes
+  maxChunkBytes: number;
+  // Requests allowed in flight at once
+  concurrency: number;
+  translate(
+    text: string,
+    from: TranslateLanguage,
+    to: TranslateLanguage,
+    signal?: AbortSignal
+  ): Promise<string>;
+}
+
+export class TranslationError extends Error {
+  // Whether trying again later may succeed (rate limits, 5xx, network errors)
+  readonly retryable: boolean;
+
+  constructor(message: string, retryable: boolean) {
+    super(message);
+    this.name = "TranslationError";
+    this.retryable = retryable;
+  }
+}
+
+export interface MyMemoryOptions {
+  endpoint?: string;
+  // Registered e-mail raises MyMemory's daily quota
+  email?: string;
+  concurrency?: number;
+}
+
+const MYMEMORY_ENDPOINT =
+  process.env.NEXT_PUBLIC_TRANSLATE_ENDPOINT || "https://api.mymemory.translated.net/get";
+
+// MyMemory's free API (GET, 500 bytes per query). The endpoint can point at
+// a local stub server that speaks the same JSON for tests.
+export function createMyMemoryProvider(options: MyMemoryOptions = {}): TranslationProvider {
+  const { endpoint = MYMEMORY_ENDPOINT, email, concurrency = 4 } = options;
+
+  return {
+    name: `mymemory:${endpoint}`,
+    maxChunkBytes: 500,
+    concurrency,
+    async translate(text, from, to, signal) {
+      const params = new URLSearchParams({ q: text, langpair: `${from}|${to}` });
+      if (email) params.set("de", email);
+
+      let response: Response;
+      try {
+        response = await fetch(`${endpoint}?${params}`, { signal });
+      } catch (error) {
+        if (signal?.aborted) throw error;
+        throw new TranslationError(`Translation request failed: ${error}`, true);
+      }
+
+      if (!response.ok) {
+        throw new TranslationError(
+          `Translation request failed with status ${response.status}`,
+          response.status === 429 || response.status >= 500
+        );
+      }
+
+      const data = await response.json();
+      if (Number(data.responseStatus) === 200 && data.responseData?.translatedText) {
+        return data.responseData.translatedText as string;
+      }
+
+      // 429 here is the daily quota, which won't recover within a retry
+      throw new TranslationError(
+        data.responseDetails || "Translation failed",
+        Number(data.responseStatus) >= 500
+      );
+    },
+  };
+}
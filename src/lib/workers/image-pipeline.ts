@@ -0,0 +1,133 @@
+import {
+  preprocessImage,
+  type PreprocessOptions,
+  type PreprocessReport,
+} from "@/lib/ocr/preprocess";
+import { detectScript as detectScriptInline, type DetectedScript } from "@/lib/ocr/script-detect";
+
+// Client for the image pipeline worker: image decode (createImageBitmap),
+// OCR preprocessing, script detection and QR decoding run off the main thread. Image bytes are
+// transferred, not copied, in both directions. Tesseract recognition already
+// runs in its own workers (see worker-pool.ts) and gets the processed image.
+
+export type PipelineRequest =
+  | {
+      id: number;
+      type: "preprocess";
+      buffer: ArrayBuffer;
+      mimeType: string;
+      options: PreprocessOptions;
+    }
+  | { id: number; type: "script"; buffer: ArrayBuffer; mimeType: string }
+  | { id: number; type: "qr"; buffer: ArrayBuffer; mimeType: string };
+
+export type PipelineResponse =
+  | {
+      id: number;
+      ok: true;
+      type: "preprocess";
+      buffer: ArrayBuffer;
+      mimeType: string;
+      report: PreprocessReport;
+    }
+  | { id: number; ok: true; type: "script"; script: DetectedScript }
+  | { id: number; ok: true; type: "qr"; data: string | null }
+  | { id: number; ok: false; error: string };
+
+type DistributiveOmit<T, K extends PropertyKey> = T extends unknown ? Omit<T, K> : never;
+
+interface PendingCall {
+  resolve: (response: PipelineResponse) => void;
+  reject: (error: Error) => void;
+}
+
+let worker: Worker | null = null;
+let nextId = 0;
+const pending = new Map<number, PendingCall>();
+
+// Workers need OffscreenCanvas to draw; older Safari falls back to the main thread
+function supportsWorkerPipeline(): boolean {
+  return (
+    typeof Worker !== "undefined" &&
+    typeof OffscreenCanvas !== "undefined" &&
+    typeof createImageBitmap !== "undefined"
+  );
+}
+
+function failAll(error: Error) {
+  for (const call of pending.values()) call.reject(error);
+  pending.clear();
+}
+
+function getWorker(): Worker {
+  if (!worker) {
+    worker = new Worker(new URL("./image-pipeline.worker.ts", import.meta.url), {
+      type: "module",
+    });
+    worker.onmessage = (event: MessageEvent<PipelineResponse>) => {
+      const call = pending.get(event.data.id);
+      if (!call) return;
+      pending.delete(event.data.id);
+      if (event.data.ok) call.resolve(event.data);
+      else call.reject(new Error(event.data.error));
+    };
+    worker.onerror = (event) => {
+      // A crashed worker is replaced on the next call
+      failAll(new Error(event.message || "Image pipeline worker failed"));
+      worker?.terminate();
+      worker = null;
+    };
+  }
+  return worker;
+}
+
+function call(request: DistributiveOmit<PipelineRequest, "id">): Promise<PipelineResponse> {
+  const id = nextId++;
+  return new Promise((resolve, reject) => {
+    pending.set(id, { resolve, reject });
+    getWorker().postMessage({ ...request, id }, [request.buffer]);
+  });
+}
+
+export async function preprocessInWorker(
+  image: Blob,
+  options: PreprocessOptions
+): Promise<{ image: Blob; report: PreprocessReport }> {
+  if (!supportsWorkerPipeline()) return preprocessImage(image, options);
+
+  const buffer = await image.arrayBuffer();
+  const response = await call({ type: "preprocess", buffer, mimeType: image.type, options });
+  if (!response.ok || response.type !== "preprocess") {
+    throw new Error("Unexpected image pipeline response");
+  }
+  return {
+    image: new Blob([response.buffer], { type: response.mimeType }),
+    report: response.report,
+  };
+}
+
+export async function detectScriptInWorker(image: Blob): Promise<DetectedScript> {
+  if (!supportsWorkerPipeline()) return detectScriptInline(image);
+
+  const buffer = await image.arrayBuffer();
+  const response = await call({ type: "script", buffer, mimeType: image.type });
+  if (!response.ok || response.type !== "script") {
+    throw new Error("Unexpected image pipeline response");
+  }
+  return response.script;
+}
+
+export async function decodeQRCode(image: Blob): Promise<string | null> {
+  if (!supportsWorkerPipeline()) {
+    // jsQR is loaded only when needed, so OCR pages that import this module don't ship it
+    const { decodeQRCode: decodeInline } = await import("@/lib/qr/decode");
+    return decodeInline(image);
+  }
+
+  const buffer = await image.arrayBuffer();
+  const response = await call({ type: "qr", buffer, mimeType: image.type });
+  if (!response.ok || response.type !== "qr") {
+    throw new Error("Unexpected image pipeline response");
+  }
+  return response.data;
+}
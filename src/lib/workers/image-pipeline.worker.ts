@@ -0,0 +1,44 @@
+import { preprocessImage } from "@/lib/ocr/preprocess";
+import { detectScript } from "@/lib/ocr/script-detect";
+import { decodeQRCode } from "@/lib/qr/decode";
+import type { PipelineRequest, PipelineResponse } from "./image-pipeline";
+
+// Worker side of the image pipeline. Requests and replies carry the image
+// bytes as transferred ArrayBuffers.
+
+function reply(response: PipelineResponse, transfer: Transferable[] = []) {
+  self.postMessage(response, { transfer });
+}
+
+self.onmessage = async (event: MessageEvent<PipelineRequest>) => {
+  const request = event.data;
+  const image = new Blob([request.buffer], { type: request.mimeType });
+
+  try {
+    if (request.type === "preprocess") {
+      const result = await preprocessImage(image, request.options);
+      const buffer = await result.image.arrayBuffer();
+      reply(
+        {
+          id: request.id,
+          ok: true,
+          type: "preprocess",
+          buffer,
+          mimeType: result.image.type,
+          report: result.report,
+        },
+        [buffer]
+      );
+    } else if (request.type === "script") {
+      reply({ id: request.id, ok: true, type: "script", script: await detectScript(image) });
+    } else {
+      reply({ id: request.id, ok: true, type: "qr", data: await decodeQRCode(image) });
+    }
+  } catch (error) {
+    reply({
+      id: request.id,
+      ok: false,
+      error: error instanceof Error ? error.message : String(error),
+    });
+  }
+};
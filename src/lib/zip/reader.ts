@@ -0,0 +1,111 @@
+import { inflateRawSync } from "node:zlib";
+
+// Minimal ZIP reader for server-side uploads. Supports stored and deflated
+// entries, which covers archives produced by every common zip tool.
+
+export interface ZipEntry {
+  name: string;
+  data: Buffer;
+}
+
+export interface ZipReadOptions {
+  maxEntries?: number;
+  maxEntrySize?: number;
+  filter?: (name: string) => boolean;
+}
+
+export class ZipError extends Error {
+  constructor(message: string) {
+    super(message);
+    this.name = "ZipError";
+  }
+}
+
+const END_OF_CENTRAL_DIR = 0x06054b50;
+const CENTRAL_DIR_HEADER = 0x02014b50;
+const LOCAL_FILE_HEADER = 0x04034b50;
+
+function findEndOfCentralDirectory(buffer: Buffer): number {
+  // The record is 22 bytes plus a comment of up to 64 KB
+  const min = Math.max(0, buffer.length - 22 - 0xffff);
+  for (let i = buffer.length - 22; i >= min; i--) {
+    if (buffer.readUInt32LE(i) === END_OF_CENTRAL_DIR) return i;
+  }
+  throw new ZipError("Not a valid zip archive");
+}
+
+export function readZipEntries(
+  buffer: Buffer,
+  options: ZipReadOptions = {}
+): ZipEntry[] {
+  const {
+    maxEntries = 100,
+    maxEntrySize = 20 * 1024 * 1024,
+    filter = () => true,
+  } = options;
+
+  const eocd = findEndOfCentralDirectory(buffer);
+  const entryCount = buffer.readUInt16LE(eocd + 10);
+  let offset = buffer.readUInt32LE(eocd + 16);
+
+  const entries: ZipEntry[] = [];
+
+  for (let i = 0; i < entryCount; i++) {
+    if (offset + 46 > buffer.length || buffer.readUInt32LE(offset) !== CENTRAL_DIR_HEADER) {
+      throw new ZipError("Corrupt zip central directory");
+    }
+
+    const method = buffer.readUInt16LE(offset + 10);
+    const compressedSize = buffer.readUInt32LE(offset + 20);
+    const size = buffer.readUInt32LE(offset + 24);
+    const nameLength = buffer.readUInt16LE(offset + 28);
+    const extraLength = buffer.readUInt16LE(offset + 30);
+    const commentLength = buffer.readUInt16LE(offset + 32);
+    const localOffset = buffer.readUInt32LE(offset + 42);
+    const name = buffer.toString("utf8", offset + 46, offset + 46 + nameLength);
+
+    offset += 46 + nameLength + extraLength + commentLength;
+
+    // Skip directories and macOS resource forks
+    if (name.endsWith("/") || name.startsWith("__MACOSX/") || !filter(name)) {
+      continue;
+    }
+
+    if (entries.length >= maxEntries) {
+      throw new ZipError(`Zip archive contains more than ${maxEntries} files`);
+    }
+    if (size > maxEntrySize) {
+      throw new ZipError(`${name} exceeds the maximum file size`);
+    }
+
+    if (
+      localOffset + 30 > buffer.length ||
+      buffer.readUInt32LE(localOffset) !== LOCAL_FILE_HEADER
+    ) {
+      throw new ZipError("Corrupt zip local header");
+    }
+    const dataStart =
+      localOffset +
+      30 +
+      buffer.readUInt16LE(localOffset + 26) +
+      buffer.readUInt16LE(localOffset + 28);
+    const raw = buffer.subarray(dataStart, dataStart + compressedSize);
+
+    let data: Buffer;
+    if (method === 0) {
+      data = raw;
+    } else if (method === 8) {
+      try {
+        data = inflateRawSync(raw, { maxOutputLength: maxEntrySize });
+      } catch {
+        throw new ZipError(`Could not decompress ${name}`);
+      }
+    } else {
+      throw new ZipError(`Unsupported compression method for ${name}`);
+    }
+
+    entries.push({ name, data });
+  }
+
+  return entries;
+}
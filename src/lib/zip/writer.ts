@@ -0,0 +1,256 @@
+// Streaming ZIP writer for the browser and Node.js. addFile stores entries
+// uncompressed (JPEG/PNG data doesn't deflate further) and only reads the
+// entry being written into memory; addStream deflates generated content
+// chunk by chunk, so it never holds more than one chunk at a time.
+
+export interface ZipSink {
+  write(chunk: Uint8Array | Blob): Promise<void>;
+  close(): Promise<void>;
+}
+
+interface CentralEntry {
+  name: Uint8Array;
+  flags: number;
+  method: number;
+  crc: number;
+  compressedSize: number;
+  size: number;
+  offset: number;
+}
+
+const FLAG_UTF8 = 0x0800;
+// Sizes and CRC follow the data in a descriptor instead of the local header
+const FLAG_DATA_DESCRIPTOR = 0x0008;
+const METHOD_STORED = 0;
+const METHOD_DEFLATE = 8;
+
+const CRC_TABLE = (() => {
+  const table = new Uint32Array(256);
+  for (let n = 0; n < 256; n++) {
+    let c = n;
+    for (let k = 0; k < 8; k++) {
+      c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+    }
+    table[n] = c >>> 0;
+  }
+  return table;
+})();
+
+// Pass the previous result to continue a checksum across chunks
+function crc32(data: Uint8Array, previous = 0): number {
+  let crc = previous ^ 0xffffffff;
+  for (let i = 0; i < data.length; i++) {
+    crc = CRC_TABLE[(crc ^ data[i]) & 0xff] ^ (crc >>> 8);
+  }
+  return (crc ^ 0xffffffff) >>> 0;
+}
+
+// DOS date/time fields for "now"
+function dosDateTime(date: Date): { time: number; date: number } {
+  return {
+    time: (date.getHours() << 11) | (date.getMinutes() << 5) | (date.getSeconds() >> 1),
+    date: ((date.getFullYear() - 1980) << 9) | ((date.getMonth() + 1) << 5) | date.getDate(),
+  };
+}
+
+export class ZipWriter {
+  private readonly sink: ZipSink;
+  private entries: CentralEntry[] = [];
+  private offset = 0;
+  private readonly stamp = dosDateTime(new Date());
+
+  constructor(sink: ZipSink) {
+    this.sink = sink;
+  }
+
+  private localHeader(entry: Omit<CentralEntry, "offset">): Uint8Array {
+    const header = new DataView(new ArrayBuffer(30));
+    header.setUint32(0, 0x04034b50, true);
+    header.setUint16(4, 20, true); // version needed
+    header.setUint16(6, entry.flags, true);
+    header.setUint16(8, entry.method, true);
+    header.setUint16(10, this.stamp.time, true);
+    header.setUint16(12, this.stamp.date, true);
+    header.setUint32(14, entry.crc, true);
+    header.setUint32(18, entry.compressedSize, true);
+    header.setUint32(22, entry.size, true);
+    header.setUint16(26, entry.name.length, true);
+    header.setUint16(28, 0, true);
+    return new Uint8Array(header.buffer);
+  }
+
+  async addFile(name: string, data: Blob | Uint8Array) {
+    const bytes = data instanceof Blob ? new Uint8Array(await data.arrayBuffer()) : data;
+    const entry = {
+      name: new TextEncoder().encode(name),
+      flags: FLAG_UTF8,
+      method: METHOD_STORED,
+      crc: crc32(bytes),
+      compressedSize: bytes.length,
+      size: bytes.length,
+    };
+
+    await this.sink.write(this.localHeader(entry));
+    await this.sink.write(entry.name);
+    // Hand the original Blob to the sink so it can be referenced, not copied
+    await this.sink.write(data instanceof Blob ? data : bytes);
+
+    this.entries.push({ ...entry, offset: this.offset });
+    this.offset += 30 + entry.name.length + bytes.length;
+  }
+
+  // Write an entry whose content is produced incrementally. The CRC and sizes
+  // are only known at the end, so they go in a trailing data descriptor.
+  async addStream(name: string, chunks: Iterable<Uint8Array> | AsyncIterable<Uint8Array>) {
+    const compress = typeof CompressionStream !== "undefined";
+    const entry = {
+      name: new TextEncoder().encode(name),
+      flags: FLAG_UTF8 | FLAG_DATA_DESCRIPTOR,
+      method: compress ? METHOD_DEFLATE : METHOD_STORED,
+      crc: 0,
+      compressedSize: 0,
+      size: 0,
+    };
+    const offset = this.offset;
+
+    await this.sink.write(this.localHeader(entry));
+    await this.sink.write(entry.name);
+
+    if (compress) {
+      const deflate = new CompressionStream("deflate-raw");
+      const input = deflate.writable.getWriter();
+      const output = deflate.readable.getReader();
+      // Drain compressed output while feeding input so backpressure holds
+      const drained = (async () => {
+        for (;;) {
+          const { done, value } = await output.read();
+          if (done) break;
+          entry.compressedSize += value.length;
+          await this.sink.write(value);
+        }
+      })();
+      // A failing sink must also unblock a pending input.write
+      drained.catch((error) => input.abort(error).catch(() => {}));
+
+      try {
+        for await (const chunk of chunks) {
+          entry.crc = crc32(chunk, entry.crc);
+          entry.size += chunk.length;
+          await input.write(chunk as Uint8Array<ArrayBuffer>);
+        }
+        await input.close();
+        await drained;
+      } catch (error) {
+        await input.abort(error).catch(() => {});
+        await drained.catch(() => {});
+        throw error;
+      }
+    } else {
+      for await (const chunk of chunks) {
+        entry.crc = crc32(chunk, entry.crc);
+        entry.size += chunk.length;
+        await this.sink.write(chunk);
+      }
+      entry.compressedSize = entry.size;
+    }
+
+    const descriptor = new DataView(new ArrayBuffer(16));
+    descriptor.setUint32(0, 0x08074b50, true);
+    descriptor.setUint32(4, entry.crc, true);
+    descriptor.setUint32(8, entry.compressedSize, true);
+    descriptor.setUint32(12, entry.size, true);
+    await this.sink.write(new Uint8Array(descriptor.buffer));
+
+    this.entries.push({ ...entry, offset });
+    this.offset += 30 + entry.name.length + entry.compressedSize + 16;
+  }
+
+  async close() {
+    const centralStart = this.offset;
+    let centralSize = 0;
+
+    for (const entry of this.entries) {
+      const record = new DataView(new ArrayBuffer(46));
+      record.setUint32(0, 0x02014b50, true);
+      record.setUint16(4, 20, true); // version made by
+      record.setUint16(6, 20, true); // version needed
+      record.setUint16(8, entry.flags, true);
+      record.setUint16(10, entry.method, true);
+      record.setUint16(12, this.stamp.time, true);
+      record.setUint16(14, this.stamp.date, true);
+      record.setUint32(16, entry.crc, true);
+      record.setUint32(20, entry.compressedSize, true);
+      record.setUint32(24, entry.size, true);
+      record.setUint16(28, entry.name.length, true);
+      record.setUint32(42, entry.offset, true);
+
+      await this.sink.write(new Uint8Array(record.buffer));
+      await this.sink.write(entry.name);
+      centralSize += 46 + entry.name.length;
+    }
+
+    const end = new DataView(new ArrayBuffer(22));
+    end.setUint32(0, 0x06054b50, true);
+    end.setUint16(8, this.entries.length, true);
+    end.setUint16(10, this.entries.length, true);
+    end.setUint32(12, centralSize, true);
+    end.setUint32(16, centralStart, true);
+
+    await this.sink.write(new Uint8Array(end.buffer));
+    await this.sink.close();
+  }
+}
+
+// Collects chunks into a Blob. Blob parts are referenced rather than copied,
+// and browsers may keep large Blobs on disk.
+export function createBlobSink(type = "application/zip") {
+  const parts: BlobPart[] = [];
+  let result: Blob | null = null;
+
+  const sink: ZipSink = {
+    async write(chunk) {
+      parts.push(chunk as BlobPart);
+    },
+    async close() {
+      result = new Blob(parts, { type });
+      parts.length = 0;
+    },
+  };
+
+  return {
+    sink,
+    getBlob: () => {
+      if (!result) throw new Error("Zip has not been closed yet");
+      return result;
+    },
+  };
+}
+
+// Writes straight to a user-chosen file via the File System Access API when
+// the browser supports it; returns null otherwise
+export async function createFileSink(suggestedName: string): Promise<ZipSink | null> {
+  const picker = (
+    window as unknown as {
+      showSaveFilePicker?: (options: {
+        suggestedName: string;
+        types: { description: string; accept: Record<string, string[]> }[];
+      }) => Promise<{ createWritable: () => Promise<WritableStream<BlobPart> & { close(): Promise<void> }> }>;
+    }
+  ).showSaveFilePicker;
+  if (!picker) return null;
+
+  // Must be called from a user gesture, before any other awaits
+  const handle = await picker.call(window, {
+    suggestedName,
+    types: [{ description: "ZIP archive", accept: { "application/zip": [".zip"] } }],
+  });
+  const writable = await handle.createWritable();
+  const writer = writable.getWriter();
+
+  return {
+    write: (chunk) => writer.write(chunk as BlobPart),
+    close: async () => {
+      await writer.close();
+    },
+  };
+}
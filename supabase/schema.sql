@@ -62,6 +62,34 @@ CREATE TABLE IF NOT EXISTS public.conversions (
 CREATE INDEX IF NOT EXISTS idx_conversions_user_id ON public.conversions(user_id);
 CREATE INDEX IF NOT EXISTS idx_conversions_created_at ON public.conversions(created_at DESC);
 
+-- Columns written by /api/history (added after the initial schema)
+ALTER TABLE public.conversions ADD COLUMN IF NOT EXISTS type TEXT;
+ALTER TABLE public.conversions ADD COLUMN IF NOT EXISTS input_filename TEXT;
+ALTER TABLE public.conversions ADD COLUMN IF NOT EXISTS input_format TEXT;
+ALTER TABLE public.conversions ADD COLUMN IF NOT EXISTS output_text TEXT;
+ALTER TABLE public.conversions ALTER COLUMN file_name DROP NOT NULL;
+
+-- History list projection: a short preview and the length, so listing
+-- history never reads the full text
+ALTER TABLE public.conversions ADD COLUMN IF NOT EXISTS snippet TEXT
+  GENERATED ALWAYS AS (LEFT(COALESCE(output_text, extracted_text, ''), 200)) STORED;
+ALTER TABLE public.conversions ADD COLUMN IF NOT EXISTS char_count INTEGER
+  GENERATED ALWAYS AS (CHAR_LENGTH(COALESCE(output_text, extracted_text, ''))) STORED;
+
+-- Keyset pagination on (created_at, id) per user
+CREATE INDEX IF NOT EXISTS idx_conversions_user_created
+  ON public.conversions(user_id, created_at DESC, id DESC);
+
+-- Full-text search over file names and extracted text. 'simple' skips
+-- stemming, since OCR text can be in any language.
+ALTER TABLE public.conversions ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+  GENERATED ALWAYS AS (
+    SETWEIGHT(TO_TSVECTOR('simple', COALESCE(input_filename, file_name, '')), 'A') ||
+    SETWEIGHT(TO_TSVECTOR('simple', COALESCE(output_text, extracted_text, '')), 'B')
+  ) STORED;
+CREATE INDEX IF NOT EXISTS idx_conversions_search
+  ON public.conversions USING GIN (search_vector);
+
 -- =============================================
 -- 3. Daily Usage Tracking Table
 -- =============================================
@@ -115,6 +143,54 @@ CREATE TABLE IF NOT EXISTS public.api_keys (
 
 CREATE INDEX IF NOT EXISTS idx_api_keys_user_id ON public.api_keys(user_id);
 
+-- Rate limiting columns (added after the initial schema)
+ALTER TABLE public.api_keys ADD COLUMN IF NOT EXISTS is_active BOOLEAN DEFAULT TRUE;
+ALTER TABLE public.api_keys ADD COLUMN IF NOT EXISTS rate_limit INTEGER DEFAULT 100;
+ALTER TABLE public.api_keys ADD COLUMN IF NOT EXISTS last_reset TIMESTAMPTZ DEFAULT NOW();
+
+-- The key clients send in X-API-Key, which the API looks keys up by
+ALTER TABLE public.api_keys ADD COLUMN IF NOT EXISTS key TEXT;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_api_keys_key ON public.api_keys(key);
+
+-- Add a batch of API requests to a key's daily counter in one atomic
+-- statement, starting a new count when the UTC day has changed.
+-- p_day is the UTC day the requests were made on; requests from a day that
+-- has already ended are not added to the new day's count.
+-- Returns the updated count (NULL when nothing was added). Only the server
+-- (service role) may call it; see the REVOKE at the end of this file.
+DROP FUNCTION IF EXISTS public.increment_api_key_usage(UUID, INTEGER);
+CREATE OR REPLACE FUNCTION public.increment_api_key_usage(
+  p_key_id UUID,
+  p_count INTEGER DEFAULT 1,
+  p_day DATE DEFAULT NULL
+)
+RETURNS INTEGER AS $$
+DECLARE
+  v_count INTEGER;
+BEGIN
+  UPDATE public.api_keys
+  SET
+    requests_today = CASE
+      WHEN last_reset IS NULL
+        OR (last_reset AT TIME ZONE 'UTC')::date < (NOW() AT TIME ZONE 'UTC')::date
+      THEN p_count
+      ELSE COALESCE(requests_today, 0) + p_count
+    END,
+    last_reset = CASE
+      WHEN last_reset IS NULL
+        OR (last_reset AT TIME ZONE 'UTC')::date < (NOW() AT TIME ZONE 'UTC')::date
+      THEN NOW()
+      ELSE last_reset
+    END,
+    last_used_at = NOW()
+  WHERE id = p_key_id
+    AND (p_day IS NULL OR p_day = (NOW() AT TIME ZONE 'UTC')::date)
+  RETURNING requests_today INTO v_count;
+
+  RETURN v_count;
+END;
+$$ LANGUAGE plpgsql SECURITY INVOKER SET search_path = public;
+
 -- =============================================
 -- 5. Feedback/Ratings Table
 -- =============================================
@@ -190,3 +266,7 @@ GRANT USAGE ON SCHEMA public TO authenticated;
 GRANT ALL ON ALL TABLES IN SCHEMA public TO authenticated;
 GRANT ALL ON ALL SEQUENCES IN SCHEMA public TO authenticated;
 GRANT EXECUTE ON ALL FUNCTIONS IN SCHEMA public TO authenticated;
+
+-- Usage counters are written by the server only
+REVOKE EXECUTE ON FUNCTION public.increment_api_key_usage(UUID, INTEGER, DATE) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.increment_api_key_usage(UUID, INTEGER, DATE) TO service_role;